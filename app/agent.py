@@ -1,28 +1,40 @@
 import os
 import json
+import asyncio
+import datetime
 import logging
-import re
-from typing import Any, Dict, Optional
-
-# Kütüphane ve modül importları burada kalmalı
-try:
-    import google.generativeai as genai
-except ImportError as e:
-    raise ImportError(
-        "google-generativeai is not installed. Install with:\n"
-        "pip install google-generativeai"
-    ) from e
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Iterator, List, Mapping, Optional, Tuple
 
 from app.assessment_engine import AssessmentEngine
-from app.scenario_manager import ScenarioManager
+from app.scenario_manager import ScenarioManager, TurnContext
 from app.mock_responses import get_mock_interpretation
+from app.intent_classifier import action_label, classify_intent, clinical_intent_for
+from app.json_extractor import (
+    JsonExtractionError,
+    JsonScanner,
+    JsonStringFieldStreamer,
+    parse_json_object,
+    validate_object,
+)
 from app.services.med_gemma_service import MedGemmaService
+from app.services.evaluation_queue import evaluation_queue
+from app.services.interpretation_cache import InterpretationCache, interpretation_cache as default_interpretation_cache
 from app.services.rule_service import rule_service
+from app.services.llm_backends import LLMBackend, create_interpretation_backend
+from app.services.prompt_compiler import PROMPT_COMPILER_VERSION, CompiledPrompt, PromptCompiler
 
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO)
 
+# Fast-path replies to small talk, by IntentClassifier chat_kind
+CHAT_REPLIES: Dict[str, str] = {
+    "greeting": "Merhaba! Hastayı değerlendirmek için klinik adımlarınızı yazabilirsiniz.",
+    "thanks": "Rica ederim. Değerlendirmeye klinik adımlarınızla devam edebilirsiniz.",
+    "closing": "Görüşmek üzere! Vakaya istediğiniz zaman kaldığınız yerden devam edebilirsiniz.",
+}
 
 DENTAL_EDUCATOR_PROMPT = """
 You are a dental education assistant helping to interpret student actions within a simulated clinical scenario.
@@ -60,47 +72,27 @@ CLINICAL SIMULATION STANDARDS (EXPERT LEVEL):
 3. **Visual Metaphors:** When describing lesions, use vivid clinical metaphors (e.g., "looks like a fishnet/balık ağı" for Lichen, "cheesy white" for Candida, "punched-out crater" for ulcers).
 """
 
-# Bu fonksiyon, LLM'in gönderdiği gereksiz metni temizleyerek JSON'a ulaşmaya çalışır.
-def _extract_first_json_block(text: str) -> Optional[str]:
-    # ... (Buraya daha önce verdiğin _extract_first_json_block fonksiyonunun tamamı gelecek) ...
-    # Bu fonksiyon doğru çalıştığı varsayılıyor.
-    # ...
-    text = text.strip()
+# Interpretation JSON schema: field -> (type, default). Action/enum keys must never be
+# taken from a truncated string; explanatory_feedback may be (it is shown as-is).
+INTERPRETATION_FIELDS = {
+    "intent_type": (str, "ACTION"),
+    "interpreted_action": (str, ""),
+    "clinical_intent": (str, "other"),
+    "priority": (str, "medium"),
+    "safety_concerns": (list, []),
+    "explanatory_feedback": (str, ""),
+    "structured_args": (dict, {}),
+}
+_INTERPRETATION_ATOMIC_FIELDS = ("intent_type", "interpreted_action", "clinical_intent", "priority")
 
-    # 1) Try direct parse
-    try:
-        json.loads(text)
-        return text
-    except Exception:
-        pass
-
-    # 2) Try fenced blocks ```json ... ``` or ``` ... ```
-    fence_patterns = [
-        r"```json\s*(\{.*?\})\s*```",
-        r"```\s*(\{.*?\})\s*```",
-    ]
-    for pat in fence_patterns:
-        m = re.search(pat, text, flags=re.DOTALL)
-        if m:
-            candidate = m.group(1).strip()
-            try:
-                json.loads(candidate)
-                return candidate
-            except Exception:
-                continue
 
-    # 3) Fallback: greedy first {...}
-    m = re.search(r"(\{.*\})", text, flags=re.DOTALL)
-    if m:
-        candidate = m.group(1).strip()
-        try:
-            # En son { veya } karakterine kadar olan kısmı kesebilirsin
-            # Bu, basit bir regexp yaklaşımıdır
-            return candidate
-        except Exception:
-            return None
+# Batch interpretation defaults (offline re-grading / replays)
+BATCH_SIZE = int(os.getenv("DENTAI_BATCH_SIZE", "16"))
+BATCH_CONCURRENCY = int(os.getenv("DENTAI_BATCH_CONCURRENCY", "4"))
+BATCH_MAX_OUTPUT_TOKENS = 8192
 
-    return None
+# Stored (and shown) as the assistant message when the model produced no feedback text
+EMPTY_FEEDBACK_TEXT = "Üzgünüm, şu anda yanıt veremiyorum."
 
 class DentalEducationAgent:
     """
@@ -118,43 +110,114 @@ class DentalEducationAgent:
         temperature: float = 0.2,
         assessment_engine: Optional[AssessmentEngine] = None,
         scenario_manager: Optional[ScenarioManager] = None,
+        interpretation_cache: Optional[InterpretationCache] = None,
+        fast_path_threshold: Optional[float] = None,
+        med_gemma: Optional[MedGemmaService] = None,
+        enable_med_gemma: bool = True,
+        backend: Optional[LLMBackend] = None,
+        prompt_compiler: Optional[PromptCompiler] = None,
     ) -> None:
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
-        if not self.api_key:
-            raise ValueError(
-                "GEMINI_API_KEY not set. Provide api_key param or set environment variable GEMINI_API_KEY."
-            )
-
-        genai.configure(api_key=self.api_key)
+        self.model_name = model_name
+        self._generation_config = {
+            "temperature": temperature,
+            "top_p": 0.9,
+            "top_k": 40,
+            "max_output_tokens": 512,
+            # Hint to return JSON. Some SDK versions honor this directly.
+            "response_mime_type": "application/json",
+        }
 
-        self.model = genai.GenerativeModel(
+        # Gemini by default; DENTAI_LLM_BACKEND=local swaps in the offline stand-in (no key needed).
+        # This generic-prompt backend serves cases without compiled rules.
+        self.backend = backend or create_interpretation_backend(
             model_name=model_name,
+            api_key=self.api_key,
             system_instruction=DENTAL_EDUCATOR_PROMPT,
-            generation_config={
-                "temperature": temperature,
-                "top_p": 0.9,
-                "top_k": 40,
-                "max_output_tokens": 512,
-                # Hint to return JSON. Some SDK versions honor this directly.
-                "response_mime_type": "application/json",
-            },
+            generation_config=self._generation_config,
         )
+        # An injected backend has its system instruction fixed, so it keeps the generic prompt.
+        self._use_case_prompts = backend is None and os.getenv("DENTAI_CASE_PROMPTS", "1") != "0"
+        # case_id -> backend bound to that case's current compiled system instruction
+        self._case_backends: Dict[str, LLMBackend] = {}
+        self._case_backends_lock = threading.Lock()
 
         self.assessment_engine = assessment_engine or AssessmentEngine()
         self.scenario_manager = scenario_manager or ScenarioManager()
+        self.prompt_compiler = prompt_compiler or PromptCompiler(
+            self.assessment_engine, self.scenario_manager, DENTAL_EDUCATOR_PROMPT
+        )
+        self.interpretation_cache = interpretation_cache or default_interpretation_cache
+
+        # Local classifier confidence above which Gemini is skipped (> 1.0 disables the fast path).
+        # 0.95: only strong (weight 1.0) patterns or several corroborating ones skip the LLM;
+        # negated messages and questions that are not history taking go to the LLM.
+        if fast_path_threshold is None:
+            fast_path_threshold = float(os.getenv("DENTAI_FAST_PATH_THRESHOLD", "0.95"))
+        self.fast_path_threshold = fast_path_threshold
         
-        # MedGemma: Silent Grader (Arka planda çalışır)
+        # MedGemma: Silent Grader (Arka planda, kalıcı kuyruk üzerinden çalışır)
+        self.med_gemma = None
+        if enable_med_gemma:
+            try:
+                self.med_gemma = med_gemma or MedGemmaService()
+                evaluation_queue.start(self._run_silent_evaluation)
+                logger.info("MedGemma servis başarıyla başlatıldı (Silent Evaluator)")
+            except Exception as e:
+                logger.warning(f"MedGemma başlatılamadı: {e}. Sessiz değerlendirme olmadan devam edilecek.")
+                self.med_gemma = None
+
+    def _compiled_prompt(self, case_id: Optional[str]) -> Optional[CompiledPrompt]:
+        if not self._use_case_prompts:
+            return None
         try:
-            self.med_gemma = MedGemmaService()
-            logger.info("MedGemma servis başarıyla başlatıldı (Silent Evaluator)")
+            # Token counts come from the model's tokenizer when the backend has one
+            token_counter = self.backend.count_tokens if self.backend.counts_tokens else None
+            return self.prompt_compiler.compile(case_id, self.model_name, token_counter)
         except Exception as e:
-            logger.warning(f"MedGemma başlatılamadı: {e}. Sessiz değerlendirme olmadan devam edilecek.")
-            self.med_gemma = None
+            logger.warning(f"Prompt compilation failed for case {case_id}, using generic prompt: {e}")
+            return None
 
-    def interpret_action(self, action: str, state: Dict[str, Any]) -> Dict[str, Any]:
+    def _backend_for(self, state: Dict[str, Any]) -> Tuple[LLMBackend, Optional[CompiledPrompt]]:
         """
-        Use Gemini (Single Call) to convert raw action into structured JSON.
+        Pooled per-case backend (compact system instruction), or the generic one.
+        A backend is replaced when the case's prompt is recompiled (rules hot reload),
+        so newly added or required action keys reach the model.
         """
+        case_id = state.get("case_id")
+        compiled = self._compiled_prompt(case_id)
+        if compiled is None:
+            return self.backend, None
+
+        backend = self._case_backends.get(case_id)
+        if backend is None or backend.system_instruction != compiled.system_instruction:
+            with self._case_backends_lock:
+                backend = self._case_backends.get(case_id)
+                if backend is None or backend.system_instruction != compiled.system_instruction:
+                    backend = create_interpretation_backend(
+                        model_name=self.model_name,
+                        api_key=self.api_key,
+                        system_instruction=compiled.system_instruction,
+                        generation_config=self._generation_config,
+                    )
+                    self._case_backends[case_id] = backend
+        return backend, compiled
+
+    def _prompt_for(self, action: str, state: Dict[str, Any]) -> Tuple[LLMBackend, str]:
+        """(backend, user prompt) for one student action."""
+        backend, compiled = self._backend_for(state)
+        if compiled is not None:
+            return backend, compiled.user_prompt(action, state)
+        return backend, self._build_user_prompt(action, state)
+
+    def _batch_prompt_for(self, items: List[Tuple[int, str]], state: Dict[str, Any]) -> Tuple[LLMBackend, str]:
+        backend, compiled = self._backend_for(state)
+        if compiled is not None:
+            return backend, compiled.batch_user_prompt(items, state)
+        return backend, self._build_batch_prompt(items, state)
+
+    def _build_user_prompt(self, action: str, state: Dict[str, Any]) -> str:
+        """Öğrenci eylemi + kısmi senaryo durumundan kullanıcı prompt'unu oluşturur."""
         context_snippet = {
             "case_id": state.get("case_id"),
             "patient_age": state.get("patient", {}).get("age"),
@@ -162,7 +225,7 @@ class DentalEducationAgent:
             "revealed_findings": state.get("revealed_findings"),
         }
 
-        user_prompt = (
+        return (
             "Student action:\n"
             f"{action}\n\n"
             "Scenario state (partial):\n"
@@ -170,112 +233,427 @@ class DentalEducationAgent:
             "Return STRICT JSON ONLY following the required schema."
         )
 
+    def _parse_interpretation(self, raw_text: str) -> Dict[str, Any]:
+        """
+        Parse the raw model output into the normalized interpretation dict.
+        Raises ValueError when no usable JSON can be extracted.
+        """
         try:
-            response = self.model.generate_content(user_prompt)
-            raw_text = getattr(response, "text", "") or ""
-            json_str = _extract_first_json_block(raw_text)
-
-            if not json_str:
-                # Eğer JSON yoksa, ama metin varsa, bunu CHAT olarak kabul et (Fallback)
-                if raw_text and len(raw_text) < 200:
-                    return {
-                        "intent_type": "CHAT",
-                        "interpreted_action": "general_chat",
-                        "explanatory_feedback": raw_text.strip(),
-                        "clinical_intent": "other",
-                        "priority": "low",
-                        "safety_concerns": [],
-                        "structured_args": {},
-                    }
-                raise ValueError("Failed to extract JSON from model response.")
-
-            data = json.loads(json_str)
-
-            # Normalize data
-            interpreted = {
-                "intent_type": data.get("intent_type", "ACTION").strip(),
-                "interpreted_action": data.get("interpreted_action", "").strip(),
-                "clinical_intent": data.get("clinical_intent", "other").strip() or "other",
-                "priority": data.get("priority", "medium").strip() or "medium",
-                "safety_concerns": data.get("safety_concerns", []) or [],
-                "explanatory_feedback": data.get("explanatory_feedback", "").strip(),
-                "structured_args": data.get("structured_args", {}) or {},
-            }
-            return interpreted
+            data = parse_json_object(
+                raw_text,
+                INTERPRETATION_FIELDS,
+                complete_only=_INTERPRETATION_ATOMIC_FIELDS,
+                partial_required=("interpreted_action",),
+            )
+        except JsonExtractionError:
+            # Eğer JSON yoksa, ama metin varsa, bunu CHAT olarak kabul et (Fallback)
+            if raw_text and "{" not in raw_text and len(raw_text) < 200:
+                return {
+                    "intent_type": "CHAT",
+                    "interpreted_action": "general_chat",
+                    "explanatory_feedback": raw_text.strip(),
+                    "clinical_intent": "other",
+                    "priority": "low",
+                    "safety_concerns": [],
+                    "structured_args": {},
+                }
+            raise
+
+        return self._normalize_interpretation(data)
+
+    @staticmethod
+    def _normalize_interpretation(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill defaults / strip whitespace on a decoded interpretation object."""
+        data = validate_object(data, INTERPRETATION_FIELDS)
+        return {
+            "intent_type": data["intent_type"] or "ACTION",
+            "interpreted_action": data["interpreted_action"],
+            "clinical_intent": data["clinical_intent"] or "other",
+            "priority": data["priority"] or "medium",
+            "safety_concerns": data["safety_concerns"],
+            "explanatory_feedback": data["explanatory_feedback"],
+            "structured_args": data["structured_args"],
+        }
 
-        except Exception as e:
-            logger.exception(f"LLM interpretation failed: {e}")
-            
-            # Kullanıcı dostu hata mesajı ve kota aşımında mock yanıt
-            error_msg = str(e)
-            if "quota" in error_msg.lower() or "429" in error_msg:
-                logger.warning("API quota exceeded. Using mock interpretation fallback.")
-                # KOTA AŞIMI: Mock sistem ile devam et
-                try:
-                    mock_result = get_mock_interpretation(action)
-                    mock_result["explanatory_feedback"] = "⚠️ API kotası doldu (Mock sistem aktif). " + mock_result["explanatory_feedback"]
-                    return mock_result
-                except Exception as mock_err:
-                    logger.error(f"Mock interpretation failed: {mock_err}")
-                    feedback = "⏳ API günlük kullanım limiti doldu. Lütfen yarın tekrar deneyin."
-            else:
-                feedback = "Anlaşılamadı (Teknik Hata). Lütfen tekrar dener misiniz?"
-            
-            # HATA DURUMUNDA 'CHAT' OLARAK DÖN (PUANI GİZLEMEK İÇİN)
+    def _interpretation_fallback(self, action: str, error: Exception) -> Dict[str, Any]:
+        """LLM hatasında (kota dahil) dönecek güvenli yorumu üretir."""
+        logger.exception(f"LLM interpretation failed: {error}")
+
+        # Kullanıcı dostu hata mesajı ve kota aşımında mock yanıt
+        error_msg = str(error)
+        if "quota" in error_msg.lower() or "429" in error_msg:
+            logger.warning("API quota exceeded. Using mock interpretation fallback.")
+            # KOTA AŞIMI: Mock sistem ile devam et
+            try:
+                mock_result = get_mock_interpretation(action)
+                mock_result["explanatory_feedback"] = "⚠️ API kotası doldu (Mock sistem aktif). " + mock_result["explanatory_feedback"]
+                return mock_result
+            except Exception as mock_err:
+                logger.error(f"Mock interpretation failed: {mock_err}")
+                feedback = "⏳ API günlük kullanım limiti doldu. Lütfen yarın tekrar deneyin."
+        else:
+            feedback = "Anlaşılamadı (Teknik Hata). Lütfen tekrar dener misiniz?"
+
+        # HATA DURUMUNDA 'CHAT' OLARAK DÖN (PUANI GİZLEMEK İÇİN)
+        return {
+            "intent_type": "CHAT",
+            "interpreted_action": "error",
+            "explanatory_feedback": feedback,
+            "safety_concerns": [],
+            "clinical_intent": "other",
+            "priority": "low",
+            "structured_args": {},
+        }
+
+    def _cache_key(self, action: str, state: Dict[str, Any]) -> str:
+        return InterpretationCache.make_key(
+            action,
+            state.get("case_id"),
+            state.get("revealed_findings"),
+            self.model_name,
+            rules_digest=self.assessment_engine.rule_index.digest,
+            prompt_version=PROMPT_COMPILER_VERSION,
+        )
+
+    def _cache_store(self, cache_key: str, interpretation: Dict[str, Any], state: Dict[str, Any]) -> None:
+        # Only successful model interpretations are cached (never error/mock fallbacks)
+        self.interpretation_cache.set(
+            cache_key, interpretation, case_id=state.get("case_id"), model_name=self.model_name
+        )
+
+    def _fast_path_interpretation(self, action: str, state: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Resolve unambiguous turns with the local intent classifier (no LLM call).
+        Returns None when confidence is below the threshold.
+        """
+        prediction = classify_intent(action)
+        if prediction["decision"] == "UNKNOWN" or prediction["confidence"] < self.fast_path_threshold:
+            return None
+
+        if prediction["decision"] == "CHAT":
             return {
                 "intent_type": "CHAT",
-                "interpreted_action": "error",
-                "explanatory_feedback": feedback,
-                "safety_concerns": [],
+                "interpreted_action": "general_chat",
                 "clinical_intent": "other",
                 "priority": "low",
-                "structured_args": {},
+                "safety_concerns": [],
+                "explanatory_feedback": CHAT_REPLIES.get(prediction.get("chat_kind"), CHAT_REPLIES["greeting"]),
+                "structured_args": {"classifier_confidence": prediction["confidence"]},
             }
 
-    def _silent_evaluation(
-        self, 
-        student_input: str, 
-        interpreted_action: str, 
+        action_key = prediction["interpreted_action"]
+        return {
+            "intent_type": "ACTION",
+            "interpreted_action": action_key,
+            "clinical_intent": clinical_intent_for(action_key),
+            "priority": "medium",
+            "safety_concerns": [],
+            "explanatory_feedback": self._fast_path_feedback(action_key, state),
+            "structured_args": {"classifier_confidence": prediction["confidence"]},
+        }
+
+    def _fast_path_feedback(self, action_key: str, state: Dict[str, Any]) -> str:
+        """
+        Neutral feedback for a fast-path action: what it revealed, never the verdict.
+        rule_outcome ("HATA: ...", "Doğru Tanı: ...") stays in the assessment; the
+        silent-evaluation UI shows no scores or warnings, and the sequence check may
+        still turn the rule into a penalty.
+        """
+        case_id = state.get("case_id")
+        rule = self.assessment_engine.get_rule(case_id, action_key) or {}
+        updates = rule.get("state_updates")
+        revealed = updates.get("revealed_findings") if isinstance(updates, Mapping) else None
+        details = self.scenario_manager.cases.index().finding_descriptions(case_id, revealed)
+        if details:
+            return f"{action_label(action_key)}: {' '.join(details)}"
+        return f"Eylem kaydedildi: {action_label(action_key)}."
+
+    def _lookup_interpretation(self, action: str, state: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], str]:
+        """Fast path + cache lookup. Returns (interpretation or None, cache_key)."""
+        fast = self._fast_path_interpretation(action, state)
+        cache_key = self._cache_key(action, state)
+        if fast is not None:
+            return fast, cache_key
+        return self.interpretation_cache.get(cache_key), cache_key
+
+    def interpret_action(self, action: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Use Gemini (Single Call) to convert raw action into structured JSON.
+        Unambiguous turns are resolved by the local classifier first, and repeated
+        phrasings for the same case/findings are served from the interpretation cache.
+        """
+        known, cache_key = self._lookup_interpretation(action, state)
+        if known is not None:
+            return known
+
+        backend, user_prompt = self._prompt_for(action, state)
+
+        try:
+            raw_text = backend.generate(user_prompt, hints={"student_action": action})
+            interpretation = self._parse_interpretation(raw_text)
+        except Exception as e:
+            return self._interpretation_fallback(action, e)
+
+        self._cache_store(cache_key, interpretation, state)
+        return interpretation
+
+    async def ainterpret_action(self, action: str, state: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Async variant of interpret_action: awaits Gemini without occupying a thread.
+        """
+        known, cache_key = await asyncio.to_thread(self._lookup_interpretation, action, state)
+        if known is not None:
+            return known
+
+        backend, user_prompt = self._prompt_for(action, state)
+
+        try:
+            raw_text = await backend.agenerate(user_prompt, hints={"student_action": action})
+            interpretation = self._parse_interpretation(raw_text)
+        except Exception as e:
+            return self._interpretation_fallback(action, e)
+
+        await asyncio.to_thread(self._cache_store, cache_key, interpretation, state)
+        return interpretation
+
+    # ==================== BATCH INTERPRETATION ====================
+
+    def _build_batch_prompt(self, items: List[Tuple[int, str]], state: Dict[str, Any]) -> str:
+        """Several student actions for the same case/state in one request (JSON array in, JSON array out)."""
+        context_snippet = {
+            "case_id": state.get("case_id"),
+            "patient_age": state.get("patient", {}).get("age"),
+            "chief_complaint": state.get("patient", {}).get("chief_complaint"),
+            "revealed_findings": state.get("revealed_findings"),
+        }
+        actions = [{"id": item_id, "action": text} for item_id, text in items]
+
+        return (
+            "Student actions (JSON array, interpret each one independently):\n"
+            f"{json.dumps(actions, ensure_ascii=False)}\n\n"
+            "Scenario state (partial):\n"
+            f"{json.dumps(context_snippet, ensure_ascii=False)}\n\n"
+            "Return STRICT JSON ONLY: a JSON array with exactly one object per input action. "
+            "Each object must contain the input \"id\" plus every field of the required schema."
+        )
+
+    def _batch_generation_config(self, size: int) -> Dict[str, Any]:
+        # 512 tokens per item (same budget as a single call), capped by the model limit
+        return {"max_output_tokens": min(512 * size, BATCH_MAX_OUTPUT_TOKENS)}
+
+    def _parse_batch_interpretations(self, raw_text: str, ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Map a batch response back to item ids. Items that are missing or malformed
+        are simply absent from the result (the caller retries them one by one).
+        """
+        scanner = JsonScanner()
+        scanner.feed(raw_text or "")
+        data = scanner.finish()
+        if data is None:
+            raise JsonExtractionError("Failed to extract JSON array from batch response.")
+
+        if isinstance(data, dict):
+            data = data.get("results") or data.get("items") or []
+        if not isinstance(data, list):
+            raise JsonExtractionError("Batch response is not a JSON array.")
+        if scanner.partial and data:
+            # Output was cut off: the last element may be incomplete, retry it on its own
+            data = data[:-1]
+
+        wanted = set(ids)
+        parsed: Dict[int, Dict[str, Any]] = {}
+        for position, entry in enumerate(data):
+            if not isinstance(entry, dict):
+                continue
+            item_id = entry.get("id")
+            if not isinstance(item_id, int) and len(data) == len(ids):
+                # Model dropped the id but kept the order
+                item_id = ids[position]
+            if item_id not in wanted or item_id in parsed:
+                continue
+            try:
+                parsed[item_id] = self._normalize_interpretation(entry)
+            except Exception as e:
+                logger.warning(f"Batch item {item_id} could not be normalized: {e}")
+        return parsed
+
+    def _plan_batch(
+        self, actions: List[str], state: Dict[str, Any]
+    ) -> Tuple[List[Optional[Dict[str, Any]]], Dict[str, List[int]], List[Tuple[int, str]]]:
+        """
+        Resolve what the fast path / cache already know and de-duplicate the rest.
+        Returns (results with None holes, cache_key -> result indexes, pending (index, text)).
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(actions)
+        slots: Dict[str, List[int]] = {}
+        pending: List[Tuple[int, str]] = []
+
+        for index, action in enumerate(actions):
+            known, cache_key = self._lookup_interpretation(action, state)
+            if known is not None:
+                results[index] = known
+                continue
+            if cache_key not in slots:
+                slots[cache_key] = []
+                pending.append((index, action))
+            slots[cache_key].append(index)
+        return results, slots, pending
+
+    def _fill_batch_slots(
+        self,
+        results: List[Optional[Dict[str, Any]]],
+        slots: Dict[str, List[int]],
+        resolved: Dict[int, Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Copy each resolved interpretation to every input that shared its cache key."""
+        for indexes in slots.values():
+            interpretation = resolved[indexes[0]]
+            for i in indexes:
+                results[i] = dict(interpretation)
+        return results
+
+    def _batch_chunks(self, pending: List[Tuple[int, str]], batch_size: Optional[int]) -> List[List[Tuple[int, str]]]:
+        size = max(1, batch_size or BATCH_SIZE)
+        return [pending[i:i + size] for i in range(0, len(pending), size)]
+
+    def _interpret_chunk(self, chunk: List[Tuple[int, str]], state: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+        ids = [index for index, _ in chunk]
+        resolved: Dict[int, Dict[str, Any]] = {}
+        try:
+            backend, prompt = self._batch_prompt_for(chunk, state)
+            raw_text = backend.generate(
+                prompt,
+                generation_config=self._batch_generation_config(len(chunk)),
+                hints={"student_actions": [{"id": index, "action": action} for index, action in chunk]},
+            )
+            resolved = self._parse_batch_interpretations(raw_text, ids)
+        except Exception as e:
+            logger.warning(f"Batch interpretation failed for {len(chunk)} item(s), retrying individually: {e}")
+
+        for index, action in chunk:
+            if index in resolved:
+                self._cache_store(self._cache_key(action, state), resolved[index], state)
+            else:
+                # Per-item isolation: a bad item never poisons its batch
+                resolved[index] = self.interpret_action(action, state)
+        return resolved
+
+    async def _ainterpret_chunk(
+        self, chunk: List[Tuple[int, str]], state: Dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> Dict[int, Dict[str, Any]]:
+        ids = [index for index, _ in chunk]
+        resolved: Dict[int, Dict[str, Any]] = {}
+        async with semaphore:
+            try:
+                backend, prompt = self._batch_prompt_for(chunk, state)
+                raw_text = await backend.agenerate(
+                    prompt,
+                    generation_config=self._batch_generation_config(len(chunk)),
+                    hints={"student_actions": [{"id": index, "action": action} for index, action in chunk]},
+                )
+                resolved = self._parse_batch_interpretations(raw_text, ids)
+            except Exception as e:
+                logger.warning(f"Batch interpretation failed for {len(chunk)} item(s), retrying individually: {e}")
+
+            for index, action in chunk:
+                if index in resolved:
+                    await asyncio.to_thread(self._cache_store, self._cache_key(action, state), resolved[index], state)
+                else:
+                    resolved[index] = await self.ainterpret_action(action, state)
+        return resolved
+
+    def interpret_actions_batch(
+        self,
+        actions: List[str],
+        state: Dict[str, Any],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Interpret many student actions for one case/state (re-grading, replays).
+        Fast path and cache are consulted per item; the remaining unique actions are
+        packed `batch_size` per Gemini request, with at most `max_concurrency`
+        requests in flight. Results are returned in input order.
+        """
+        if not actions:
+            return []
+        results, slots, pending = self._plan_batch(actions, state)
+        chunks = self._batch_chunks(pending, batch_size)
+
+        resolved: Dict[int, Dict[str, Any]] = {}
+        if chunks:
+            workers = max(1, min(max_concurrency or BATCH_CONCURRENCY, len(chunks)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="interpret-batch") as pool:
+                for chunk_result in pool.map(lambda c: self._interpret_chunk(c, state), chunks):
+                    resolved.update(chunk_result)
+
+        return self._fill_batch_slots(results, slots, resolved)
+
+    async def ainterpret_actions_batch(
+        self,
+        actions: List[str],
+        state: Dict[str, Any],
+        batch_size: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Async variant of interpret_actions_batch (bounded by an asyncio.Semaphore)."""
+        if not actions:
+            return []
+        results, slots, pending = await asyncio.to_thread(self._plan_batch, actions, state)
+        chunks = self._batch_chunks(pending, batch_size)
+
+        resolved: Dict[int, Dict[str, Any]] = {}
+        if chunks:
+            semaphore = asyncio.Semaphore(max(1, max_concurrency or BATCH_CONCURRENCY))
+            for chunk_result in await asyncio.gather(
+                *(self._ainterpret_chunk(chunk, state, semaphore) for chunk in chunks)
+            ):
+                resolved.update(chunk_result)
+
+        return self._fill_batch_slots(results, slots, resolved)
+
+    def _build_evaluation_payload(
+        self,
+        student_input: str,
+        interpreted_action: Optional[str],
         state: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> Optional[Dict[str, Any]]:
         """
-        MedGemma sessizce arka planda değerlendirme yapar.
-        Bu fonksiyon konuşma akışını ENGELLEMEZ.
-        Değerlendirme başarısız olursa boş dict döner.
+        MedGemma sessiz değerlendirme işinin yükünü hazırlar (MedGemma yoksa None).
+        İş, turun transaction'ı içinde asistan mesajının ChatLog id'si ile
+        kuyruğa eklenir (bkz. _finalize_turn); Hugging Face çağrısı worker
+        thread'lerinde yapılır ve konuşma akışını ENGELLEMEZ.
         """
         if not self.med_gemma:
             logger.debug("MedGemma mevcut değil, sessiz değerlendirme atlanıyor")
-            return {}
+            return None
 
-        try:
-            case_id = state.get("case_id", "default_case")
-            category = state.get("category", "GENERAL")
-            
-            # Kategori için aktif kuralları al
-            rules = rule_service.get_active_rules(category)
-            
-            # Hasta bağlamı özeti oluştur
-            patient = state.get("patient", {})
-            context_summary = (
+        patient = state.get("patient", {})
+        return {
+            "student_input": student_input,
+            "interpreted_action": interpreted_action,
+            "case_id": state.get("case_id", "default_case"),
+            "category": state.get("category", "GENERAL"),
+            # Hasta bağlamı özeti
+            "context_summary": (
                 f"Hasta: {patient.get('age', 'Bilinmiyor')} yaşında. "
                 f"Şikayet: {patient.get('chief_complaint', 'Belirtilmemiş')}. "
                 f"Bulgular: {', '.join(state.get('revealed_findings', []))}"
-            )
-            
-            # MedGemma'yı çağır (sessiz değerlendirme)
-            logger.info(f"[Sessiz Değerlendirme] Başlatılıyor: {interpreted_action}")
-            evaluation = self.med_gemma.validate_clinical_action(
-                student_text=student_input,
-                rules=rules,
-                context_summary=context_summary
-            )
-            
-            logger.info(f"[Sessiz Değerlendirme] Tamamlandı: {evaluation.get('is_clinically_accurate', 'Bilinmiyor')}")
-            return evaluation
-            
-        except Exception as e:
-            logger.warning(f"Sessiz değerlendirme başarısız (kritik değil): {e}")
-            return {}
+            ),
+        }
+
+    def _run_silent_evaluation(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Kuyruk worker'ı tarafından çağrılır: tek bir MedGemma doğrulama denemesi.
+        Hata fırlatırsa kuyruk backoff ile yeniden dener.
+        """
+        # Kategori için aktif kuralları al
+        rules = rule_service.get_active_rules(payload.get("category") or "GENERAL")
+        return self.med_gemma.validate_clinical_action_once(
+            student_text=payload.get("student_input", ""),
+            rules=rules,
+            context_summary=payload.get("context_summary", ""),
+        )
 
     def _compose_final_feedback(
         self, 
@@ -304,7 +682,7 @@ class DentalEducationAgent:
         
         1) Gemini: Öğrenci eylemini yorumlar (Eğitim Asistanı rolünde)
         2) AssessmentEngine: Kural bazlı puanlama yapar
-        3) MedGemma: ARKA PLANDA sessizce değerlendirir (konuşmayı engellemez)
+        3) MedGemma: Kalıcı kuyruğa eklenir, ARKA PLANDA değerlendirilir (konuşmayı engellemez)
         4) Final feedback oluşturulur ve tüm sonuçlar döner
         
         Args:
@@ -318,37 +696,145 @@ class DentalEducationAgent:
           "case_id": str,
           "llm_interpretation": dict (Gemini yorumu - response_text içerir),
           "assessment": dict (Kural motoru puanı),
-          "silent_evaluation": dict (MedGemma arka plan değerlendirmesi),
+          "silent_evaluation": dict (kuyruk durumu: {"status": "queued", "job_id": ...}),
           "final_feedback": str (Öğrenciye gösterilen geri bildirim),
-          "updated_state": dict
+          "state_delta": dict (Bu turda uygulanan skor/durum değişikliği),
+          "updated_state": dict,
+          "session_id": int | None,
+          "chat_log_ids": {"user": int | None, "assistant": int | None},
+          "turn_metadata": dict (asistan mesajının ChatLog.metadata_json içeriği)
         }
         """
-        # Step 1: Get Context (persistent)
-        # If case_id is provided, bind to that session/case so state is stored correctly.
-        state = self.scenario_manager.get_state(student_id, case_id=case_id) if case_id else self.scenario_manager.get_state(student_id)
-        state = state or {}
+        # Step 1: Get Context (persistent, one read)
+        turn = self._prepare_turn(student_id, case_id)
+
+        # Step 2: Gemini Interpretation (Eğitim Asistanı)
+        interpretation = self.interpret_action(raw_action, turn.state)
+
+        # Steps 3-6: Scoring, final feedback and ONE transaction for state, chat logs
+        # and the queued MedGemma evaluation (arka plan)
+        return self._finalize_turn(turn, raw_action, interpretation)
+
+    async def aprocess_student_input(
+        self, student_id: str, raw_action: str, case_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of process_student_input (same return shape).
 
-        # Use provided case_id or fallback to state
-        if not case_id:
-            case_id = state.get("case_id", "default_case")
+        - Blocking DB I/O (the turn's read and its single write transaction) runs in
+          worker threads so the event loop stays free.
+        """
+        turn = await asyncio.to_thread(self._prepare_turn, student_id, case_id)
+        interpretation = await self.ainterpret_action(raw_action, turn.state)
+        return await asyncio.to_thread(self._finalize_turn, turn, raw_action, interpretation)
+
+    def stream_student_input(
+        self, student_id: str, raw_action: str, case_id: Optional[str] = None
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Streaming version of process_student_input.
+
+        Yields events:
+          {"event": "token", "data": {"text": str}}   explanatory_feedback as Gemini produces it
+          {"event": "final", "data": <process_student_input result>}
+        The final event is authoritative (e.g. if the stream had to fall back).
+        """
+        turn = self._prepare_turn(student_id, case_id)
+        state = turn.state
+
+        interpretation, cache_key = self._lookup_interpretation(raw_action, state)
+        if interpretation is None:
+            streamer = JsonStringFieldStreamer("explanatory_feedback")
+            chunks: List[str] = []
+            try:
+                backend, user_prompt = self._prompt_for(raw_action, state)
+                for text in backend.stream(user_prompt, hints={"student_action": raw_action}):
+                    chunks.append(text)
+                    delta = streamer.feed(text)
+                    if delta:
+                        yield {"event": "token", "data": {"text": delta}}
+                interpretation = self._parse_interpretation("".join(chunks))
+                self._cache_store(cache_key, interpretation, state)
+            except Exception as e:
+                interpretation = self._interpretation_fallback(raw_action, e)
         else:
-            state["case_id"] = case_id
+            # Fast path / cache hit: the whole feedback is available at once
+            yield {"event": "token", "data": {"text": interpretation.get("explanatory_feedback", "")}}
+
+        result = self._finalize_turn(turn, raw_action, interpretation)
+        yield {"event": "final", "data": result}
+
+    async def astream_student_input(
+        self, student_id: str, raw_action: str, case_id: Optional[str] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Async version of stream_student_input (used by the SSE endpoint)."""
+        turn = await asyncio.to_thread(self._prepare_turn, student_id, case_id)
+        state = turn.state
+
+        interpretation, cache_key = await asyncio.to_thread(self._lookup_interpretation, raw_action, state)
+        if interpretation is None:
+            streamer = JsonStringFieldStreamer("explanatory_feedback")
+            chunks: List[str] = []
+            try:
+                backend, user_prompt = self._prompt_for(raw_action, state)
+                async for text in backend.astream(user_prompt, hints={"student_action": raw_action}):
+                    chunks.append(text)
+                    delta = streamer.feed(text)
+                    if delta:
+                        yield {"event": "token", "data": {"text": delta}}
+                interpretation = self._parse_interpretation("".join(chunks))
+                await asyncio.to_thread(self._cache_store, cache_key, interpretation, state)
+            except Exception as e:
+                interpretation = self._interpretation_fallback(raw_action, e)
+        else:
+            yield {"event": "token", "data": {"text": interpretation.get("explanatory_feedback", "")}}
 
-        # Step 2: Gemini Interpretation (Eğitim Asistanı)
-        interpretation = self.interpret_action(raw_action, state)
-        interpreted_action = interpretation.get("interpreted_action", "")
+        result = await asyncio.to_thread(self._finalize_turn, turn, raw_action, interpretation)
+        yield {"event": "final", "data": result}
 
-        # Step 3: Objective Scoring (Kural Motoru)
-        assessment = self.assessment_engine.evaluate_action(case_id, interpretation) or {}
+    def _prepare_turn(self, student_id: str, case_id: Optional[str]) -> TurnContext:
+        """Load (or initialize) the persistent state and resolve the effective case_id (one read)."""
+        return self.scenario_manager.begin_turn(student_id, case_id=case_id)
 
-        # Step 4: Silent Evaluation (MedGemma - Arka Plan)
-        # Bu çağrı BAŞARISIZ olsa bile diğer işlemler devam eder
-        silent_evaluation = self._silent_evaluation(raw_action, interpreted_action, state)
+    @staticmethod
+    def _build_turn_metadata(
+        case_id: str,
+        interpretation: Dict[str, Any],
+        assessment: Dict[str, Any],
+        silent_evaluation: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Metadata stored with the assistant message (and used by the UI for finding images)."""
+        revealed_findings = (assessment.get("state_updates") or {}).get("revealed_findings", [])
+        return {
+            "interpreted_action": interpretation.get("interpreted_action"),
+            "assessment": assessment,
+            "silent_evaluation": silent_evaluation,
+            "revealed_findings": revealed_findings,
+            "timestamp": datetime.datetime.utcnow().isoformat(),
+            "case_id": case_id,
+        }
 
-        # Step 5: Final Feedback (Gemini + Puanlama)
+    def _finalize_turn(
+        self,
+        turn: TurnContext,
+        raw_action: str,
+        interpretation: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """
+        Score the interpretation and persist the whole turn in ONE transaction:
+        score delta + state merge, user and assistant ChatLog rows, the
+        action_events row and the MedGemma job (already linked to the assistant
+        message), then build the result.
+        """
+        case_id = turn.case_id
+
+        # Objective Scoring (Kural Motoru)
+        # turn.state: ordering (requires / forbidden_after) and repeat checks run locally
+        assessment = self.assessment_engine.evaluate_action(case_id, interpretation, turn.state) or {}
+
+        # Final Feedback (Gemini + Puanlama)
         final_feedback = self._compose_final_feedback(interpretation, assessment)
 
-        # Step 6: Update State
         # Always propagate score_change (even when a rule has no state_updates).
         score_delta = assessment.get("score_change")
         state_updates = (
@@ -363,25 +849,76 @@ class DentalEducationAgent:
         if isinstance(state_updates, dict) and state_updates:
             combined_updates.update(state_updates)
 
-        if combined_updates:
-            try:
-                self.scenario_manager.update_state(student_id, combined_updates, case_id=case_id)
-            except Exception as e:
-                logger.exception("Failed to update scenario state: %s", e)
+        payload = self._build_evaluation_payload(raw_action, interpretation.get("interpreted_action"), turn.state)
+        silent_evaluation: Dict[str, Any] = {}
+        metadata = self._build_turn_metadata(case_id, interpretation, assessment, silent_evaluation)
+        chat_log_ids: Dict[str, Optional[int]] = {"user": None, "assistant": None}
+        updated_state = turn.state
+        job_id = None
 
-        updated_state = self.scenario_manager.get_state(student_id, case_id=case_id) or state
+        try:
+            with self.scenario_manager.unit_of_work(turn) as uow:
+                if combined_updates:
+                    uow.apply_updates(combined_updates)
+
+                user_log = uow.add_message("user", raw_action, timestamp=turn.started_at)
+                assistant_log = uow.add_message("assistant", final_feedback or EMPTY_FEEDBACK_TEXT, metadata)
+                uow.flush()
+
+                if payload is not None:
+                    # Enqueued inside the turn's transaction with the assistant message id,
+                    # so the worker can never finish before the job is linked to its ChatLog.
+                    logger.info(f"[Sessiz Değerlendirme] Kuyruğa ekleniyor: {payload['interpreted_action'] or raw_action[:60]}")
+                    job_id = evaluation_queue.enqueue(
+                        payload,
+                        chat_log_id=assistant_log.id if assistant_log is not None else None,
+                        db=uow.db,
+                    )
+                    if job_id is None:
+                        silent_evaluation = {"status": "skipped", "reason": "queue_full"}
+                    else:
+                        silent_evaluation = {"status": "queued", "job_id": job_id}
+                    metadata["silent_evaluation"] = silent_evaluation
+                    if assistant_log is not None:
+                        # Reassign so SQLAlchemy detects the JSON change
+                        assistant_log.metadata_json = dict(metadata)
+
+                score = assessment.get("score", 0)
+                uow.add_action_event(
+                    action=interpretation.get("interpreted_action") or "",
+                    score=score if isinstance(score, (int, float)) else 0.0,
+                    outcome=assessment.get("rule_outcome"),
+                    chat_log=assistant_log,
+                    latency_ms=int((datetime.datetime.utcnow() - turn.started_at).total_seconds() * 1000),
+                )
+
+                if user_log is not None:
+                    chat_log_ids = {"user": user_log.id, "assistant": assistant_log.id}
+            updated_state = uow.state
+        except Exception as e:
+            logger.exception("Failed to persist chat turn: %s", e)
+            chat_log_ids = {"user": None, "assistant": None}
+            job_id = None
+            silent_evaluation = {}
+            metadata["silent_evaluation"] = silent_evaluation
+
+        if job_id is not None:
+            evaluation_queue.notify()
 
         return {
-            "student_id": student_id,
+            "student_id": turn.student_id,
             "case_id": case_id,
             "llm_interpretation": interpretation,  # içinde 'explanatory_feedback' var (response_text gibi)
             "assessment": assessment,
             "silent_evaluation": silent_evaluation,  # YENI: MedGemma değerlendirmesi
             "final_feedback": final_feedback,
+            "state_delta": combined_updates,
             "updated_state": updated_state,
+            "session_id": turn.session_id,
+            "chat_log_ids": chat_log_ids,
+            "turn_metadata": metadata,
         }
 
-
 if __name__ == "__main__":
     """
     Test: Silent Evaluator Architecture
@@ -419,12 +956,24 @@ if __name__ == "__main__":
         
         print("\n🔬 MEDGEMMA SESSIZ DEĞERLENDİRME (Arka Plan):")
         silent_eval = result.get('silent_evaluation', {})
-        if silent_eval:
+        job_id = silent_eval.get('job_id')
+        if job_id:
+            # Demo amaçlı: kuyruktaki işin bitmesini kısa süre bekle
+            import time
+            for _ in range(30):
+                done = evaluation_queue.get_result(job_id)
+                if done:
+                    silent_eval = done
+                    break
+                time.sleep(1)
+        if silent_eval and 'job_id' not in silent_eval:
             print(f"   ✓ Klinik Doğruluk: {silent_eval.get('is_clinically_accurate', 'N/A')}")
             print(f"   ⚠️  Güvenlik İhlali: {silent_eval.get('safety_violation', 'N/A')}")
             print(f"   📝 MedGemma Geri Bildirimi: {silent_eval.get('feedback', 'N/A')}")
             if silent_eval.get('missing_critical_info'):
                 print(f"   ⚡ Eksik Bilgi: {silent_eval.get('missing_critical_info')}")
+        elif silent_eval:
+            print(f"   (Değerlendirme henüz tamamlanmadı: {silent_eval})")
         else:
             print("   (MedGemma değerlendirmesi mevcut değil - servis başlatılamadı)")
         
@@ -11,11 +11,20 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import logging
 
-from app.api.routers import chat, auth
-
 from dotenv import load_dotenv
 load_dotenv()  # .env dosyasını yükler
 
+from db.database import init_db
+
+# Apply pending schema migrations (or fail fast if DENTAI_AUTO_MIGRATE=0 and the
+# DB is behind) before the routers build the agent and start the queue workers.
+init_db()
+
+from app.api.middleware import GZipExceptStreamsMiddleware
+from app.api.routers import chat, auth
+from app.services.evaluation_queue import evaluation_queue
+from app.services.agent_registry import agent_registry
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -45,6 +54,10 @@ app.add_middleware(
     allow_headers=["*"],  # Allow all headers
 )
 
+# Gzip JSON bodies above 1 KB (chat history, metadata). /api/chat/stream is
+# bypassed explicitly so it keeps flushing token by token on any Starlette version.
+app.add_middleware(GZipExceptStreamsMiddleware, stream_paths={"/api/chat/stream"}, minimum_size=1000)
+
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["authentication"])
 app.include_router(chat.router, prefix="/api/chat", tags=["chat"])
@@ -79,11 +92,14 @@ def health_check():
 async def startup_event():
     logger.info("🚀 Dental Tutor API starting up...")
     logger.info("📚 API documentation available at: http://localhost:8000/docs")
+    # Load rule/case catalogs and build the default agent before the first request
+    agent_registry.warm_up()
 
 # Shutdown event
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("👋 Dental Tutor API shutting down...")
+    evaluation_queue.stop()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,30 @@
+"""
+API Middleware
+==============
+Response compression that never touches the Server-Sent Events routes.
+
+Starlette's GZipMiddleware only skips text/event-stream on recent releases;
+older ones buffer the stream into one gzip body, so the client sees no token
+until the turn is over. The stream routes are therefore bypassed by path,
+whatever Starlette version is installed.
+"""
+
+from typing import Iterable
+
+from fastapi.middleware.gzip import GZipMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+
+class GZipExceptStreamsMiddleware:
+    """GZipMiddleware for every HTTP route except the given (streaming) paths."""
+
+    def __init__(self, app: ASGIApp, stream_paths: Iterable[str], minimum_size: int = 500) -> None:
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+        self.stream_paths = frozenset(stream_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in self.stream_paths:
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
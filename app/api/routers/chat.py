@@ -2,34 +2,40 @@
 Chat Router
 ===========
 Endpoints for student-AI chat interactions.
-Reuses existing DentalEducationAgent from app/agent.py.
+Reuses the shared DentalEducationAgent from app/services/agent_registry.py.
 """
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Header, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 import os
+import json
 import logging
 
-from app.agent import DentalEducationAgent
-from app.assessment_engine import AssessmentEngine
-from app.scenario_manager import ScenarioManager
-from app.api.deps import get_current_user  # JWT authentication
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from app.services.agent_registry import agent_registry
+from app.services.llm_backends import local_backend_enabled
+from app.api.deps import get_current_user, get_db  # JWT authentication
+from db.database import StudentSession, ChatLog, EvaluationJob
+from db.retention import archived_messages
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Initialize the agent (same as Streamlit version)
+# Shared agent from the process-wide registry (same pooled instance Streamlit uses)
 try:
     GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
-    if not GEMINI_API_KEY:
+    if not GEMINI_API_KEY and not local_backend_enabled():
         logger.warning("⚠️ GEMINI_API_KEY not found in environment. Chat endpoint will fail.")
         agent = None
     else:
-        agent = DentalEducationAgent(
-            api_key=GEMINI_API_KEY,
-            model_name="models/gemini-2.5-flash-lite"
+        agent = agent_registry.get_agent(
+            model_name="models/gemini-2.5-flash-lite",
+            api_key=GEMINI_API_KEY
         )
         logger.info("✅ DentalEducationAgent initialized successfully")
 except Exception as e:
@@ -82,10 +88,33 @@ class ChatResponse(BaseModel):
         }
 
 
+class InterpretBatchRequest(BaseModel):
+    """
+    Batch interpretation request (re-grading / replaying historical messages).
+    Nothing is persisted: no state update, no chat log, no score change.
+    """
+    case_id: str = Field(..., description="Case the messages belong to", example="behcet_01")
+    messages: List[str] = Field(..., min_length=1, max_length=500, description="Raw student messages, in order")
+    revealed_findings: List[str] = Field(default_factory=list, description="Findings already revealed (scenario context)")
+
+
+class InterpretBatchItem(BaseModel):
+    index: int
+    message: str
+    interpretation: Dict[str, Any]
+    assessment: Dict[str, Any]
+
+
+class InterpretBatchResponse(BaseModel):
+    case_id: str
+    count: int
+    items: List[InterpretBatchItem]
+
+
 # ==================== ENDPOINTS ====================
 
 @router.post("/send", response_model=ChatResponse, status_code=status.HTTP_200_OK)
-def send_chat_message(
+async def send_chat_message(
     request: ChatRequest,
     current_user: str = Depends(get_current_user)  # JWT Authentication Required
 ):
@@ -96,9 +125,9 @@ def send_chat_message(
     
     This endpoint:
     1. Validates JWT token and extracts student_id
-    2. Calls DentalEducationAgent.process_student_input()
+    2. Awaits DentalEducationAgent.aprocess_student_input()
     3. Returns the AI's response and assessment
-    4. Automatically updates student state in the database
+    4. Persists the turn (state, user/assistant chat logs, queued MedGemma job) in one transaction
     
     The student_id is extracted from the JWT token, ensuring that users
     can only interact with their own sessions.
@@ -111,7 +140,7 @@ def send_chat_message(
     
     try:
         # Use authenticated student_id from JWT token (not from request)
-        result = agent.process_student_input(
+        result = await agent.aprocess_student_input(
             student_id=current_user,  # From JWT token
             raw_action=request.message,
             case_id=request.case_id
@@ -146,50 +175,269 @@ def send_chat_message(
         )
 
 
-@router.get("/history/{student_id}/{case_id}", status_code=status.HTTP_200_OK)
-def get_chat_history(student_id: str, case_id: str):
+def _sse_event(event: str, data: Dict[str, Any]) -> str:
+    """Format one Server-Sent Event frame."""
+    payload = json.dumps(data, ensure_ascii=False, default=str)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("/stream", status_code=status.HTTP_200_OK)
+async def stream_chat_message(
+    request: ChatRequest,
+    current_user: str = Depends(get_current_user)  # JWT Authentication Required
+):
+    """
+    Process a student's chat message and stream the AI response (Server-Sent Events).
+    
+    **Authentication Required:** Yes (Bearer token in Authorization header)
+    
+    Events:
+    - `token`: `{"text": "..."}` — next piece of the explanatory feedback
+    - `final`: same fields as `/send` (`final_feedback`, `score`, `metadata` incl. assessment and state delta)
+    - `error`: `{"detail": "..."}` — processing failed
+    """
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chat service is unavailable. GEMINI_API_KEY not configured."
+        )
+
+    async def event_source():
+        try:
+            async for event in agent.astream_student_input(
+                student_id=current_user,  # From JWT token
+                raw_action=request.message,
+                case_id=request.case_id
+            ):
+                if event["event"] == "final":
+                    result = event["data"]
+                    yield _sse_event("final", {
+                        "student_id": current_user,
+                        "case_id": result["case_id"],
+                        "final_feedback": result.get("final_feedback", ""),
+                        "score": result.get("assessment", {}).get("score", 0.0),
+                        "metadata": result,
+                    })
+                else:
+                    yield _sse_event(event["event"], event["data"])
+        except Exception as e:
+            logger.exception(f"Error streaming chat message: {e}")
+            yield _sse_event("error", {"detail": f"Failed to process message: {str(e)}"})
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post("/interpret-batch", response_model=InterpretBatchResponse, status_code=status.HTTP_200_OK)
+async def interpret_batch(
+    request: InterpretBatchRequest,
+    current_user: str = Depends(get_current_user)  # JWT Authentication Required
+):
     """
-    Get chat history for a student's session.
+    Interpret many student messages for one case in as few Gemini calls as possible.
+    
+    **Authentication Required:** Yes (Bearer token in Authorization header)
     
-    Returns all messages exchanged in this case session.
+    Messages are packed into batched requests (bounded parallelism); an item the
+    model fails on is retried on its own, so one bad message never fails the batch.
+    Each item is also scored with the case rules (read-only), in message order so
+    ordering and repeat rules apply across the batch.
+    """
+    if not agent:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chat service is unavailable. GEMINI_API_KEY not configured."
+        )
+
+    state = agent.scenario_manager.build_initial_state(request.case_id)
+    state["revealed_findings"] = list(request.revealed_findings)
+
+    try:
+        interpretations = await agent.ainterpret_actions_batch(request.messages, state)
+    except Exception as e:
+        logger.exception(f"Error interpreting batch: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to interpret batch: {str(e)}"
+        )
+
+    items = []
+    for i, (message, interpretation) in enumerate(zip(request.messages, interpretations)):
+        assessment = agent.assessment_engine.evaluate_action(request.case_id, interpretation, state)
+        # Carry the progress bitmap so ordering / repeat checks see the earlier messages
+        agent.scenario_manager.progress.apply(state, assessment.get("state_updates") or {})
+        items.append(InterpretBatchItem(index=i, message=message, interpretation=interpretation, assessment=assessment))
+    return InterpretBatchResponse(case_id=request.case_id, count=len(items), items=items)
+
+
+HISTORY_DEFAULT_LIMIT = 50
+HISTORY_MAX_LIMIT = 500
+
+
+def _history_etag(session_id: int, last_id: int, evaluated: int, variant: str) -> str:
+    """Weak validator: changes when a message is added or a silent evaluation lands."""
+    return f'W/"h{session_id}-{last_id}-{evaluated}-{variant}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # Weak comparison (RFC 9110): W/"x" == "x"
+    bare = etag[2:] if etag.startswith("W/") else etag
+    return "*" in candidates or any(
+        (tag[2:] if tag.startswith("W/") else tag) == bare for tag in candidates
+    )
+
+
+def _history_page(
+    messages: List[Dict[str, Any]], limit: int, after_id: Optional[int], before_id: Optional[int]
+) -> Tuple[List[Dict[str, Any]], bool, Optional[int]]:
+    """Same cursor semantics as the SQL keyset path, over an id-ordered list (archived sessions)."""
+    if before_id is not None:
+        older = [m for m in messages if m["id"] < before_id]
+        page = older[-limit:]
+        has_more = len(older) > limit
+        return page, has_more, page[0]["id"] if has_more and page else None
+    newer = [m for m in messages if m["id"] > (after_id or 0)]
+    page = newer[:limit]
+    return page, len(newer) > limit, page[-1]["id"] if page else after_id
+
+
+@router.get("/history/{student_id}/{case_id}", status_code=status.HTTP_200_OK)
+def get_chat_history(
+    student_id: str,
+    case_id: str,
+    response: Response,
+    limit: int = Query(HISTORY_DEFAULT_LIMIT, ge=1, le=HISTORY_MAX_LIMIT, description="Page size"),
+    after_id: Optional[int] = Query(None, ge=0, description="Return messages newer than this id (forward / polling)"),
+    before_id: Optional[int] = Query(None, ge=1, description="Return messages older than this id (scroll back)"),
+    include_metadata: bool = Query(True, description="Include metadata_json (assessment, silent evaluation)"),
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
     """
-    from db.database import SessionLocal, StudentSession, ChatLog
+    Get chat history for a student's latest session on a case, one page at a time.
+    
+    Pagination is keyset on the message id (ids grow with time within a session):
+    - no cursor: first `limit` messages of the session
+    - `after_id`: next `limit` messages after that id (pass `next_cursor` back here)
+    - `before_id`: the `limit` messages right before that id (older page)
+    Messages are always returned oldest-first; `has_more` tells whether another
+    page exists in the requested direction.
     
-    db = SessionLocal()
+    Responses carry an `ETag` (last message id + finished silent evaluations);
+    send it back as `If-None-Match` to get `304 Not Modified` while nothing changed.
+    `include_metadata=false` skips the metadata blobs entirely.
+    Sessions moved out by the retention job are read back from their archive.
+    """
+    if after_id is not None and before_id is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use either after_id or before_id, not both"
+        )
+
     try:
-        # Find the session
-        session = db.query(StudentSession).filter_by(
+        session = db.query(StudentSession.id, StudentSession.current_score, StudentSession.archived_at).filter_by(
             student_id=student_id,
             case_id=case_id
         ).order_by(StudentSession.start_time.desc()).first()
-        
+
         if not session:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail=f"No session found for student {student_id} on case {case_id}"
             )
-        
-        # Get chat logs
-        messages = db.query(ChatLog).filter_by(
-            session_id=session.id
-        ).order_by(ChatLog.timestamp).all()
-        
+
+        # Validator first (one index lookup); the page itself is only read on a miss
+        last_id = db.query(func.max(ChatLog.id)).filter(ChatLog.session_id == session.id).scalar() or 0
+        evaluated = 0
+        if include_metadata:
+            evaluated = (
+                db.query(func.count(EvaluationJob.id))
+                .join(ChatLog, ChatLog.id == EvaluationJob.chat_log_id)
+                .filter(ChatLog.session_id == session.id, EvaluationJob.status.in_(("done", "failed")))
+                .scalar()
+                or 0
+            )
+        variant = f"{'m' if include_metadata else 'n'}{limit}a{after_id if after_id is not None else ''}b{before_id or ''}"
+        if session.archived_at:
+            # Archive payloads only change when an archive run folds new messages in
+            variant += f"x{int(session.archived_at.timestamp())}"
+        etag = _history_etag(session.id, last_id, evaluated, variant)
+        headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+
+        if _etag_matches(if_none_match, etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        # Archived sessions: older messages live in session_archives, newer ones stay hot
+        archived = archived_messages(db, session.id) if session.archived_at else []
+        if archived:
+            last_id = max(last_id, archived[-1]["id"])
+
+        columns = [ChatLog.id, ChatLog.role, ChatLog.content, ChatLog.timestamp]
+        if include_metadata:
+            columns.append(ChatLog.metadata_json)
+        query = db.query(*columns).filter(ChatLog.session_id == session.id)
+
+        if archived:
+            hot = [
+                {
+                    "id": row.id,
+                    "role": row.role,
+                    "content": row.content,
+                    "timestamp": row.timestamp.isoformat() if row.timestamp else None,
+                    "metadata": row.metadata_json if include_metadata else None,
+                }
+                for row in query.order_by(ChatLog.id)
+            ]
+            rows, has_more, next_cursor = _history_page(archived + hot, limit, after_id, before_id)
+        else:
+            # One extra row tells whether another page exists
+            if before_id is not None:
+                rows = query.filter(ChatLog.id < before_id).order_by(ChatLog.id.desc()).limit(limit + 1).all()
+                has_more = len(rows) > limit
+                rows = list(reversed(rows[:limit]))
+                next_cursor = rows[0].id if has_more and rows else None
+            else:
+                rows = query.filter(ChatLog.id > (after_id or 0)).order_by(ChatLog.id).limit(limit + 1).all()
+                has_more = len(rows) > limit
+                rows = rows[:limit]
+                # Forward cursor is always the last id seen, so polling can resume from it
+                next_cursor = rows[-1].id if rows else after_id
+            rows = [
+                {
+                    "id": row.id,
+                    "role": row.role,
+                    "content": row.content,
+                    "timestamp": row.timestamp.isoformat() if row.timestamp else None,
+                    "metadata": row.metadata_json if include_metadata else None,
+                }
+                for row in rows
+            ]
+
+        messages = []
+        for row in rows:
+            message = {k: row[k] for k in ("id", "role", "content", "timestamp")}
+            if include_metadata:
+                message["metadata"] = row.get("metadata")
+            messages.append(message)
+
+        response.headers.update(headers)
         return {
             "student_id": student_id,
             "case_id": case_id,
             "session_id": session.id,
             "current_score": session.current_score,
-            "messages": [
-                {
-                    "role": msg.role,
-                    "content": msg.content,
-                    "timestamp": msg.timestamp.isoformat() if msg.timestamp else None,
-                    "metadata": msg.metadata_json
-                }
-                for msg in messages
-            ]
+            "last_message_id": last_id,
+            "next_cursor": next_cursor,
+            "has_more": has_more,
+            "messages": messages,
         }
-    
+
     except HTTPException:
         raise
     except Exception as e:
@@ -198,8 +446,6 @@ def get_chat_history(student_id: str, case_id: str):
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch chat history: {str(e)}"
         )
-    finally:
-        db.close()
 
 
 @router.get("/status", status_code=status.HTTP_200_OK)
@@ -211,5 +457,7 @@ def chat_service_status():
         "service": "chat",
         "status": "operational" if agent else "unavailable",
         "agent_initialized": agent is not None,
-        "model": "gemini-2.5-flash-lite" if agent else None
+        "model": "gemini-2.5-flash-lite" if agent else None,
+        "interpretation_cache": agent.interpretation_cache.stats() if agent else None,
+        "prompt_tokens": agent.prompt_compiler.token_report() if agent else None
     }
@@ -1,89 +1,86 @@
 from __future__ import annotations
 
-import json
 import os
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Mapping, Optional
+
+from app import progress
+from app.intake_questions import INTAKE_ACTION_MAP, INTAKE_CASE_PREFIXES
+from app.intent_classifier import action_label
+from app.services.rule_index import (
+    SEQUENCE_OK,
+    CompiledRule,
+    RuleCatalog,
+    RuleIndex,
+    SequenceRule,
+    SequenceVerdict,
+    get_rule_catalog,
+)
 
 logger = logging.getLogger(__name__)
 
 
 class AssessmentEngine:
     """
-    Loads scoring rules and evaluates interpreted actions against case-specific rules.
-    Rules file: ../data/scoring_rules.json (relative to this file).
+    Evaluates interpreted actions against case-specific scoring rules.
+    Rules file: ../data/scoring_rules.json (relative to this file), compiled into a
+    shared, hot-reloading RuleIndex (see app/services/rule_index.py).
     """
 
     def __init__(self, rules_path: Optional[str] = None) -> None:
         self._rules_path = rules_path or os.path.normpath(
             os.path.join(os.path.dirname(__file__), "..", "data", "scoring_rules.json")
         )
-        self._rules: List[Dict[str, Any]] = []
-        self._load_rules()
+        # Engines over the same file share one catalog: the file is parsed once per process
+        self._catalog: RuleCatalog = get_rule_catalog(self._rules_path)
 
-    def _load_rules(self) -> None:
-        """
-        Load rules from JSON.
-        On error (file not found or JSON error), log and keep an empty rules list.
-        Expected top-level structure: List[case_rule_object].
-        """
-        try:
-            with open(self._rules_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            if isinstance(data, list):
-                self._rules = data
-            else:
-                logger.error("Invalid rules format (expected list): %s", type(data).__name__)
-                self._rules = []
-        except FileNotFoundError:
-            logger.error("Scoring rules file not found: %s", self._rules_path)
-            self._rules = []
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse scoring rules JSON: %s", e)
-            self._rules = []
-
-    def _find_rule(self, case_id: str, interpreted_action: str) -> Optional[Dict[str, Any]]:
-        """
-        Find a rule matching the given case_id and interpreted_action.
-        Looks inside 'rules' (preferred) or 'actions' (fallback) for entries where
-        rule['target_action'] == interpreted_action.
-        """
+    @property
+    def rule_index(self) -> RuleIndex:
+        return self._catalog.index()
+
+    def _find_rule(self, case_id: str, interpreted_action: str) -> Optional[CompiledRule]:
+        """O(1) lookup of the rule for (case_id, target_action)."""
         if not case_id or not interpreted_action:
             return None
+        return self._catalog.index().rule(case_id, interpreted_action)
 
-        for entry in self._rules:
-            if not isinstance(entry, dict):
-                continue
-            if entry.get("case_id") != case_id:
-                continue
-
-            rules_list = entry.get("rules")
-            if rules_list is None:
-                rules_list = entry.get("actions", [])
-            if not isinstance(rules_list, list):
-                logger.warning("Rules list for case_id '%s' is not a list.", case_id)
-                return None
-
-            for rule in rules_list:
-                if isinstance(rule, dict) and rule.get("target_action") == interpreted_action:
-                    return rule
-            # If case_id matched but no rule matched, stop searching further case entries
-            return None
+    def get_rule(self, case_id: str, interpreted_action: str) -> Optional[Mapping[str, Any]]:
+        """Public rule lookup (used e.g. by the agent's local fast path for feedback text). Read-only."""
+        rule = self._find_rule(case_id, interpreted_action)
+        return rule.raw if rule is not None else None
 
-        return None
+    def get_case_actions(self, case_id: str) -> List[str]:
+        """
+        Action keys the prompt compiler offers for a case: scorable target_actions
+        in rule order, then actions only named by ordering rules (requires / forbidden_after).
+        """
+        return list(self._catalog.index().prompt_actions(case_id))
 
-    def evaluate_action(self, case_id: str, interpretation: Dict[str, Any]) -> Dict[str, Any]:
+    def evaluate_action(
+        self, case_id: str, interpretation: Dict[str, Any], state: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
         """
         Evaluate an interpreted action for a specific case.
 
+        With the session `state`, rules using the sequence DSL (requires /
+        forbidden_after, see app/services/rule_index.py) are checked against the
+        actions already marked in the session's progress bitmap (app/progress.py),
+        and an action that would score positive a second time scores 0. Without
+        it each action is scored in isolation.
+
+        state_updates name the action in "progress_action" (rule actions, actions
+        ordering rules refer to, and intake questions of intake cases) so
+        ScenarioManager can mark it in the bitmap.
+
         Returns:
         - If matched:
             {
               "score": int|float,
               "score_change": int|float,
               "rule_outcome": str,
-              "action_effect": Any
+              "action_effect": Any,
+              "state_updates": dict,
+              "sequence_violation": {"kind": ..., "actions": [...]}   # only when an ordering rule fired
             }
         - If not matched:
             {
@@ -106,20 +103,63 @@ class AssessmentEngine:
         interpreted_action = interpretation.get("interpreted_action")
         if not isinstance(interpreted_action, str) or not interpreted_action.strip():
             return default_result
+        interpreted_action = interpreted_action.strip()
+
+        case = self._catalog.index().cases.get(case_id) if case_id else None
+        rule = case.rules.get(interpreted_action) if case is not None else None
+
+        verdict = SEQUENCE_OK
+        sequence = case.sequence if case is not None else None
+        if sequence is not None and isinstance(state, dict) and interpreted_action in sequence.rules:
+            verdict = sequence.check(progress.sequence_mask(state, sequence), interpreted_action)
 
-        rule = self._find_rule(case_id, interpreted_action.strip())
         if not rule:
+            tracked = (sequence is not None and interpreted_action in sequence.bits) or (
+                case_id and case_id.startswith(INTAKE_CASE_PREFIXES) and interpreted_action in INTAKE_ACTION_MAP
+            )
+            if tracked:
+                # Unscored, but a later rule may require it (or it counts toward intake progress)
+                return {**default_result, "state_updates": {progress.PROGRESS_ACTION_KEY: interpreted_action}}
             return default_result
 
-        score = rule.get("score", 0)
-        outcome = rule.get("rule_outcome", "Unscored")
-        effect = rule.get("action_effect")
-        state_updates = rule.get("state_updates", {})
+        result = {
+            "score": rule.score,
+            "score_change": rule.score,
+            "rule_outcome": rule.rule_outcome,
+            "action_effect": rule.action_effect,
+            # Rules are shared across agents (AgentRegistry); every caller gets its own copy
+            "state_updates": rule.state_updates(),
+        }
+        if verdict.kind != "ok":
+            result.update(self._sequence_outcome(sequence.rules[interpreted_action], verdict))
+            result["state_updates"]["score_change"] = result["score"]
+        score = result["score"]
+        if isinstance(score, (int, float)) and score > 0 and progress.is_done(state, interpreted_action):
+            # Also covers a positive partial-credit penalty: no points twice for the same step
+            result.update(self._repeat_outcome(rule))
+            result["state_updates"]["score_change"] = 0
+        result["state_updates"][progress.PROGRESS_ACTION_KEY] = interpreted_action
+        return result
+
+    @staticmethod
+    def _repeat_outcome(rule: CompiledRule) -> Dict[str, Any]:
+        return {
+            "score": 0,
+            "score_change": 0,
+            "rule_outcome": "Bu adım daha önce yapıldı; tekrar puan verilmez.",
+            "sequence_violation": {"kind": "repeat", "actions": [rule.target_action]},
+        }
 
+    @staticmethod
+    def _sequence_outcome(seq_rule: SequenceRule, verdict: SequenceVerdict) -> Dict[str, Any]:
+        names = ", ".join(action_label(a) for a in verdict.actions)
+        if verdict.kind == "requires":
+            default_outcome = f"Sıra hatası: önce şu adım(lar) yapılmalıydı: {names}."
+        else:
+            default_outcome = f"Sıra hatası: bu adım şunlardan sonra yapılmamalıydı: {names}."
         return {
-            "score": score,
-            "score_change": score,
-            "rule_outcome": outcome,
-            "action_effect": effect,
-            "state_updates": state_updates,
-        }
\ No newline at end of file
+            "score": seq_rule.penalty_score,
+            "score_change": seq_rule.penalty_score,
+            "rule_outcome": seq_rule.penalty_outcome or default_outcome,
+            "sequence_violation": {"kind": verdict.kind, "actions": list(verdict.actions)},
+        }
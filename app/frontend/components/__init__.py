@@ -2,10 +2,11 @@
 Reusable UI Components for Dental Tutor AI
 """
 
-from .sidebar import render_sidebar, CASE_OPTIONS, MODEL_OPTIONS, DEFAULT_MODEL
+from .sidebar import render_sidebar, get_case_options, CASE_OPTIONS, MODEL_OPTIONS, DEFAULT_MODEL
 
 __all__ = [
     'render_sidebar',
+    'get_case_options',
     'CASE_OPTIONS',
     'MODEL_OPTIONS',
     'DEFAULT_MODEL'
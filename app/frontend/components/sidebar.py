@@ -8,16 +8,16 @@ import streamlit as st
 from typing import Optional, Dict, Callable
 import os
 
+from app.services.case_catalog import get_case_catalog
 
-# Case options configuration
-CASE_OPTIONS = {
-    "Oral Liken Planus (Orta)": "olp_001",
-    "Kronik Periodontitis (Zor)": "perio_001",
-    "Primer Herpes (Orta)": "herpes_primary_01",
-    "Behçet Hastalığı (Zor)": "behcet_01",
-    "Sekonder Sifiliz (Zor)": "syphilis_02",
-    "Kronik Deskuamatif Gingivitis (Zor)": "desquamative_01"
-}
+
+# Case options: menu label -> case_id, generated from data/case_scenarios.json
+def get_case_options() -> Dict[str, str]:
+    return get_case_catalog().index().menu()
+
+
+# Snapshot at import time (kept for existing imports; render_sidebar reads the live catalog)
+CASE_OPTIONS = get_case_options()
 
 DEFAULT_MODEL = "models/gemini-2.5-flash-lite"
 MODEL_OPTIONS = [
@@ -68,12 +68,13 @@ def render_sidebar(
         if show_case_selector:
             st.subheader("📂 Vaka Seçimi")
             
+            case_options = get_case_options()
             selected_case_name = st.selectbox(
                 "Aktif Vaka:",
-                list(CASE_OPTIONS.keys()),
+                list(case_options.keys()),
                 key="case_selector"
             )
-            selected_case_id = CASE_OPTIONS[selected_case_name]
+            selected_case_id = case_options.get(selected_case_name) or get_case_catalog().index().default_case_id
             
             # Initialize or update current case
             if "current_case_id" not in st.session_state:
@@ -6,6 +6,9 @@ from typing import Any, Dict, Iterable, List, Optional
 DEFAULT_SCORE = 2
 HIGH_PRIORITY_SCORE = 3
 
+# Cases whose scenario is a periodontal intake (anamnez formu)
+INTAKE_CASE_PREFIXES = ("perio_",)
+
 INTAKE_QUESTION_SECTIONS: List[Dict[str, Any]] = [
     {
         "id": "demographics",
@@ -231,4 +234,4 @@ def get_intake_progress(state: Optional[Dict[str, Any]]) -> Dict[str, Dict[str,
 
 
 def get_completed_count(intake_responses: Dict[str, Dict[str, Any]]) -> int:
-    return sum(1 for data in intake_responses.values() if data.get("completed")) to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions_create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file#+#+#+#+ to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions_create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions_create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functions.create_file to=functionsionale
\ No newline at end of file
+    return sum(1 for data in intake_responses.values() if data.get("completed"))
@@ -0,0 +1,369 @@
+"""
+Local fast-path intent classifier.
+
+Maps Turkish student input to (CHAT | ACTION, action key, confidence) without
+an LLM call. All keyword patterns are compiled once into an Aho-Corasick
+automaton, so a message is scanned in a single pass regardless of how many
+patterns exist. Matching is done on Turkish-normalized text and patterns are
+anchored at word starts (Turkish suffixes may follow: "ateş" matches "ateşini").
+
+Negated messages ("antibiyotik yazmıyorum", "alerjisi yok") name an action
+without performing it; they are flagged (blocked_by = "negation") with
+confidence 0, so the agent always asks the LLM for them. Questions are how
+history is taken ("alerjiniz var mı?" is check_allergies_meds), so a question
+that matches a history-taking action is classified as usual; any other
+question ("antibiyotik yazalım mı?") is flagged (blocked_by = "question") and
+its confidence scaled by QUESTION_PENALTY, below the fast-path threshold.
+
+Used by:
+- DentalEducationAgent.interpret_action (skips Gemini above a confidence threshold)
+- app.mock_responses (quota fallback)
+"""
+
+import re
+from collections import deque
+from typing import Any, Dict, Iterable, List, Tuple
+
+from app.intake_questions import INTAKE_ACTION_MAP
+from app.text_normalization import normalize_student_text
+
+# action_key -> [(pattern, weight)]
+# Weight ~ how strongly the pattern alone identifies the action (0..1].
+ACTION_PATTERNS: Dict[str, List[Tuple[str, float]]] = {
+    # Vital signs / fever
+    "check_vital_signs": [
+        ("ateş", 0.9), ("ateşini ölç", 1.0), ("vital", 0.9), ("vital bulgu", 1.0),
+        ("tansiyon", 0.9), ("kan basıncı", 1.0), ("nabız", 0.9), ("nabzını", 1.0),
+    ],
+    "check_fever": [("ateş öykü", 1.0), ("ateşi oldu", 1.0), ("vücut sıcaklığı", 0.9)],
+
+    # Examinations
+    "perform_oral_exam": [
+        ("muayene", 0.6), ("oral muayene", 1.0), ("ağız muayene", 1.0), ("ağız içi muayene", 1.0),
+        ("ağız içini muayene", 1.0), ("intraoral", 1.0), ("mukoza", 0.7), ("ağzına bak", 0.9),
+        ("ağız içine bak", 1.0), ("lezyonlara bak", 0.8),
+    ],
+    "perform_extraoral_exam": [
+        ("ekstraoral", 1.0), ("extraoral", 1.0), ("ağız dışı muayene", 1.0), ("lenf nod", 0.9),
+        ("lenf düğüm", 0.9), ("cilt muayene", 0.9), ("deri muayene", 0.9), ("deriye bak", 0.9),
+    ],
+
+    # Tests
+    "perform_pathergy_test": [("paterji", 1.0), ("pathergy", 1.0)],
+    "request_serology_tests": [
+        ("seroloji", 1.0), ("serolojik", 1.0), ("vdrl", 1.0), ("tpha", 1.0), ("rpr", 1.0),
+        ("kan testi", 0.8), ("kan tahlili", 0.8),
+    ],
+    "perform_nikolsky_test": [("nikolsky", 1.0), ("nikolski", 1.0)],
+    "request_dif_biopsy": [
+        ("biyopsi", 0.8), ("dif biyopsi", 1.0), ("immünofloresan", 1.0), ("immunofloresan", 1.0),
+    ],
+    "order_radiograph": [("röntgen", 1.0), ("radyograf", 1.0), ("panoramik", 1.0), ("periapikal", 0.9)],
+
+    # History taking
+    "ask_systemic_symptoms": [
+        ("sistemik", 0.9), ("sistemik semptom", 1.0), ("genital", 0.9), ("eklem ağrı", 0.8),
+        ("vücudunun başka", 0.8), ("başka yerinde", 0.7),
+    ],
+    "gather_medical_history": [
+        ("tıbbi geçmiş", 1.0), ("tıbbi öykü", 1.0), ("kronik hastalı", 0.9), ("anamnez", 0.8),
+        ("geçirdiği hastalık", 0.9),
+    ],
+    "gather_personal_info": [("adınız", 0.9), ("kaç yaşında", 0.9), ("mesleğ", 0.8)],
+    "check_allergies_meds": [
+        ("alerji", 1.0), ("ilaç", 0.8), ("kullandığı ilaç", 1.0), ("ilaç kullan", 1.0),
+    ],
+    "check_pacemaker": [("kalp pili", 1.0), ("pacemaker", 1.0)],
+    "check_bleeding_disorder": [
+        ("kanama bozuk", 1.0), ("pıhtılaşma", 1.0), ("kan sulandırıcı", 1.0), ("antikoagülan", 1.0),
+        ("kanama", 0.6),
+    ],
+    "check_diabetes": [("diyabet", 1.0), ("şeker hastalı", 1.0), ("kan şeker", 0.9), ("hba1c", 1.0)],
+    "check_smoking_history": [("sigara", 1.0), ("tütün", 1.0)],
+    "check_oral_hygiene_habits": [
+        ("diş fırçala", 1.0), ("fırçalama", 0.9), ("ağız hijyen", 1.0), ("oral hijyen", 1.0), ("diş ipi", 1.0),
+    ],
+    "ask_hydration_nutrition": [
+        ("sıvı alım", 1.0), ("su iç", 0.9), ("beslen", 0.9), ("yemek yiyebil", 0.9), ("yeme içme", 1.0),
+    ],
+
+    # Treatment
+    "prescribe_antibiotics": [
+        ("antibiyotik", 1.0), ("amoksisilin", 1.0), ("amoxicillin", 1.0), ("penisilin", 0.9),
+        ("klindamisin", 1.0), ("metronidazol", 1.0),
+    ],
+    "prescribe_palliative_care": [
+        ("destekleyici tedavi", 1.0), ("palyatif", 1.0), ("semptomatik tedavi", 1.0),
+        ("ağrı kesici", 0.8), ("analjezik", 0.8), ("gargara", 0.7),
+    ],
+    "refer_oral_surgery": [("cerrahiye sevk", 1.0), ("ağız cerrahisi", 0.9)],
+
+    # Diagnosis (require a diagnosis cue, see DIAGNOSIS_CUES)
+    "diagnose_herpetic_gingivostomatitis": [("herpetik gingivostomatit", 1.0), ("herpes", 0.8), ("herpetik", 0.8)],
+    "diagnose_primary_herpes": [("primer herpes", 1.0)],
+    "diagnose_behcet_disease": [("behçet", 1.0), ("behcet", 1.0)],
+    "diagnose_secondary_syphilis": [("sifiliz", 1.0), ("frengi", 1.0), ("syphilis", 1.0)],
+    "diagnose_mucous_membrane_pemphigoid": [("pemfigoid", 1.0), ("müköz membran pemfigoid", 1.0)],
+    "diagnose_pulpitis": [("pulpit", 1.0)],
+}
+
+# Turkish labels for feedback text (the UI never shows raw action keys)
+ACTION_LABELS: Dict[str, str] = {
+    "check_vital_signs": "Vital bulguların kontrolü",
+    "check_fever": "Ateş öyküsünün sorgulanması",
+    "perform_oral_exam": "Ağız içi muayene",
+    "perform_extraoral_exam": "Ağız dışı muayene",
+    "perform_pathergy_test": "Paterji testi",
+    "request_serology_tests": "Serolojik testlerin istenmesi",
+    "perform_nikolsky_test": "Nikolsky testi",
+    "request_dif_biopsy": "Biyopsi (DİF) istenmesi",
+    "order_radiograph": "Radyografi istenmesi",
+    "ask_systemic_symptoms": "Sistemik semptomların sorgulanması",
+    "gather_medical_history": "Tıbbi geçmişin sorgulanması",
+    "gather_personal_info": "Kişisel bilgilerin alınması",
+    "check_allergies_meds": "Alerji ve ilaç kullanımının sorgulanması",
+    "check_pacemaker": "Kalp pili sorgusu",
+    "check_bleeding_disorder": "Kanama bozukluğu sorgusu",
+    "check_diabetes": "Diyabet sorgusu",
+    "check_smoking_history": "Sigara kullanımının sorgulanması",
+    "check_oral_hygiene_habits": "Ağız hijyeni alışkanlıklarının sorgulanması",
+    "ask_hydration_nutrition": "Sıvı alımı ve beslenmenin sorgulanması",
+    "prescribe_antibiotics": "Antibiyotik reçetesi",
+    "prescribe_palliative_care": "Destekleyici (palyatif) tedavi",
+    "refer_oral_surgery": "Ağız cerrahisine sevk",
+    "diagnose_herpetic_gingivostomatitis": "Herpetik gingivostomatit tanısı",
+    "diagnose_primary_herpes": "Primer herpes tanısı",
+    "diagnose_behcet_disease": "Behçet hastalığı tanısı",
+    "diagnose_secondary_syphilis": "Sekonder sifiliz tanısı",
+    "diagnose_mucous_membrane_pemphigoid": "Müköz membran pemfigoid tanısı",
+    "diagnose_pulpitis": "Pulpitis tanısı",
+}
+
+
+def action_label(action_key: str) -> str:
+    """Turkish label of an action key (intake questions use their question text)."""
+    label = ACTION_LABELS.get(action_key)
+    if label:
+        return label
+    question = INTAKE_ACTION_MAP.get(action_key)
+    if question:
+        return question["question"].rstrip(".?")
+    return "Klinik adım"
+
+
+# Naming a disease is not the same as diagnosing it: without one of these cues
+# diagnose_* scores are halved so the turn falls through to the LLM.
+DIAGNOSIS_CUES: List[str] = ["tanı", "teşhis", "düşünüyorum", "olduğunu", "tanısı"]
+
+# chat kind -> patterns (the agent answers each kind differently)
+CHAT_PATTERNS: Dict[str, List[str]] = {
+    "greeting": ["merhaba", "selam", "günaydın", "iyi günler", "iyi akşamlar", "nasılsınız", "nasılsın", "kolay gelsin"],
+    "thanks": ["teşekkür", "sağ ol", "sağol"],
+    "closing": ["hoşça kal", "görüşürüz"],
+}
+
+DIAGNOSIS_PENALTY = 0.5
+QUESTION_PENALTY = 0.5
+MAX_CHAT_WORDS = 6
+
+# Negation: standalone words, and the negative verb suffix -ma/-me followed by a
+# tense / mood suffix (yazmıyorum, yapmadan, vermeyecek, gerekmez, yazmam, almadı)
+NEGATION_WORDS = frozenset({"değil", "yok", "hayır", "olmadan", "gerekmez", "gerekmiyor"})
+_NEGATION_SUFFIX_RE = re.compile(
+    r"\w{2,}?m[ıiuü]yor"
+    r"|\w{2,}?m[ae](?:d[ae]n|y[ae]c[ae]k|m[ae]l[ıi]|y[ıi]n|d[ıi]|m[ıi]ş|z|m|y[ıi]z|s[ıi]n)(?:\w*)$"
+)
+# Question particles as separate words: mı / mi / mu / mü (+ person / copula suffixes)
+_QUESTION_PARTICLE_RE = re.compile(r"^m[ıiuü](?:y[ıiuü]m|s[ıiuü]n|y[ıiuü]z|s[ıiuü]n[ıiuü]z|d[ıiuü]r|yd[ıiuü])?$")
+
+
+def detect_blocker(text: str, normalized: str) -> str:
+    """'question', 'negation' or '' for a message (raw text is needed for '?')."""
+    words = normalized.split()
+    if "?" in (text or "") or any(_QUESTION_PARTICLE_RE.match(w) for w in words):
+        return "question"
+    if any(w in NEGATION_WORDS or _NEGATION_SUFFIX_RE.match(w) for w in words):
+        return "negation"
+    return ""
+
+_CLINICAL_INTENT_BY_PREFIX = [
+    ("diagnose_", "diagnosis_gathering"),
+    ("prescribe_", "treatment_planning"),
+    ("refer_", "treatment_planning"),
+    ("order_radiograph", "radiography"),
+    ("check_vital_signs", "diagnosis_gathering"),
+    ("perform_", "diagnosis_gathering"),
+    ("request_", "diagnosis_gathering"),
+]
+
+
+def clinical_intent_for(action_key: str) -> str:
+    """Coarse clinical_intent category for an action key (matches the LLM schema)."""
+    for prefix, intent in _CLINICAL_INTENT_BY_PREFIX:
+        if action_key.startswith(prefix):
+            return intent
+    return "history_taking"
+
+
+class AhoCorasick:
+    """Minimal Aho-Corasick automaton over characters; payloads are returned per match."""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[Tuple[int, Any]]] = [[]]  # (pattern_length, payload)
+
+        for pattern, payload in patterns:
+            if pattern:
+                self._add(pattern, payload)
+        self._build()
+
+    def _add(self, pattern: str, payload: Any) -> None:
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append((len(pattern), payload))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[nxt] = self._goto[f].get(ch, 0) if node else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def iter_matches(self, text: str):
+        """Yield (start_index, payload) for every pattern occurrence in text."""
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for length, payload in self._out[node]:
+                yield i - length + 1, payload
+
+
+class IntentClassifier:
+    """
+    Keyword-based CHAT/ACTION classifier with per-action confidence.
+
+    Per-action score combines matched pattern weights as a noisy-OR
+    (1 - Π(1 - w)), so overlapping patterns reinforce without exceeding 1.
+    Confidence for the winning action is its score scaled by the margin over
+    the runner-up, so ambiguous inputs get low confidence.
+    """
+
+    def __init__(self) -> None:
+        entries: List[Tuple[str, Any]] = []
+        for action, patterns in ACTION_PATTERNS.items():
+            for pattern, weight in patterns:
+                entries.append((normalize_student_text(pattern), ("action", action, weight)))
+        for chat_kind, patterns in CHAT_PATTERNS.items():
+            for pattern in patterns:
+                entries.append((normalize_student_text(pattern), ("chat", chat_kind, 1.0)))
+        for pattern in DIAGNOSIS_CUES:
+            entries.append((normalize_student_text(pattern), ("cue", None, 1.0)))
+        self._automaton = AhoCorasick(entries)
+
+    def classify(self, text: str) -> Dict[str, Any]:
+        """
+        Returns:
+        {
+          "decision": "ACTION" | "CHAT" | "UNKNOWN",
+          "interpreted_action": str | None,
+          "confidence": float (0..1),
+          "scores": {action_key: score},
+          "matched_patterns": [str],
+          "blocked_by": "" | "negation" | "question",  # negation: confidence 0; question: scaled down
+          "chat_kind": "greeting" | "thanks" | "closing" | None   # CHAT only
+        }
+        """
+        normalized = normalize_student_text(text)
+        blocked_by = detect_blocker(text, normalized)
+
+        miss_probability: Dict[str, float] = {}
+        matched: List[str] = []
+        chat_kinds = set()
+        diagnosis_cue = False
+
+        for start, (kind, action, weight) in self._automaton.iter_matches(normalized):
+            # Anchor at word starts (suffixes after the pattern are allowed)
+            if start > 0 and normalized[start - 1].isalnum():
+                continue
+            if kind == "chat":
+                chat_kinds.add(action)
+            elif kind == "cue":
+                diagnosis_cue = True
+            else:
+                miss_probability[action] = miss_probability.get(action, 1.0) * (1.0 - weight)
+                matched.append(action)
+
+        scores = {action: 1.0 - miss for action, miss in miss_probability.items()}
+        if not diagnosis_cue:
+            for action in scores:
+                if action.startswith("diagnose_"):
+                    scores[action] *= DIAGNOSIS_PENALTY
+
+        if scores:
+            ranked = sorted(scores.items(), key=lambda kv: kv[1], reverse=True)
+            top_action, top = ranked[0]
+            second = ranked[1][1] if len(ranked) > 1 else 0.0
+            confidence = top * (1.0 - second / top) if top > 0 else 0.0
+            if blocked_by == "question" and clinical_intent_for(top_action) == "history_taking":
+                # Asking the patient performs the history-taking step
+                blocked_by = ""
+            if blocked_by == "negation":
+                confidence = 0.0
+            elif blocked_by == "question":
+                confidence *= QUESTION_PENALTY
+            return {
+                "decision": "ACTION",
+                "interpreted_action": top_action,
+                "confidence": round(confidence, 3),
+                "scores": scores,
+                "matched_patterns": sorted(set(matched)),
+                "blocked_by": blocked_by,
+                "chat_kind": None,
+            }
+
+        if chat_kinds:
+            # Short greetings/thanks are CHAT; long messages may hide an action we do not know.
+            confidence = 0.95 if len(normalized.split()) <= MAX_CHAT_WORDS else 0.5
+            return {
+                "decision": "CHAT",
+                "interpreted_action": "general_chat",
+                "confidence": confidence,
+                "scores": {},
+                "matched_patterns": [],
+                "blocked_by": "",
+                "chat_kind": next(kind for kind in CHAT_PATTERNS if kind in chat_kinds),
+            }
+
+        return {
+            "decision": "UNKNOWN",
+            "interpreted_action": None,
+            "confidence": 0.0,
+            "scores": {},
+            "matched_patterns": [],
+            "blocked_by": blocked_by,
+            "chat_kind": None,
+        }
+
+
+# Singleton instance (automaton is compiled once per process)
+intent_classifier = IntentClassifier()
+
+
+def classify_intent(text: str) -> Dict[str, Any]:
+    return intent_classifier.classify(text)
@@ -0,0 +1,330 @@
+"""
+Tolerant JSON extraction from LLM output.
+
+One incremental, brace-balanced scanner replaces the per-service heuristics
+(json.loads retries, fence regexes, greedy `{.*}` matches):
+
+- Finds the first JSON object/array in free text (prose, ```json fences, ...),
+  tracking strings and escapes so braces inside values do not confuse it.
+- Calls json.loads once per candidate; a candidate that fails to parse (e.g.
+  "{...}" in prose) is skipped and scanning resumes right after its start.
+- Recovers truncated output (max_output_tokens): open strings are closed, and
+  if that is not enough the text is cut back to the last complete member
+  before the missing brackets are appended.
+- Validates / coerces objects against a small field schema.
+
+Used by DentalEducationAgent (Gemini interpretations, batch arrays, streamed
+feedback) and MedGemmaService (validation JSON).
+"""
+
+import copy
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# field -> (accepted type or tuple of types, default)
+FieldSchema = Dict[str, Tuple[Any, Any]]
+
+_OPENERS = {"{": "}", "[": "]"}
+_MAX_RECOVERY_ATTEMPTS = 8
+
+
+class JsonExtractionError(ValueError):
+    """No usable JSON could be extracted (or it failed schema validation)."""
+
+
+class JsonScanner:
+    """
+    Incremental JSON finder. feed() text as it arrives (whole responses or
+    stream chunks); `value` is set as soon as the first complete, valid JSON
+    value has been seen. finish() attempts partial recovery if it never was.
+    """
+
+    def __init__(self, expect: Optional[str] = None) -> None:
+        if expect == "object":
+            self._openers = "{"
+        elif expect == "array":
+            self._openers = "["
+        else:
+            self._openers = "{["
+
+        self.value: Any = None
+        self.complete = False
+        self.partial = False
+        self.truncated_key: Optional[str] = None  # key whose string value was cut off (partial only)
+
+        self._buf = ""
+        self._pos = 0
+        self._start: Optional[int] = None
+        # frame: [opener, expecting_key, last_key]
+        self._stack: List[list] = []
+        self._in_string = False
+        self._escape = False
+        self._string_is_key = False
+        self._string_start = 0
+        # (cut index, opener chars of the stack at that point)
+        self._safe_points: List[Tuple[int, str]] = []
+
+    @property
+    def found(self) -> bool:
+        """True once the start of a JSON value has been seen."""
+        return self.complete or self._start is not None
+
+    def feed(self, chunk: str) -> Any:
+        """Scan more text; returns the value once complete (None until then)."""
+        if self.complete or not chunk:
+            return self.value
+        self._buf += chunk
+        self._scan()
+        return self.value
+
+    def finish(self, allow_partial: bool = True) -> Any:
+        """Value of the first complete JSON, else (optionally) a recovered prefix, else None."""
+        if self.complete:
+            return self.value
+        if not allow_partial or self._start is None:
+            return None
+        return self._recover()
+
+    # ==================== SCANNING ====================
+
+    def _reset_candidate(self) -> None:
+        self._start = None
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._safe_points = []
+
+    def _scan(self) -> None:
+        buf = self._buf
+        n = len(buf)
+        pos = self._pos
+
+        while pos < n:
+            if self._start is None:
+                # Jump straight to the next possible opener
+                nxt = min((i for i in (buf.find(o, pos) for o in self._openers) if i != -1), default=-1)
+                if nxt == -1:
+                    pos = n
+                    break
+                self._start = nxt
+                self._stack = [[buf[nxt], True, None]]
+                self._safe_points = [(nxt + 1, buf[nxt])]
+                pos = nxt + 1
+                continue
+
+            ch = buf[pos]
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                    if self._string_is_key:
+                        self._stack[-1][2] = buf[self._string_start + 1:pos]
+                pos += 1
+                continue
+
+            top = self._stack[-1]
+            if ch == '"':
+                self._in_string = True
+                self._string_is_key = top[0] == "{" and top[1]
+                self._string_start = pos
+            elif ch in _OPENERS:
+                self._stack.append([ch, True, None])
+                self._safe_points.append((pos + 1, "".join(f[0] for f in self._stack)))
+            elif ch == "}" or ch == "]":
+                self._stack.pop()
+                if not self._stack:
+                    candidate = buf[self._start:pos + 1]
+                    try:
+                        self.value = json.loads(candidate)
+                        self.complete = True
+                        self._pos = pos + 1
+                        return
+                    except ValueError:
+                        # Not JSON after all (e.g. "{...}" in prose): resume after this opener
+                        pos = self._start + 1
+                        self._reset_candidate()
+                        continue
+            elif ch == ":":
+                top[1] = False
+            elif ch == ",":
+                self._safe_points.append((pos, "".join(f[0] for f in self._stack)))
+                if top[0] == "{":
+                    top[1] = True
+            pos += 1
+
+        self._pos = pos
+
+    # ==================== RECOVERY ====================
+
+    def _recover(self) -> Any:
+        text = self._buf[self._start:]
+        openers = "".join(f[0] for f in self._stack)
+
+        # 1) Keep everything: close the open string (if it is a value) and the open containers.
+        if not (self._in_string and self._string_is_key):
+            head = text[:-1] if self._escape else text
+            if self._in_string:
+                head += '"'
+            try:
+                value = json.loads(head.rstrip() + _closers(openers))
+                self.partial = True
+                top = self._stack[-1] if self._stack else None
+                if self._in_string and top and top[0] == "{":
+                    self.truncated_key = top[2]
+                self.value = value
+                return value
+            except ValueError:
+                pass
+
+        # 2) Cut back to the last complete member (before a comma / right after an opener).
+        for cut, stack_openers in reversed(self._safe_points[-_MAX_RECOVERY_ATTEMPTS:]):
+            try:
+                value = json.loads(self._buf[self._start:cut] + _closers(stack_openers))
+            except ValueError:
+                continue
+            self.partial = True
+            self.value = value
+            return value
+        return None
+
+
+def _closers(openers: str) -> str:
+    return "".join(_OPENERS[o] for o in reversed(openers))
+
+
+# ==================== PUBLIC HELPERS ====================
+
+def extract_json(text: str, expect: Optional[str] = None, allow_partial: bool = True) -> Any:
+    """First JSON value in `text` (expect: "object", "array" or None for either), or None."""
+    scanner = JsonScanner(expect=expect)
+    scanner.feed(text or "")
+    return scanner.finish(allow_partial=allow_partial)
+
+
+def validate_object(
+    data: Any,
+    fields: Optional[FieldSchema] = None,
+    required: Iterable[str] = (),
+) -> Dict[str, Any]:
+    """
+    Check a decoded object against `fields`: values of the wrong type are replaced
+    by the field default (strings are stripped), unknown keys are kept.
+    Raises JsonExtractionError when a required field is missing or mistyped.
+    """
+    if not isinstance(data, dict):
+        raise JsonExtractionError("Expected a JSON object.")
+    result = dict(data)
+    required = set(required)
+    for key, (types, default) in (fields or {}).items():
+        value = data.get(key)
+        accepted = types if isinstance(types, tuple) else (types,)
+        if isinstance(value, bool) and bool not in accepted:
+            value = None  # bool is an int subclass; never accept it as a number
+        if value is not None and isinstance(value, accepted):
+            result[key] = value.strip() if isinstance(value, str) else value
+        elif key in required:
+            raise JsonExtractionError(f"Missing or invalid required field: {key}")
+        else:
+            result[key] = copy.deepcopy(default)
+    missing = [key for key in required if key not in result]
+    if missing:
+        raise JsonExtractionError(f"Missing required fields: {', '.join(missing)}")
+    return result
+
+
+def parse_json_object(
+    text: str,
+    fields: Optional[FieldSchema] = None,
+    required: Iterable[str] = (),
+    complete_only: Iterable[str] = (),
+    partial_required: Iterable[str] = (),
+    allow_partial: bool = True,
+) -> Dict[str, Any]:
+    """
+    Extract + validate one JSON object from model output.
+
+    complete_only:    fields that must not keep a truncated string value
+                      (e.g. an action key cut mid-word); dropped when truncated.
+    partial_required: extra required fields when the object had to be recovered.
+    """
+    scanner = JsonScanner(expect="object")
+    scanner.feed(text or "")
+    value = scanner.finish(allow_partial=allow_partial)
+    if not isinstance(value, dict):
+        raise JsonExtractionError("Failed to extract JSON object from model response.")
+
+    if scanner.partial:
+        if scanner.truncated_key in set(complete_only):
+            value.pop(scanner.truncated_key, None)
+        required = set(required) | set(partial_required)
+    return validate_object(value, fields, required)
+
+
+# ==================== STREAMED STRING FIELDS ====================
+
+_STREAM_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class JsonStringFieldStreamer:
+    """
+    Incrementally decodes one string field (e.g. "explanatory_feedback") out of a
+    JSON object that arrives in chunks, so its text can be shown while the
+    model is still generating the rest of the object.
+    """
+
+    def __init__(self, field: str) -> None:
+        self._key_re = re.compile(r'"' + re.escape(field) + r'"\s*:\s*"')
+        self._buffer = ""
+        self._pos: Optional[int] = None  # index of the next undecoded value char
+        self.done = False
+        self.emitted = ""
+
+    def feed(self, chunk: str) -> str:
+        """Add raw model text; return the newly decoded part of the field value."""
+        if self.done or not chunk:
+            return ""
+        self._buffer += chunk
+
+        if self._pos is None:
+            m = self._key_re.search(self._buffer)
+            if not m:
+                return ""
+            self._pos = m.end()
+
+        out = []
+        buf, i = self._buffer, self._pos
+        while i < len(buf):
+            ch = buf[i]
+            if ch == '"':
+                self.done = True
+                i += 1
+                break
+            if ch != "\\":
+                out.append(ch)
+                i += 1
+                continue
+            # Escape sequence: wait for the rest of it if the chunk ended mid-escape
+            if i + 1 >= len(buf):
+                break
+            esc = buf[i + 1]
+            if esc == "u":
+                if i + 6 > len(buf):
+                    break
+                try:
+                    out.append(chr(int(buf[i + 2:i + 6], 16)))
+                except ValueError:
+                    pass
+                i += 6
+            else:
+                out.append(_STREAM_ESCAPES.get(esc, esc))
+                i += 2
+
+        self._pos = i
+        delta = "".join(out)
+        self.emitted += delta
+        return delta
@@ -0,0 +1,327 @@
+"""
+Compact per-session progress: one bitmap plus a few counters.
+
+ScenarioManager used to keep progress only as lists in the state
+(revealed_findings grew on every matching rule, and a repeated action was
+re-awarded its points each time). Instead each case's
+
+    actions          (scoring_rules.json target_actions, then actions named by
+                      requires / forbidden_after: RuleIndex.prompt_actions)
+    findings         (case_scenarios.json findings + rules' revealed_findings)
+    intake questions (INTAKE_ACTION_MAP keys, for intake cases)
+
+are interned to bit positions in a ProgressLayout, and a session stores
+
+    state["progress"] = {"layout": "<digest>", "bits": <int>,
+                         "done": ["<action>", ...],
+                         "counts": {"actions": n, "repeats": n}}
+
+so membership, dedup and completion checks are AND / popcount on one int and
+the state has a bounded size per case. "done" names the performed actions /
+intake questions behind the bits, so the bitmap stays readable when its layout
+is no longer known to the process (see below). state["revealed_findings"] is still
+written (prompts, UI and the interpretation cache read it) but derived from
+the bitmap, so it can never hold duplicates.
+
+Actions come first, in the same order as the case's SequenceMachine bits, so
+ordering rules (requires / forbidden_after) check the low bits of this bitmap
+(sequence_mask()): it is the only record of which actions a session performed.
+
+Deltas name the performed action in "progress_action" (added by the
+AssessmentEngine). ScenarioManager applies them through
+ProgressTracker.apply(), also on event replay and after a version conflict,
+so a repeated positive-score action never adds points twice even when two
+turns race. Penalties (negative scores) still apply every time.
+
+Bit positions are derived from the files; when they change the digest
+changes, and an older session's bitmap is re-interned by name: actions from
+"done" (layouts only live in this process, so after an edit + restart the old
+digest is unknown and its bits alone could not be decoded), findings from
+revealed_findings.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, Mapping, Optional, Tuple
+
+from app.intake_questions import INTAKE_ACTION_KEYS, INTAKE_CASE_PREFIXES
+from app.services.rule_index import RuleCatalog, SequenceMachine
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_KEY = "progress"
+PROGRESS_ACTION_KEY = "progress_action"
+# Part of every layout digest; bump when the bit order itself changes
+LAYOUT_VERSION = "2"
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+@dataclass(frozen=True)
+class ProgressLayout:
+    """Bit positions of one case's findings, actions and intake questions."""
+
+    case_id: str
+    digest: str
+    findings: Tuple[str, ...]
+    actions: Tuple[str, ...]
+    intake: Tuple[str, ...]
+    finding_bits: Mapping[str, int]
+    action_bits: Mapping[str, int]
+    intake_bits: Mapping[str, int]
+    findings_mask: int
+    actions_mask: int
+    intake_mask: int
+
+    def action_bit(self, action: str) -> int:
+        """Bit of a tracked action or intake question (0 when untracked)."""
+        return self.action_bits.get(action, 0) | self.intake_bits.get(action, 0)
+
+    def names(self, bits: int) -> Tuple[str, ...]:
+        """Names behind the set bits (used to re-intern after a layout change)."""
+        out = []
+        for names, index in (
+            (self.actions, self.action_bits),
+            (self.findings, self.finding_bits),
+            (self.intake, self.intake_bits),
+        ):
+            out.extend(name for name in names if bits & index[name])
+        return tuple(out)
+
+    def revealed_findings(self, bits: int) -> list:
+        return [name for name in self.findings if bits & self.finding_bits[name]]
+
+
+def build_layout(
+    case_id: str, findings: Iterable[str], actions: Iterable[str], intake: Iterable[str] = ()
+) -> ProgressLayout:
+    """Intern names to consecutive bits: actions (from bit 0), then findings, then intake questions."""
+    groups = []
+    position = 0
+    for names in (actions, findings, intake):
+        unique = tuple(dict.fromkeys(n for n in names if isinstance(n, str) and n))
+        bits = {name: 1 << (position + i) for i, name in enumerate(unique)}
+        mask = ((1 << len(unique)) - 1) << position
+        position += len(unique)
+        groups.append((unique, MappingProxyType(bits), mask))
+
+    (a_names, a_bits, a_mask), (f_names, f_bits, f_mask), (i_names, i_bits, i_mask) = groups
+    signature = "\x1f".join((LAYOUT_VERSION, case_id, ",".join(a_names), ",".join(f_names), ",".join(i_names)))
+    layout = ProgressLayout(
+        case_id=case_id,
+        digest=hashlib.sha1(signature.encode("utf-8")).hexdigest()[:12],
+        findings=f_names,
+        actions=a_names,
+        intake=i_names,
+        finding_bits=f_bits,
+        action_bits=a_bits,
+        intake_bits=i_bits,
+        findings_mask=f_mask,
+        actions_mask=a_mask,
+        intake_mask=i_mask,
+    )
+    with _layouts_lock:
+        _layouts.setdefault(layout.digest, layout)
+    return layout
+
+
+# Every layout built in this process, by digest (layouts are small and few)
+_layouts: Dict[str, ProgressLayout] = {}
+_layouts_lock = threading.Lock()
+
+
+def layout_of(state: Optional[Mapping[str, Any]]) -> Optional[ProgressLayout]:
+    progress = state.get(PROGRESS_KEY) if isinstance(state, Mapping) else None
+    if not isinstance(progress, Mapping):
+        return None
+    return _layouts.get(progress.get("layout"))
+
+
+def bits_of(state: Optional[Mapping[str, Any]]) -> int:
+    progress = state.get(PROGRESS_KEY) if isinstance(state, Mapping) else None
+    bits = progress.get("bits") if isinstance(progress, Mapping) else None
+    return bits if isinstance(bits, int) else 0
+
+
+def done_of(state: Optional[Mapping[str, Any]]) -> Tuple[str, ...]:
+    """Names of the performed actions / intake questions, as persisted next to the bits."""
+    progress = state.get(PROGRESS_KEY) if isinstance(state, Mapping) else None
+    done = progress.get("done") if isinstance(progress, Mapping) else None
+    if not isinstance(done, list):
+        return ()
+    return tuple(name for name in done if isinstance(name, str))
+
+
+# ==================== QUERIES (O(1) on the bitmap) ====================
+
+def is_done(state: Optional[Mapping[str, Any]], action: str) -> bool:
+    """True when the session already performed a tracked action / asked an intake question."""
+    layout = layout_of(state)
+    if layout is None:
+        # Layout from another process / rules file: read the persisted names
+        return action in done_of(state)
+    bit = layout.action_bit(action)
+    return bool(bit and bits_of(state) & bit)
+
+
+def has_finding(state: Optional[Mapping[str, Any]], finding: str) -> bool:
+    layout = layout_of(state)
+    bit = layout.finding_bits.get(finding, 0) if layout is not None else 0
+    return bool(bit and bits_of(state) & bit)
+
+
+def completion(state: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """Done / total / percent for findings, actions and intake questions."""
+    layout = layout_of(state)
+    bits = bits_of(state)
+    report: Dict[str, Any] = {}
+    for name, mask in (
+        ("findings", layout.findings_mask if layout else 0),
+        ("actions", layout.actions_mask if layout else 0),
+        ("intake", layout.intake_mask if layout else 0),
+    ):
+        total = _popcount(mask)
+        done = _popcount(bits & mask)
+        report[name] = {"done": done, "total": total, "percent": round(100.0 * done / total, 1) if total else 0.0}
+    return report
+
+
+def sequence_mask(state: Optional[Mapping[str, Any]], sequence: SequenceMachine) -> int:
+    """The session's performed actions as a mask in `sequence`'s bits (the low bits of the bitmap)."""
+    layout = layout_of(state)
+    if layout is None:
+        return sequence.mask_of(done_of(state))
+    bits = bits_of(state)
+    if layout.actions[: len(sequence.bits)] == tuple(sequence.bits):
+        return bits & ((1 << len(sequence.bits)) - 1)
+    # The bitmap predates a rules reload: look the actions up by name
+    return sequence.mask_of(layout.names(bits & layout.actions_mask))
+
+
+# ==================== TRACKER ====================
+
+class ProgressTracker:
+    """
+    Builds case layouts (cached per rules-file digest and case findings) and folds deltas into
+    state["progress"]. Shared by ScenarioManager; thread-safe.
+    """
+
+    def __init__(self, catalog: RuleCatalog, case_findings: Callable[[str], Iterable[str]]) -> None:
+        self._catalog = catalog
+        self._case_findings = case_findings
+        self._cache: Dict[Tuple[str, str, Tuple[str, ...]], ProgressLayout] = {}
+        self._lock = threading.Lock()
+
+    def layout(self, case_id: str) -> ProgressLayout:
+        index = self._catalog.index()
+        case_findings = tuple(self._case_findings(case_id))
+        key = (case_id, index.digest, case_findings)
+        layout = self._cache.get(key)
+        if layout is not None:
+            return layout
+
+        findings = list(case_findings)
+        case = index.cases.get(case_id)
+        actions = list(index.prompt_actions(case_id))
+        if case is not None:
+            for rule in case.rules.values():
+                updates = rule.raw.get("state_updates")
+                revealed = updates.get("revealed_findings") if isinstance(updates, Mapping) else None
+                if isinstance(revealed, list):
+                    findings.extend(revealed)
+        intake = INTAKE_ACTION_KEYS if case_id.startswith(INTAKE_CASE_PREFIXES) else ()
+        layout = build_layout(case_id, findings, actions, intake)
+        with self._lock:
+            # Drop the case's layout from a previous rules / cases file
+            for stale in [k for k in self._cache if k[0] == case_id]:
+                del self._cache[stale]
+            self._cache[key] = layout
+        return layout
+
+    def initial(self, case_id: str) -> Dict[str, Any]:
+        layout = self.layout(case_id)
+        return {"layout": layout.digest, "bits": 0, "done": [], "counts": {"actions": 0, "repeats": 0}}
+
+    def _current(self, state: Dict[str, Any], layout: ProgressLayout) -> Tuple[int, Dict[str, int]]:
+        """(bits, counts) of the state in `layout`, re-interning an older layout by name."""
+        progress = state.get(PROGRESS_KEY)
+        if not isinstance(progress, dict):
+            progress = {}
+        counts = {"actions": 0, "repeats": 0}
+        if isinstance(progress.get("counts"), dict):
+            counts.update({k: v for k, v in progress["counts"].items() if isinstance(v, int)})
+
+        bits = progress.get("bits") if isinstance(progress.get("bits"), int) else 0
+        if progress.get("layout") == layout.digest:
+            return bits, counts
+
+        names = list(done_of(state))
+        if not names:
+            # States written before "done" was persisted: only decodable while the layout is known
+            old = _layouts.get(progress.get("layout"))
+            names = list(old.names(bits)) if old is not None else []
+        findings = state.get("revealed_findings")
+        if isinstance(findings, list):
+            names.extend(findings)
+        bits = 0
+        for name in names:
+            if not isinstance(name, str):
+                continue
+            bits |= layout.finding_bits.get(name, 0) | layout.action_bit(name)
+        if progress:
+            logger.debug("Re-interned progress of case %s into layout %s", layout.case_id, layout.digest)
+        return bits, counts
+
+    def apply(self, state: Dict[str, Any], updates: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Fold one delta into state["progress"] (and the derived revealed_findings).
+
+        `state` is replaced key by key (copy-on-write, like _merge_updates).
+        Returns the delta to merge: without score_change when a positive-score
+        action was already done.
+        """
+        case_id = state.get("case_id")
+        if not isinstance(case_id, str) or not case_id:
+            return updates
+        layout = self.layout(case_id)
+        bits, counts = self._current(state, layout)
+
+        action = updates.get(PROGRESS_ACTION_KEY)
+        bit = layout.action_bit(action) if isinstance(action, str) else 0
+        if bit:
+            if bits & bit:
+                counts["repeats"] += 1
+                score_delta = updates.get("score_change")
+                if isinstance(score_delta, (int, float)) and score_delta > 0:
+                    updates = {k: v for k, v in updates.items() if k != "score_change"}
+            else:
+                counts["actions"] += 1
+            bits |= bit
+
+        revealed = updates.get("revealed_findings")
+        extra = []
+        if isinstance(revealed, list):
+            for finding in revealed:
+                finding_bit = layout.finding_bits.get(finding, 0) if isinstance(finding, str) else 0
+                if finding_bit:
+                    bits |= finding_bit
+                else:
+                    extra.append(finding)
+            updates = {k: v for k, v in updates.items() if k != "revealed_findings"}
+
+        findings = layout.revealed_findings(bits)
+        # Findings outside the layout (legacy states, rules edited away) are kept as before
+        for finding in list(state.get("revealed_findings") or []) + extra:
+            if finding not in findings:
+                findings.append(finding)
+        state["revealed_findings"] = findings
+        done = list(layout.names(bits & (layout.actions_mask | layout.intake_mask)))
+        state[PROGRESS_KEY] = {"layout": layout.digest, "bits": bits, "done": done, "counts": counts}
+        return updates
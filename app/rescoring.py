@@ -0,0 +1,386 @@
+"""
+Bulk re-scoring of historical sessions after scoring_rules.json changes.
+
+Stored scores go stale when the rules change: StudentSession.current_score,
+the "assessment" blob in each assistant ChatLog.metadata_json and the
+action_events rows (plus the stat rollups built from them). Re-scoring
+replays every session's assistant turns, in order, through the current
+compiled rules:
+
+- the stored interpreted_action is reused, the LLM is never called;
+- each session is replayed from a fresh initial state, so ordering rules and
+  the progress bitmap (repeats) see the same history as the live turn did;
+- sessions are independent, so the replay is sharded by session across a
+  process pool; the parent only reads and writes the database.
+
+Writes go in batches, one transaction per batch:
+- the score correction is appended as a scenario event
+  ({"score_change": delta, "rescore": {...}}) behind the usual
+  UPDATE ... WHERE version = ? guard; a session that took a turn meanwhile is
+  skipped and picked up by the next run;
+- metadata_json is re-read inside the transaction and only "assessment" and
+  "revealed_findings" are replaced (MedGemma results are kept);
+- action_events get the new score / outcome and the rollups the difference.
+
+Archived sessions (db/retention.py) are not re-scored. Re-running is a
+no-op once everything matches the current rules.
+
+Run with: python scripts/rescore_sessions.py [--dry-run]
+"""
+
+from __future__ import annotations
+
+import datetime
+import json
+import logging
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.assessment_engine import AssessmentEngine
+from app.scenario_manager import ScenarioManager
+from db import event_store
+from db.database import NON_ACTION_EVENTS, ActionEvent, ChatLog, StudentSession
+from db.rollups import adjust_action_score
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SESSIONS = 200
+
+
+@dataclass
+class SessionInput:
+    """One session's assistant turns, as read from chat_logs (sent to the workers)."""
+
+    session_id: int
+    student_id: str
+    case_id: str
+    version: int
+    # (chat_log_id, interpreted_action, stored assessment)
+    turns: List[Tuple[int, str, Dict[str, Any]]]
+
+
+@dataclass
+class TurnRescore:
+    chat_log_id: int
+    action: str
+    old_score: float
+    new_score: float
+    old_outcome: Optional[str]
+    new_outcome: Optional[str]
+    assessment: Dict[str, Any]
+    revealed_findings: List[Any]
+
+
+@dataclass
+class SessionRescore:
+    session_id: int
+    student_id: str
+    case_id: str
+    version: int
+    turn_count: int
+    score_delta: float
+    changed_turns: List[TurnRescore] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return bool(self.changed_turns) or bool(self.score_delta)
+
+    def to_report(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.session_id,
+            "student_id": self.student_id,
+            "case_id": self.case_id,
+            "turns": self.turn_count,
+            "score_delta": self.score_delta,
+            "changed_turns": [
+                {
+                    "chat_log_id": t.chat_log_id,
+                    "action": t.action,
+                    "old_score": t.old_score,
+                    "new_score": t.new_score,
+                    "old_outcome": t.old_outcome,
+                    "new_outcome": t.new_outcome,
+                }
+                for t in self.changed_turns
+            ],
+        }
+
+
+# ==================== REPLAY (worker side) ====================
+
+def applied_score_change(assessment: Optional[Dict[str, Any]]) -> float:
+    """score_change the agent applied for an assessment (state_updates win, as in _finalize_turn)."""
+    if not isinstance(assessment, dict):
+        return 0.0
+    value = assessment.get("score_change")
+    updates = assessment.get("state_updates")
+    if isinstance(updates, dict) and "score_change" in updates:
+        value = updates["score_change"]
+    return float(value) if isinstance(value, (int, float)) else 0.0
+
+
+def _canonical(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def rescore_session(engine: AssessmentEngine, manager: ScenarioManager, session: SessionInput) -> SessionRescore:
+    """Replay one session's turns through the current rules (pure; no DB access)."""
+    state = manager.build_initial_state(session.case_id)
+    score = 0.0
+    old_total = new_total = 0.0
+    changed: List[TurnRescore] = []
+
+    for chat_log_id, action, old in session.turns:
+        assessment = engine.evaluate_action(session.case_id, {"interpreted_action": action}, state) or {}
+
+        # Same delta the agent builds for the unit of work
+        updates: Dict[str, Any] = {}
+        score_delta = assessment.get("score_change")
+        if isinstance(score_delta, (int, float)) and score_delta:
+            updates["score_change"] = score_delta
+        if isinstance(assessment.get("state_updates"), dict):
+            updates.update(assessment["state_updates"])
+        if updates:
+            state, score = manager._apply_updates(state, score, updates)
+
+        old_change = applied_score_change(old)
+        new_change = applied_score_change(assessment)
+        old_total += old_change
+        new_total += new_change
+        if _canonical(assessment) != _canonical(old):
+            changed.append(
+                TurnRescore(
+                    chat_log_id=chat_log_id,
+                    action=action,
+                    old_score=float((old or {}).get("score") or 0.0),
+                    new_score=float(assessment.get("score") or 0.0),
+                    old_outcome=(old or {}).get("rule_outcome"),
+                    new_outcome=assessment.get("rule_outcome"),
+                    assessment=assessment,
+                    revealed_findings=list((assessment.get("state_updates") or {}).get("revealed_findings", [])),
+                )
+            )
+
+    return SessionRescore(
+        session_id=session.session_id,
+        student_id=session.student_id,
+        case_id=session.case_id,
+        version=session.version,
+        turn_count=len(session.turns),
+        score_delta=new_total - old_total,
+        changed_turns=changed,
+    )
+
+
+_worker: Optional[Tuple[AssessmentEngine, ScenarioManager]] = None
+
+
+def init_worker(rules_digest: Optional[str] = None) -> None:
+    """Process-pool initializer: one engine + manager per worker, on the same rules as the parent."""
+    global _worker
+    engine = AssessmentEngine()
+    if rules_digest is not None and engine.rule_index.digest != rules_digest:
+        raise RuntimeError("scoring_rules.json changed while re-scoring; run the job again")
+    _worker = (engine, ScenarioManager())
+
+
+def rescore_in_worker(session: SessionInput) -> SessionRescore:
+    if _worker is None:
+        init_worker()
+    return rescore_session(_worker[0], _worker[1], session)
+
+
+# ==================== READ / WRITE (parent side) ====================
+
+def iter_session_batches(
+    db: Session, batch_sessions: int = DEFAULT_BATCH_SESSIONS, case_id: Optional[str] = None
+) -> Iterator[List[SessionInput]]:
+    """Hot (non-archived) sessions with their assistant turns, keyset-paged by session id."""
+    last_id = 0
+    while True:
+        query = db.query(
+            StudentSession.id, StudentSession.student_id, StudentSession.case_id, StudentSession.version
+        ).filter(StudentSession.id > last_id, StudentSession.archived_at.is_(None))
+        if case_id:
+            query = query.filter(StudentSession.case_id == case_id)
+        rows = query.order_by(StudentSession.id).limit(batch_sessions).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+
+        turns: Dict[int, List[Tuple[int, str, Dict[str, Any]]]] = defaultdict(list)
+        logs = (
+            db.query(ChatLog.id, ChatLog.session_id, ChatLog.metadata_json)
+            .filter(ChatLog.session_id.in_([r.id for r in rows]), ChatLog.role == "assistant")
+            .order_by(ChatLog.session_id, ChatLog.id)
+        )
+        for log_id, session_id, metadata in logs:
+            if not isinstance(metadata, dict):
+                continue
+            action = metadata.get("interpreted_action")
+            if not isinstance(action, str) or not action:
+                continue
+            turns[session_id].append((log_id, action, metadata.get("assessment") or {}))
+
+        batch = [
+            SessionInput(r.id, r.student_id, r.case_id, r.version or 0, turns[r.id])
+            for r in rows
+            if r.case_id and turns.get(r.id)
+        ]
+        # Release the read transaction before the batch is written
+        db.rollback()
+        if batch:
+            yield batch
+
+
+def write_batch(
+    db: Session, results: List[SessionRescore], rules_digest: str, now: Optional[datetime.datetime] = None
+) -> Dict[str, int]:
+    """Stage the corrections of one batch (the caller commits). Returns counters."""
+    now = now or datetime.datetime.utcnow()
+    counts = {"sessions": 0, "conflicts": 0, "messages": 0, "action_events": 0}
+    turns: Dict[int, TurnRescore] = {}
+
+    for result in results:
+        if not result.changed:
+            continue
+        if result.score_delta:
+            claimed = (
+                db.query(StudentSession)
+                .filter(StudentSession.id == result.session_id, StudentSession.version == result.version)
+                .update(
+                    {
+                        "current_score": StudentSession.current_score + result.score_delta,
+                        "version": result.version + 1,
+                    },
+                    synchronize_session=False,
+                )
+            )
+            if claimed != 1:
+                counts["conflicts"] += 1
+                continue
+            delta = {"score_change": result.score_delta, "rescore": {"rules": rules_digest, "at": now.isoformat()}}
+            event_store.append_events(db, result.session_id, result.version, [delta], at=now)
+        counts["sessions"] += 1
+        turns.update((t.chat_log_id, t) for t in result.changed_turns)
+
+    if not turns:
+        return counts
+
+    # Patch only the scoring keys; other writers (MedGemma) own the rest of metadata_json
+    log_updates = []
+    for log_id, metadata in db.query(ChatLog.id, ChatLog.metadata_json).filter(ChatLog.id.in_(list(turns))):
+        metadata = dict(metadata) if isinstance(metadata, dict) else {}
+        metadata["assessment"] = turns[log_id].assessment
+        metadata["revealed_findings"] = turns[log_id].revealed_findings
+        log_updates.append({"id": log_id, "metadata_json": metadata})
+    if log_updates:
+        db.execute(update(ChatLog), log_updates)
+    counts["messages"] = len(log_updates)
+
+    event_updates = []
+    rollup_deltas: Dict[Tuple[str, str], float] = defaultdict(float)
+    events = db.query(
+        ActionEvent.id, ActionEvent.chat_log_id, ActionEvent.student_id, ActionEvent.case_id,
+        ActionEvent.action, ActionEvent.score,
+    ).filter(ActionEvent.chat_log_id.in_(list(turns)))
+    for event_id, log_id, student_id, case_id, action, old_score in events:
+        turn = turns[log_id]
+        event_updates.append({"id": event_id, "score": turn.new_score, "outcome": turn.new_outcome})
+        if action not in NON_ACTION_EVENTS:
+            rollup_deltas[(student_id, case_id)] += turn.new_score - float(old_score or 0.0)
+    if event_updates:
+        db.execute(update(ActionEvent), event_updates)
+    for (student_id, case_id), score_delta in rollup_deltas.items():
+        adjust_action_score(db, student_id, case_id, score_delta)
+    counts["action_events"] = len(event_updates)
+    return counts
+
+
+@dataclass
+class RescoreReport:
+    rules_digest: str
+    dry_run: bool
+    sessions_scanned: int = 0
+    turns_scanned: int = 0
+    sessions_changed: int = 0
+    turns_changed: int = 0
+    score_delta_total: float = 0.0
+    written: Dict[str, int] = field(default_factory=lambda: defaultdict(int))
+    # action -> [turns changed, score delta]
+    by_action: Dict[str, List[float]] = field(default_factory=lambda: defaultdict(lambda: [0, 0.0]))
+
+    def add(self, result: SessionRescore) -> None:
+        self.sessions_scanned += 1
+        self.turns_scanned += result.turn_count
+        if not result.changed:
+            return
+        self.sessions_changed += 1
+        self.turns_changed += len(result.changed_turns)
+        self.score_delta_total += result.score_delta
+        for turn in result.changed_turns:
+            entry = self.by_action[turn.action]
+            entry[0] += 1
+            entry[1] += turn.new_score - turn.old_score
+
+
+def run_rescore(
+    session_factory: Callable[[], Session],
+    workers: int = 0,
+    batch_sessions: int = DEFAULT_BATCH_SESSIONS,
+    dry_run: bool = False,
+    case_id: Optional[str] = None,
+    on_result: Optional[Callable[[SessionRescore], None]] = None,
+) -> RescoreReport:
+    """
+    Re-score every hot session. workers=0 replays in this process (small
+    databases, tests); otherwise sessions are spread over a process pool.
+    on_result sees every changed session (diff reports).
+    """
+    engine = AssessmentEngine()
+    rules_digest = engine.rule_index.digest
+    report = RescoreReport(rules_digest=rules_digest, dry_run=dry_run)
+
+    pool = None
+    if workers and workers > 1:
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(rules_digest,))
+    manager = ScenarioManager() if pool is None else None
+
+    reader = session_factory()
+    try:
+        for batch in iter_session_batches(reader, batch_sessions, case_id):
+            if pool is None:
+                results = [rescore_session(engine, manager, s) for s in batch]
+            else:
+                chunksize = max(1, len(batch) // (workers * 4))
+                results = list(pool.map(rescore_in_worker, batch, chunksize=chunksize))
+
+            for result in results:
+                report.add(result)
+                if on_result is not None and result.changed:
+                    on_result(result)
+            if dry_run:
+                continue
+
+            writer = session_factory()
+            try:
+                counts = write_batch(writer, results, rules_digest)
+                writer.commit()
+            except Exception:
+                writer.rollback()
+                raise
+            finally:
+                writer.close()
+            for key, value in counts.items():
+                report.written[key] += value
+            logger.info("Re-scored %d session(s): %s", len(results), counts)
+    finally:
+        reader.close()
+        if pool is not None:
+            pool.shutdown()
+    return report
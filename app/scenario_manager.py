@@ -1,13 +1,35 @@
 from __future__ import annotations
 
+import copy
+import datetime
 import json
 import os
 import logging
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
-from db.database import SessionLocal, StudentSession
+from app.progress import PROGRESS_ACTION_KEY, ProgressTracker
+from app.services.case_catalog import CaseCatalog, get_case_catalog
+from app.services.rule_index import get_rule_catalog
+from app.services.session_state_cache import CachedSessionState, SessionStateCache
+from db.database import SessionLocal, StudentSession, ChatLog, ActionEvent
+from db import event_store
+from db.rollups import record_action
+
+# Optimistic concurrency: how often a conflicting state write is reloaded and replayed
+MAX_STATE_WRITE_ATTEMPTS = 5
+
+@dataclass
+class TurnContext:
+    """State snapshot taken at the start of a chat turn (see ScenarioManager.begin_turn)."""
+
+    student_id: str
+    case_id: str
+    session_id: Optional[int]
+    state: Dict[str, Any]
+    started_at: datetime.datetime = field(default_factory=datetime.datetime.utcnow)
 
 
 class ScenarioManager:
@@ -15,53 +37,31 @@ class ScenarioManager:
     Loads case scenarios and manages per-student scenario state.
     """
 
-    def __init__(self, cases_path: Optional[str] = None) -> None:
+    def __init__(self, cases_path: Optional[str] = None, state_cache: Optional[SessionStateCache] = None) -> None:
+        self.state_cache = state_cache or SessionStateCache()
         self._cases_path = cases_path or os.path.normpath(
             os.path.join(os.path.dirname(__file__), "..", "data", "case_scenarios.json")
         )
-        self.case_data: List[Dict[str, Any]] = []
-        self._default_case_id: str = "olp_001"
-        self._load_cases()
+        # Shared with the chat page / sidebar: parsed once per process, reloaded on change
+        self.cases: CaseCatalog = get_case_catalog(self._cases_path)
+        # Findings / actions / intake questions interned to bits (state["progress"])
+        self.progress = ProgressTracker(get_rule_catalog(), self._case_findings)
 
-    def _load_cases(self) -> None:
-        """
-        Load all cases from JSON.
-        - On error, log and keep an empty list.
-        - Accepts top-level list, or dict with "cases" list.
-        """
-        try:
-            with open(self._cases_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+    @property
+    def case_data(self) -> List[Dict[str, Any]]:
+        index = self.cases.index()
+        return [index.cases[case_id].data for case_id in index.order]
 
-            if isinstance(data, list):
-                self.case_data = data
-            elif isinstance(data, dict) and isinstance(data.get("cases"), list):
-                self.case_data = data.get("cases", [])
-            else:
-                logger.error("Unexpected structure in case_scenarios.json; expected a list or a dict with 'cases'.")
-                self.case_data = []
-
-            # Determine default case_id from the first case, if available
-            if self.case_data:
-                first_case = self.case_data[0]
-                cid = first_case.get("case_id")
-                if isinstance(cid, str) and cid:
-                    self._default_case_id = cid
-
-        except FileNotFoundError:
-            logger.error("Case scenarios file not found: %s", self._cases_path)
-            self.case_data = []
-        except json.JSONDecodeError as e:
-            logger.error("Failed to parse case scenarios JSON: %s", e)
-            self.case_data = []
+    @property
+    def _default_case_id(self) -> str:
+        return self.cases.index().default_case_id
 
     def _find_case(self, case_id: str) -> Dict[str, Any]:
-        if not case_id:
-            return {}
-        for c in self.case_data:
-            if isinstance(c, dict) and c.get("case_id") == case_id:
-                return c
-        return {}
+        return self.cases.index().case(case_id) or {}
+
+    def _case_findings(self, case_id: str) -> Tuple[str, ...]:
+        """Finding ids of a case (gizli_bulgular / hidden_findings), in file order."""
+        return self.cases.index().findings(case_id)
 
     def _build_initial_state(self, case_id: str) -> Dict[str, Any]:
         case = self._find_case(case_id) or {}
@@ -70,6 +70,7 @@ class ScenarioManager:
             "case_id": case_id,
             "revealed_findings": [],
             "history": [],
+            "progress": self.progress.initial(case_id),
         }
 
         # Case category (used by RuleService / MedGemma silent validation)
@@ -108,6 +109,258 @@ class ScenarioManager:
 
         return state
 
+    def build_initial_state(self, case_id: str) -> Dict[str, Any]:
+        """Fresh (unsaved) state for a case, e.g. for batch re-grading without a session."""
+        return self._build_initial_state(case_id)
+
+    # ==================== STATE STORAGE (event-sourced, cached, versioned) ====================
+
+    def _decode_state(self, raw: Any, case_id: Optional[str], student_id: str, session_id: int) -> Dict[str, Any]:
+        """Decoded state_json of a session (re-initialized when missing or invalid)."""
+        try:
+            state = json.loads(raw or "{}") if isinstance(raw, str) else {}
+        except Exception:
+            logger.warning("Invalid state_json for student_id=%s session_id=%s; resetting.", student_id, session_id)
+            state = {}
+
+        if not isinstance(state, dict) or not state:
+            state = self._build_initial_state(case_id or self._default_case_id)
+        return state
+
+    def _replay(
+        self, db, student_id: str, session_id: int, case_id: Optional[str], upto_seq: Optional[int] = None
+    ) -> Tuple[Dict[str, Any], float, int]:
+        """
+        (state, score, seq) of a session: latest snapshot at or before upto_seq,
+        then the events after it replayed in order.
+        """
+        snapshot = event_store.load_snapshot(db, session_id, upto_seq)
+        if snapshot is None:
+            # Session without snapshots (written outside ScenarioManager): state_json is its initial state
+            raw = db.query(StudentSession.state_json).filter(StudentSession.id == session_id).scalar()
+            seq, state, score = 0, self._decode_state(raw, case_id, student_id, session_id), 0.0
+        else:
+            seq, state, score = snapshot
+            if not state:
+                state = self._build_initial_state(case_id or self._default_case_id)
+
+        for seq, delta in event_store.load_events(db, session_id, seq, upto_seq):
+            state, score = self._apply_updates(state, score, delta)
+        return state, score, seq
+
+    def _rebuild_entry(self, db, student_id: str, row: Any) -> CachedSessionState:
+        case_id = row.case_id or self._default_case_id
+        state, _, _ = self._replay(db, student_id, row.id, case_id, upto_seq=row.version or 0)
+        state["case_id"] = case_id
+        # Older sessions / rules files: (re-)intern the progress bitmap into the current layout
+        self.progress.apply(state, {})
+        # The row's score is authoritative for the live state (legacy sessions, rescoring)
+        state["current_score"] = row.current_score or 0.0
+        return CachedSessionState(
+            session_id=row.id,
+            case_id=case_id,
+            version=row.version or 0,
+            score=row.current_score or 0.0,
+            state=state,
+        )
+
+    def _load_entry(self, db, student_id: str, case_id: Optional[str]) -> Optional[CachedSessionState]:
+        """
+        State of the student's most recent session (for case_id, if given).
+
+        Only id/version/score are read from the row; the state is rebuilt from
+        snapshot + events only when the cached copy is missing or another
+        process appended events in between.
+        """
+        query = db.query(
+            StudentSession.id, StudentSession.case_id, StudentSession.version, StudentSession.current_score
+        ).filter(StudentSession.student_id == student_id)
+        if case_id:
+            query = query.filter(StudentSession.case_id == case_id)
+        row = query.order_by(StudentSession.start_time.desc()).first()
+        if row is None:
+            return None
+
+        key = (student_id, row.case_id or self._default_case_id)
+        entry = self.state_cache.get(key, version=row.version or 0)
+        if entry is not None and entry.session_id == row.id:
+            return entry
+
+        entry = self._rebuild_entry(db, student_id, row)
+        self.state_cache.put(key, entry)
+        return entry
+
+    def _reload_entry(self, db, student_id: str, session_id: int) -> Optional[CachedSessionState]:
+        """Fresh entry for a session id straight from the DB (after a version conflict)."""
+        row = (
+            db.query(StudentSession.id, StudentSession.case_id, StudentSession.version, StudentSession.current_score)
+            .filter(StudentSession.id == session_id)
+            .first()
+        )
+        if row is None:
+            return None
+        return self._rebuild_entry(db, student_id, row)
+
+    def _create_session(self, db, student_id: str, case_id: Optional[str]) -> CachedSessionState:
+        chosen_case_id = case_id or self._default_case_id
+        state = self._build_initial_state(chosen_case_id)
+        session = StudentSession(
+            student_id=student_id,
+            case_id=chosen_case_id,
+            current_score=0.0,
+            state_json=json.dumps(state, ensure_ascii=False),
+            version=0,
+        )
+        db.add(session)
+        db.flush()
+        event_store.write_snapshot(db, session.id, 0, state, 0.0, at=session.start_time)
+        db.commit()
+        state["current_score"] = 0.0
+        entry = CachedSessionState(session_id=session.id, case_id=chosen_case_id, version=0, score=0.0, state=state)
+        self.state_cache.put((student_id, chosen_case_id), entry)
+        return entry
+
+    @staticmethod
+    def _write_entry(
+        db,
+        entry: CachedSessionState,
+        state: Dict[str, Any],
+        score: float,
+        deltas: List[Dict[str, Any]],
+    ) -> Optional[CachedSessionState]:
+        """
+        Append `deltas` as events after entry.version, guarded by
+        UPDATE student_sessions ... WHERE version = entry.version (score + version only).
+        Adds a snapshot when the new events cross the snapshot interval.
+        Returns the new entry (not yet committed), or None on a version conflict.
+        """
+        if not deltas:
+            return entry
+
+        new_version = entry.version + len(deltas)
+        updated = (
+            db.query(StudentSession)
+            .filter(StudentSession.id == entry.session_id, StudentSession.version == entry.version)
+            .update(
+                {"current_score": score, "case_id": entry.case_id, "version": new_version},
+                synchronize_session=False,
+            )
+        )
+        if updated != 1:
+            return None
+
+        now = datetime.datetime.utcnow()
+        event_store.append_events(db, entry.session_id, entry.version, deltas, at=now)
+        if event_store.snapshot_due(entry.version, new_version):
+            event_store.write_snapshot(db, entry.session_id, new_version, state, score, at=now)
+        return CachedSessionState(
+            session_id=entry.session_id,
+            case_id=entry.case_id,
+            version=new_version,
+            score=score,
+            state=state,
+        )
+
+    @staticmethod
+    def _merge_updates(state: Dict[str, Any], updates: Dict[str, Any]) -> None:
+        """
+        Merge rule updates into state (shallow merge; dicts update, lists extend
+        with items not already present, so repeated actions do not pile up duplicates).
+
+        Copy-on-write: nested containers are replaced, never mutated, so a
+        shallow copy of a cached state can be merged without touching the
+        cache; values are deep-copied so rules' state_updates are never aliased.
+        """
+        for k, v in updates.items():
+            if k in ("score_change", PROGRESS_ACTION_KEY):
+                continue
+            v = copy.deepcopy(v)
+
+            if k not in state:
+                state[k] = v
+            else:
+                if isinstance(state[k], dict) and isinstance(v, dict):
+                    state[k] = {**state[k], **v}
+                elif isinstance(state[k], list) and isinstance(v, list):
+                    merged = list(state[k])
+                    for item in v:
+                        if item not in merged:
+                            merged.append(item)
+                    state[k] = merged
+                else:
+                    state[k] = v
+
+    def _apply_updates(
+        self, state: Dict[str, Any], score: float, updates: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], float]:
+        """New (state, score) after an assessment delta; the inputs are left untouched."""
+        state = dict(state)
+        # Progress bitmap first: a repeated positive-score action loses its score_change
+        updates = self.progress.apply(state, updates)
+        score_delta = updates.get("score_change")
+        if isinstance(score_delta, (int, float)):
+            score = (score or 0.0) + float(score_delta)
+        self._merge_updates(state, updates)
+        state["current_score"] = score
+        return state, score
+
+    def checkpoint(self, db, session_id: int) -> bool:
+        """
+        Make sure the session has a snapshot at its current version (staged, not
+        committed), so older events/snapshots can be archived without changing
+        how the live state is rebuilt. False for an unknown session.
+        """
+        row = (
+            db.query(StudentSession.id, StudentSession.student_id, StudentSession.case_id,
+                     StudentSession.version, StudentSession.current_score)
+            .filter(StudentSession.id == session_id)
+            .first()
+        )
+        if row is None:
+            return False
+        snapshot = event_store.load_snapshot(db, session_id)
+        if snapshot is not None and snapshot[0] == (row.version or 0):
+            return True
+        entry = self._rebuild_entry(db, row.student_id, row)
+        event_store.write_snapshot(db, session_id, entry.version, entry.state, entry.score)
+        db.flush()
+        return True
+
+    def replay_state(
+        self,
+        session_id: int,
+        seq: Optional[int] = None,
+        at: Optional[datetime.datetime] = None,
+    ) -> Dict[str, Any]:
+        """
+        Point-in-time state of a session: after event `seq`, or as of time `at`
+        (default: latest). Read-only; the result carries "seq" and "current_score"
+        as of that point. Returns {} for an unknown session.
+        """
+        db = SessionLocal()
+        try:
+            row = (
+                db.query(StudentSession.student_id, StudentSession.case_id, StudentSession.version)
+                .filter(StudentSession.id == session_id)
+                .first()
+            )
+            if row is None:
+                return {}
+            upto = row.version or 0
+            if at is not None:
+                upto = min(upto, event_store.seq_at(db, session_id, at))
+            if seq is not None:
+                upto = min(upto, max(seq, 0))
+            case_id = row.case_id or self._default_case_id
+            state, score, _ = self._replay(db, row.student_id, session_id, case_id, upto_seq=upto)
+            state = copy.deepcopy(state)
+            state["case_id"] = case_id
+            state["current_score"] = score
+            state["seq"] = upto
+            return state
+        finally:
+            db.close()
+
     def get_state(self, student_id: str, case_id: Optional[str] = None) -> Dict[str, Any]:
         """
         Retrieve (or initialize) the persistent state for a student.
@@ -117,58 +370,15 @@ class ScenarioManager:
         - Else, use the most recent StudentSession for the student.
 
         If no session exists, create one for the default case.
+        The returned dict is a private copy (callers may mutate it).
         """
         if not student_id:
             return {}
 
         db = SessionLocal()
         try:
-            query = db.query(StudentSession).filter(StudentSession.student_id == student_id)
-            if case_id:
-                query = query.filter(StudentSession.case_id == case_id)
-
-            session = query.order_by(StudentSession.start_time.desc()).first()
-
-            if not session:
-                # Create a new persistent session for the default case
-                chosen_case_id = case_id or self._default_case_id
-                initial_state = self._build_initial_state(chosen_case_id)
-                session = StudentSession(
-                    student_id=student_id,
-                    case_id=chosen_case_id,
-                    current_score=0.0,
-                    state_json=json.dumps(initial_state, ensure_ascii=False),
-                )
-                db.add(session)
-                db.commit()
-                db.refresh(session)
-                return initial_state
-
-            # Load and validate state_json
-            raw = session.state_json or "{}"
-            try:
-                state = json.loads(raw) if isinstance(raw, str) else {}
-            except Exception:
-                logger.warning("Invalid state_json for student_id=%s session_id=%s; resetting.", student_id, session.id)
-                state = {}
-
-            if not isinstance(state, dict) or not state:
-                state = self._build_initial_state(session.case_id or (case_id or self._default_case_id))
-
-            # Ensure case_id is present and consistent
-            effective_case_id = case_id or session.case_id or state.get("case_id") or self._default_case_id
-            state["case_id"] = effective_case_id
-
-            # Keep DB score as the source of truth for score
-            state["current_score"] = session.current_score or 0.0
-
-            # Persist repaired/initialized state back if needed
-            if (session.state_json or "").strip() == "" or raw == "{}" or state.get("case_id") != session.case_id:
-                session.case_id = effective_case_id
-                session.state_json = json.dumps(state, ensure_ascii=False)
-                db.commit()
-
-            return state
+            entry = self._load_entry(db, student_id, case_id) or self._create_session(db, student_id, case_id)
+            return copy.deepcopy(entry.state)
         finally:
             db.close()
 
@@ -178,8 +388,9 @@ class ScenarioManager:
 
         Behavior:
         - Updates StudentSession.current_score additively when 'score_change' is numeric.
-        - Merges remaining keys into the state_json dict (shallow merge; list extends).
-        - Persists back to StudentSession.state_json.
+        - Merges remaining keys into the state (shallow merge; lists extend without duplicates).
+        - Tracks findings / actions in the progress bitmap (repeats are not re-awarded, see app/progress.py).
+        - Appends the delta to scenario_events (versioned; conflicts are reloaded and retried).
         """
         if not isinstance(updates, dict):
             return
@@ -187,60 +398,192 @@ class ScenarioManager:
         if not student_id:
             return
 
+        for _ in range(MAX_STATE_WRITE_ATTEMPTS):
+            db = SessionLocal()
+            try:
+                entry = self._load_entry(db, student_id, case_id) or self._create_session(db, student_id, case_id)
+                state, score = self._apply_updates(entry.state, entry.score, updates)
+                new_entry = self._write_entry(db, entry, state, score, [updates])
+                if new_entry is not None:
+                    db.commit()
+                    self.state_cache.put((student_id, entry.case_id), new_entry)
+                    return
+                db.rollback()
+                self.state_cache.invalidate((student_id, entry.case_id))
+                self.state_cache.record_conflict()
+            finally:
+                db.close()
+
+        logger.warning("Gave up updating state for student_id=%s case_id=%s after repeated conflicts.", student_id, case_id)
+
+    # ==================== TURN UNIT OF WORK ====================
+
+    def begin_turn(self, student_id: str, case_id: Optional[str] = None) -> TurnContext:
+        """
+        Read the student's session once at the start of a chat turn.
+
+        Creates the session only when none exists yet. Steady-state turns are
+        served from the state cache after a version check (no snapshot/event replay).
+        Without a student_id the turn is not persisted (session_id is None).
+        turn.state is a shallow copy of the cached state: treat it as read-only.
+        """
+        if not student_id:
+            return TurnContext(student_id, case_id or "default_case", None, {})
+
         db = SessionLocal()
         try:
-            query = db.query(StudentSession).filter(StudentSession.student_id == student_id)
-            if case_id:
-                query = query.filter(StudentSession.case_id == case_id)
-            session = query.order_by(StudentSession.start_time.desc()).first()
-
-            if not session:
-                # Ensure a session exists so we have a place to store state
-                _ = self.get_state(student_id, case_id=case_id)
-                session = db.query(StudentSession).filter(StudentSession.student_id == student_id)
-                if case_id:
-                    session = session.filter(StudentSession.case_id == case_id)
-                session = session.order_by(StudentSession.start_time.desc()).first()
-                if not session:
-                    return
+            entry = self._load_entry(db, student_id, case_id) or self._create_session(db, student_id, case_id)
+            return TurnContext(student_id, entry.case_id, entry.session_id, dict(entry.state))
+        finally:
+            db.close()
 
-            # Load current state
-            raw = session.state_json or "{}"
-            try:
-                state = json.loads(raw) if isinstance(raw, str) else {}
-            except Exception:
-                state = {}
+    def unit_of_work(self, turn: TurnContext) -> "TurnUnitOfWork":
+        """Single write transaction for a turn: `with manager.unit_of_work(turn) as uow: ...`."""
+        return TurnUnitOfWork(self, turn)
 
-            if not isinstance(state, dict) or not state:
-                state = self._build_initial_state(session.case_id or (case_id or self._default_case_id))
 
-            # Apply score change to DB score (source of truth)
-            score_delta = updates.get("score_change")
-            if isinstance(score_delta, (int, float)):
-                session.current_score = (session.current_score or 0.0) + float(score_delta)
-                state["current_score"] = session.current_score
+class TurnUnitOfWork:
+    """
+    Persists everything a chat turn changes in ONE transaction:
+    the turn's state deltas (scenario_events) + score/version on the StudentSession row, the user/assistant
+    ChatLog rows, the turn's action_events row and any row other services
+    add through `db` (e.g. the silent evaluation job). Commits on a clean exit, rolls back on error.
 
-            # Merge other fields into state_json
-            for k, v in updates.items():
-                if k in ("score_change",):
-                    continue
+    The state write is versioned: if another worker/process wrote the session
+    since it was cached, the row is reloaded inside this transaction and the
+    turn's updates are replayed on top of it.
 
-                if k not in state:
-                    state[k] = v
+    When the turn has no session (no student_id) the state is merged in
+    memory only and nothing is written.
+    """
+
+    def __init__(self, manager: ScenarioManager, turn: TurnContext) -> None:
+        self.manager = manager
+        self.turn = turn
+        self.state: Dict[str, Any] = dict(turn.state)
+        self.score: float = turn.state.get("current_score") or 0.0
+        self.db = None
+        self._entry: Optional[CachedSessionState] = None
+        self._updates: List[Dict[str, Any]] = []
+
+    @property
+    def persistent(self) -> bool:
+        return self._entry is not None
+
+    @property
+    def _key(self):
+        return (self.turn.student_id, self.turn.case_id)
+
+    def __enter__(self) -> "TurnUnitOfWork":
+        if self.turn.session_id is None:
+            return self
+        self.db = SessionLocal()
+        entry = self.manager.state_cache.get(self._key)
+        if entry is None or entry.session_id != self.turn.session_id:
+            entry = self.manager._reload_entry(self.db, self.turn.student_id, self.turn.session_id)
+        if entry is None:
+            logger.warning("Session %s vanished during the turn; not persisting.", self.turn.session_id)
+        else:
+            self._entry = entry
+            self.state, self.score = dict(entry.state), entry.score
+        return self
+
+    def apply_updates(self, updates: Dict[str, Any]) -> None:
+        """Apply an assessment delta (score_change + state updates)."""
+        if not isinstance(updates, dict):
+            return
+        self._updates.append(updates)
+        self.state, self.score = self.manager._apply_updates(self.state, self.score, updates)
+
+    def add_message(
+        self,
+        role: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        timestamp: Optional[datetime.datetime] = None,
+    ) -> Optional[ChatLog]:
+        """Stage a ChatLog row; its id is available after flush()."""
+        if not self.persistent:
+            return None
+        log = ChatLog(
+            session_id=self._entry.session_id,
+            role=role,
+            content=content,
+            metadata_json=metadata,
+            timestamp=timestamp or datetime.datetime.utcnow(),
+        )
+        self.db.add(log)
+        return log
+
+    def add_action_event(
+        self,
+        action: str,
+        score: float,
+        outcome: Optional[str],
+        chat_log: Optional[ChatLog] = None,
+        latency_ms: Optional[int] = None,
+    ) -> Optional[ActionEvent]:
+        """
+        Stage the turn's normalized action_events row (flush chat_log first so
+        its id exists) and fold it into the stat rollups.
+        """
+        if not self.persistent or not action:
+            return None
+        event = ActionEvent(
+            student_id=self.turn.student_id,
+            case_id=self.turn.case_id,
+            session_id=self._entry.session_id,
+            chat_log_id=chat_log.id if chat_log is not None else None,
+            action=action,
+            score=float(score or 0.0),
+            outcome=outcome,
+            latency_ms=latency_ms,
+            created_at=chat_log.timestamp if chat_log is not None else datetime.datetime.utcnow(),
+        )
+        self.db.add(event)
+        record_action(self.db, event.student_id, event.case_id, event.action, event.score, event.created_at)
+        return event
+
+    def flush(self) -> None:
+        if self.db is not None:
+            self.db.flush()
+
+    def _write_state(self) -> Optional[CachedSessionState]:
+        """Versioned state write; replays this turn's updates on a conflict."""
+        entry = self._entry
+        for _ in range(MAX_STATE_WRITE_ATTEMPTS):
+            new_entry = self.manager._write_entry(self.db, entry, self.state, self.score, self._updates)
+            if new_entry is not None:
+                return new_entry
+
+            self.manager.state_cache.record_conflict()
+            entry = self.manager._reload_entry(self.db, self.turn.student_id, entry.session_id)
+            if entry is None:
+                return None
+            self.state, self.score = entry.state, entry.score
+            for updates in self._updates:
+                self.state, self.score = self.manager._apply_updates(self.state, self.score, updates)
+        raise RuntimeError(f"State of session {self._entry.session_id} kept changing; turn not persisted.")
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self.db is None:
+            return False
+        try:
+            if exc_type is None and self.persistent:
+                new_entry = self._write_state()
+                if new_entry is None:
+                    logger.warning("Session %s vanished during the turn; not persisting.", self.turn.session_id)
+                    self.db.rollback()
+                    self.manager.state_cache.invalidate(self._key)
                 else:
-                    if isinstance(state[k], dict) and isinstance(v, dict):
-                        state[k].update(v)
-                    elif isinstance(state[k], list) and isinstance(v, list):
-                        state[k].extend(v)
-                    else:
-                        state[k] = v
-
-            # Ensure case_id
-            effective_case_id = case_id or session.case_id or state.get("case_id") or self._default_case_id
-            session.case_id = effective_case_id
-            state["case_id"] = effective_case_id
-
-            session.state_json = json.dumps(state, ensure_ascii=False)
-            db.commit()
+                    self.db.commit()
+                    self.manager.state_cache.put(self._key, new_entry)
+            else:
+                self.db.rollback()
+        except Exception:
+            self.db.rollback()
+            self.manager.state_cache.invalidate(self._key)
+            raise
         finally:
-            db.close()
\ No newline at end of file
+            self.db.close()
+        return False
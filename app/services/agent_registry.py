@@ -0,0 +1,144 @@
+"""
+Process-wide registry for DentalEducationAgent instances and their catalogs.
+
+Streamlit re-executes the page script on every interaction; building a new
+agent each time re-read scoring_rules.json / case_scenarios.json, reconfigured
+the Gemini SDK and re-parsed .env for MedGemma. The registry keeps one
+instance of each per process:
+
+- AssessmentEngine / ScenarioManager (rule + case catalogs, loaded once)
+- MedGemmaService (silent evaluator, constructed once)
+- PromptCompiler (case-scoped system instructions, compiled once per case/model)
+- DentalEducationAgent pooled by (model_name, temperature)
+
+Modules are cached in sys.modules across Streamlit reruns, so the singleton
+below survives reruns as well as uvicorn requests.
+"""
+
+import logging
+import os
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+from app.agent import DENTAL_EDUCATOR_PROMPT, DentalEducationAgent
+from app.assessment_engine import AssessmentEngine
+from app.scenario_manager import ScenarioManager
+from app.services.med_gemma_service import MedGemmaService
+from app.services.prompt_compiler import PromptCompiler
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_NAME = "models/gemini-2.5-flash-lite"
+DEFAULT_TEMPERATURE = 0.2
+
+
+class AgentRegistry:
+    """Lazily builds and caches shared agents and catalogs (thread-safe)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._agents: Dict[Tuple[str, float], DentalEducationAgent] = {}
+        self._assessment_engine: Optional[AssessmentEngine] = None
+        self._scenario_manager: Optional[ScenarioManager] = None
+        self._med_gemma: Optional[MedGemmaService] = None
+        self._med_gemma_attempted = False
+        self._prompt_compiler: Optional[PromptCompiler] = None
+
+    # ==================== SHARED CATALOGS ====================
+
+    def get_assessment_engine(self) -> AssessmentEngine:
+        with self._lock:
+            if self._assessment_engine is None:
+                self._assessment_engine = AssessmentEngine()
+            return self._assessment_engine
+
+    def get_scenario_manager(self) -> ScenarioManager:
+        with self._lock:
+            if self._scenario_manager is None:
+                self._scenario_manager = ScenarioManager()
+            return self._scenario_manager
+
+    def get_prompt_compiler(self) -> PromptCompiler:
+        """Compiled per-case prompts are cached per (case, model), so one compiler serves all agents."""
+        with self._lock:
+            if self._prompt_compiler is None:
+                self._prompt_compiler = PromptCompiler(
+                    self.get_assessment_engine(), self.get_scenario_manager(), DENTAL_EDUCATOR_PROMPT
+                )
+            return self._prompt_compiler
+
+    def get_med_gemma(self) -> Optional[MedGemmaService]:
+        """Shared MedGemma client; a failed construction is not retried on every call."""
+        with self._lock:
+            if not self._med_gemma_attempted:
+                self._med_gemma_attempted = True
+                try:
+                    self._med_gemma = MedGemmaService()
+                except Exception as e:
+                    logger.warning(f"MedGemma başlatılamadı: {e}. Sessiz değerlendirme olmadan devam edilecek.")
+                    self._med_gemma = None
+            return self._med_gemma
+
+    # ==================== AGENTS ====================
+
+    def get_agent(
+        self,
+        model_name: Optional[str] = None,
+        temperature: float = DEFAULT_TEMPERATURE,
+        api_key: Optional[str] = None,
+    ) -> DentalEducationAgent:
+        """
+        Return the pooled agent for (model_name, temperature), building it on first use.
+        Raises ValueError (from the agent) when no Gemini API key is available.
+        """
+        key = (model_name or DEFAULT_MODEL_NAME, round(float(temperature), 3))
+        agent = self._agents.get(key)
+        if agent is not None:
+            return agent
+
+        with self._lock:
+            agent = self._agents.get(key)
+            if agent is None:
+                med_gemma = self.get_med_gemma()
+                agent = DentalEducationAgent(
+                    api_key=api_key or os.getenv("GEMINI_API_KEY"),
+                    model_name=key[0],
+                    temperature=key[1],
+                    assessment_engine=self.get_assessment_engine(),
+                    scenario_manager=self.get_scenario_manager(),
+                    med_gemma=med_gemma,
+                    enable_med_gemma=med_gemma is not None,
+                    prompt_compiler=self.get_prompt_compiler(),
+                )
+                self._agents[key] = agent
+                logger.info("Agent registered for model=%s temperature=%s", key[0], key[1])
+            return agent
+
+    def warm_up(self, model_names: Optional[Iterable[str]] = None, api_key: Optional[str] = None) -> bool:
+        """
+        Load catalogs and build agents ahead of the first request (idempotent).
+        Returns False if an agent could not be built (e.g. missing API key).
+        """
+        self.get_assessment_engine()
+        self.get_scenario_manager()
+        try:
+            for name in model_names or [DEFAULT_MODEL_NAME]:
+                self.get_agent(model_name=name, api_key=api_key)
+            return True
+        except Exception as e:
+            logger.warning(f"Agent warm-up failed: {e}")
+            return False
+
+    def reset(self) -> None:
+        """Drop all cached instances (tests / config reload)."""
+        with self._lock:
+            self._agents.clear()
+            self._assessment_engine = None
+            self._scenario_manager = None
+            self._med_gemma = None
+            self._med_gemma_attempted = False
+            self._prompt_compiler = None
+
+
+# Singleton instance
+agent_registry = AgentRegistry()
@@ -0,0 +1,209 @@
+"""
+Shared, hot-reloading catalog over data/case_scenarios.json.
+
+Case data used to be loaded separately by ScenarioManager, by the chat page
+(which re-opened and re-parsed the file for every assistant message on every
+Streamlit rerun) and by a hard-coded case menu in the sidebar; finding media
+was found by scanning the case's findings and calling Path.exists per
+message. The file is now compiled once per process into
+
+    CaseIndex.cases[case_id] -> CaseEntry (raw case dict, menu label,
+                                finding ids, finding_id -> media path)
+
+Menu labels are "<menu_name> (<difficulty>)", falling back to name /
+dogru_tani; a name that already carries a parenthesis gets no difficulty
+suffix. Cases with "menu": false stay loadable by id but are not listed.
+
+and shared through get_case_catalog(). Both schemas of the file are indexed
+(gizli_bulgular / bulgu_id and hidden_findings / finding_id). Media paths
+are resolved and checked for existence at load, so rendering a chat history
+does no file I/O.
+
+CaseCatalog.index() stats the file at most every DENTAI_CASES_RELOAD_SECONDS
+(default 2) and recompiles when the content changed
+(app/services/hot_reload.py); a file that fails to parse keeps the previous
+index.
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from app.services.hot_reload import FileRegistry, HotReloadingFile
+
+logger = logging.getLogger(__name__)
+
+_PROJECT_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", ".."))
+DEFAULT_CASES_PATH = os.path.join(_PROJECT_DIR, "data", "case_scenarios.json")
+FALLBACK_CASE_ID = "olp_001"
+
+
+class CasesFileError(ValueError):
+    """case_scenarios.json has the wrong top-level structure."""
+
+
+@dataclass(frozen=True)
+class CaseEntry:
+    case_id: str
+    data: Dict[str, Any]  # raw case dict, shared: treat as read-only
+    label: str  # menu label, e.g. "Behçet Hastalığı (Zor)"
+    findings: Tuple[str, ...]  # finding ids in file order
+    media: Mapping[str, str]  # finding id -> absolute path of an existing media file
+    descriptions: Mapping[str, str] = field(default_factory=lambda: MappingProxyType({}))  # finding id -> tanim / description
+    in_menu: bool = True  # false for cases marked "menu": false (reachable by id only)
+
+
+@dataclass(frozen=True)
+class CaseIndex:
+    cases: Mapping[str, CaseEntry]
+    order: Tuple[str, ...] = ()
+    digest: str = ""
+    problems: Tuple[str, ...] = ()
+
+    @property
+    def default_case_id(self) -> str:
+        return self.order[0] if self.order else FALLBACK_CASE_ID
+
+    def case(self, case_id: Optional[str]) -> Optional[Dict[str, Any]]:
+        entry = self.cases.get(case_id) if case_id else None
+        return entry.data if entry is not None else None
+
+    def findings(self, case_id: Optional[str]) -> Tuple[str, ...]:
+        entry = self.cases.get(case_id) if case_id else None
+        return entry.findings if entry is not None else ()
+
+    def finding_media(self, case_id: Optional[str], finding_ids: Optional[List[str]]) -> Optional[str]:
+        """Media path of the first revealed finding (in case order) that has an existing file."""
+        entry = self.cases.get(case_id) if case_id else None
+        if entry is None or not finding_ids or not entry.media:
+            return None
+        wanted = set(finding_ids)
+        for finding_id, path in entry.media.items():
+            if finding_id in wanted:
+                return path
+        return None
+
+    def finding_descriptions(self, case_id: Optional[str], finding_ids: Optional[List[str]]) -> List[str]:
+        """Descriptions of the given findings, in the order given (findings without one are skipped)."""
+        entry = self.cases.get(case_id) if case_id else None
+        if entry is None or not finding_ids:
+            return []
+        return [entry.descriptions[f] for f in finding_ids if isinstance(f, str) and f in entry.descriptions]
+
+    def menu(self) -> Dict[str, str]:
+        """Menu label -> case_id, in file order (cases marked "menu": false are left out)."""
+        return {self.cases[case_id].label: case_id for case_id in self.order if self.cases[case_id].in_menu}
+
+
+EMPTY_INDEX = CaseIndex(cases=MappingProxyType({}))
+
+
+# ==================== COMPILE ====================
+
+def _case_label(case: Dict[str, Any], case_id: str) -> str:
+    # menu_name is the short menu text; name is also the case_name the prompts see
+    name = str(case.get("menu_name") or case.get("name") or case.get("dogru_tani") or case_id)
+    difficulty = case.get("difficulty") or case.get("zorluk_seviyesi")
+    if not difficulty or "(" in name:
+        return name
+    return f"{name} ({difficulty})"
+
+
+def compile_cases(data: Any, base_dir: str = _PROJECT_DIR, digest: str = "") -> CaseIndex:
+    """Build a CaseIndex from parsed case_scenarios.json; raises CasesFileError on a wrong top level."""
+    cases = data.get("cases") if isinstance(data, dict) else data
+    if not isinstance(cases, list):
+        raise CasesFileError("Unexpected structure; expected a list or a dict with 'cases'")
+
+    problems: List[str] = []
+    entries: Dict[str, CaseEntry] = {}
+    order: List[str] = []
+    labels: Dict[str, str] = {}
+    for case in cases:
+        case_id = case.get("case_id") if isinstance(case, dict) else None
+        if not isinstance(case_id, str) or not case_id:
+            problems.append("case without a case_id")
+            continue
+        if case_id in entries:
+            problems.append(f"{case_id}: duplicate case entry (the first one is used)")
+            continue
+
+        findings: List[str] = []
+        media: Dict[str, str] = {}
+        descriptions: Dict[str, str] = {}
+        raw_findings = case.get("hidden_findings") or case.get("gizli_bulgular") or []
+        for finding in raw_findings if isinstance(raw_findings, list) else []:
+            if not isinstance(finding, dict):
+                continue
+            finding_id = finding.get("finding_id") or finding.get("bulgu_id")
+            if not isinstance(finding_id, str) or not finding_id:
+                problems.append(f"{case_id}: finding without an id")
+                continue
+            findings.append(finding_id)
+            description = finding.get("description") or finding.get("tanim")
+            if isinstance(description, str) and description:
+                descriptions.setdefault(finding_id, description)
+            path = finding.get("media")
+            if not path:
+                continue
+            full_path = os.path.join(base_dir, path)
+            if os.path.exists(full_path):
+                media.setdefault(finding_id, full_path)
+            else:
+                problems.append(f"{case_id}/{finding_id}: media file not found: {path}")
+
+        label = _case_label(case, case_id)
+        if label in labels:
+            problems.append(f"{case_id}: menu label '{label}' also used by {labels[label]}")
+            label = f"{label} [{case_id}]"
+        labels[label] = case_id
+
+        entries[case_id] = CaseEntry(
+            case_id=case_id,
+            data=case,
+            label=label,
+            findings=tuple(dict.fromkeys(findings)),
+            media=MappingProxyType(media),
+            descriptions=MappingProxyType(descriptions),
+            in_menu=case.get("menu") is not False,
+        )
+        order.append(case_id)
+
+    return CaseIndex(
+        cases=MappingProxyType(entries),
+        order=tuple(order),
+        digest=digest,
+        problems=tuple(problems),
+    )
+
+
+# ==================== CATALOG ====================
+
+class CaseCatalog(HotReloadingFile[CaseIndex]):
+    """Shared, hot-reloading holder of the current CaseIndex for one cases file."""
+
+    def __init__(self, cases_path: str = DEFAULT_CASES_PATH, reload_seconds: Optional[float] = None) -> None:
+        self.cases_path = cases_path
+        super().__init__(
+            cases_path,
+            lambda data, digest: compile_cases(data, digest=digest),
+            EMPTY_INDEX,
+            name="case_scenarios.json",
+            reload_seconds=reload_seconds,
+            reload_env="DENTAI_CASES_RELOAD_SECONDS",
+            describe=lambda index: f"{len(index.cases)} case(s)",
+        )
+
+    def index(self) -> CaseIndex:
+        """Current index; re-checks the file at most every reload_seconds (negative = never)."""
+        return self.current()
+
+
+_catalogs: FileRegistry[CaseCatalog] = FileRegistry(CaseCatalog, DEFAULT_CASES_PATH)
+
+
+def get_case_catalog(cases_path: Optional[str] = None) -> CaseCatalog:
+    """Process-wide CaseCatalog per cases file (ScenarioManager, chat page, sidebar, rule validation)."""
+    return _catalogs.get(cases_path)
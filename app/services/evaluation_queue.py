@@ -0,0 +1,329 @@
+"""
+Durable background queue for MedGemma silent evaluations.
+
+Jobs are stored in the `evaluation_jobs` table of the application DB, so
+pending work survives restarts. A small pool of daemon worker threads claims
+jobs, calls the registered evaluator, retries failures with exponential
+backoff and finally patches the result into the assistant message's
+ChatLog.metadata_json["silent_evaluation"] (or, once the retries are used
+up, {"status": "failed", ...} in the same transaction that fails the job).
+"""
+
+import datetime
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from db.database import SessionLocal, ChatLog, EvaluationJob
+
+logger = logging.getLogger(__name__)
+
+Evaluator = Callable[[Dict[str, Any]], Dict[str, Any]]
+
+
+class EvaluationQueue:
+    """
+    SQLite-backed job queue with a worker pool, retries and back-pressure.
+
+    - enqueue() refuses new work (returns None) once `max_pending` jobs are waiting.
+    - Workers poll the table, so jobs enqueued by other processes are picked up too.
+    - Jobs stuck in 'running' longer than `lease_seconds` (e.g. after a crash) are re-queued,
+      at start and then by the workers every `lease_seconds / 2`.
+    """
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        max_attempts: int = 3,
+        poll_interval: float = 1.0,
+        lease_seconds: int = 120,
+    ) -> None:
+        self.workers = workers or int(os.getenv("DENTAI_EVAL_WORKERS", "2"))
+        self.max_pending = max_pending or int(os.getenv("DENTAI_EVAL_MAX_PENDING", "200"))
+        self.max_attempts = max_attempts
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+
+        self._evaluator: Optional[Evaluator] = None
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._next_recovery_at = 0.0
+
+    # ==================== LIFECYCLE ====================
+
+    @property
+    def running(self) -> bool:
+        return any(t.is_alive() for t in self._threads)
+
+    def start(self, evaluator: Evaluator) -> None:
+        """Start the worker pool (idempotent; the first registered evaluator is kept)."""
+        with self._lock:
+            if self.running:
+                return
+
+            self._evaluator = evaluator
+            self._stopping.clear()
+
+            self._recover_stale_jobs()
+            self._next_recovery_at = time.monotonic() + self.lease_seconds / 2
+
+            self._threads = [
+                threading.Thread(target=self._worker_loop, name=f"eval-worker-{i}", daemon=True)
+                for i in range(self.workers)
+            ]
+            for t in self._threads:
+                t.start()
+            logger.info("Evaluation queue started with %d worker(s)", self.workers)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Signal workers to exit and wait briefly for them."""
+        self._stopping.set()
+        self._wakeup.set()
+        for t in self._threads:
+            t.join(timeout=timeout)
+        self._threads = []
+
+    # ==================== PRODUCER API ====================
+
+    def enqueue(
+        self,
+        payload: Dict[str, Any],
+        chat_log_id: Optional[int] = None,
+        db=None,
+    ) -> Optional[int]:
+        """
+        Persist a new evaluation job.
+        Returns the job id, or None when the queue is full (back-pressure) or the insert failed.
+
+        When `db` is given the job joins the caller's transaction (e.g. a chat
+        turn's unit of work): it is only flushed here, and the caller commits and
+        then calls notify() so the workers see it right away.
+        """
+        own_session = db is None
+        if own_session:
+            db = SessionLocal()
+        try:
+            pending = (
+                db.query(EvaluationJob)
+                .filter(EvaluationJob.status.in_(("pending", "running")))
+                .count()
+            )
+            if pending >= self.max_pending:
+                logger.warning("Evaluation queue full (%d pending); skipping silent evaluation", pending)
+                return None
+
+            now = datetime.datetime.utcnow()
+            job = EvaluationJob(
+                chat_log_id=chat_log_id,
+                status="pending",
+                attempts=0,
+                payload_json=json.dumps(payload, ensure_ascii=False),
+                available_at=now,
+                created_at=now,
+                updated_at=now,
+            )
+            if own_session:
+                db.add(job)
+                db.commit()
+                db.refresh(job)
+            else:
+                # SAVEPOINT: a failed insert must not poison the caller's transaction
+                with db.begin_nested():
+                    db.add(job)
+        except Exception as e:
+            logger.error(f"Failed to enqueue evaluation job: {e}")
+            if own_session:
+                db.rollback()
+            return None
+        finally:
+            if own_session:
+                db.close()
+
+        if own_session:
+            self.notify()
+        return job.id
+
+    def notify(self) -> None:
+        """Wake idle workers (after a caller-owned transaction committed new jobs)."""
+        self._wakeup.set()
+
+    def get_result(self, job_id: int) -> Optional[Dict[str, Any]]:
+        """Return the stored evaluation result, or None if the job is not finished."""
+        db = SessionLocal()
+        try:
+            job = db.get(EvaluationJob, job_id)
+            if not job or job.status != "done" or not job.result_json:
+                return None
+            return json.loads(job.result_json)
+        finally:
+            db.close()
+
+    # ==================== WORKERS ====================
+
+    def _worker_loop(self) -> None:
+        while not self._stopping.is_set():
+            self._maybe_recover_stale_jobs()
+            try:
+                claimed = self._claim_next()
+            except Exception as e:
+                logger.warning(f"Evaluation worker could not claim a job: {e}")
+                claimed = None
+
+            if not claimed:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+
+            job_id, payload, attempts = claimed
+            try:
+                result = self._evaluator(payload) if self._evaluator else None
+                if not isinstance(result, dict):
+                    raise ValueError("Evaluator returned no result")
+                self._complete(job_id, result)
+            except Exception as e:
+                self._fail(job_id, attempts, e)
+
+    def _claim_next(self) -> Optional[Tuple[int, Dict[str, Any], int]]:
+        """Atomically move the oldest due 'pending' job to 'running'."""
+        db = SessionLocal()
+        try:
+            while True:
+                now = datetime.datetime.utcnow()
+                candidate = (
+                    db.query(EvaluationJob.id)
+                    .filter(EvaluationJob.status == "pending", EvaluationJob.available_at <= now)
+                    .order_by(EvaluationJob.id)
+                    .first()
+                )
+                if not candidate:
+                    return None
+
+                # Conditional UPDATE: only one worker (in any process) can win the claim.
+                claimed = (
+                    db.query(EvaluationJob)
+                    .filter(EvaluationJob.id == candidate.id, EvaluationJob.status == "pending")
+                    .update(
+                        {
+                            "status": "running",
+                            "attempts": EvaluationJob.attempts + 1,
+                            "updated_at": now,
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                db.commit()
+                if claimed != 1:
+                    continue
+
+                job = db.get(EvaluationJob, candidate.id)
+                return job.id, json.loads(job.payload_json or "{}"), job.attempts
+        finally:
+            db.close()
+
+    def _complete(self, job_id: int, result: Dict[str, Any]) -> None:
+        db = SessionLocal()
+        try:
+            job = db.get(EvaluationJob, job_id)
+            if not job:
+                return
+            job.status = "done"
+            job.result_json = json.dumps(result, ensure_ascii=False)
+            job.last_error = None
+            job.updated_at = datetime.datetime.utcnow()
+            if job.chat_log_id:
+                self._patch_chat_log(db, job.chat_log_id, result)
+            db.commit()
+            logger.info(
+                "[Sessiz Değerlendirme] Tamamlandı (job=%s): %s",
+                job_id, result.get("is_clinically_accurate", "Bilinmiyor"),
+            )
+        except Exception as e:
+            logger.error(f"Failed to store evaluation result for job {job_id}: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def _fail(self, job_id: int, attempts: int, error: Exception) -> None:
+        """Re-schedule with exponential backoff, or mark as failed after max_attempts."""
+        db = SessionLocal()
+        try:
+            job = db.get(EvaluationJob, job_id)
+            if not job:
+                return
+            now = datetime.datetime.utcnow()
+            job.last_error = str(error)[:1000]
+            job.updated_at = now
+            if attempts >= self.max_attempts:
+                job.status = "failed"
+                if job.chat_log_id:
+                    # Replace the "queued" marker so readers stop waiting for a result
+                    self._patch_chat_log(
+                        db,
+                        job.chat_log_id,
+                        {"status": "failed", "job_id": job_id, "attempts": attempts, "error": job.last_error},
+                    )
+                logger.warning("Silent evaluation job %s failed permanently: %s", job_id, error)
+            else:
+                job.status = "pending"
+                job.available_at = now + datetime.timedelta(seconds=2 ** attempts)
+                logger.info("Silent evaluation job %s failed (attempt %d), retrying: %s", job_id, attempts, error)
+            db.commit()
+        except Exception as e:
+            logger.error(f"Failed to record evaluation failure for job {job_id}: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    def _maybe_recover_stale_jobs(self) -> None:
+        """Run _recover_stale_jobs from one worker at most every lease_seconds / 2."""
+        now = time.monotonic()
+        with self._lock:
+            if now < self._next_recovery_at:
+                return
+            self._next_recovery_at = now + self.lease_seconds / 2
+        self._recover_stale_jobs()
+
+    def _recover_stale_jobs(self) -> None:
+        """Re-queue jobs left in 'running' by a crashed/restarted process."""
+        db = SessionLocal()
+        try:
+            cutoff = datetime.datetime.utcnow() - datetime.timedelta(seconds=self.lease_seconds)
+            recovered = (
+                db.query(EvaluationJob)
+                .filter(EvaluationJob.status == "running", EvaluationJob.updated_at < cutoff)
+                .update({"status": "pending"}, synchronize_session=False)
+            )
+            db.commit()
+            if recovered:
+                logger.info("Re-queued %d stale evaluation job(s)", recovered)
+        except Exception as e:
+            logger.warning(f"Could not recover stale evaluation jobs: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+    @staticmethod
+    def _patch_chat_log(db, chat_log_id: int, result: Dict[str, Any]) -> None:
+        log = db.get(ChatLog, chat_log_id)
+        if not log:
+            return
+        metadata = log.metadata_json
+        if isinstance(metadata, str):
+            try:
+                metadata = json.loads(metadata)
+            except ValueError:
+                metadata = {}
+        metadata = dict(metadata) if isinstance(metadata, dict) else {}
+        metadata["silent_evaluation"] = result
+        # Reassign so SQLAlchemy detects the JSON change
+        log.metadata_json = metadata
+
+
+# Singleton instance
+evaluation_queue = EvaluationQueue()
@@ -0,0 +1,147 @@
+"""
+Shared, hot-reloading holder of a value compiled from one JSON data file.
+
+RuleCatalog (data/scoring_rules.json) and CaseCatalog
+(data/case_scenarios.json) both keep one compiled, immutable index per
+process and swap it when the file changes. The reload logic lives here; each
+catalog only supplies its compile function:
+
+- current() stats the file at most every `reload_seconds` (negative = never;
+  the default comes from the catalog's environment variable) and recompiles
+  when the mtime/size changed and the content hash differs;
+- the new value replaces the old one in a single assignment, so readers
+  never see a half-built index;
+- a file that is missing or fails to compile (compile raises ValueError)
+  keeps the previous value; problems the compiled value reports in
+  `.problems` are logged.
+
+FileRegistry shares one holder per file path (get_rule_catalog, get_case_catalog).
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Generic, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RELOAD_SECONDS = 2.0
+
+T = TypeVar("T")
+H = TypeVar("H")
+
+
+@dataclass
+class _FileStamp:
+    mtime_ns: int = -1
+    size: int = -1
+    checked_at: float = 0.0
+    digest: str = ""
+
+
+def reload_seconds_from_env(env_var: str, default: float = DEFAULT_RELOAD_SECONDS) -> float:
+    try:
+        return float(os.getenv(env_var, str(default)))
+    except ValueError:
+        return default
+
+
+class HotReloadingFile(Generic[T]):
+    """Current value compiled from `path` by `compile(parsed_json, sha256_digest)`."""
+
+    def __init__(
+        self,
+        path: str,
+        compile: Callable[[Any, str], T],
+        empty: T,
+        *,
+        name: str,
+        reload_seconds: Optional[float] = None,
+        reload_env: Optional[str] = None,
+        describe: Optional[Callable[[T], str]] = None,
+    ) -> None:
+        self.path = path
+        self.name = name
+        if reload_seconds is None:
+            reload_seconds = reload_seconds_from_env(reload_env) if reload_env else DEFAULT_RELOAD_SECONDS
+        self.reload_seconds = reload_seconds
+        self.reloads = 0
+        self._compile = compile
+        self._describe = describe
+        self._value: T = empty
+        self._stamp = _FileStamp()
+        self._lock = threading.Lock()
+        self._refresh(force=True)
+
+    def current(self) -> T:
+        """Current value; re-checks the file at most every reload_seconds (negative = never)."""
+        if self.reload_seconds >= 0 and time.monotonic() - self._stamp.checked_at >= self.reload_seconds:
+            self._refresh()
+        return self._value
+
+    def reload(self) -> T:
+        """Recompile now if the file changed (e.g. after an admin edit)."""
+        self._refresh(force=True)
+        return self._value
+
+    def _refresh(self, force: bool = False) -> None:
+        if not self._lock.acquire(blocking=force):
+            return  # another thread is already checking; keep serving the current value
+        try:
+            self._stamp.checked_at = time.monotonic()
+            try:
+                st = os.stat(self.path)
+            except FileNotFoundError:
+                if self._stamp.size != -1 or force:
+                    logger.error("%s not found: %s", self.name, self.path)
+                self._stamp = _FileStamp(checked_at=self._stamp.checked_at)
+                return
+            if not force and (st.st_mtime_ns, st.st_size) == (self._stamp.mtime_ns, self._stamp.size):
+                return
+
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            digest = hashlib.sha256(raw).hexdigest()
+            self._stamp.mtime_ns, self._stamp.size = st.st_mtime_ns, st.st_size
+            if digest == self._stamp.digest:
+                return  # touched, not changed
+
+            try:
+                value = self._compile(json.loads(raw.decode("utf-8")), digest)
+            except ValueError as e:
+                # JSONDecodeError and the catalogs' file errors are ValueErrors
+                logger.error("Failed to load %s (%s): %s", self.name, self.path, e)
+                return
+
+            for problem in getattr(value, "problems", ()):
+                logger.warning("%s: %s", self.name, problem)
+            self._value = value
+            self._stamp.digest = digest
+            self.reloads += 1
+            logger.info("%s loaded: %s", self.name, self._describe(value) if self._describe else self.path)
+        finally:
+            self._lock.release()
+
+
+class FileRegistry(Generic[H]):
+    """One shared holder per (normalized) file path, created on first use."""
+
+    def __init__(self, factory: Callable[[str], H], default_path: str) -> None:
+        self._factory = factory
+        self._default_path = default_path
+        self._holders: Dict[str, H] = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Optional[str] = None) -> H:
+        path = os.path.normpath(os.path.abspath(path or self._default_path))
+        holder = self._holders.get(path)
+        if holder is None:
+            with self._lock:
+                holder = self._holders.get(path)
+                if holder is None:
+                    holder = self._holders[path] = self._factory(path)
+        return holder
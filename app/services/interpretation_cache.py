@@ -0,0 +1,202 @@
+"""
+Two-tier cache for DentalEducationAgent.interpret_action results.
+
+Students of the same cohort type near-identical lines against the same case,
+so interpretations are cached on
+(normalized text, case_id, revealed_findings fingerprint, model_name,
+rules digest, prompt compiler version): editing scoring_rules.json or the
+prompt templates changes the action keys the model sees, so older entries
+are never served for the new prompt.
+
+- Tier 1: in-process LRU (OrderedDict) with TTL.
+- Tier 2: `interpretation_cache` table in the application DB, shared by all
+  processes (Streamlit + uvicorn workers). A DB hit is kept in memory only
+  for the row's remaining lifetime.
+"""
+
+import copy
+import datetime
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from app.text_normalization import normalize_student_text
+from db.database import SessionLocal, InterpretationCacheEntry
+
+logger = logging.getLogger(__name__)
+
+
+class InterpretationCache:
+    """
+    LRU + TTL cache with an optional persistent (SQL) tier and hit/miss counters.
+    Values are deep-copied on the way in and out so callers can mutate them freely.
+    """
+
+    def __init__(
+        self,
+        max_entries: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        persistent: Optional[bool] = None,
+    ) -> None:
+        self.max_entries = max_entries or int(os.getenv("DENTAI_INTERPRETATION_CACHE_SIZE", "2048"))
+        self.ttl_seconds = ttl_seconds or int(os.getenv("DENTAI_INTERPRETATION_CACHE_TTL", "86400"))
+        if persistent is None:
+            persistent = os.getenv("DENTAI_INTERPRETATION_CACHE_PERSIST", "1") != "0"
+        self.persistent = persistent
+
+        self._memory: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {
+            "memory_hits": 0,
+            "db_hits": 0,
+            "misses": 0,
+            "stores": 0,
+            "evictions": 0,
+        }
+
+    # ==================== KEYS ====================
+
+    @staticmethod
+    def make_key(
+        text: str,
+        case_id: Optional[str],
+        revealed_findings: Optional[Iterable[str]],
+        model_name: Optional[str],
+        rules_digest: str = "",
+        prompt_version: Any = "",
+    ) -> str:
+        """Stable cache key; the findings fingerprint is order-insensitive."""
+        findings = sorted({str(f) for f in (revealed_findings or [])})
+        material = json.dumps(
+            [normalize_student_text(text), case_id or "", findings, model_name or "", rules_digest or "", prompt_version],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    # ==================== LOOKUP / STORE ====================
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached interpretation (memory first, then DB) or None."""
+        now = time.time()
+        with self._lock:
+            item = self._memory.get(key)
+            if item is not None:
+                expires_at, value = item
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._counters["memory_hits"] += 1
+                    return copy.deepcopy(value)
+                del self._memory[key]
+
+        found = self._db_get(key) if self.persistent else None
+        with self._lock:
+            if found is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["db_hits"] += 1
+        value, remaining = found
+        # Never outlive the row: another process stored it earlier
+        self._remember(key, value, now + min(remaining, self.ttl_seconds))
+        return copy.deepcopy(value)
+
+    def set(
+        self,
+        key: str,
+        value: Dict[str, Any],
+        case_id: Optional[str] = None,
+        model_name: Optional[str] = None,
+    ) -> None:
+        value = copy.deepcopy(value)
+        self._remember(key, value, time.time() + self.ttl_seconds)
+        with self._lock:
+            self._counters["stores"] += 1
+        if self.persistent:
+            self._db_set(key, value, case_id, model_name)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            counters["memory_entries"] = len(self._memory)
+        lookups = counters["memory_hits"] + counters["db_hits"] + counters["misses"]
+        counters["hit_rate"] = round((counters["memory_hits"] + counters["db_hits"]) / lookups, 3) if lookups else 0.0
+        return counters
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def purge_expired(self) -> int:
+        """Delete expired rows from the persistent tier. Returns the number removed."""
+        if not self.persistent:
+            return 0
+        db = SessionLocal()
+        try:
+            removed = (
+                db.query(InterpretationCacheEntry)
+                .filter(InterpretationCacheEntry.expires_at <= datetime.datetime.utcnow())
+                .delete(synchronize_session=False)
+            )
+            db.commit()
+            return removed
+        except Exception as e:
+            logger.warning(f"Interpretation cache purge failed: {e}")
+            db.rollback()
+            return 0
+        finally:
+            db.close()
+
+    # ==================== INTERNALS ====================
+
+    def _remember(self, key: str, value: Dict[str, Any], expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def _db_get(self, key: str) -> Optional[Tuple[Dict[str, Any], float]]:
+        """(value, seconds until the row expires), or None."""
+        db = SessionLocal()
+        try:
+            entry = db.get(InterpretationCacheEntry, key)
+            remaining = (entry.expires_at - datetime.datetime.utcnow()).total_seconds() if entry else 0.0
+            if remaining <= 0:
+                return None
+            return json.loads(entry.value_json), remaining
+        except Exception as e:
+            logger.warning(f"Interpretation cache DB lookup failed: {e}")
+            return None
+        finally:
+            db.close()
+
+    def _db_set(self, key: str, value: Dict[str, Any], case_id: Optional[str], model_name: Optional[str]) -> None:
+        db = SessionLocal()
+        try:
+            now = datetime.datetime.utcnow()
+            db.merge(
+                InterpretationCacheEntry(
+                    key=key,
+                    case_id=case_id,
+                    model_name=model_name,
+                    value_json=json.dumps(value, ensure_ascii=False),
+                    created_at=now,
+                    expires_at=now + datetime.timedelta(seconds=self.ttl_seconds),
+                )
+            )
+            db.commit()
+        except Exception as e:
+            logger.warning(f"Interpretation cache DB store failed: {e}")
+            db.rollback()
+        finally:
+            db.close()
+
+
+# Singleton instance
+interpretation_cache = InterpretationCache()
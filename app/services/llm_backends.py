@@ -0,0 +1,525 @@
+"""
+Pluggable LLM backends.
+
+DentalEducationAgent (Gemini) and MedGemmaService (Hugging Face) talk to their
+models through the small LLMBackend interface below, so both can run against
+a deterministic local stand-in for load tests, benchmarks and CI (no keys, no
+network).
+
+Selection (environment):
+- DENTAI_LLM_BACKEND          "gemini"/"huggingface" (default, live) or "local"
+- DENTAI_LOCAL_LATENCY_MS     "200" (fixed) or "200:1500" (median:p99, log-normal)
+- DENTAI_LOCAL_FAILURE_RATE   probability (0..1) that a local call raises
+- DENTAI_LOCAL_FIXTURES       JSONL of {"prompt_sha256", "response"} to replay (the key
+                              covers the system instruction too: see prompt_fingerprint)
+- DENTAI_LOCAL_SEED           seed for the latency / failure RNG
+- DENTAI_LLM_RECORD_FIXTURES  JSONL path; live responses are appended for later replay
+
+`hints` passed to generate()/stream() carry structured request context (e.g.
+{"student_action": ...}); live backends ignore them, local responders use them
+instead of re-parsing the prompt.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional
+
+from app.intent_classifier import action_label, classify_intent, clinical_intent_for
+
+logger = logging.getLogger(__name__)
+
+Responder = Callable[[str, Dict[str, Any]], str]
+
+
+def prompt_fingerprint(prompt: str, system_instruction: Optional[str] = None) -> str:
+    """
+    Fixture key of a prompt (sha256 hex). The same user prompt under another
+    system instruction (e.g. another case's compiled prompt) gets another key;
+    without a system instruction the key is the plain prompt hash.
+    """
+    if not system_instruction:
+        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+    system_digest = hashlib.sha256(system_instruction.encode("utf-8")).hexdigest()
+    return hashlib.sha256(f"{system_digest}\n{prompt}".encode("utf-8")).hexdigest()
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token estimate (~4 characters per token) for backends without a tokenizer."""
+    return max(1, math.ceil(len(text or "") / 4))
+
+
+class LLMBackend(ABC):
+    """
+    One configured model (system instruction and default generation settings
+    are bound at construction). Only generate() is mandatory; the other methods
+    fall back to it.
+    """
+
+    name = "base"
+    model_name = ""
+    system_instruction: Optional[str] = None
+    # True when count_tokens() asks the model's tokenizer (otherwise it estimates)
+    counts_tokens = False
+
+    @abstractmethod
+    def generate(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        hints: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Return the full response text. Raises on transport/model errors."""
+
+    async def agenerate(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        hints: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        return await asyncio.to_thread(self.generate, prompt, generation_config, hints)
+
+    def stream(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        hints: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[str]:
+        yield self.generate(prompt, generation_config, hints)
+
+    async def astream(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        hints: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[str]:
+        yield await self.agenerate(prompt, generation_config, hints)
+
+    def count_tokens(self, text: str) -> int:
+        return estimate_tokens(text)
+
+
+# ==================== GEMINI ====================
+
+_configured_api_key: Optional[str] = None
+
+
+def _configure_genai(genai: Any, api_key: str) -> None:
+    """genai.configure is process-global; only call it when the key actually changes."""
+    global _configured_api_key
+    if _configured_api_key != api_key:
+        genai.configure(api_key=api_key)
+        _configured_api_key = api_key
+
+
+def _chunk_text(chunk: Any) -> str:
+    """Text of a streamed Gemini chunk ('' for chunks without text parts, e.g. safety stops)."""
+    try:
+        return getattr(chunk, "text", "") or ""
+    except Exception:
+        return ""
+
+
+class GeminiBackend(LLMBackend):
+    """google.generativeai GenerativeModel."""
+
+    name = "gemini"
+    counts_tokens = True
+
+    def __init__(
+        self,
+        model_name: str,
+        api_key: str,
+        system_instruction: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        try:
+            import google.generativeai as genai
+        except ImportError as e:
+            raise ImportError(
+                "google-generativeai is not installed. Install with:\n"
+                "pip install google-generativeai"
+            ) from e
+
+        _configure_genai(genai, api_key)
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.model = genai.GenerativeModel(
+            model_name=model_name,
+            system_instruction=system_instruction,
+            generation_config=generation_config,
+        )
+
+    def generate(self, prompt, generation_config=None, hints=None) -> str:
+        response = self.model.generate_content(prompt, generation_config=generation_config)
+        return getattr(response, "text", "") or ""
+
+    async def agenerate(self, prompt, generation_config=None, hints=None) -> str:
+        response = await self.model.generate_content_async(prompt, generation_config=generation_config)
+        return getattr(response, "text", "") or ""
+
+    def stream(self, prompt, generation_config=None, hints=None) -> Iterator[str]:
+        response = self.model.generate_content(prompt, generation_config=generation_config, stream=True)
+        for chunk in response:
+            yield _chunk_text(chunk)
+
+    async def astream(self, prompt, generation_config=None, hints=None) -> AsyncIterator[str]:
+        response = await self.model.generate_content_async(
+            prompt, generation_config=generation_config, stream=True
+        )
+        async for chunk in response:
+            yield _chunk_text(chunk)
+
+    def count_tokens(self, text: str) -> int:
+        try:
+            return int(self.model.count_tokens(text).total_tokens)
+        except Exception as e:
+            logger.debug(f"Gemini count_tokens failed, using estimate: {e}")
+            return estimate_tokens(text)
+
+
+# ==================== HUGGING FACE ====================
+
+class HuggingFaceChatBackend(LLMBackend):
+    """huggingface_hub InferenceClient.chat_completion (single user turn)."""
+
+    name = "huggingface"
+
+    def __init__(
+        self,
+        model_id: str,
+        api_key: str,
+        system_instruction: Optional[str] = None,
+        generation_config: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        from huggingface_hub import InferenceClient
+
+        self.model_name = model_id
+        self.system_instruction = system_instruction
+        self.generation_config = dict(generation_config or {})
+        self.client = InferenceClient(token=api_key)
+
+    def _messages(self, prompt: str) -> List[Dict[str, str]]:
+        messages = []
+        if self.system_instruction:
+            messages.append({"role": "system", "content": self.system_instruction})
+        messages.append({"role": "user", "content": prompt})
+        return messages
+
+    def generate(self, prompt, generation_config=None, hints=None) -> str:
+        config = {**self.generation_config, **(generation_config or {})}
+        response = self.client.chat_completion(
+            model=self.model_name,
+            messages=self._messages(prompt),
+            **config,
+        )
+        return (response.choices[0].message.content or "").strip()
+
+    def stream(self, prompt, generation_config=None, hints=None) -> Iterator[str]:
+        config = {**self.generation_config, **(generation_config or {})}
+        for chunk in self.client.chat_completion(
+            model=self.model_name,
+            messages=self._messages(prompt),
+            stream=True,
+            **config,
+        ):
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if delta:
+                yield delta
+
+
+# ==================== LOCAL STAND-IN ====================
+
+class LocalBackendError(RuntimeError):
+    """Synthetic failure injected by LocalBackend."""
+
+
+def _parse_latency(spec: Optional[str]) -> Optional[tuple]:
+    """'200' -> fixed 200 ms; '200:1500' -> log-normal with median 200 ms and p99 1500 ms."""
+    if not spec:
+        return None
+    parts = [float(p) for p in str(spec).split(":") if p.strip()]
+    if not parts or parts[0] <= 0:
+        return None
+    median = parts[0]
+    p99 = parts[1] if len(parts) > 1 and parts[1] > median else median
+    return median, p99
+
+
+class LocalBackend(LLMBackend):
+    """
+    Deterministic offline backend.
+
+    Responses come from recorded fixtures (by prompt_fingerprint of the prompt
+    and the bound system instruction) or, on a miss,
+    from `responder(prompt, hints)`. Each call sleeps for a synthetic latency and
+    fails with probability `failure_rate`, so throughput and tail latency of
+    the surrounding pipeline can be measured without the network.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        responder: Responder,
+        model_name: str = "local",
+        system_instruction: Optional[str] = None,
+        latency_ms: Optional[str] = None,
+        failure_rate: Optional[float] = None,
+        fixtures_path: Optional[str] = None,
+        seed: Optional[int] = None,
+        stream_chunk_chars: int = 16,
+    ) -> None:
+        self.responder = responder
+        self.model_name = model_name
+        self.system_instruction = system_instruction
+        self.latency = _parse_latency(latency_ms if latency_ms is not None else os.getenv("DENTAI_LOCAL_LATENCY_MS"))
+        if failure_rate is None:
+            failure_rate = float(os.getenv("DENTAI_LOCAL_FAILURE_RATE", "0") or 0)
+        self.failure_rate = min(max(failure_rate, 0.0), 1.0)
+        self.stream_chunk_chars = max(1, stream_chunk_chars)
+
+        if seed is None and os.getenv("DENTAI_LOCAL_SEED"):
+            seed = int(os.getenv("DENTAI_LOCAL_SEED"))
+        self._rng = random.Random(seed)
+        self._rng_lock = threading.Lock()
+
+        self.fixtures: Dict[str, str] = {}
+        fixtures_path = fixtures_path or os.getenv("DENTAI_LOCAL_FIXTURES")
+        if fixtures_path:
+            self.fixtures = load_fixtures(fixtures_path)
+
+        self.calls = 0
+        self.fixture_hits = 0
+
+    # --- synthetic behaviour ---
+
+    def _sample(self) -> tuple:
+        """(latency seconds, should_fail) for one call."""
+        with self._rng_lock:
+            self.calls += 1
+            fail = self._rng.random() < self.failure_rate
+            if not self.latency:
+                return 0.0, fail
+            median, p99 = self.latency
+            if p99 == median:
+                return median / 1000.0, fail
+            sigma = math.log(p99 / median) / 2.326  # z(0.99)
+            return self._rng.lognormvariate(math.log(median), sigma) / 1000.0, fail
+
+    def _respond(self, prompt: str, hints: Optional[Dict[str, Any]]) -> str:
+        recorded = self.fixtures.get(prompt_fingerprint(prompt, self.system_instruction))
+        if recorded is not None:
+            self.fixture_hits += 1
+            return recorded
+        return self.responder(prompt, hints or {})
+
+    def _split(self, text: str) -> List[str]:
+        size = self.stream_chunk_chars
+        return [text[i:i + size] for i in range(0, len(text), size)] or [""]
+
+    # --- LLMBackend ---
+
+    def generate(self, prompt, generation_config=None, hints=None) -> str:
+        delay, fail = self._sample()
+        time.sleep(delay)
+        if fail:
+            raise LocalBackendError("503 synthetic backend failure")
+        return self._respond(prompt, hints)
+
+    async def agenerate(self, prompt, generation_config=None, hints=None) -> str:
+        delay, fail = self._sample()
+        await asyncio.sleep(delay)
+        if fail:
+            raise LocalBackendError("503 synthetic backend failure")
+        return self._respond(prompt, hints)
+
+    def stream(self, prompt, generation_config=None, hints=None) -> Iterator[str]:
+        delay, fail = self._sample()
+        if fail:
+            time.sleep(delay)
+            raise LocalBackendError("503 synthetic backend failure")
+        parts = self._split(self._respond(prompt, hints))
+        for part in parts:
+            time.sleep(delay / len(parts))
+            yield part
+
+    async def astream(self, prompt, generation_config=None, hints=None) -> AsyncIterator[str]:
+        delay, fail = self._sample()
+        if fail:
+            await asyncio.sleep(delay)
+            raise LocalBackendError("503 synthetic backend failure")
+        parts = self._split(self._respond(prompt, hints))
+        for part in parts:
+            await asyncio.sleep(delay / len(parts))
+            yield part
+
+
+# ==================== FIXTURES ====================
+
+def load_fixtures(path: str) -> Dict[str, str]:
+    """Read a JSONL fixture file into {prompt_sha256: response}."""
+    fixtures: Dict[str, str] = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    fixtures[entry["prompt_sha256"]] = entry["response"]
+                except (ValueError, KeyError) as e:
+                    logger.warning(f"Skipping bad fixture line {line_no} in {path}: {e}")
+    except FileNotFoundError:
+        logger.warning(f"LLM fixtures file not found: {path}")
+    return fixtures
+
+
+class RecordingBackend(LLMBackend):
+    """Wraps a live backend and appends every (prompt, response) pair to a fixtures file."""
+
+    def __init__(self, inner: LLMBackend, path: str) -> None:
+        self.inner = inner
+        self.path = path
+        self.name = f"{inner.name}+record"
+        self.model_name = inner.model_name
+        self.system_instruction = inner.system_instruction
+        self.counts_tokens = inner.counts_tokens
+        self._lock = threading.Lock()
+
+    def _record(self, prompt: str, response: str) -> None:
+        entry = {
+            "prompt_sha256": prompt_fingerprint(prompt, self.system_instruction),
+            "model": self.model_name,
+            "response": response,
+        }
+        with self._lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+    def generate(self, prompt, generation_config=None, hints=None) -> str:
+        response = self.inner.generate(prompt, generation_config, hints)
+        self._record(prompt, response)
+        return response
+
+    async def agenerate(self, prompt, generation_config=None, hints=None) -> str:
+        response = await self.inner.agenerate(prompt, generation_config, hints)
+        await asyncio.to_thread(self._record, prompt, response)
+        return response
+
+    def stream(self, prompt, generation_config=None, hints=None) -> Iterator[str]:
+        parts: List[str] = []
+        for part in self.inner.stream(prompt, generation_config, hints):
+            parts.append(part)
+            yield part
+        self._record(prompt, "".join(parts))
+
+    async def astream(self, prompt, generation_config=None, hints=None) -> AsyncIterator[str]:
+        parts: List[str] = []
+        async for part in self.inner.astream(prompt, generation_config, hints):
+            parts.append(part)
+            yield part
+        await asyncio.to_thread(self._record, prompt, "".join(parts))
+
+    def count_tokens(self, text: str) -> int:
+        return self.inner.count_tokens(text)
+
+
+# ==================== LOCAL RESPONDERS ====================
+
+def _local_interpretation(action: str) -> Dict[str, Any]:
+    prediction = classify_intent(action or "")
+    if prediction["decision"] == "ACTION" and not prediction.get("blocked_by"):
+        action_key = prediction["interpreted_action"]
+        return {
+            "intent_type": "ACTION",
+            "interpreted_action": action_key,
+            "clinical_intent": clinical_intent_for(action_key),
+            "priority": "medium",
+            "safety_concerns": [],
+            "explanatory_feedback": f"Eylem kaydedildi: {action_label(action_key)}.",
+            "structured_args": {},
+        }
+    return {
+        "intent_type": "CHAT",
+        "interpreted_action": "general_chat" if prediction["decision"] == "CHAT" else "unspecified_action",
+        "clinical_intent": "other",
+        "priority": "low",
+        "safety_concerns": [],
+        "explanatory_feedback": "Anlaşıldı. Hastayı değerlendirmek için klinik adımlarınızı yazabilirsiniz.",
+        "structured_args": {},
+    }
+
+
+def interpretation_responder(prompt: str, hints: Dict[str, Any]) -> str:
+    """Interpretation JSON from the keyword classifier (single action or batch array)."""
+    if "student_actions" in hints:
+        return json.dumps(
+            [{"id": item["id"], **_local_interpretation(item["action"])} for item in hints["student_actions"]],
+            ensure_ascii=False,
+        )
+    return json.dumps(_local_interpretation(hints.get("student_action", prompt)), ensure_ascii=False)
+
+
+def validation_responder(prompt: str, hints: Dict[str, Any]) -> str:
+    """MedGemma-shaped validation JSON (always 'accurate', never a safety violation)."""
+    return json.dumps(
+        {
+            "is_clinically_accurate": True,
+            "safety_violation": False,
+            "missing_critical_info": [],
+            "feedback": "Yerel test modu: klinik doğrulama yapılmadı.",
+        },
+        ensure_ascii=False,
+    )
+
+
+# ==================== FACTORY ====================
+
+def local_backend_enabled() -> bool:
+    return os.getenv("DENTAI_LLM_BACKEND", "").strip().lower() == "local"
+
+
+def _maybe_record(backend: LLMBackend) -> LLMBackend:
+    path = os.getenv("DENTAI_LLM_RECORD_FIXTURES")
+    return RecordingBackend(backend, path) if path else backend
+
+
+def create_interpretation_backend(
+    model_name: str,
+    api_key: Optional[str],
+    system_instruction: Optional[str],
+    generation_config: Optional[Dict[str, Any]],
+) -> LLMBackend:
+    """Backend for DentalEducationAgent (Gemini, or local when DENTAI_LLM_BACKEND=local)."""
+    if local_backend_enabled():
+        return LocalBackend(interpretation_responder, model_name=model_name, system_instruction=system_instruction)
+    if not api_key:
+        raise ValueError(
+            "GEMINI_API_KEY not set. Provide api_key param or set environment variable GEMINI_API_KEY."
+        )
+    return _maybe_record(GeminiBackend(model_name, api_key, system_instruction, generation_config))
+
+
+def create_validation_backend(
+    model_id: str,
+    api_key_loader: Callable[[], Optional[str]],
+    generation_config: Optional[Dict[str, Any]] = None,
+) -> LLMBackend:
+    """Backend for MedGemmaService (Hugging Face, or local when DENTAI_LLM_BACKEND=local)."""
+    if local_backend_enabled():
+        return LocalBackend(validation_responder, model_name=model_id)
+    api_key = api_key_loader()
+    if not api_key:
+        raise ValueError(
+            "HUGGINGFACE_API_KEY not found! "
+            "Please ensure you have a .env file in the project root with this key."
+        )
+    return _maybe_record(HuggingFaceChatBackend(model_id, api_key, generation_config=generation_config))
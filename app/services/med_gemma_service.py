@@ -4,31 +4,36 @@ import logging
 import time
 from pathlib import Path
 from typing import Dict, Any, List, Optional
-from huggingface_hub import InferenceClient
 from dotenv import load_dotenv
 
+from app.json_extractor import parse_json_object
+from app.services.llm_backends import LLMBackend, create_validation_backend
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Validation JSON schema: field -> (type, default)
+VALIDATION_FIELDS = {
+    "is_clinically_accurate": (bool, False),
+    "safety_violation": (bool, False),
+    "missing_critical_info": (list, []),
+    "feedback": (str, ""),
+}
+
+
 class MedGemmaService:
     """
     Service to interact with High-Reasoning LLMs via Hugging Face Inference API
     for medical validation.
     """
     
-    def __init__(self):
-        self.api_key = self._get_api_key_robust()
-        
-        if not self.api_key:
-            raise ValueError(
-                "HUGGINGFACE_API_KEY not found! "
-                "Please ensure you have a .env file in the project root with this key."
-            )
-        
+    def __init__(self, backend: Optional[LLMBackend] = None):
         # Using Gemma 2 9B IT for its strong reasoning capabilities
         self.model_id = "google/gemma-2-9b-it"
-        self.client = InferenceClient(token=self.api_key)
+
+        # Hugging Face by default; DENTAI_LLM_BACKEND=local needs no API key
+        self.backend = backend or create_validation_backend(self.model_id, self._get_api_key_robust)
 
     def _get_api_key_robust(self) -> Optional[str]:
         """
@@ -73,20 +78,8 @@ class MedGemmaService:
 
         return None
 
-    def validate_clinical_action(self, student_text: str, rules: Dict[str, Any], context_summary: str) -> Dict[str, Any]:
-        """
-        Validates a student's action against clinical rules using the LLM.
-        
-        Args:
-            student_text: The action proposed by the student.
-            rules: A dictionary of clinical rules.
-            context_summary: A summary of the patient case context.
-            
-        Returns:
-            A dictionary containing validation results.
-        """
-        
-        system_prompt = f"""
+    def _build_validation_prompt(self, student_text: str, rules: Dict[str, Any], context_summary: str) -> str:
+        return f"""
         You are a Senior Oral Pathology Examiner. Validate the student's clinical decision based strictly on the provided rules.
         
         CASE CONTEXT:
@@ -113,35 +106,46 @@ class MedGemmaService:
         }}
         """
 
-        messages = [{"role": "user", "content": system_prompt}]
+    def validate_clinical_action_once(self, student_text: str, rules: Dict[str, Any], context_summary: str) -> Dict[str, Any]:
+        """
+        Single validation attempt (no retries, no fail-safe).
+        Raises on transport errors or malformed output so callers (e.g. the
+        background evaluation queue) can apply their own retry policy.
+        """
+        content = self.backend.generate(
+            self._build_validation_prompt(student_text, rules, context_summary),
+            generation_config={
+                "max_tokens": 500,
+                "temperature": 0.1,  # Low temperature for consistent JSON
+            },
+            hints={"student_action": student_text},
+        )
+
+        # Fences/prose are skipped and truncated output is recovered, so only
+        # a response without the two verdict flags costs another attempt.
+        return parse_json_object(
+            content,
+            VALIDATION_FIELDS,
+            required=("is_clinically_accurate", "safety_violation"),
+        )
+
+    def validate_clinical_action(self, student_text: str, rules: Dict[str, Any], context_summary: str) -> Dict[str, Any]:
+        """
+        Validates a student's action against clinical rules using the LLM.
+        
+        Args:
+            student_text: The action proposed by the student.
+            rules: A dictionary of clinical rules.
+            context_summary: A summary of the patient case context.
+            
+        Returns:
+            A dictionary containing validation results.
+        """
         max_attempts = 3
         
         for attempt in range(max_attempts):
             try:
-                response = self.client.chat_completion(
-                    model=self.model_id,
-                    messages=messages,
-                    max_tokens=500,
-                    temperature=0.1, # Low temperature for consistent JSON
-                )
-                
-                content = response.choices[0].message.content.strip()
-                
-                # Clean Markdown formatting if present
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
-                
-                result = json.loads(content)
-                
-                # Validate structure
-                required_keys = ["is_clinically_accurate", "safety_violation", "missing_critical_info", "feedback"]
-                if all(key in result for key in required_keys):
-                    return result
-                else:
-                    raise ValueError("Missing required keys in LLM response")
-
+                return self.validate_clinical_action_once(student_text, rules, context_summary)
             except Exception as e:
                 logger.warning(f"Validation attempt {attempt + 1} failed: {e}")
                 time.sleep(1)
@@ -0,0 +1,202 @@
+"""
+Case-scoped prompt compilation for DentalEducationAgent.
+
+DENTAL_EDUCATOR_PROMPT lists every action key of every case plus long
+guidance, and the per-turn user prompt re-serializes the same patient context
+each time. The compiler builds, once per (case_id, model_name):
+
+- a compact system instruction with only the case's scorable target_actions
+  (from scoring_rules.json), the periodontal intake keys for perio_* cases and
+  the static patient context (age, chief complaint) as precomputed JSON;
+- a tiny per-turn user prompt (student text + revealed findings only);
+- token counts for both, so savings against the generic prompt are visible.
+
+Actions outside the case's rule set are unscored either way, so narrowing the
+key list does not change scores; the model answers 'unspecified_action' instead.
+"""
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.assessment_engine import AssessmentEngine
+from app.intake_questions import INTAKE_ACTION_KEYS, INTAKE_CASE_PREFIXES
+from app.scenario_manager import ScenarioManager
+from app.services.llm_backends import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+# Bump when _SYSTEM_TEMPLATE or the user prompts change: cached interpretations
+# (app/services/interpretation_cache.py) are keyed on it
+PROMPT_COMPILER_VERSION = 1
+
+_CLINICAL_INTENTS = (
+    "history_taking|diagnosis_gathering|treatment_planning|patient_education|infection_control|"
+    "radiography|anesthesia|restorative|periodontics|endodontics|oral_surgery|prosthodontics|"
+    "orthodontics|follow_up|other"
+)
+
+_SYSTEM_TEMPLATE = """You are a dental education assistant interpreting one student message in a simulated clinical case.
+Classify it as CHAT (greeting/question) or ACTION (clinical step), map it to ONE action key below and explain briefly.
+Keys and enum values are English; explanatory_feedback is TURKISH (<= 3 sentences).
+Respond with ONLY this JSON object (no markdown, no prose):
+{{"intent_type":"CHAT|ACTION","interpreted_action":"<action key>","clinical_intent":"{intents}","priority":"high|medium|low","safety_concerns":[],"explanatory_feedback":"...","structured_args":{{}}}}
+ACTION KEYS: {action_keys}
+If none fit use 'unspecified_action' (CHAT: 'general_chat').{intake_block}
+CASE: {case_context}
+Prefer conservative, safety-first interpretations; put unsafe or unclear actions in safety_concerns and raise priority.
+Patient realism: habits (smoking, alcohol, neglect) and past illnesses are downplayed until the student points to signs or presses; describe lesions with vivid clinical metaphors."""
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """Precomputed prompt material for one (case_id, model_name)."""
+
+    case_id: str
+    model_name: str
+    system_instruction: str
+    action_keys: Tuple[str, ...]
+    static_context_json: str
+    system_tokens: int
+    generic_system_tokens: int
+    token_source: str = "estimate"
+
+    def user_prompt(self, action: str, state: Dict[str, Any]) -> str:
+        """Per-turn prompt: only what changes between turns."""
+        findings = state.get("revealed_findings") or []
+        return (
+            f"Student action:\n{action}\n\n"
+            f"Revealed findings: {json.dumps(findings, ensure_ascii=False)}"
+        )
+
+    def batch_user_prompt(self, items: List[Tuple[int, str]], state: Dict[str, Any]) -> str:
+        findings = state.get("revealed_findings") or []
+        actions = [{"id": item_id, "action": text} for item_id, text in items]
+        return (
+            f"Student actions (interpret each independently):\n{json.dumps(actions, ensure_ascii=False)}\n\n"
+            f"Revealed findings: {json.dumps(findings, ensure_ascii=False)}\n\n"
+            "Return a JSON array with one object per action; each object has the input \"id\" "
+            "plus every field of the schema."
+        )
+
+
+class PromptCompiler:
+    """Compiles and caches CompiledPrompt objects (thread-safe)."""
+
+    def __init__(
+        self,
+        assessment_engine: AssessmentEngine,
+        scenario_manager: ScenarioManager,
+        generic_prompt: str = "",
+    ) -> None:
+        self.assessment_engine = assessment_engine
+        self.scenario_manager = scenario_manager
+        self.generic_prompt = generic_prompt
+        self._compiled: Dict[Tuple[str, str, Tuple[str, ...]], CompiledPrompt] = {}
+        self._lock = threading.Lock()
+
+    def compile(
+        self,
+        case_id: Optional[str],
+        model_name: str,
+        token_counter: Optional[Callable[[str], int]] = None,
+    ) -> Optional[CompiledPrompt]:
+        """
+        Return the compiled prompt for a case, or None when the case has no rules
+        (callers then keep using the generic prompt).
+        """
+        if not case_id:
+            return None
+        action_keys = tuple(self.assessment_engine.get_case_actions(case_id))
+        if not action_keys:
+            return None
+
+        # The action list is part of the key: a hot-reloaded rules file recompiles the case
+        key = (case_id, model_name, action_keys)
+        compiled = self._compiled.get(key)
+        if compiled is not None:
+            return compiled
+
+        with self._lock:
+            compiled = self._compiled.get(key)
+            if compiled is None:
+                compiled = self._build(case_id, model_name, action_keys, token_counter)
+                # Drop the case's prompt compiled from a previous rules file
+                for stale in [k for k in self._compiled if k[:2] == key[:2]]:
+                    del self._compiled[stale]
+                self._compiled[key] = compiled
+                logger.info(
+                    "Compiled prompt for case=%s model=%s: %d tokens (generic %d)",
+                    case_id, model_name, compiled.system_tokens, compiled.generic_system_tokens,
+                )
+            return compiled
+
+    def _build(
+        self,
+        case_id: str,
+        model_name: str,
+        action_keys: Tuple[str, ...],
+        token_counter: Optional[Callable[[str], int]],
+    ) -> CompiledPrompt:
+        initial_state = self.scenario_manager.build_initial_state(case_id)
+        patient = initial_state.get("patient") or {}
+        static_context = {
+            "case_id": case_id,
+            "patient_age": patient.get("age"),
+            "chief_complaint": patient.get("chief_complaint"),
+        }
+        static_context_json = json.dumps(static_context, ensure_ascii=False, separators=(",", ":"))
+
+        intake_block = ""
+        if case_id.startswith(INTAKE_CASE_PREFIXES):
+            intake_block = "\nINTAKE KEYS (anamnesis questions, also valid action keys): " + ",".join(INTAKE_ACTION_KEYS)
+
+        system_instruction = _SYSTEM_TEMPLATE.format(
+            intents=_CLINICAL_INTENTS,
+            action_keys=",".join(action_keys),
+            intake_block=intake_block,
+            case_context=static_context_json,
+        )
+
+        counter, source = (token_counter, "model") if token_counter else (estimate_tokens, "estimate")
+        try:
+            system_tokens = counter(system_instruction)
+            generic_tokens = counter(self.generic_prompt) if self.generic_prompt else 0
+        except Exception as e:
+            logger.debug(f"Token counting failed for case {case_id}, using estimate: {e}")
+            system_tokens = estimate_tokens(system_instruction)
+            generic_tokens = estimate_tokens(self.generic_prompt) if self.generic_prompt else 0
+            source = "estimate"
+
+        return CompiledPrompt(
+            case_id=case_id,
+            model_name=model_name,
+            system_instruction=system_instruction,
+            action_keys=action_keys,
+            static_context_json=static_context_json,
+            system_tokens=system_tokens,
+            generic_system_tokens=generic_tokens,
+            token_source=source,
+        )
+
+    def token_report(self) -> List[Dict[str, Any]]:
+        """Token counts of every compiled prompt (for /status and benchmarks)."""
+        with self._lock:
+            compiled = list(self._compiled.values())
+        return [
+            {
+                "case_id": c.case_id,
+                "model_name": c.model_name,
+                "system_tokens": c.system_tokens,
+                "generic_system_tokens": c.generic_system_tokens,
+                "saved_tokens": c.generic_system_tokens - c.system_tokens,
+                "token_source": c.token_source,
+            }
+            for c in compiled
+        ]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._compiled.clear()
@@ -0,0 +1,316 @@
+"""
+Compiled, hot-reloadable index over data/scoring_rules.json.
+
+AssessmentEngine used to keep the raw JSON list and scan it (cases, then the
+case's rules) on every action, and every engine re-read the file. Instead the
+file is compiled once per process into
+
+    RuleIndex.cases[case_id] -> CaseRules.rules[target_action] -> CompiledRule
+
+(frozen objects, O(1) lookups) and shared by every engine through
+get_rule_catalog(). RuleCatalog.index() stats the file at most every
+DENTAI_RULES_RELOAD_SECONDS (default 2) and recompiles when the content
+changed (app/services/hot_reload.py); a file that fails to parse keeps the
+previous index.
+
+Validation at load (logged, and kept in RuleIndex.problems):
+- duplicate target_action within a case (the first rule wins, as before)
+- duplicate case entries (the first entry wins, as before)
+- case_ids that are not in data/case_scenarios.json
+- rules without a target_action
+Check a file by hand with: python scripts/validate_rules.py
+
+Sequence DSL (optional, per rule) — compiled into a per-case SequenceMachine:
+
+    "requires": ["check_allergies_meds"]      actions that must come earlier
+    "forbidden_after": ["prescribe_steroid"]  actions that must NOT come earlier
+    "penalty": {"score": -25, "rule_outcome": "..."}   used when requires/forbidden_after fails
+
+Every action the case's rules mention gets one bit, in the order actions first
+appear in the case (rules, then referenced actions). These are the low bits of
+the session's progress bitmap (app/progress.py lays out prompt_actions first),
+so the history a check runs against is that bitmap, not a second copy; each
+check is a couple of AND ops. Actions named in requires / forbidden_after are
+offered in the case's compiled prompt (prompt_actions). Repeats need no DSL key:
+a positive-score action already in the bitmap always scores 0 (the former
+"first_time_only" key is reported as unused).
+"""
+
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.services.case_catalog import get_case_catalog
+from app.services.hot_reload import FileRegistry, HotReloadingFile
+
+logger = logging.getLogger(__name__)
+
+_DATA_DIR = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "..", "data"))
+DEFAULT_RULES_PATH = os.path.join(_DATA_DIR, "scoring_rules.json")
+DEFAULT_CASES_PATH = os.path.join(_DATA_DIR, "case_scenarios.json")
+
+
+class RulesFileError(ValueError):
+    """The rules file could not be read or has the wrong top-level structure."""
+
+
+@dataclass(frozen=True)
+class CompiledRule:
+    """One scoring rule; `raw` is a read-only view of the JSON object."""
+
+    target_action: str
+    score: Any
+    rule_outcome: str
+    action_effect: Any
+    state_updates_json: str
+    raw: Mapping[str, Any]
+
+    def state_updates(self) -> Dict[str, Any]:
+        """Fresh copy of the rule's state_updates (callers may mutate it)."""
+        return json.loads(self.state_updates_json)
+
+
+@dataclass(frozen=True)
+class SequenceRule:
+    requires_mask: int
+    forbidden_mask: int
+    penalty_score: Any
+    penalty_outcome: Optional[str]
+
+
+@dataclass(frozen=True)
+class SequenceVerdict:
+    """Outcome of one check: kind is 'ok', 'requires' or 'forbidden'."""
+
+    kind: str
+    actions: Tuple[str, ...] = ()  # missing (requires) / offending (forbidden_after) actions
+
+
+SEQUENCE_OK = SequenceVerdict("ok")
+
+
+@dataclass(frozen=True)
+class SequenceMachine:
+    """Per-case bitmask state machine over the actions a session has performed."""
+
+    layout: str
+    bits: Mapping[str, int]  # action -> single-bit mask
+    rules: Mapping[str, SequenceRule]
+
+    def check(self, mask: int, action: str) -> SequenceVerdict:
+        """Verdict for performing `action` after the actions in `mask`."""
+        rule = self.rules.get(action)
+        if rule is None:
+            return SEQUENCE_OK
+        if mask & rule.requires_mask != rule.requires_mask:
+            return SequenceVerdict("requires", self._names(rule.requires_mask & ~mask))
+        if mask & rule.forbidden_mask:
+            return SequenceVerdict("forbidden", self._names(mask & rule.forbidden_mask))
+        return SEQUENCE_OK
+
+    def _names(self, mask: int) -> Tuple[str, ...]:
+        return tuple(action for action, bit in self.bits.items() if mask & bit)
+
+    def mask_of(self, actions: Iterable[str]) -> int:
+        """Mask of the given actions (used when the progress bitmap has another layout)."""
+        mask = 0
+        for action in actions:
+            mask |= self.bits.get(action, 0)
+        return mask
+
+
+@dataclass(frozen=True)
+class CaseRules:
+    case_id: str
+    rules: Mapping[str, CompiledRule]
+    actions: Tuple[str, ...]  # target_actions in file order
+    sequence: Optional[SequenceMachine] = None  # None: no rule of the case uses the DSL
+
+
+@dataclass(frozen=True)
+class RuleIndex:
+    cases: Mapping[str, CaseRules]
+    digest: str = ""
+    problems: Tuple[str, ...] = ()
+
+    def rule(self, case_id: str, action: str) -> Optional[CompiledRule]:
+        case = self.cases.get(case_id)
+        return case.rules.get(action) if case is not None else None
+
+    def case_actions(self, case_id: str) -> Tuple[str, ...]:
+        case = self.cases.get(case_id)
+        return case.actions if case is not None else ()
+
+    def prompt_actions(self, case_id: str) -> Tuple[str, ...]:
+        """
+        Action keys the case's prompt must offer: the target_actions, then every
+        action named in requires / forbidden_after (otherwise the model could
+        never emit a required step and the rule would always fail).
+        """
+        case = self.cases.get(case_id)
+        if case is None:
+            return ()
+        if case.sequence is None:
+            return case.actions
+        return tuple(dict.fromkeys(case.actions + tuple(case.sequence.bits)))
+
+
+EMPTY_INDEX = RuleIndex(cases=MappingProxyType({}))
+
+
+# ==================== COMPILE ====================
+
+def known_case_ids(cases_path: Optional[str]) -> Optional[set]:
+    if not cases_path:
+        return None
+    index = get_case_catalog(cases_path).index()
+    if not index.digest:
+        logger.warning("Could not read %s for rule validation", cases_path)
+        return None
+    return set(index.cases)
+
+
+def compile_rules(data: Any, known_cases: Optional[set] = None, digest: str = "") -> RuleIndex:
+    """Build a RuleIndex from parsed scoring_rules.json; raises RulesFileError on a wrong top level."""
+    if not isinstance(data, list):
+        raise RulesFileError(f"Invalid rules format (expected list): {type(data).__name__}")
+
+    problems: List[str] = []
+    cases: Dict[str, CaseRules] = {}
+    for position, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            problems.append(f"entry #{position}: not an object")
+            continue
+        case_id = entry.get("case_id")
+        if not isinstance(case_id, str) or not case_id:
+            problems.append(f"entry #{position}: missing case_id")
+            continue
+        if case_id in cases:
+            problems.append(f"{case_id}: duplicate case entry #{position} ignored")
+            continue
+        if known_cases is not None and case_id not in known_cases:
+            problems.append(f"{case_id}: not found in case_scenarios.json")
+
+        rules_list = entry.get("rules")
+        if rules_list is None:
+            rules_list = entry.get("actions", [])
+        if not isinstance(rules_list, list):
+            problems.append(f"{case_id}: rules is not a list")
+            rules_list = []
+
+        rules: Dict[str, CompiledRule] = {}
+        for i, rule in enumerate(rules_list):
+            action = rule.get("target_action") if isinstance(rule, dict) else None
+            if not isinstance(action, str) or not action:
+                problems.append(f"{case_id}: rule #{i} has no target_action")
+                continue
+            if action in rules:
+                problems.append(f"{case_id}: duplicate target_action '{action}' (rule #{i} ignored)")
+                continue
+            rules[action] = CompiledRule(
+                target_action=action,
+                score=rule.get("score", 0),
+                rule_outcome=rule.get("rule_outcome", "Unscored"),
+                action_effect=rule.get("action_effect"),
+                state_updates_json=json.dumps(rule.get("state_updates", {}), ensure_ascii=False),
+                raw=MappingProxyType(dict(rule)),
+            )
+        sequence = _compile_sequence(case_id, rules, problems)
+        cases[case_id] = CaseRules(case_id, MappingProxyType(rules), tuple(rules), sequence)
+
+    return RuleIndex(cases=MappingProxyType(cases), digest=digest, problems=tuple(problems))
+
+
+def _action_list(case_id: str, action: str, rule: Mapping[str, Any], key: str, problems: List[str]) -> Tuple[str, ...]:
+    value = rule.get(key, [])
+    if isinstance(value, str):
+        value = [value]
+    if not isinstance(value, list) or not all(isinstance(a, str) and a for a in value):
+        problems.append(f"{case_id}: '{action}'.{key} must be a list of action keys")
+        return ()
+    if action in value:
+        problems.append(f"{case_id}: '{action}'.{key} refers to itself")
+        value = [a for a in value if a != action]
+    return tuple(dict.fromkeys(value))
+
+
+def _compile_sequence(case_id: str, rules: Dict[str, CompiledRule], problems: List[str]) -> Optional[SequenceMachine]:
+    for action, rule in rules.items():
+        if "first_time_only" in rule.raw:
+            problems.append(f"{case_id}: '{action}'.first_time_only is unused (repeats of a positive-score action score 0)")
+    dsl_keys = ("requires", "forbidden_after")
+    if not any(key in rule.raw for rule in rules.values() for key in dsl_keys):
+        return None
+
+    parsed: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...], Mapping[str, Any]]] = {}
+    order: List[str] = list(rules)
+    for action, rule in rules.items():
+        requires = _action_list(case_id, action, rule.raw, "requires", problems)
+        forbidden = _action_list(case_id, action, rule.raw, "forbidden_after", problems)
+        if set(requires) & set(forbidden):
+            problems.append(f"{case_id}: '{action}' both requires and forbids {sorted(set(requires) & set(forbidden))}")
+        penalty = rule.raw.get("penalty", {})
+        if not isinstance(penalty, dict):
+            problems.append(f"{case_id}: '{action}'.penalty must be an object")
+            penalty = {}
+        parsed[action] = (requires, forbidden, penalty)
+        order.extend(a for a in requires + forbidden if a not in order)
+
+    bits = {action: 1 << i for i, action in enumerate(order)}
+    sequence_rules: Dict[str, SequenceRule] = {}
+    for action, (requires, forbidden, penalty) in parsed.items():
+        if not (requires or forbidden):
+            continue
+        sequence_rules[action] = SequenceRule(
+            requires_mask=sum(bits[a] for a in requires),
+            forbidden_mask=sum(bits[a] for a in forbidden),
+            penalty_score=penalty.get("score", 0),
+            penalty_outcome=penalty.get("rule_outcome"),
+        )
+    layout = hashlib.sha1("|".join(order).encode("utf-8")).hexdigest()[:12]
+    return SequenceMachine(layout, MappingProxyType(bits), MappingProxyType(sequence_rules))
+
+
+# ==================== SHARED CATALOG ====================
+
+class RuleCatalog(HotReloadingFile[RuleIndex]):
+    """Shared, hot-reloading holder of the current RuleIndex for one rules file."""
+
+    def __init__(
+        self,
+        rules_path: str = DEFAULT_RULES_PATH,
+        cases_path: Optional[str] = DEFAULT_CASES_PATH,
+        reload_seconds: Optional[float] = None,
+    ) -> None:
+        self.rules_path = rules_path
+        self.cases_path = cases_path
+        super().__init__(
+            rules_path,
+            self._compile_file,
+            EMPTY_INDEX,
+            name="scoring_rules.json",
+            reload_seconds=reload_seconds,
+            reload_env="DENTAI_RULES_RELOAD_SECONDS",
+            describe=lambda index: (
+                f"{len(index.cases)} case(s), {sum(len(c.rules) for c in index.cases.values())} rule(s)"
+            ),
+        )
+
+    def _compile_file(self, data: Any, digest: str) -> RuleIndex:
+        return compile_rules(data, known_case_ids(self.cases_path), digest)
+
+    def index(self) -> RuleIndex:
+        """Current index; re-checks the file at most every reload_seconds (negative = never)."""
+        return self.current()
+
+
+_catalogs: FileRegistry[RuleCatalog] = FileRegistry(RuleCatalog, DEFAULT_RULES_PATH)
+
+
+def get_rule_catalog(rules_path: Optional[str] = None) -> RuleCatalog:
+    """Process-wide RuleCatalog per rules file (shared by every AssessmentEngine)."""
+    return _catalogs.get(rules_path)
@@ -0,0 +1,124 @@
+"""
+In-process cache of decoded scenario state for ScenarioManager.
+
+Scenario state is rebuilt from the latest snapshot plus the events after it
+(db/event_store.py), so a read that misses the cache costs a snapshot decode
+and up to N event replays. Entries are keyed by (student_id, case_id) and
+remember the session row's `version` (= last event seq):
+
+- Reads compare the cached version with a tiny `SELECT id, version, ...`
+  and only rebuild the state when another process appended events in between.
+- Writes append the turn's events guarded by `UPDATE ... WHERE version = ?`
+  (optimistic concurrency, see ScenarioManager), then refresh the entry.
+- The cache is bounded (LRU) and entries idle for `idle_seconds` are evicted.
+
+Cached state objects are shared: treat them as read-only (ScenarioManager
+merges copy-on-write and hands deep copies to external callers).
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+StateKey = Tuple[str, str]
+
+
+@dataclass
+class CachedSessionState:
+    """Decoded state of one StudentSession row at a known version."""
+
+    session_id: int
+    case_id: str
+    version: int
+    score: float
+    state: Dict[str, Any]
+    last_access: float = field(default_factory=time.monotonic)
+
+
+class SessionStateCache:
+    """Bounded LRU of CachedSessionState with idle eviction and hit/miss counters (thread-safe)."""
+
+    def __init__(self, max_entries: Optional[int] = None, idle_seconds: Optional[int] = None) -> None:
+        self.max_entries = max_entries or int(os.getenv("DENTAI_STATE_CACHE_SIZE", "1024"))
+        self.idle_seconds = idle_seconds or int(os.getenv("DENTAI_STATE_CACHE_IDLE_SECONDS", "1800"))
+
+        self._entries: "OrderedDict[StateKey, CachedSessionState]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "stale": 0, "misses": 0, "conflicts": 0, "evictions": 0}
+
+    def get(self, key: StateKey, version: Optional[int] = None) -> Optional[CachedSessionState]:
+        """
+        Cached entry for key, or None. With `version`, an entry at another
+        version counts as stale and is dropped.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            if now - entry.last_access > self.idle_seconds:
+                del self._entries[key]
+                self._counters["evictions"] += 1
+                self._counters["misses"] += 1
+                return None
+            if version is not None and entry.version != version:
+                del self._entries[key]
+                self._counters["stale"] += 1
+                return None
+            entry.last_access = now
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return entry
+
+    def put(self, key: StateKey, entry: CachedSessionState) -> None:
+        now = time.monotonic()
+        entry.last_access = now
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            # Access order == LRU order, so idle entries sit at the front
+            while self._entries:
+                oldest = next(iter(self._entries.values()))
+                if len(self._entries) <= self.max_entries and now - oldest.last_access <= self.idle_seconds:
+                    break
+                self._entries.popitem(last=False)
+                self._counters["evictions"] += 1
+
+    def invalidate(self, key: StateKey) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def record_conflict(self) -> None:
+        with self._lock:
+            self._counters["conflicts"] += 1
+
+    def evict_idle(self) -> int:
+        """Drop entries not used for idle_seconds; returns how many were removed."""
+        cutoff = time.monotonic() - self.idle_seconds
+        with self._lock:
+            idle = [k for k, e in self._entries.items() if e.last_access < cutoff]
+            for k in idle:
+                del self._entries[k]
+            self._counters["evictions"] += len(idle)
+        if idle:
+            logger.debug("Evicted %d idle session state(s)", len(idle))
+        return len(idle)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            counters = dict(self._counters)
+            counters["entries"] = len(self._entries)
+        lookups = counters["hits"] + counters["stale"] + counters["misses"]
+        counters["hit_rate"] = round(counters["hits"] / lookups, 3) if lookups else 0.0
+        return counters
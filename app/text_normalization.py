@@ -0,0 +1,33 @@
+"""
+Turkish-aware text normalization helpers.
+
+Python's str.lower() maps "I" to "i" and "İ" to "i̇" (i + combining dot),
+which is wrong for Turkish. These helpers apply Turkish casing rules so that
+"ATEŞİNİ ÖLÇÜYORUM" and "ateşini ölçüyorum" normalize to the same string.
+"""
+
+import re
+import unicodedata
+
+_TURKISH_UPPER_MAP = str.maketrans({"I": "ı", "İ": "i"})
+_NON_WORD_RE = re.compile(r"[^\w\s]", flags=re.UNICODE)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def turkish_lower(text: str) -> str:
+    """Lower-case text using Turkish dotted/dotless i rules."""
+    if not text:
+        return ""
+    lowered = unicodedata.normalize("NFC", text).translate(_TURKISH_UPPER_MAP).lower()
+    # Drop stray combining dots (e.g. from decomposed "İ" input)
+    return lowered.replace("̇", "")
+
+
+def normalize_student_text(text: str) -> str:
+    """
+    Canonical form of a student message for matching and caching:
+    Turkish lower-case, punctuation removed, whitespace collapsed.
+    """
+    lowered = turkish_lower(text)
+    without_punct = _NON_WORD_RE.sub(" ", lowered).replace("_", " ")
+    return _WHITESPACE_RE.sub(" ", without_punct).strip()
@@ -6,24 +6,21 @@ Streamlit uygulaması için SQLite kullanır.
 """
 
 import datetime
-import os
-import sqlite3
-from urllib.parse import urlparse
-from typing import Optional
-from sqlalchemy import create_engine, Column, Integer, String, Text, Float, DateTime, JSON, ForeignKey
+from sqlalchemy import (
+    Column, Integer, String, Text, Float, DateTime, JSON, LargeBinary, ForeignKey, Index, UniqueConstraint, distinct, func,
+)
 from sqlalchemy.orm import declarative_base, sessionmaker, relationship
 
+from db.storage import StorageConfig, create_storage_engine
+
 # ==================== VERİTABANI KONFIGÜRASYONU ====================
 
-# SQLite veritabanı URL'i (proje kök dizininde oluşturulacak)
-DATABASE_URL = "sqlite:///./dentai_app.db"
+# Veritabanı URL'i ve engine ayarları ortamdan gelir (bkz. db/storage.py).
+# Varsayılan: proje kök dizininde SQLite (sqlite:///./dentai_app.db), WAL modunda.
+storage_config = StorageConfig.from_env()
+DATABASE_URL = storage_config.url
 
-# Engine oluştur (Streamlit için check_same_thread=False kritik!)
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    echo=False  # True yaparsanız SQL sorgularını görebilirsiniz (debug için)
-)
+engine = create_storage_engine(storage_config)
 
 # Session factory (her veritabanı işlemi için yeni session)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -41,14 +38,24 @@ class StudentSession(Base):
     Her öğrencinin bir vaka üzerindeki çalışma oturumunu takip eder.
     """
     __tablename__ = "student_sessions"
+    __table_args__ = (
+        # Her turdaki sorgu: (student_id, case_id) için en son oturum
+        Index("ix_student_sessions_student_case_start", "student_id", "case_id", "start_time"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     student_id = Column(String, nullable=False, index=True)  # Öğrenci kimliği
     case_id = Column(String, nullable=False)  # Hangi vaka üzerinde çalışıyor
     current_score = Column(Float, default=0.0)  # Anlık puan
-    # Simulation state (JSON string). Stores patient context, revealed findings, progress, etc.
+    # Başlangıç durumu (JSON). Canlı durum = scenario_snapshots + scenario_events (bkz. db/event_store.py)
     state_json = Column(Text, default="{}")
+    # Son uygulanan scenario_events.seq; optimistic concurrency (ScenarioManager state cache)
+    version = Column(Integer, nullable=False, default=0)
     start_time = Column(DateTime, default=datetime.datetime.utcnow)  # Oturum başlangıç zamanı
+    # Arşivlendiyse zamanı: mesajlar/olaylar session_archives'ta sıkıştırılmış (bkz. db/retention.py)
+    archived_at = Column(DateTime, nullable=True)
+    # Son değişiklik zamanı (skor/versiyon/arşiv); artımlı korpus dışa aktarımının filigranı
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, index=True)
 
     # İlişki: Bir oturumun birden fazla chat mesajı olabilir
     chat_logs = relationship("ChatLog", back_populates="session", cascade="all, delete-orphan")
@@ -65,6 +72,12 @@ class ChatLog(Base):
     MedGemma validasyon sonuçlarını metadata_json alanında saklar.
     """
     __tablename__ = "chat_logs"
+    __table_args__ = (
+        # Geçmiş (session_id + zaman sırası) ve istatistik (session_id + role) sorguları
+        Index("ix_chat_logs_session_role_timestamp", "session_id", "role", "timestamp"),
+        # Sayfalı geçmiş API'si: session_id + id üzerinde keyset (id > / < cursor)
+        Index("ix_chat_logs_session_id_id", "session_id", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     session_id = Column(Integer, ForeignKey("student_sessions.id"), nullable=False)  # Hangi oturuma ait
@@ -72,6 +85,8 @@ class ChatLog(Base):
     content = Column(Text, nullable=False)  # Mesaj içeriği
     metadata_json = Column(JSON, nullable=True)  # MedGemma analiz sonuçları (JSON formatında)
     timestamp = Column(DateTime, default=datetime.datetime.utcnow)  # Mesaj zamanı
+    # Son değişiklik zamanı (MedGemma sonucu / yeniden puanlama metadata'yı yamalar); dışa aktarım filigranı
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow, onupdate=datetime.datetime.utcnow, index=True)
 
     # İlişki: Her chat log bir oturuma aittir
     session = relationship("StudentSession", back_populates="chat_logs")
@@ -100,64 +115,229 @@ class ExamResult(Base):
         return f"<ExamResult(id={self.id}, user={self.user_id}, case={self.case_id}, score={self.score}/{self.max_score})>"
 
 
-# ==================== VERİTABANI FONKSİYONLARI ====================
+class EvaluationJob(Base):
+    """
+    Sessiz Değerlendirme Kuyruğu
+    ----------------------------
+    MedGemma doğrulama işlerini kalıcı olarak saklar (uygulama yeniden başlasa da kaybolmaz).
+    İş tamamlandığında sonuç, bağlı asistan mesajının
+    ChatLog.metadata_json["silent_evaluation"] alanına yazılır.
+    """
+    __tablename__ = "evaluation_jobs"
 
-def init_db():
+    id = Column(Integer, primary_key=True, index=True)
+    chat_log_id = Column(Integer, ForeignKey("chat_logs.id"), nullable=True, index=True)  # Sonucun yazılacağı asistan mesajı
+    status = Column(String, nullable=False, default="pending", index=True)  # 'pending', 'running', 'done', 'failed'
+    attempts = Column(Integer, nullable=False, default=0)  # Deneme sayısı
+    payload_json = Column(Text, nullable=False)  # Değerlendirme girdisi (öğrenci metni, kategori, bağlam)
+    result_json = Column(Text, nullable=True)  # MedGemma sonucu
+    last_error = Column(Text, nullable=True)
+    available_at = Column(DateTime, default=datetime.datetime.utcnow)  # Yeniden deneme zamanı (backoff)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    def __repr__(self):
+        return f"<EvaluationJob(id={self.id}, status={self.status}, attempts={self.attempts}, chat_log={self.chat_log_id})>"
+
+
+class ActionEvent(Base):
     """
-    Veritabanını başlat (tüm tabloları oluştur).
-    Uygulama ilk çalıştırıldığında çağrılmalı.
+    Eylem Olayları Tablosu (append-only)
+    ------------------------------------
+    Her puanlanan öğrenci turu için normalize bir satır; asistan mesajıyla aynı
+    transaction'da yazılır. İstatistikler metadata_json parse etmek yerine
+    bu tablo üzerinde SQL ile toplanır.
     """
-    Base.metadata.create_all(bind=engine)
+    __tablename__ = "action_events"
+    __table_args__ = (
+        Index("ix_action_events_student_created", "student_id", "created_at"),
+        Index("ix_action_events_case_action", "case_id", "action"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    student_id = Column(String, nullable=False)
+    case_id = Column(String, nullable=False)
+    session_id = Column(Integer, ForeignKey("student_sessions.id"), nullable=False, index=True)
+    chat_log_id = Column(Integer, ForeignKey("chat_logs.id"), nullable=True)  # Asistan mesajı
+    action = Column(String, nullable=False)  # interpreted_action
+    score = Column(Float, nullable=False, default=0.0)
+    outcome = Column(String, nullable=True)  # rule_outcome
+    latency_ms = Column(Integer, nullable=True)  # Tur süresi (yorum + puanlama)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
-    # Lightweight SQLite "migration": ensure new columns exist on existing DBs.
-    # (SQLite's create_all does not alter existing tables.)
-    try:
-        _ensure_student_sessions_state_json_column()
-    except Exception as e:
-        # Don't hard-fail app startup; log for visibility.
-        print(f"⚠️ Failed to ensure state_json column exists: {e}")
+    def __repr__(self):
+        return f"<ActionEvent(id={self.id}, student={self.student_id}, case={self.case_id}, action={self.action}, score={self.score})>"
 
 
-def _sqlite_db_file_path() -> Optional[str]:
-    """Resolve the SQLite file path from DATABASE_URL (sqlite:///./file.db)."""
-    try:
-        parsed = urlparse(DATABASE_URL)
-        if parsed.scheme != "sqlite":
-            return None
-
-        # sqlite:///./dentai_app.db -> path like /./dentai_app.db
-        path = parsed.path
-        if not path:
-            return None
-
-        # Strip leading '/' on Windows paths like '/./dentai_app.db'
-        while path.startswith("/"):
-            path = path[1:]
-
-        # DATABASE_URL is relative to project root in this repo.
-        return os.path.normpath(path)
-    except Exception:
-        return None
+class ScenarioEvent(Base):
+    """
+    Senaryo Durum Olayları (append-only)
+    ------------------------------------
+    Her değerlendirme delta'sı (state_updates + score_change) bir satır;
+    seq = oturumun version değeri. Durum = son snapshot + sonraki olaylar.
+    """
+    __tablename__ = "scenario_events"
+    __table_args__ = (
+        UniqueConstraint("session_id", "seq", name="uq_scenario_events_session_seq"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, ForeignKey("student_sessions.id"), nullable=False)
+    seq = Column(Integer, nullable=False)  # 1, 2, 3, ... oturum içinde
+    delta_json = Column(Text, nullable=False)  # Ham state_updates (score_change dahil)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
 
+    def __repr__(self):
+        return f"<ScenarioEvent(session_id={self.session_id}, seq={self.seq})>"
 
-def _ensure_student_sessions_state_json_column() -> None:
-    """Add student_sessions.state_json if missing (SQLite ALTER TABLE ADD COLUMN)."""
-    db_file = _sqlite_db_file_path()
-    if not db_file:
-        return
 
-    con = sqlite3.connect(db_file)
-    try:
-        cur = con.cursor()
-        cur.execute("PRAGMA table_info(student_sessions)")
-        cols = [r[1] for r in cur.fetchall()]
-        if "state_json" in cols:
-            return
-
-        cur.execute("ALTER TABLE student_sessions ADD COLUMN state_json TEXT DEFAULT '{}' ")
-        con.commit()
-    finally:
-        con.close()
+class ScenarioSnapshot(Base):
+    """
+    Senaryo Durum Anlık Görüntüleri
+    -------------------------------
+    Her N olayda bir (DENTAI_STATE_SNAPSHOT_EVERY) tam durum; yeniden kurulum
+    en fazla N olay oynatır. seq=0 satırı oturumun başlangıç durumudur.
+    """
+    __tablename__ = "scenario_snapshots"
+    __table_args__ = (
+        UniqueConstraint("session_id", "seq", name="uq_scenario_snapshots_session_seq"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    session_id = Column(Integer, ForeignKey("student_sessions.id"), nullable=False)
+    seq = Column(Integer, nullable=False)  # Bu olaya kadar (dahil) uygulanmış durum
+    state_json = Column(Text, nullable=False)
+    score = Column(Float, nullable=False, default=0.0)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    def __repr__(self):
+        return f"<ScenarioSnapshot(session_id={self.session_id}, seq={self.seq})>"
+
+
+class SessionArchive(Base):
+    """
+    Oturum Arşivi
+    -------------
+    Saklama süresini aşan oturumların chat mesajları, senaryo olayları ve eski
+    snapshot'ları tek sıkıştırılmış JSON (zstd, yoksa zlib) olarak burada durur;
+    sıcak tablolar küçük kalır. Geçmiş API'si arşivden okur (bkz. db/retention.py).
+    """
+    __tablename__ = "session_archives"
+
+    session_id = Column(Integer, ForeignKey("student_sessions.id"), primary_key=True)
+    codec = Column(String, nullable=False)  # 'zstd' | 'zlib'
+    payload = Column(LargeBinary, nullable=False)
+    message_count = Column(Integer, nullable=False, default=0)
+    event_count = Column(Integer, nullable=False, default=0)
+    raw_bytes = Column(Integer, nullable=False, default=0)
+    stored_bytes = Column(Integer, nullable=False, default=0)
+    last_activity_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, default=datetime.datetime.utcnow)
+
+    def __repr__(self):
+        return f"<SessionArchive(session_id={self.session_id}, codec={self.codec}, messages={self.message_count})>"
+
+
+class StudentStats(Base):
+    """
+    Öğrenci Özet İstatistikleri (rollup)
+    ------------------------------------
+    Sınav sonucu / puanlanan eylem yazılırken artımlı güncellenir (bkz. db/rollups.py),
+    panolar tüm geçmişi taramak yerine tek satır okur.
+    """
+    __tablename__ = "student_stats"
+
+    student_id = Column(String, primary_key=True)
+    exams_completed = Column(Integer, nullable=False, default=0)
+    exam_points = Column(Integer, nullable=False, default=0)
+    exam_max_points = Column(Integer, nullable=False, default=0)
+    actions_count = Column(Integer, nullable=False, default=0)
+    action_score_total = Column(Float, nullable=False, default=0.0)
+    last_activity_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<StudentStats(student={self.student_id}, exams={self.exams_completed}, actions={self.actions_count})>"
+
+
+class StudentCaseStats(Base):
+    """
+    Öğrenci x Vaka Özet İstatistikleri (rollup)
+    -------------------------------------------
+    """
+    __tablename__ = "student_case_stats"
+
+    student_id = Column(String, primary_key=True)
+    case_id = Column(String, primary_key=True)
+    exams_completed = Column(Integer, nullable=False, default=0)
+    exam_points = Column(Integer, nullable=False, default=0)
+    exam_max_points = Column(Integer, nullable=False, default=0)
+    best_score = Column(Integer, nullable=True)
+    last_score = Column(Integer, nullable=True)
+    last_max_score = Column(Integer, nullable=True)
+    last_completed_at = Column(DateTime, nullable=True)
+    actions_count = Column(Integer, nullable=False, default=0)
+    action_score_total = Column(Float, nullable=False, default=0.0)
+    last_activity_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<StudentCaseStats(student={self.student_id}, case={self.case_id}, exams={self.exams_completed})>"
+
+
+class CaseStats(Base):
+    """
+    Vaka Özet İstatistikleri (rollup)
+    ---------------------------------
+    """
+    __tablename__ = "case_stats"
+
+    case_id = Column(String, primary_key=True)
+    exams_completed = Column(Integer, nullable=False, default=0)
+    exam_points = Column(Integer, nullable=False, default=0)
+    exam_max_points = Column(Integer, nullable=False, default=0)
+    actions_count = Column(Integer, nullable=False, default=0)
+    action_score_total = Column(Float, nullable=False, default=0.0)
+    last_activity_at = Column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return f"<CaseStats(case={self.case_id}, exams={self.exams_completed}, actions={self.actions_count})>"
+
+
+class InterpretationCacheEntry(Base):
+    """
+    Yorum Önbelleği Tablosu
+    -----------------------
+    interpret_action sonuçlarının süreçler arası paylaşılan kalıcı katmanı.
+    Anahtar: (normalize metin, case_id, açığa çıkan bulgular, model) özetinin SHA-256'sı.
+    """
+    __tablename__ = "interpretation_cache"
+
+    key = Column(String(64), primary_key=True)
+    case_id = Column(String, nullable=True, index=True)
+    model_name = Column(String, nullable=True)
+    value_json = Column(Text, nullable=False)  # Normalize edilmiş yorum (JSON string)
+    created_at = Column(DateTime, default=datetime.datetime.utcnow)
+    expires_at = Column(DateTime, nullable=False, index=True)
+
+    def __repr__(self):
+        return f"<InterpretationCacheEntry(key={self.key[:12]}, case={self.case_id}, model={self.model_name})>"
+
+
+# ==================== VERİTABANI FONKSİYONLARI ====================
+
+def init_db():
+    """
+    Veritabanını başlat: bekleyen şema migration'larını uygula (bkz. db/migrations.py).
+    Uygulama ilk çalıştırıldığında çağrılmalı.
+
+    DENTAI_AUTO_MIGRATE=0 ise migration uygulanmaz; şema gerideyse
+    SchemaOutOfDateError fırlatılır (python scripts/migrate.py ile güncelleyin).
+    """
+    from db.migrations import auto_migrate_enabled, check_schema, migrate
+
+    if auto_migrate_enabled():
+        migrate(engine)
+    else:
+        check_schema(engine)
 
 
 def get_db():
@@ -244,6 +424,7 @@ def save_exam_result(user_id: str, case_id: str, score: int, max_score: int, det
         ExamResult object or None if error
     """
     import json
+    from db.rollups import record_exam_result
     
     db = SessionLocal()
     try:
@@ -255,6 +436,9 @@ def save_exam_result(user_id: str, case_id: str, score: int, max_score: int, det
             details_json=json.dumps(details) if details else None
         )
         db.add(result)
+        db.flush()
+        # Rollups are updated in the same transaction as the result row
+        record_exam_result(db, user_id, case_id, score, max_score, result.completed_at)
         db.commit()
         db.refresh(result)
         return result
@@ -269,6 +453,8 @@ def save_exam_result(user_id: str, case_id: str, score: int, max_score: int, det
 def get_user_stats(user_id: str):
     """
     Get comprehensive statistics for a user.
+    Totals and case_summary read the student_stats / student_case_stats
+    rollups (db/rollups.py); only case_breakdown still lists exam results.
     
     Args:
         user_id: Student identifier
@@ -279,26 +465,29 @@ def get_user_stats(user_id: str):
             - avg_score: Average score percentage
             - user_level: Level based on performance
             - total_points: Total points earned
-            - case_breakdown: List of individual case results
+            - case_breakdown: List of individual case results (one per ExamResult, oldest first)
+            - case_summary: One row per case: latest score, best_score, attempts
     """
+    empty = {
+        "total_solved": 0,
+        "avg_score": 0,
+        "user_level": "Başlangıç",
+        "total_points": 0,
+        "case_breakdown": [],
+        "case_summary": []
+    }
+    
     db = SessionLocal()
     try:
-        # Get all exam results for this user
-        results = db.query(ExamResult).filter_by(user_id=user_id).all()
+        stats = db.get(StudentStats, user_id)
         
-        if not results:
-            return {
-                "total_solved": 0,
-                "avg_score": 0,
-                "user_level": "Başlangıç",
-                "total_points": 0,
-                "case_breakdown": []
-            }
+        if not stats or not stats.exams_completed:
+            return empty
         
         # Calculate stats
-        total_solved = len(results)
-        total_points = sum(r.score for r in results)
-        total_max = sum(r.max_score for r in results)
+        total_solved = stats.exams_completed
+        total_points = stats.exam_points
+        total_max = stats.exam_max_points
         avg_score = int((total_points / total_max * 100)) if total_max > 0 else 0
         
         # Determine user level
@@ -311,43 +500,75 @@ def get_user_stats(user_id: str):
         else:
             user_level = "Başlangıç"
         
-        # Case breakdown
+        # Case breakdown (individual results; only the columns shown)
+        results = (
+            db.query(ExamResult.case_id, ExamResult.score, ExamResult.max_score, ExamResult.completed_at)
+            .filter(ExamResult.user_id == user_id)
+            .order_by(ExamResult.id)
+            .all()
+        )
         case_breakdown = [
             {
                 "case_id": r.case_id,
                 "score": r.score,
                 "max_score": r.max_score,
                 "percentage": int(r.score / r.max_score * 100) if r.max_score > 0 else 0,
-                "completed_at": r.completed_at.strftime("%Y-%m-%d %H:%M")
+                "completed_at": r.completed_at.strftime("%Y-%m-%d %H:%M") if r.completed_at else "N/A"
             }
             for r in results
         ]
+
+        # Case summary (one rollup row per case)
+        case_rows = (
+            db.query(StudentCaseStats)
+            .filter(StudentCaseStats.student_id == user_id, StudentCaseStats.exams_completed > 0)
+            .order_by(StudentCaseStats.last_completed_at)
+            .all()
+        )
+        case_summary = [
+            {
+                "case_id": r.case_id,
+                "score": r.last_score,
+                "max_score": r.last_max_score,
+                "best_score": r.best_score,
+                "attempts": r.exams_completed,
+                "percentage": int(r.last_score / r.last_max_score * 100) if r.last_max_score else 0,
+                "completed_at": r.last_completed_at.strftime("%Y-%m-%d %H:%M") if r.last_completed_at else "N/A"
+            }
+            for r in case_rows
+        ]
         
         return {
             "total_solved": total_solved,
             "avg_score": avg_score,
             "user_level": user_level,
             "total_points": total_points,
-            "case_breakdown": case_breakdown
+            "case_breakdown": case_breakdown,
+            "case_summary": case_summary
         }
     
     except Exception as e:
         print(f"Error getting user stats: {e}")
-        return {
-            "total_solved": 0,
-            "avg_score": 0,
-            "user_level": "Başlangıç",
-            "total_points": 0,
-            "case_breakdown": []
-        }
+        return empty
     finally:
         db.close()
 
 
+# Interpreted actions that are conversation, not clinical steps (excluded from stats)
+NON_ACTION_EVENTS = ("general_chat", "error")
+
+
+def _stat_number(value):
+    """SQL SUM() returns floats; keep whole numbers as int for display."""
+    value = value or 0
+    return int(value) if float(value).is_integer() else round(float(value), 2)
+
+
 def get_student_detailed_history(user_id: str):
     """
     Get detailed action history for a student for analytics.
     This replaces the inline load_student_stats() logic in pages/5_stats.py.
+    Reads the action_events table (indexed on student_id, created_at).
     
     Args:
         user_id: Student identifier
@@ -359,14 +580,20 @@ def get_student_detailed_history(user_id: str):
             - total_actions: Count of actions
             - completed_cases: Set of unique case IDs
     """
-    import json
-    
     db = SessionLocal()
     try:
-        # Get all sessions for this student
-        sessions = db.query(StudentSession).filter_by(student_id=user_id).all()
+        scored = (
+            ActionEvent.student_id == user_id,
+            ActionEvent.action.notin_(NON_ACTION_EVENTS),
+        )
+        
+        total_actions, total_score = (
+            db.query(func.count(ActionEvent.id), func.coalesce(func.sum(ActionEvent.score), 0))
+            .filter(*scored)
+            .one()
+        )
         
-        if not sessions:
+        if not total_actions:
             return {
                 "action_history": [],
                 "total_score": 0,
@@ -374,53 +601,29 @@ def get_student_detailed_history(user_id: str):
                 "completed_cases": set()
             }
         
-        action_history = []
-        total_score = 0
-        total_actions = 0
-        completed_cases = set()
+        rows = (
+            db.query(ActionEvent.created_at, ActionEvent.case_id, ActionEvent.action, ActionEvent.score, ActionEvent.outcome)
+            .filter(*scored)
+            .order_by(ActionEvent.created_at, ActionEvent.id)
+            .all()
+        )
         
-        for session in sessions:
-            # Get chat logs for this session (only assistant messages have evaluation metadata)
-            logs = db.query(ChatLog).filter_by(
-                session_id=session.id,
-                role="assistant"
-            ).all()
-            
-            for log in logs:
-                if log.metadata_json:
-                    try:
-                        # Parse metadata
-                        metadata = log.metadata_json if isinstance(log.metadata_json, dict) else json.loads(log.metadata_json)
-                        
-                        # Extract action info
-                        interpreted_action = metadata.get("interpreted_action", "unknown")
-                        assessment = metadata.get("assessment", {})
-                        score = assessment.get("score", 0)
-                        outcome = assessment.get("rule_outcome", "N/A")
-                        
-                        # Only count if it's an ACTION (not general chat)
-                        if interpreted_action and interpreted_action not in ["general_chat", "error"]:
-                            action_record = {
-                                "timestamp": log.timestamp.strftime("%Y-%m-%d %H:%M:%S") if log.timestamp else "N/A",
-                                "case_id": metadata.get("case_id", session.case_id),
-                                "action": interpreted_action,
-                                "score": score,
-                                "outcome": outcome
-                            }
-                            action_history.append(action_record)
-                            total_score += score
-                            total_actions += 1
-                            completed_cases.add(session.case_id)
-                    
-                    except Exception as e:
-                        print(f"Error parsing metadata: {e}")
-                        continue
+        action_history = [
+            {
+                "timestamp": created_at.strftime("%Y-%m-%d %H:%M:%S") if created_at else "N/A",
+                "case_id": case_id,
+                "action": action,
+                "score": _stat_number(score),
+                "outcome": outcome or "N/A"
+            }
+            for created_at, case_id, action, score, outcome in rows
+        ]
         
         return {
             "action_history": action_history,
-            "total_score": total_score,
+            "total_score": _stat_number(total_score),
             "total_actions": total_actions,
-            "completed_cases": completed_cases
+            "completed_cases": {record["case_id"] for record in action_history}
         }
     
     except Exception as e:
@@ -433,4 +636,29 @@ def get_student_detailed_history(user_id: str):
         }
     finally:
         db.close()
- 
\ No newline at end of file
+
+
+def get_student_action_summary(user_id: str):
+    """
+    Session / action totals for the account page.
+    Action totals come from the student_stats rollup; sessions are an indexed COUNT.
+    
+    Returns:
+        dict with keys: total_sessions, completed_cases, total_actions, total_score
+    """
+    db = SessionLocal()
+    try:
+        total_sessions, completed_cases = (
+            db.query(func.count(StudentSession.id), func.count(distinct(StudentSession.case_id)))
+            .filter(StudentSession.student_id == user_id)
+            .one()
+        )
+        stats = db.get(StudentStats, user_id)
+        return {
+            "total_sessions": total_sessions,
+            "completed_cases": completed_cases,
+            "total_actions": stats.actions_count if stats else 0,
+            "total_score": _stat_number(stats.action_score_total if stats else 0),
+        }
+    finally:
+        db.close()
@@ -0,0 +1,142 @@
+"""
+DentAI Scenario Event Store
+===========================
+Scenario state as an append-only log of small deltas plus periodic snapshots:
+
+- scenario_events     (session_id, seq)  one assessment delta (state_updates + score_change)
+- scenario_snapshots  (session_id, seq)  full state after event `seq` (seq=0: initial state)
+
+A turn writes only its own deltas (constant size), never the whole state; a
+snapshot is added every DENTAI_STATE_SNAPSHOT_EVERY events (default 20), so
+rebuilding a session replays at most that many events. StudentSession.version
+is the seq of the last event (optimistic concurrency, see ScenarioManager).
+
+This module only reads/writes rows; merging deltas into a state is
+ScenarioManager's job. Nothing here commits.
+"""
+
+import datetime
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from db.database import ScenarioEvent, ScenarioSnapshot
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SNAPSHOT_EVERY = 20
+
+
+def snapshot_interval() -> int:
+    try:
+        return max(1, int(os.getenv("DENTAI_STATE_SNAPSHOT_EVERY", str(DEFAULT_SNAPSHOT_EVERY))))
+    except ValueError:
+        logger.warning("Invalid DENTAI_STATE_SNAPSHOT_EVERY; using %d", DEFAULT_SNAPSHOT_EVERY)
+        return DEFAULT_SNAPSHOT_EVERY
+
+
+def snapshot_due(old_seq: int, new_seq: int, every: Optional[int] = None) -> bool:
+    """True when the events (old_seq, new_seq] cross a multiple of the snapshot interval."""
+    every = every or snapshot_interval()
+    return new_seq // every > old_seq // every
+
+
+# ==================== WRITES ====================
+
+def append_events(
+    db: Session,
+    session_id: int,
+    after_seq: int,
+    deltas: List[Dict[str, Any]],
+    at: Optional[datetime.datetime] = None,
+) -> int:
+    """Stage deltas as events after_seq+1, after_seq+2, ...; returns the last seq."""
+    at = at or datetime.datetime.utcnow()
+    seq = after_seq
+    for delta in deltas:
+        seq += 1
+        db.add(
+            ScenarioEvent(
+                session_id=session_id,
+                seq=seq,
+                delta_json=json.dumps(delta, ensure_ascii=False, default=str),
+                created_at=at,
+            )
+        )
+    return seq
+
+
+def write_snapshot(
+    db: Session,
+    session_id: int,
+    seq: int,
+    state: Dict[str, Any],
+    score: float,
+    at: Optional[datetime.datetime] = None,
+) -> None:
+    db.add(
+        ScenarioSnapshot(
+            session_id=session_id,
+            seq=seq,
+            state_json=json.dumps(state, ensure_ascii=False, default=str),
+            score=float(score or 0.0),
+            created_at=at or datetime.datetime.utcnow(),
+        )
+    )
+
+
+# ==================== READS ====================
+
+def load_snapshot(
+    db: Session, session_id: int, max_seq: Optional[int] = None
+) -> Optional[Tuple[int, Dict[str, Any], float]]:
+    """(seq, state, score) of the latest snapshot at or before max_seq, or None."""
+    query = db.query(ScenarioSnapshot.seq, ScenarioSnapshot.state_json, ScenarioSnapshot.score).filter(
+        ScenarioSnapshot.session_id == session_id
+    )
+    if max_seq is not None:
+        query = query.filter(ScenarioSnapshot.seq <= max_seq)
+    row = query.order_by(ScenarioSnapshot.seq.desc()).first()
+    if row is None:
+        return None
+    try:
+        state = json.loads(row.state_json or "{}")
+    except ValueError:
+        logger.warning("Invalid snapshot session_id=%s seq=%s; ignoring.", session_id, row.seq)
+        return load_snapshot(db, session_id, row.seq - 1) if row.seq > 0 else None
+    return row.seq, state if isinstance(state, dict) else {}, row.score or 0.0
+
+
+def load_events(
+    db: Session, session_id: int, after_seq: int, upto_seq: Optional[int] = None
+) -> List[Tuple[int, Dict[str, Any]]]:
+    """(seq, delta) of events after_seq < seq <= upto_seq, in order."""
+    query = db.query(ScenarioEvent.seq, ScenarioEvent.delta_json).filter(
+        ScenarioEvent.session_id == session_id, ScenarioEvent.seq > after_seq
+    )
+    if upto_seq is not None:
+        query = query.filter(ScenarioEvent.seq <= upto_seq)
+    events = []
+    for seq, delta_json in query.order_by(ScenarioEvent.seq):
+        try:
+            delta = json.loads(delta_json)
+        except ValueError:
+            logger.warning("Invalid event session_id=%s seq=%s; skipping.", session_id, seq)
+            continue
+        if isinstance(delta, dict):
+            events.append((seq, delta))
+    return events
+
+
+def seq_at(db: Session, session_id: int, at: datetime.datetime) -> int:
+    """Last event seq recorded at or before `at` (0 = initial state)."""
+    value = (
+        db.query(func.max(ScenarioEvent.seq))
+        .filter(ScenarioEvent.session_id == session_id, ScenarioEvent.created_at <= at)
+        .scalar()
+    )
+    return int(value or 0)
@@ -0,0 +1,294 @@
+"""
+DentAI Schema Migrations
+========================
+Versioned, forward-only schema changes for the application DB.
+
+Applied versions are recorded in `schema_migrations`. init_db() applies the
+pending ones automatically (DENTAI_AUTO_MIGRATE=1, default); with
+DENTAI_AUTO_MIGRATE=0 it raises SchemaOutOfDateError instead, so a process
+never runs against a DB that is behind (run `python scripts/migrate.py`).
+
+Every migration is idempotent (checks columns / uses IF NOT EXISTS), so DBs
+created before this module existed (create_all + ad-hoc ALTERs) are adopted
+as-is. To add one: append a Migration with the next version number; never
+edit or reorder shipped migrations.
+"""
+
+import datetime
+import json
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, text
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session
+
+from db.database import Base
+
+logger = logging.getLogger(__name__)
+
+schema_metadata = MetaData()
+
+schema_migrations = Table(
+    "schema_migrations",
+    schema_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+class SchemaOutOfDateError(RuntimeError):
+    """The DB schema is behind the code and auto-migration is disabled."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    apply: Callable[[Connection], None]
+
+
+# ==================== HELPERS ====================
+
+def _has_column(conn: Connection, table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(conn).get_columns(table))
+
+
+def _add_column(conn: Connection, table: str, column: str, ddl: str) -> None:
+    if not _has_column(conn, table, column):
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+
+
+def _create_index(conn: Connection, name: str, table: str, columns: str) -> None:
+    conn.execute(text(f"CREATE INDEX IF NOT EXISTS {name} ON {table} ({columns})"))
+
+
+def _create_tables(conn: Connection, *names: str) -> None:
+    tables = [Base.metadata.tables[name] for name in names]
+    Base.metadata.create_all(bind=conn, tables=tables, checkfirst=True)
+
+
+# ==================== MIGRATIONS ====================
+
+def _m001_baseline(conn: Connection) -> None:
+    _create_tables(
+        conn,
+        "student_sessions",
+        "chat_logs",
+        "exam_results",
+        "evaluation_jobs",
+        "interpretation_cache",
+    )
+
+
+def _m002_student_sessions_state_json(conn: Connection) -> None:
+    _add_column(conn, "student_sessions", "state_json", "TEXT DEFAULT '{}'")
+
+
+def _m003_student_sessions_version(conn: Connection) -> None:
+    _add_column(conn, "student_sessions", "version", "INTEGER NOT NULL DEFAULT 0")
+
+
+def _m004_student_sessions_lookup_index(conn: Connection) -> None:
+    # Every turn: latest session for (student_id, case_id) ORDER BY start_time DESC
+    _create_index(conn, "ix_student_sessions_student_case_start", "student_sessions", "student_id, case_id, start_time")
+
+
+def _m005_chat_logs_session_index(conn: Connection) -> None:
+    # History (session_id ORDER BY timestamp) and stats (session_id, role='assistant')
+    _create_index(conn, "ix_chat_logs_session_role_timestamp", "chat_logs", "session_id, role, timestamp")
+
+
+def _m006_action_events(conn: Connection) -> None:
+    _create_tables(conn, "action_events")
+    _backfill_action_events(conn)
+
+
+def _backfill_action_events(conn: Connection) -> None:
+    """One event per scored assistant message already in chat_logs."""
+    rows = conn.execute(
+        text(
+            "SELECT c.id, c.session_id, c.metadata_json, c.timestamp, s.student_id, s.case_id "
+            "FROM chat_logs c JOIN student_sessions s ON s.id = c.session_id "
+            "WHERE c.role = 'assistant' AND c.metadata_json IS NOT NULL "
+            "AND NOT EXISTS (SELECT 1 FROM action_events e WHERE e.chat_log_id = c.id) "
+            "ORDER BY c.id"
+        )
+    )
+    table = Base.metadata.tables["action_events"]
+    batch = []
+    for chat_log_id, session_id, metadata_json, timestamp, student_id, case_id in rows:
+        event = _action_event_from_metadata(metadata_json)
+        if event is None:
+            continue
+        batch.append(
+            {
+                "student_id": student_id,
+                "case_id": event.pop("case_id", None) or case_id,
+                "session_id": session_id,
+                "chat_log_id": chat_log_id,
+                "created_at": _as_datetime(timestamp),
+                "latency_ms": None,
+                **event,
+            }
+        )
+        if len(batch) >= 1000:
+            conn.execute(table.insert(), batch)
+            batch = []
+    if batch:
+        conn.execute(table.insert(), batch)
+
+
+def _action_event_from_metadata(metadata_json: Any) -> Optional[Dict[str, Any]]:
+    """(action, score, outcome, case_id) from an assistant message's metadata, or None."""
+    metadata = metadata_json
+    if isinstance(metadata, str):
+        try:
+            metadata = json.loads(metadata)
+        except ValueError:
+            return None
+    if not isinstance(metadata, dict):
+        return None
+    action = metadata.get("interpreted_action")
+    if not action or not isinstance(action, str):
+        return None
+    assessment = metadata.get("assessment") or {}
+    score = assessment.get("score", 0) if isinstance(assessment, dict) else 0
+    outcome = assessment.get("rule_outcome") if isinstance(assessment, dict) else None
+    return {
+        "action": action,
+        "score": float(score) if isinstance(score, (int, float)) and not isinstance(score, bool) else 0.0,
+        "outcome": outcome if isinstance(outcome, str) else None,
+        "case_id": metadata.get("case_id") if isinstance(metadata.get("case_id"), str) else None,
+    }
+
+
+def _as_datetime(value: Any) -> Optional[datetime.datetime]:
+    # Raw SQL on SQLite returns DateTime columns as ISO strings
+    if value is None or isinstance(value, datetime.datetime):
+        return value
+    try:
+        return datetime.datetime.fromisoformat(str(value))
+    except ValueError:
+        return None
+
+
+def _m007_stat_rollups(conn: Connection) -> None:
+    from db.rollups import rebuild_rollups
+
+    _create_tables(conn, "student_stats", "student_case_stats", "case_stats")
+    with Session(bind=conn) as db:
+        rebuild_rollups(db)
+        db.flush()
+
+
+def _m008_chat_logs_keyset_index(conn: Connection) -> None:
+    # Paginated history: WHERE session_id = ? AND id > / < cursor ORDER BY id
+    _create_index(conn, "ix_chat_logs_session_id_id", "chat_logs", "session_id, id")
+
+
+def _m009_scenario_event_store(conn: Connection) -> None:
+    _create_tables(conn, "scenario_events", "scenario_snapshots")
+    # Existing sessions: their current state_json becomes the snapshot at seq=version
+    conn.execute(
+        text(
+            "INSERT INTO scenario_snapshots (session_id, seq, state_json, score, created_at) "
+            "SELECT s.id, COALESCE(s.version, 0), COALESCE(s.state_json, '{}'), COALESCE(s.current_score, 0), "
+            "COALESCE(s.start_time, CURRENT_TIMESTAMP) "
+            "FROM student_sessions s "
+            "WHERE NOT EXISTS (SELECT 1 FROM scenario_snapshots p WHERE p.session_id = s.id)"
+        )
+    )
+
+
+def _m010_session_archives(conn: Connection) -> None:
+    _add_column(conn, "student_sessions", "archived_at", "TIMESTAMP")
+    _create_tables(conn, "session_archives")
+
+
+def _m011_updated_at(conn: Connection) -> None:
+    # Incremental corpus export watermarks on these (scripts/export_corpus.py)
+    _add_column(conn, "student_sessions", "updated_at", "TIMESTAMP")
+    _add_column(conn, "chat_logs", "updated_at", "TIMESTAMP")
+    conn.execute(text("UPDATE student_sessions SET updated_at = COALESCE(archived_at, start_time) WHERE updated_at IS NULL"))
+    conn.execute(text("UPDATE chat_logs SET updated_at = timestamp WHERE updated_at IS NULL"))
+    _create_index(conn, "ix_student_sessions_updated_at", "student_sessions", "updated_at")
+    _create_index(conn, "ix_chat_logs_updated_at", "chat_logs", "updated_at")
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "baseline", _m001_baseline),
+    Migration(2, "student_sessions.state_json", _m002_student_sessions_state_json),
+    Migration(3, "student_sessions.version", _m003_student_sessions_version),
+    Migration(4, "ix_student_sessions_student_case_start", _m004_student_sessions_lookup_index),
+    Migration(5, "ix_chat_logs_session_role_timestamp", _m005_chat_logs_session_index),
+    Migration(6, "action_events", _m006_action_events),
+    Migration(7, "stat_rollups", _m007_stat_rollups),
+    Migration(8, "ix_chat_logs_session_id_id", _m008_chat_logs_keyset_index),
+    Migration(9, "scenario_event_store", _m009_scenario_event_store),
+    Migration(10, "session_archives", _m010_session_archives),
+    Migration(11, "updated_at", _m011_updated_at),
+]
+
+LATEST_VERSION = MIGRATIONS[-1].version
+
+
+# ==================== RUNNER ====================
+
+def auto_migrate_enabled() -> bool:
+    return os.getenv("DENTAI_AUTO_MIGRATE", "1") != "0"
+
+
+def current_version(engine: Engine) -> int:
+    """Highest applied migration version (0 for a DB without schema_migrations)."""
+    with engine.connect() as conn:
+        if not inspect(conn).has_table("schema_migrations"):
+            return 0
+        value = conn.execute(text("SELECT MAX(version) FROM schema_migrations")).scalar()
+        return int(value or 0)
+
+
+def pending_migrations(engine: Engine) -> List[Migration]:
+    applied = current_version(engine)
+    return [m for m in MIGRATIONS if m.version > applied]
+
+
+def migrate(engine: Engine, target: Optional[int] = None) -> List[Migration]:
+    """Apply pending migrations up to `target` (default: latest), each in its own transaction."""
+    schema_metadata.create_all(bind=engine, checkfirst=True)
+    applied: List[Migration] = []
+    for migration in pending_migrations(engine):
+        if target is not None and migration.version > target:
+            break
+        with engine.begin() as conn:
+            # Re-check inside the transaction: another process may have just applied it
+            done = conn.execute(
+                text("SELECT 1 FROM schema_migrations WHERE version = :v"), {"v": migration.version}
+            ).first()
+            if done:
+                continue
+            migration.apply(conn)
+            conn.execute(
+                schema_migrations.insert().values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.datetime.utcnow(),
+                )
+            )
+        logger.info("Applied migration %03d_%s", migration.version, migration.name)
+        applied.append(migration)
+    return applied
+
+
+def check_schema(engine: Engine) -> None:
+    """Raise SchemaOutOfDateError when migrations are pending."""
+    pending = pending_migrations(engine)
+    if pending:
+        names = ", ".join(f"{m.version:03d}_{m.name}" for m in pending)
+        raise SchemaOutOfDateError(
+            f"Database schema is at version {current_version(engine)}, code expects {LATEST_VERSION} "
+            f"(pending: {names}). Run: python scripts/migrate.py"
+        )
@@ -0,0 +1,247 @@
+"""
+DentAI Session Retention
+========================
+Moves sessions idle for longer than DENTAI_RETENTION_DAYS (default 180) out of
+the hot tables into `session_archives`: one compressed JSON payload per
+session (zstd when the `zstandard` package is installed, zlib otherwise)
+holding its chat_logs, scenario_events and superseded scenario_snapshots.
+
+What stays hot:
+- the student_sessions row (small; marked with archived_at) and one snapshot
+  at its current version, so the live state still rebuilds without replay and
+  a returning student simply continues;
+- action_events, exam_results and the stat rollups (dashboards are unaffected;
+  action_events.chat_log_id is cleared because the message row moves).
+
+The history API reads archived messages through archived_messages(); a turn
+that lands on an archived session writes new hot rows as usual, and the next
+archive run folds them into the same payload.
+
+Nothing here commits; run with: python scripts/archive_sessions.py
+"""
+
+import datetime
+import json
+import logging
+import os
+import zlib
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import and_, exists, func, or_
+from sqlalchemy.orm import Session
+
+from db.database import (
+    ActionEvent,
+    ChatLog,
+    EvaluationJob,
+    ScenarioEvent,
+    ScenarioSnapshot,
+    SessionArchive,
+    StudentSession,
+)
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RETENTION_DAYS = 180
+
+
+def retention_days() -> int:
+    try:
+        return max(1, int(os.getenv("DENTAI_RETENTION_DAYS", str(DEFAULT_RETENTION_DAYS))))
+    except ValueError:
+        logger.warning("Invalid DENTAI_RETENTION_DAYS; using %d", DEFAULT_RETENTION_DAYS)
+        return DEFAULT_RETENTION_DAYS
+
+
+# ==================== COMPRESSION ====================
+
+def compress(data: bytes) -> tuple:
+    """(codec, blob) with the best available codec."""
+    if zstandard is not None:
+        return "zstd", zstandard.ZstdCompressor(level=10).compress(data)
+    return "zlib", zlib.compress(data, 9)
+
+
+def decompress(codec: str, blob: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise RuntimeError("Archive is zstd-compressed; install zstandard to read it")
+        return zstandard.ZstdDecompressor().decompress(blob)
+    if codec == "zlib":
+        return zlib.decompress(blob)
+    raise ValueError(f"Unknown archive codec: {codec}")
+
+
+def _iso(value: Optional[datetime.datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+# ==================== ARCHIVE ====================
+
+def find_archivable_sessions(db: Session, cutoff: datetime.datetime, limit: Optional[int] = None) -> List[int]:
+    """
+    Sessions whose last message (or start, if none) is older than `cutoff` and
+    that still have hot rows. Sessions with unfinished MedGemma jobs are skipped.
+    """
+    last_message = (
+        db.query(ChatLog.session_id.label("session_id"), func.max(ChatLog.timestamp).label("last_at"))
+        .group_by(ChatLog.session_id)
+        .subquery()
+    )
+    pending_job = (
+        exists()
+        .where(EvaluationJob.chat_log_id == ChatLog.id)
+        .where(ChatLog.session_id == StudentSession.id)
+        .where(EvaluationJob.status.in_(("pending", "running")))
+    )
+    has_hot_rows = or_(
+        StudentSession.archived_at.is_(None),
+        exists().where(ChatLog.session_id == StudentSession.id),
+        exists().where(ScenarioEvent.session_id == StudentSession.id),
+    )
+    query = (
+        db.query(StudentSession.id)
+        .outerjoin(last_message, last_message.c.session_id == StudentSession.id)
+        .filter(func.coalesce(last_message.c.last_at, StudentSession.start_time) < cutoff)
+        .filter(has_hot_rows)
+        .filter(~pending_job)
+        .order_by(StudentSession.id)
+    )
+    if limit:
+        query = query.limit(limit)
+    return [session_id for (session_id,) in query]
+
+
+def archive_session(db: Session, session_id: int, now: Optional[datetime.datetime] = None) -> Optional[Dict[str, int]]:
+    """
+    Move one session's hot rows into its (possibly existing) archive payload.
+
+    Requires a snapshot at the session's current version (ScenarioManager.checkpoint).
+    The session row is claimed with UPDATE ... WHERE version = ?, so a turn
+    that commits in between wins and the session is skipped (returns None).
+    """
+    now = now or datetime.datetime.utcnow()
+    session = (
+        db.query(StudentSession.id, StudentSession.student_id, StudentSession.case_id,
+                 StudentSession.current_score, StudentSession.version, StudentSession.start_time)
+        .filter(StudentSession.id == session_id)
+        .first()
+    )
+    if session is None:
+        return None
+    version = session.version or 0
+    has_checkpoint = db.query(
+        exists().where(and_(ScenarioSnapshot.session_id == session_id, ScenarioSnapshot.seq == version))
+    ).scalar()
+    if not has_checkpoint:
+        logger.warning("Session %s has no snapshot at version %s; not archiving.", session_id, version)
+        return None
+
+    # SQLite hands out max(rowid)+1: deleting the newest chat_logs row would let the
+    # next message reuse an archived id and break the history cursors. Wait until
+    # some other session has written a newer message.
+    newest_log_session = db.query(ChatLog.session_id).order_by(ChatLog.id.desc()).limit(1).scalar()
+    if newest_log_session == session_id:
+        logger.info("Session %s holds the newest chat message; archiving it later.", session_id)
+        return None
+
+    claimed = (
+        db.query(StudentSession)
+        .filter(StudentSession.id == session_id, StudentSession.version == version)
+        .update({"archived_at": now}, synchronize_session=False)
+    )
+    if claimed != 1:
+        return None
+
+    archive = db.get(SessionArchive, session_id)
+    payload: Dict[str, Any] = {"chat_logs": [], "scenario_events": [], "scenario_snapshots": []}
+    if archive is not None:
+        payload = json.loads(decompress(archive.codec, archive.payload))
+
+    logs = db.query(ChatLog).filter(ChatLog.session_id == session_id).order_by(ChatLog.id).all()
+    events = db.query(ScenarioEvent).filter(ScenarioEvent.session_id == session_id).order_by(ScenarioEvent.seq).all()
+    snapshots = (
+        db.query(ScenarioSnapshot)
+        .filter(ScenarioSnapshot.session_id == session_id, ScenarioSnapshot.seq < version)
+        .order_by(ScenarioSnapshot.seq)
+        .all()
+    )
+
+    payload["session"] = {
+        "id": session.id,
+        "student_id": session.student_id,
+        "case_id": session.case_id,
+        "current_score": session.current_score,
+        "version": version,
+        "start_time": _iso(session.start_time),
+    }
+    payload["chat_logs"].extend(
+        {"id": c.id, "role": c.role, "content": c.content, "metadata": c.metadata_json, "timestamp": _iso(c.timestamp)}
+        for c in logs
+    )
+    payload["scenario_events"].extend(
+        {"seq": e.seq, "delta_json": e.delta_json, "created_at": _iso(e.created_at)} for e in events
+    )
+    payload["scenario_snapshots"].extend(
+        {"seq": p.seq, "state_json": p.state_json, "score": p.score, "created_at": _iso(p.created_at)}
+        for p in snapshots
+    )
+
+    raw = json.dumps(payload, ensure_ascii=False, default=str).encode("utf-8")
+    codec, blob = compress(raw)
+    timestamps = [m["timestamp"] for m in payload["chat_logs"] if m.get("timestamp")]
+    last_activity = max(timestamps) if timestamps else payload["session"]["start_time"]
+    if archive is None:
+        archive = SessionArchive(session_id=session_id)
+        db.add(archive)
+    archive.codec = codec
+    archive.payload = blob
+    archive.message_count = len(payload["chat_logs"])
+    archive.event_count = len(payload["scenario_events"])
+    archive.raw_bytes = len(raw)
+    archive.stored_bytes = len(blob)
+    archive.last_activity_at = datetime.datetime.fromisoformat(last_activity) if last_activity else None
+    archive.archived_at = now
+
+    log_ids = [c.id for c in logs]
+    if log_ids:
+        db.query(EvaluationJob).filter(EvaluationJob.chat_log_id.in_(log_ids)).delete(synchronize_session=False)
+        db.query(ActionEvent).filter(ActionEvent.chat_log_id.in_(log_ids)).update(
+            {"chat_log_id": None}, synchronize_session=False
+        )
+        db.query(ChatLog).filter(ChatLog.id.in_(log_ids)).delete(synchronize_session=False)
+    db.query(ScenarioEvent).filter(ScenarioEvent.session_id == session_id).delete(synchronize_session=False)
+    db.query(ScenarioSnapshot).filter(
+        ScenarioSnapshot.session_id == session_id, ScenarioSnapshot.seq < version
+    ).delete(synchronize_session=False)
+
+    return {
+        "messages": len(logs),
+        "events": len(events),
+        "snapshots": len(snapshots),
+        "raw_bytes": len(raw),
+        "stored_bytes": len(blob),
+    }
+
+
+# ==================== READ BACK ====================
+
+def load_archive(db: Session, session_id: int) -> Optional[Dict[str, Any]]:
+    """Decoded archive payload of a session, or None if it was never archived."""
+    archive = db.query(SessionArchive.codec, SessionArchive.payload).filter(
+        SessionArchive.session_id == session_id
+    ).first()
+    if archive is None:
+        return None
+    return json.loads(decompress(archive.codec, archive.payload))
+
+
+def archived_messages(db: Session, session_id: int) -> List[Dict[str, Any]]:
+    """Archived chat messages of a session (id, role, content, metadata, timestamp), oldest first."""
+    payload = load_archive(db, session_id)
+    return payload.get("chat_logs", []) if payload else []
@@ -0,0 +1,238 @@
+"""
+DentAI Stat Rollups
+===================
+Incrementally maintained summary rows so dashboards read O(1) per student:
+
+- student_stats       (student_id)            exams + scored actions
+- student_case_stats  (student_id, case_id)   exams (best / last) + scored actions
+- case_stats          (case_id)               cohort totals per case
+
+Writers call record_exam_result() / record_action() with their own DB session,
+inside the transaction that stores the exam result / action event, so a rollup
+never drifts from the rows it summarizes. Increments are single UPSERT
+statements (ON CONFLICT DO UPDATE) on SQLite and PostgreSQL, so concurrent
+writers do not lose counts.
+
+rebuild_rollups() recomputes everything from exam_results + action_events
+(backfill / repair): python scripts/rebuild_rollups.py
+"""
+
+import datetime
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Optional, Tuple, Type
+
+from sqlalchemy import case, func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from db.database import (
+    NON_ACTION_EVENTS,
+    ActionEvent,
+    Base,
+    CaseStats,
+    ExamResult,
+    StudentCaseStats,
+    StudentStats,
+)
+
+logger = logging.getLogger(__name__)
+
+_DIALECT_INSERTS = {"sqlite": sqlite_insert, "postgresql": postgresql_insert}
+
+
+def _upsert(
+    db: Session,
+    model: Type[Base],
+    keys: Dict[str, Any],
+    increments: Dict[str, Any],
+    assign: Optional[Dict[str, Any]] = None,
+    greatest: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Insert the row, or on conflict add `increments`, overwrite `assign` and keep
+    the larger of old/new for `greatest` columns.
+    """
+    assign = assign or {}
+    greatest = greatest or {}
+    insert = _DIALECT_INSERTS.get(db.get_bind().dialect.name)
+
+    if insert is None:
+        # Other backends: read-modify-write inside the caller's transaction
+        row = db.get(model, tuple(keys.values()) if len(keys) > 1 else next(iter(keys.values())))
+        if row is None:
+            db.add(model(**keys, **increments, **assign, **greatest))
+            return
+        for col, value in increments.items():
+            setattr(row, col, (getattr(row, col) or 0) + value)
+        for col, value in assign.items():
+            setattr(row, col, value)
+        for col, value in greatest.items():
+            current = getattr(row, col)
+            if current is None or (value is not None and value > current):
+                setattr(row, col, value)
+        return
+
+    table = model.__table__
+    stmt = insert(table).values(**keys, **increments, **assign, **greatest)
+    excluded = stmt.excluded
+    set_ = {col: table.c[col] + excluded[col] for col in increments}
+    set_.update({col: excluded[col] for col in assign})
+    set_.update(
+        {
+            col: case(
+                (table.c[col].is_(None), excluded[col]),
+                (excluded[col] > table.c[col], excluded[col]),
+                else_=table.c[col],
+            )
+            for col in greatest
+        }
+    )
+    db.execute(stmt.on_conflict_do_update(index_elements=list(keys), set_=set_))
+
+
+# ==================== INCREMENTAL UPDATES ====================
+
+def record_exam_result(
+    db: Session,
+    user_id: str,
+    case_id: str,
+    score: int,
+    max_score: int,
+    completed_at: Optional[datetime.datetime] = None,
+) -> None:
+    """Fold one ExamResult into the rollups (call before the caller commits)."""
+    completed_at = completed_at or datetime.datetime.utcnow()
+    exam = {"exams_completed": 1, "exam_points": int(score or 0), "exam_max_points": int(max_score or 0)}
+
+    _upsert(db, StudentStats, {"student_id": user_id}, exam, {"last_activity_at": completed_at})
+    _upsert(
+        db,
+        StudentCaseStats,
+        {"student_id": user_id, "case_id": case_id},
+        exam,
+        {
+            "last_score": int(score or 0),
+            "last_max_score": int(max_score or 0),
+            "last_completed_at": completed_at,
+            "last_activity_at": completed_at,
+        },
+        {"best_score": int(score or 0)},
+    )
+    _upsert(db, CaseStats, {"case_id": case_id}, exam, {"last_activity_at": completed_at})
+
+
+def record_action(
+    db: Session,
+    student_id: str,
+    case_id: str,
+    action: str,
+    score: float,
+    at: Optional[datetime.datetime] = None,
+) -> None:
+    """Fold one scored action (an action_events row) into the rollups; chat turns are ignored."""
+    if not action or action in NON_ACTION_EVENTS:
+        return
+    at = at or datetime.datetime.utcnow()
+    increments = {"actions_count": 1, "action_score_total": float(score or 0.0)}
+    assign = {"last_activity_at": at}
+
+    _upsert(db, StudentStats, {"student_id": student_id}, increments, assign)
+    _upsert(db, StudentCaseStats, {"student_id": student_id, "case_id": case_id}, increments, assign)
+    _upsert(db, CaseStats, {"case_id": case_id}, increments, assign)
+
+
+def adjust_action_score(db: Session, student_id: str, case_id: str, score_delta: float) -> None:
+    """Shift the action score totals after action_events were re-scored (counts are unchanged)."""
+    if not score_delta:
+        return
+    increments = {"action_score_total": float(score_delta)}
+    _upsert(db, StudentStats, {"student_id": student_id}, increments)
+    _upsert(db, StudentCaseStats, {"student_id": student_id, "case_id": case_id}, increments)
+    _upsert(db, CaseStats, {"case_id": case_id}, increments)
+
+
+# ==================== REBUILD ====================
+
+def rebuild_rollups(db: Session) -> Dict[str, int]:
+    """
+    Recompute all rollups from exam_results + action_events (does not commit).
+    Returns the number of rows written per table.
+    """
+    students: Dict[str, Dict[str, Any]] = defaultdict(dict)
+    student_cases: Dict[Tuple[str, str], Dict[str, Any]] = defaultdict(dict)
+    cases: Dict[str, Dict[str, Any]] = defaultdict(dict)
+
+    def _fold(row: Dict[str, Any], values: Dict[str, Any]) -> None:
+        for col, value in values.items():
+            if col == "last_activity_at":
+                if value is not None and (row.get(col) is None or value > row[col]):
+                    row[col] = value
+            else:
+                row[col] = row.get(col, 0) + (value or 0)
+
+    # Exams: walk in completion order so last_* ends up on the latest result
+    exams = (
+        db.query(ExamResult.user_id, ExamResult.case_id, ExamResult.score, ExamResult.max_score, ExamResult.completed_at)
+        .order_by(ExamResult.completed_at, ExamResult.id)
+    )
+    for user_id, case_id, score, max_score, completed_at in exams:
+        values = {
+            "exams_completed": 1,
+            "exam_points": score or 0,
+            "exam_max_points": max_score or 0,
+            "last_activity_at": completed_at,
+        }
+        _fold(students[user_id], values)
+        _fold(cases[case_id], values)
+        sc = student_cases[(user_id, case_id)]
+        _fold(sc, values)
+        sc["best_score"] = max(sc.get("best_score", score or 0), score or 0)
+        sc["last_score"] = score
+        sc["last_max_score"] = max_score
+        sc["last_completed_at"] = completed_at
+
+    # Actions: aggregated in SQL per (student, case)
+    actions = (
+        db.query(
+            ActionEvent.student_id,
+            ActionEvent.case_id,
+            func.count(ActionEvent.id),
+            func.coalesce(func.sum(ActionEvent.score), 0),
+            func.max(ActionEvent.created_at),
+        )
+        .filter(ActionEvent.action.notin_(NON_ACTION_EVENTS))
+        .group_by(ActionEvent.student_id, ActionEvent.case_id)
+    )
+    for student_id, case_id, count, total, last_at in actions:
+        values = {"actions_count": count, "action_score_total": float(total or 0.0), "last_activity_at": last_at}
+        _fold(students[student_id], values)
+        _fold(student_cases[(student_id, case_id)], values)
+        _fold(cases[case_id], values)
+
+    db.query(StudentStats).delete(synchronize_session=False)
+    db.query(StudentCaseStats).delete(synchronize_session=False)
+    db.query(CaseStats).delete(synchronize_session=False)
+
+    db.bulk_insert_mappings(StudentStats, [{"student_id": k, **_defaults(v)} for k, v in students.items()])
+    db.bulk_insert_mappings(
+        StudentCaseStats, [{"student_id": k[0], "case_id": k[1], **_defaults(v)} for k, v in student_cases.items()]
+    )
+    db.bulk_insert_mappings(CaseStats, [{"case_id": k, **_defaults(v)} for k, v in cases.items()])
+
+    counts = {"student_stats": len(students), "student_case_stats": len(student_cases), "case_stats": len(cases)}
+    logger.info("Rebuilt rollups: %s", counts)
+    return counts
+
+
+def _defaults(values: Dict[str, Any]) -> Dict[str, Any]:
+    row = {
+        "exams_completed": 0,
+        "exam_points": 0,
+        "exam_max_points": 0,
+        "actions_count": 0,
+        "action_score_total": 0.0,
+    }
+    row.update(values)
+    return row
@@ -0,0 +1,177 @@
+"""
+DentAI Storage Configuration
+============================
+Engine construction for db/database.py, selected by environment (models stay untouched).
+
+Two modes, picked from the URL scheme of DENTAI_DATABASE_URL:
+
+- SQLite (default, sqlite:///./dentai_app.db): applies WAL, synchronous=NORMAL,
+  busy_timeout, mmap_size and cache_size pragmas on every new connection so the
+  API, Streamlit and the evaluation workers can read while one of them writes
+  instead of stalling on "database is locked".
+- Server (any other SQLAlchemy URL, e.g. postgresql+psycopg://user:pw@host/dentai):
+  pooled engine with tuned pool_size / max_overflow / pre-ping / recycle.
+  The DB driver (psycopg, ...) must be installed separately.
+
+Environment variables:
+    DENTAI_DATABASE_URL            SQLAlchemy URL (default sqlite:///./dentai_app.db)
+    DENTAI_DB_POOL_SIZE            server mode pool size (default 10)
+    DENTAI_DB_MAX_OVERFLOW         server mode extra connections (default 20)
+    DENTAI_DB_POOL_TIMEOUT         seconds to wait for a pooled connection (default 30)
+    DENTAI_DB_POOL_RECYCLE         seconds before a connection is recycled (default 1800)
+    DENTAI_DB_POOL_PRE_PING        "0" disables the liveness check (default on)
+    DENTAI_SQLITE_BUSY_TIMEOUT_MS  wait for locks instead of failing (default 5000)
+    DENTAI_SQLITE_SYNCHRONOUS      OFF | NORMAL | FULL (default NORMAL)
+    DENTAI_SQLITE_MMAP_SIZE        bytes of memory-mapped I/O (default 256 MB)
+    DENTAI_SQLITE_CACHE_SIZE_KB    page cache per connection (default 64 MB)
+    DENTAI_SQL_ECHO                "1" logs every SQL statement
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import StaticPool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DATABASE_URL = "sqlite:///./dentai_app.db"
+
+_SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, str(default)))
+    except ValueError:
+        logger.warning("Invalid integer in %s; using %d", name, default)
+        return default
+
+
+@dataclass(frozen=True)
+class StorageConfig:
+    """Engine settings; build with StorageConfig.from_env()."""
+
+    url: str = DEFAULT_DATABASE_URL
+    echo: bool = False
+    # Server mode (QueuePool)
+    pool_size: int = 10
+    max_overflow: int = 20
+    pool_timeout: int = 30
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = True
+    # SQLite mode (pragmas applied on connect)
+    sqlite_busy_timeout_ms: int = 5000
+    sqlite_synchronous: str = "NORMAL"
+    sqlite_mmap_size: int = 256 * 1024 * 1024
+    sqlite_cache_size_kb: int = 64 * 1024
+
+    @classmethod
+    def from_env(cls) -> "StorageConfig":
+        synchronous = os.getenv("DENTAI_SQLITE_SYNCHRONOUS", "NORMAL").upper()
+        if synchronous not in _SYNCHRONOUS_MODES:
+            logger.warning("Invalid DENTAI_SQLITE_SYNCHRONOUS=%s; using NORMAL", synchronous)
+            synchronous = "NORMAL"
+        return cls(
+            url=os.getenv("DENTAI_DATABASE_URL") or DEFAULT_DATABASE_URL,
+            echo=os.getenv("DENTAI_SQL_ECHO", "0") == "1",
+            pool_size=_env_int("DENTAI_DB_POOL_SIZE", 10),
+            max_overflow=_env_int("DENTAI_DB_MAX_OVERFLOW", 20),
+            pool_timeout=_env_int("DENTAI_DB_POOL_TIMEOUT", 30),
+            pool_recycle=_env_int("DENTAI_DB_POOL_RECYCLE", 1800),
+            pool_pre_ping=os.getenv("DENTAI_DB_POOL_PRE_PING", "1") != "0",
+            sqlite_busy_timeout_ms=_env_int("DENTAI_SQLITE_BUSY_TIMEOUT_MS", 5000),
+            sqlite_synchronous=synchronous,
+            sqlite_mmap_size=_env_int("DENTAI_SQLITE_MMAP_SIZE", 256 * 1024 * 1024),
+            sqlite_cache_size_kb=_env_int("DENTAI_SQLITE_CACHE_SIZE_KB", 64 * 1024),
+        )
+
+    @property
+    def is_sqlite(self) -> bool:
+        return urlparse(self.url).scheme.split("+", 1)[0] == "sqlite"
+
+    @property
+    def is_sqlite_memory(self) -> bool:
+        return self.is_sqlite and sqlite_db_file_path(self.url) is None
+
+    @property
+    def mode(self) -> str:
+        return "sqlite" if self.is_sqlite else "server"
+
+
+def sqlite_db_file_path(url: str) -> Optional[str]:
+    """Resolve the SQLite file path from a URL (sqlite:///./file.db); None for other DBs / :memory:."""
+    try:
+        parsed = urlparse(url)
+        if parsed.scheme.split("+", 1)[0] != "sqlite":
+            return None
+
+        # sqlite:///./dentai_app.db -> path like /./dentai_app.db
+        path = parsed.path
+        if not path or path.strip("/") == ":memory:":
+            return None
+
+        # sqlite:////abs/path.db keeps one leading '/'; relative paths lose it.
+        if path.startswith("//"):
+            path = path[1:]
+        else:
+            path = path.lstrip("/")
+
+        # Relative URLs are relative to the working directory (project root in this repo).
+        return os.path.normpath(path)
+    except Exception:
+        return None
+
+
+def _apply_sqlite_pragmas(config: StorageConfig, dbapi_connection: Any) -> None:
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA busy_timeout = {int(config.sqlite_busy_timeout_ms)}")
+        if not config.is_sqlite_memory:
+            # WAL is persistent in the file; asking again is a cheap no-op.
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute(f"PRAGMA mmap_size = {int(config.sqlite_mmap_size)}")
+        cursor.execute(f"PRAGMA synchronous = {config.sqlite_synchronous}")
+        # Negative cache_size = size in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size = {-int(config.sqlite_cache_size_kb)}")
+    finally:
+        cursor.close()
+
+
+def create_storage_engine(config: Optional[StorageConfig] = None) -> Engine:
+    """SQLAlchemy engine for the configured mode."""
+    config = config or StorageConfig.from_env()
+
+    if config.is_sqlite:
+        kwargs: Dict[str, Any] = {
+            # Streamlit / worker threads share the pool (check_same_thread=False kritik!)
+            "connect_args": {
+                "check_same_thread": False,
+                "timeout": max(config.sqlite_busy_timeout_ms, 0) / 1000.0,
+            },
+        }
+        if config.is_sqlite_memory:
+            # One shared connection, otherwise every checkout sees an empty DB
+            kwargs["poolclass"] = StaticPool
+        engine = create_engine(config.url, echo=config.echo, **kwargs)
+
+        @event.listens_for(engine, "connect")
+        def _on_connect(dbapi_connection, connection_record):  # noqa: ARG001
+            _apply_sqlite_pragmas(config, dbapi_connection)
+    else:
+        engine = create_engine(
+            config.url,
+            echo=config.echo,
+            pool_size=config.pool_size,
+            max_overflow=config.max_overflow,
+            pool_timeout=config.pool_timeout,
+            pool_recycle=config.pool_recycle,
+            pool_pre_ping=config.pool_pre_ping,
+        )
+
+    logger.info("Storage engine: mode=%s url=%s", config.mode, engine.url.render_as_string(hide_password=True))
+    return engine
@@ -121,11 +121,23 @@ export const chatAPI = {
     },
 
     /**
-     * Get chat history for a session
+     * Get the full chat history for a session.
+     * The endpoint is paged (keyset on message id); follow next_cursor until
+     * has_more is false and return one response with every message.
      */
     getHistory: async (student_id: string, case_id: string) => {
-        const response = await apiClient.get(`/api/chat/history/${student_id}/${case_id}`);
-        return response.data;
+        const url = `/api/chat/history/${student_id}/${case_id}`;
+        const limit = 500; // server maximum page size
+        const response = await apiClient.get(url, { params: { limit } });
+        const history = response.data;
+        const messages = [...history.messages];
+        let page = history;
+        while (page.has_more && page.next_cursor != null) {
+            const next = await apiClient.get(url, { params: { limit, after_id: page.next_cursor } });
+            page = next.data;
+            messages.push(...page.messages);
+        }
+        return { ...page, messages, has_more: false };
     },
 };
 
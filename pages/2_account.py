@@ -14,8 +14,7 @@ if parent_dir not in sys.path:
 
 from app.student_profile import init_student_profile
 from app.frontend.components import render_sidebar
-from db.database import SessionLocal, StudentSession, ChatLog, init_db
-import json
+from db.database import get_student_action_summary, init_db
 
 # Initialize systems
 init_db()
@@ -80,47 +79,19 @@ st.markdown("""
 # ==================== HELPER FUNCTIONS ====================
 
 def get_user_statistics():
-    """Get user statistics from database"""
+    """Get user statistics from database (SQL aggregations over sessions / action_events)"""
     user_info = st.session_state.get("user_info") or {}
     student_id = user_info.get("student_id", "web_user_default")
     
-    db = SessionLocal()
     try:
-        # Get all sessions for this student
-        sessions = db.query(StudentSession).filter_by(student_id=student_id).all()
-        
-        total_sessions = len(sessions)
-        completed_cases = len(set(s.case_id for s in sessions))
-        
-        # Calculate statistics from chat logs
-        total_actions = 0
-        total_score = 0
-        
-        for session in sessions:
-            logs = db.query(ChatLog).filter_by(
-                session_id=session.id,
-                role="assistant"
-            ).all()
-            
-            for log in logs:
-                if log.metadata_json:
-                    try:
-                        metadata = log.metadata_json if isinstance(log.metadata_json, dict) else json.loads(log.metadata_json)
-                        interpreted_action = metadata.get("interpreted_action", "")
-                        
-                        if interpreted_action and interpreted_action not in ["general_chat", "error"]:
-                            assessment = metadata.get("assessment", {})
-                            score = assessment.get("score", 0)
-                            total_actions += 1
-                            total_score += score
-                    except:
-                        continue
-        
+        summary = get_student_action_summary(student_id)
+        total_actions = summary["total_actions"]
+        total_score = summary["total_score"]
         avg_score = (total_score / total_actions) if total_actions > 0 else 0
         
         return {
-            "total_sessions": total_sessions,
-            "completed_cases": completed_cases,
+            "total_sessions": summary["total_sessions"],
+            "completed_cases": summary["completed_cases"],
             "total_actions": total_actions,
             "total_score": total_score,
             "average_score": round(avg_score, 1)
@@ -134,8 +105,6 @@ def get_user_statistics():
             "total_score": 0,
             "average_score": 0
         }
-    finally:
-        db.close()
 
 
 # ==================== MAIN CONTENT ====================
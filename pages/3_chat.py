@@ -7,11 +7,8 @@ Students see ONLY the conversation - no scores or warnings during chat.
 
 import os
 import sys
-import json
 import logging
 from typing import Optional, List, Tuple, Any, Dict
-from datetime import datetime
-from pathlib import Path
 
 # Add parent directory to path
 parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -25,7 +22,8 @@ load_dotenv()
 
 from app.student_profile import init_student_profile
 from app.frontend.components import render_sidebar, DEFAULT_MODEL
-from db.database import SessionLocal, StudentSession, ChatLog, init_db
+from app.services.case_catalog import get_case_catalog
+from db.database import SessionLocal, StudentSession, init_db
 
 # Initialize systems
 init_student_profile()
@@ -33,9 +31,11 @@ init_db()
 
 # Try optional imports
 try:
-    from app.agent import DentalEducationAgent
+    from app.services.agent_registry import agent_registry
+    from app.services.llm_backends import local_backend_enabled
 except Exception as e:
-    DentalEducationAgent = None
+    agent_registry = None
+    local_backend_enabled = lambda: False
     print(f"⚠️ DentalEducationAgent import error: {e}")
 
 LOGGER = logging.getLogger(__name__)
@@ -158,43 +158,17 @@ def render_patient_card(case_id: str):
 # ==================== HELPER FUNCTIONS ====================
 
 def load_case_data(case_id: str) -> Optional[Dict[str, Any]]:
-    """Load case data from case_scenarios.json"""
-    try:
-        case_file = Path(parent_dir) / "data" / "case_scenarios.json"
-        with open(case_file, "r", encoding="utf-8") as f:
-            cases = json.load(f)
-        for case in cases:
-            if case.get("case_id") == case_id:
-                return case
-        return None
-    except Exception as e:
-        LOGGER.error(f"Failed to load case data: {e}")
-        return None
+    """Case data from the shared CaseCatalog (parsed once per process, not per message)."""
+    return get_case_catalog().index().case(case_id)
 
 
-def get_finding_media(case_data: Dict[str, Any], finding_ids: List[str]) -> Optional[str]:
+def get_finding_media(case_id: str, finding_ids: List[str]) -> Optional[str]:
     """
     Get media path for revealed findings.
-    Returns the first media path found in the revealed findings.
+    Returns the first media path found in the revealed findings
+    (precomputed index; file existence was checked when the catalog loaded).
     """
-    if not case_data or not finding_ids:
-        return None
-    
-    hidden_findings = case_data.get("hidden_findings", [])
-    if not hidden_findings:
-        # Try Turkish key name
-        hidden_findings = case_data.get("gizli_bulgular", [])
-    
-    for finding in hidden_findings:
-        finding_id = finding.get("finding_id") or finding.get("bulgu_id")
-        if finding_id in finding_ids:
-            media_path = finding.get("media")
-            if media_path:
-                # Check if file exists
-                full_path = Path(parent_dir) / media_path
-                if full_path.exists():
-                    return str(full_path)
-    return None
+    return get_case_catalog().index().finding_media(case_id, finding_ids)
 
 
 # ==================== DATABASE HELPERS ====================
@@ -235,50 +209,6 @@ def get_or_create_session(student_id: str, case_id: str) -> int:
         db.close()
 
 
-def save_message_to_db(
-    session_id: int,
-    role: str,
-    content: str,
-    metadata: Optional[Dict[str, Any]] = None
-) -> bool:
-    """
-    Save chat message to database with optional metadata.
-    Updates session score if metadata contains assessment.
-    
-    Args:
-        session_id: Database session ID
-        role: 'user' or 'assistant'
-        content: Message text
-        metadata: Evaluation results (saved silently, not shown to user)
-    """
-    if session_id < 0:
-        return False
-    
-    db = SessionLocal()
-    try:
-        # Save chat log
-        chat_log = ChatLog(
-            session_id=session_id,
-            role=role,
-            content=content,
-            metadata_json=metadata,
-            timestamp=datetime.utcnow()
-        )
-        db.add(chat_log)
-        # NOTE:
-        # Session score is now updated centrally by ScenarioManager (via agent.process_student_input).
-        # Avoid double-counting here.
-        
-        db.commit()
-        return True
-    except Exception as e:
-        LOGGER.error(f"Failed to save message: {e}")
-        db.rollback()
-        return False
-    finally:
-        db.close()
-
-
 # ==================== MAIN INTERFACE ====================
 
 def main() -> None:
@@ -379,13 +309,13 @@ def main() -> None:
 
     # Initialize agent
     agent_instance = None
-    if DentalEducationAgent and GEMINI_API_KEY:
+    if agent_registry and (GEMINI_API_KEY or local_backend_enabled()):
         try:
-            # Use selected model from session state
+            # Use selected model from session state (pooled per process, not rebuilt per rerun)
             selected_model = st.session_state.get("selected_model", DEFAULT_MODEL)
-            agent_instance = DentalEducationAgent(
-                api_key=GEMINI_API_KEY,
-                model_name=selected_model
+            agent_instance = agent_registry.get_agent(
+                model_name=selected_model,
+                api_key=GEMINI_API_KEY
             )
         except Exception as e:
             LOGGER.error(f"Agent initialization failed: {e}")
@@ -406,9 +336,7 @@ def main() -> None:
                 revealed = metadata.get("revealed_findings", [])
                 
                 if revealed:
-                    # Load current case data
-                    case_data = load_case_data(st.session_state.current_case_id)
-                    media_path = get_finding_media(case_data, revealed)
+                    media_path = get_finding_media(st.session_state.current_case_id, revealed)
                     
                     if media_path:
                         st.image(media_path, caption="🔬 Klinik Görünüm", width=400)
@@ -420,13 +348,8 @@ def main() -> None:
         with st.chat_message("user"):
             st.markdown(user_input)
         
-        # Save user message to DB (no metadata for user messages)
-        save_message_to_db(
-            session_id=st.session_state.db_session_id,
-            role="user",
-            content=user_input,
-            metadata=None
-        )
+        # NOTE: The agent persists the user + assistant messages, score/state and the
+        # silent evaluation job in a single transaction at the end of the turn.
 
         # Process with agent
         with st.chat_message("assistant"):
@@ -438,14 +361,21 @@ def main() -> None:
                 profile = st.session_state.get("student_profile") or {}
                 student_id = profile.get("student_id", "web_user_default")
                 
-                # Process input through agent
-                result = agent_instance.process_student_input(
+                # Process input through agent, rendering feedback as it streams in
+                result = {}
+                streamed_text = ""
+                for event in agent_instance.stream_student_input(
                     student_id=student_id,
                     raw_action=user_input,
                     case_id=st.session_state.current_case_id
-                )
+                ):
+                    if event["event"] == "token":
+                        streamed_text += event["data"].get("text", "")
+                        placeholder.markdown(streamed_text + "▌")
+                    elif event["event"] == "final":
+                        result = event["data"]
                 
-                # Extract response text
+                # Extract response text (final event is authoritative)
                 response_text = result.get("llm_interpretation", {}).get("explanatory_feedback", "")
                 
                 if not response_text:
@@ -455,29 +385,10 @@ def main() -> None:
                 placeholder.markdown(response_text)
                 
                 # ==================== EXTRACT REVEALED FINDINGS ====================
-                # Extract revealed findings from assessment for image display
-                revealed_findings = []
-                assessment = result.get("assessment", {})
-                
-                # DEBUG: Log full result structure
-                LOGGER.info(f"[DEBUG] Full result keys: {result.keys()}")
-                LOGGER.info(f"[DEBUG] Assessment: {assessment}")
-                
-                if assessment and "state_updates" in assessment:
-                    revealed_findings = assessment["state_updates"].get("revealed_findings", [])
-                    LOGGER.info(f"[DEBUG] Revealed findings: {revealed_findings}")
-                else:
-                    LOGGER.warning("[DEBUG] No state_updates in assessment!")
-                
-                # Create evaluation metadata
-                evaluation_metadata = {
-                    "interpreted_action": result.get("llm_interpretation", {}).get("interpreted_action"),
-                    "assessment": assessment,
-                    "silent_evaluation": result.get("silent_evaluation", {}),
-                    "revealed_findings": revealed_findings,
-                    "timestamp": datetime.utcnow().isoformat(),
-                    "case_id": st.session_state.current_case_id
-                }
+                # Turn metadata (same dict the agent stored with the assistant ChatLog)
+                evaluation_metadata = result.get("turn_metadata") or {}
+                revealed_findings = evaluation_metadata.get("revealed_findings", [])
+                LOGGER.info(f"[DEBUG] Revealed findings: {revealed_findings}")
                 
                 # Store message with metadata for image display
                 st.session_state.messages.append({
@@ -489,9 +400,7 @@ def main() -> None:
                 # Display clinical image if findings were revealed
                 if revealed_findings:
                     LOGGER.info(f"[DEBUG] Attempting to display image for findings: {revealed_findings}")
-                    case_data = load_case_data(st.session_state.current_case_id)
-                    LOGGER.info(f"[DEBUG] Case data loaded: {case_data is not None}")
-                    media_path = get_finding_media(case_data, revealed_findings)
+                    media_path = get_finding_media(st.session_state.current_case_id, revealed_findings)
                     LOGGER.info(f"[DEBUG] Media path: {media_path}")
                     if media_path:
                         st.image(media_path, caption="🔬 Klinik Görünüm", width=400)
@@ -501,17 +410,10 @@ def main() -> None:
                 else:
                     LOGGER.warning("[DEBUG] No revealed findings to display image")
                 
-                save_message_to_db(
-                    session_id=st.session_state.db_session_id,
-                    role="assistant",
-                    content=response_text,
-                    metadata=evaluation_metadata
-                )
-                
                 # Log silently (for admin/debug purposes only)
                 LOGGER.info(
-                    f"[Silent Eval] Action: {evaluation_metadata['interpreted_action']}, "
-                    f"Accurate: {evaluation_metadata['silent_evaluation'].get('is_clinically_accurate', 'N/A')}"
+                    f"[Silent Eval] Action: {evaluation_metadata.get('interpreted_action')}, "
+                    f"Status: {(evaluation_metadata.get('silent_evaluation') or {}).get('status', 'N/A')}"
                 )
 
             except Exception as e:
@@ -0,0 +1,99 @@
+"""
+Session Archive Script
+======================
+Moves idle sessions' chat logs and scenario events out of the hot tables into
+compressed session_archives rows (see db/retention.py). Rollups, exam results
+and action_events are kept.
+
+Usage:
+    python scripts/archive_sessions.py                 # idle > DENTAI_RETENTION_DAYS (default 180)
+    python scripts/archive_sessions.py --days 90 --limit 500
+    python scripts/archive_sessions.py --dry-run       # list candidates only
+    python scripts/archive_sessions.py --vacuum        # SQLite: give freed pages back to the OS
+"""
+
+import argparse
+import datetime
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.scenario_manager import ScenarioManager
+from db.database import SessionLocal, engine, init_db, storage_config
+from db.retention import archive_session, find_archivable_sessions, retention_days
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Archive idle sessions")
+    parser.add_argument("--days", type=int, default=None, help="idle days before archiving (default DENTAI_RETENTION_DAYS)")
+    parser.add_argument("--limit", type=int, default=None, help="archive at most this many sessions")
+    parser.add_argument("--dry-run", action="store_true", help="only list the candidate sessions")
+    parser.add_argument("--vacuum", action="store_true", help="VACUUM the SQLite file afterwards")
+    args = parser.parse_args()
+
+    init_db()
+    days = args.days or retention_days()
+    cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=days)
+
+    db = SessionLocal()
+    try:
+        candidates = find_archivable_sessions(db, cutoff, args.limit)
+    finally:
+        db.close()
+
+    print(f"🗄️ {len(candidates)} session(s) idle since before {cutoff:%Y-%m-%d} ({days} days)")
+    if args.dry_run:
+        for session_id in candidates:
+            print(f"   • session {session_id}")
+        return 0
+
+    manager = ScenarioManager()
+    totals = {"sessions": 0, "skipped": 0, "messages": 0, "events": 0, "raw_bytes": 0, "stored_bytes": 0}
+    for session_id in candidates:
+        # One transaction per session: a failure never leaves a half-moved session
+        db = SessionLocal()
+        try:
+            manager.checkpoint(db, session_id)
+            result = archive_session(db, session_id)
+            if result is None:
+                db.rollback()
+                totals["skipped"] += 1
+                continue
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            print(f"   ❌ session {session_id}: {e}")
+            totals["skipped"] += 1
+            continue
+        finally:
+            db.close()
+        totals["sessions"] += 1
+        for key in ("messages", "events", "raw_bytes", "stored_bytes"):
+            totals[key] += result[key]
+
+    ratio = totals["raw_bytes"] / totals["stored_bytes"] if totals["stored_bytes"] else 0
+    print(
+        f"✅ Archived {totals['sessions']} session(s): {totals['messages']} message(s), "
+        f"{totals['events']} event(s), {totals['raw_bytes'] // 1024} KB → {totals['stored_bytes'] // 1024} KB "
+        f"(x{ratio:.1f}); skipped {totals['skipped']}"
+    )
+
+    if args.vacuum:
+        if storage_config.is_sqlite:
+            with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+                conn.exec_driver_sql("VACUUM")
+            print("🧹 VACUUM done")
+        else:
+            print("ℹ️ --vacuum only applies to SQLite (server databases reclaim space via autovacuum)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,475 @@
+"""
+Corpus Export Script
+====================
+Streams student_sessions, chat_logs, exam_results and archived chat messages
+(session_archives) out of the DB into date-partitioned files for research, in
+bounded memory:
+
+    <out>/<table>/date=YYYY-MM-DD/part-<run>-<n>.parquet   (pyarrow installed)
+    <out>/<table>/date=YYYY-MM-DD/part-<run>-<n>.jsonl.gz  (fallback / --format jsonl)
+
+Rows are read with yield_per (server-side cursor where the driver has one)
+and written batch by batch; chat_logs carry flattened metadata columns
+(interpreted_action, score, rule_outcome, MedGemma verdict, ...) next to the
+student/case of their session.
+
+<out>/_watermark.json records, per table, the last exported id and an
+updated_at watermark; --incremental exports rows above the id plus rows
+changed since (a full export belongs in an empty directory, otherwise it
+duplicates the parts already there). Changed rows are exported again:
+- chat_logs: metadata patched after export (a MedGemma evaluation that was
+  still "queued", or a re-score by scripts/rescore_sessions.py);
+- student_sessions: current_score / version after later turns or a re-score,
+  archived_at once archived;
+- session_archives: every message of a session archived (or re-folded) since
+  the last run, in the chat_logs shape plus archived_at — archived messages
+  have left chat_logs, so a full export finds them only here.
+A row can therefore appear in several parts; keep the one with the newest
+updated_at (archived_at for session_archives) per id. The updated_at
+watermark trails the run start by WATERMARK_OVERLAP, so a transaction that
+stamped its rows before the run but committed during it is picked up next
+time (at the cost of a few repeated rows).
+
+Usage:
+    python scripts/export_corpus.py --out exports/
+    python scripts/export_corpus.py --out exports/ --incremental
+    python scripts/export_corpus.py --out exports/ --tables chat_logs --format jsonl
+"""
+
+import argparse
+import datetime
+import gzip
+import json
+import os
+import sys
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from sqlalchemy import or_, select
+
+from db.database import ChatLog, ExamResult, SessionArchive, SessionLocal, StudentSession, init_db
+from db.retention import decompress
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # optional: pip install pyarrow
+    pa = None
+    pq = None
+
+WATERMARK_FILE = "_watermark.json"
+WATERMARK_OVERLAP = datetime.timedelta(minutes=5)
+MAX_OPEN_PARTITIONS = 8
+
+
+# ==================== ROW SHAPES ====================
+
+def _parse_json(value: Any) -> Dict[str, Any]:
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except ValueError:
+            return {}
+    return value if isinstance(value, dict) else {}
+
+
+def _flatten_chat_log(row: Dict[str, Any]) -> Dict[str, Any]:
+    metadata = _parse_json(row.pop("metadata_json"))
+    assessment = metadata.get("assessment") if isinstance(metadata.get("assessment"), dict) else {}
+    evaluation = metadata.get("silent_evaluation") if isinstance(metadata.get("silent_evaluation"), dict) else {}
+    findings = metadata.get("revealed_findings")
+    score = assessment.get("score")
+    row.update(
+        {
+            "interpreted_action": metadata.get("interpreted_action"),
+            "score": float(score) if isinstance(score, (int, float)) and not isinstance(score, bool) else None,
+            "rule_outcome": assessment.get("rule_outcome"),
+            "medgemma_status": evaluation.get("status") or ("done" if "is_clinically_accurate" in evaluation else None),
+            "medgemma_clinically_accurate": evaluation.get("is_clinically_accurate"),
+            "medgemma_safety_violation": evaluation.get("safety_violation"),
+            "medgemma_feedback": evaluation.get("feedback"),
+            "revealed_findings": [str(f) for f in findings] if isinstance(findings, list) else [],
+        }
+    )
+    return row
+
+
+def _archived_chat_logs(row: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    """One session_archives row -> its archived messages, shaped like chat_logs."""
+    payload = json.loads(decompress(row["codec"], row["payload"]))
+    for message in payload.get("chat_logs", []):
+        timestamp = message.get("timestamp")
+        yield _flatten_chat_log(
+            {
+                "id": message["id"],
+                "session_id": row["session_id"],
+                "student_id": row["student_id"],
+                "case_id": row["case_id"],
+                "role": message.get("role"),
+                "content": message.get("content"),
+                "timestamp": datetime.datetime.fromisoformat(timestamp) if timestamp else None,
+                "archived_at": row["archived_at"],
+                "metadata_json": message.get("metadata"),
+            }
+        )
+
+
+class TableExport:
+    """One exported table: streamed statement, column types and row shaping."""
+
+    def __init__(
+        self,
+        name: str,
+        statement: Callable[[int, Optional[datetime.datetime]], Any],
+        date_column: str,
+        columns: Dict[str, str],
+        shape: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+        explode: Optional[Callable[[Dict[str, Any]], Iterable[Dict[str, Any]]]] = None,
+        id_column: str = "id",
+    ) -> None:
+        self.name = name
+        # (id watermark, updated_at watermark or None) -> SELECT ... WHERE id > ? [OR changed since] ORDER BY id
+        self.statement = statement
+        self.date_column = date_column
+        self.columns = columns  # name -> int | float | str | bool | datetime | list_str
+        self.shape = shape
+        self.explode = explode  # one source row -> several exported rows
+        self.id_column = id_column  # source column the id watermark follows
+
+    def arrow_schema(self):
+        types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "str": pa.string(),
+            "bool": pa.bool_(),
+            "datetime": pa.timestamp("us"),
+            "list_str": pa.list_(pa.string()),
+        }
+        return pa.schema([(col, types[kind]) for col, kind in self.columns.items()])
+
+
+def _after_or_changed(id_column, updated_column, after: int, since: Optional[datetime.datetime]):
+    """New rows (id above the watermark), plus rows changed since `since` on an incremental run."""
+    if since is None:
+        return id_column > after
+    return or_(id_column > after, updated_column > since)
+
+
+EXPORTS: Dict[str, TableExport] = {
+    "student_sessions": TableExport(
+        "student_sessions",
+        lambda after, since: select(
+            StudentSession.id,
+            StudentSession.student_id,
+            StudentSession.case_id,
+            StudentSession.current_score,
+            StudentSession.version,
+            StudentSession.start_time,
+            StudentSession.archived_at,
+            StudentSession.updated_at,
+        ).where(_after_or_changed(StudentSession.id, StudentSession.updated_at, after, since))
+        .order_by(StudentSession.id),
+        "start_time",
+        {
+            "id": "int", "student_id": "str", "case_id": "str",
+            "current_score": "float", "version": "int", "start_time": "datetime",
+            "archived_at": "datetime", "updated_at": "datetime",
+        },
+    ),
+    "chat_logs": TableExport(
+        "chat_logs",
+        lambda after, since: select(
+            ChatLog.id,
+            ChatLog.session_id,
+            StudentSession.student_id,
+            StudentSession.case_id,
+            ChatLog.role,
+            ChatLog.content,
+            ChatLog.timestamp,
+            ChatLog.updated_at,
+            ChatLog.metadata_json,
+        ).join(StudentSession, StudentSession.id == ChatLog.session_id)
+        .where(_after_or_changed(ChatLog.id, ChatLog.updated_at, after, since))
+        .order_by(ChatLog.id),
+        "timestamp",
+        {
+            "id": "int", "session_id": "int", "student_id": "str", "case_id": "str",
+            "role": "str", "content": "str", "timestamp": "datetime", "updated_at": "datetime",
+            "interpreted_action": "str", "score": "float", "rule_outcome": "str",
+            "medgemma_status": "str", "medgemma_clinically_accurate": "bool",
+            "medgemma_safety_violation": "bool", "medgemma_feedback": "str",
+            "revealed_findings": "list_str",
+        },
+        _flatten_chat_log,
+    ),
+    "exam_results": TableExport(
+        "exam_results",
+        lambda after, since: select(
+            ExamResult.id,
+            ExamResult.user_id,
+            ExamResult.case_id,
+            ExamResult.score,
+            ExamResult.max_score,
+            ExamResult.completed_at,
+            ExamResult.details_json,
+        ).where(ExamResult.id > after).order_by(ExamResult.id),
+        "completed_at",
+        {
+            "id": "int", "user_id": "str", "case_id": "str", "score": "int",
+            "max_score": "int", "completed_at": "datetime", "details_json": "str",
+        },
+    ),
+    "session_archives": TableExport(
+        "session_archives",
+        lambda after, since: select(
+            SessionArchive.session_id,
+            StudentSession.student_id,
+            StudentSession.case_id,
+            SessionArchive.archived_at,
+            SessionArchive.codec,
+            SessionArchive.payload,
+        ).join(StudentSession, StudentSession.id == SessionArchive.session_id)
+        .where(_after_or_changed(SessionArchive.session_id, SessionArchive.archived_at, after, since))
+        .order_by(SessionArchive.session_id),
+        "timestamp",
+        {
+            "id": "int", "session_id": "int", "student_id": "str", "case_id": "str",
+            "role": "str", "content": "str", "timestamp": "datetime", "archived_at": "datetime",
+            "interpreted_action": "str", "score": "float", "rule_outcome": "str",
+            "medgemma_status": "str", "medgemma_clinically_accurate": "bool",
+            "medgemma_safety_violation": "bool", "medgemma_feedback": "str",
+            "revealed_findings": "list_str",
+        },
+        explode=_archived_chat_logs,
+        id_column="session_id",
+    ),
+}
+
+
+# ==================== WRITERS ====================
+
+class JsonlGzPart:
+    suffix = ".jsonl.gz"
+
+    def __init__(self, path: Path, export: TableExport, batch_size: int) -> None:
+        self.path = path
+        self._file = gzip.open(path, "wt", encoding="utf-8")
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(row, ensure_ascii=False, default=str))
+        self._file.write("\n")
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class ParquetPart:
+    suffix = ".parquet"
+
+    def __init__(self, path: Path, export: TableExport, batch_size: int) -> None:
+        self.path = path
+        self.schema = export.arrow_schema()
+        self.batch_size = batch_size
+        self._writer = pq.ParquetWriter(str(path), self.schema, compression="zstd")
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self.batch_size:
+            self._flush()
+
+    def _flush(self) -> None:
+        if self._rows:
+            self._writer.write_table(pa.Table.from_pylist(self._rows, schema=self.schema))
+            self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._writer.close()
+
+
+class PartitionedSink:
+    """
+    One open part file per date partition, at most MAX_OPEN_PARTITIONS at a
+    time (rows arrive in id order, so dates are almost sorted). Reopening an
+    evicted partition starts a new part file. Files are written as *.tmp and
+    renamed only by commit().
+    """
+
+    def __init__(self, out_dir: Path, export: TableExport, fmt: str, run_id: str, batch_size: int) -> None:
+        self.out_dir = out_dir / export.name
+        self.export = export
+        self.fmt = fmt
+        self.run_id = run_id
+        self.batch_size = batch_size
+        self._open: "OrderedDict[str, Any]" = OrderedDict()
+        self._parts: List[Path] = []
+        self.rows = 0
+
+    def _new_part(self, date: str):
+        directory = self.out_dir / f"date={date}"
+        directory.mkdir(parents=True, exist_ok=True)
+        cls = ParquetPart if self.fmt == "parquet" else JsonlGzPart
+        path = directory / f"part-{self.run_id}-{len(self._parts):04d}{cls.suffix}.tmp"
+        self._parts.append(path)
+        return cls(path, self.export, self.batch_size)
+
+    def write(self, row: Dict[str, Any]) -> None:
+        value = row.get(self.export.date_column)
+        date = value.date().isoformat() if isinstance(value, datetime.datetime) else "unknown"
+        part = self._open.get(date)
+        if part is None:
+            if len(self._open) >= MAX_OPEN_PARTITIONS:
+                _, oldest = self._open.popitem(last=False)
+                oldest.close()
+            part = self._open[date] = self._new_part(date)
+        else:
+            self._open.move_to_end(date)
+        part.write(row)
+        self.rows += 1
+
+    def close(self) -> None:
+        while self._open:
+            _, part = self._open.popitem(last=False)
+            part.close()
+
+    def commit(self) -> int:
+        self.close()
+        for path in self._parts:
+            os.replace(path, path.with_suffix(""))
+        return len(self._parts)
+
+    def abort(self) -> None:
+        self.close()
+        for path in self._parts:
+            path.unlink(missing_ok=True)
+
+
+# ==================== EXPORT ====================
+
+class Watermark:
+    """Last exported id and the updated_at a table's next incremental run starts from."""
+
+    def __init__(self, id: int = 0, updated_at: Optional[datetime.datetime] = None) -> None:
+        self.id = id
+        self.updated_at = updated_at
+
+    @classmethod
+    def from_json(cls, value: Any) -> "Watermark":
+        if isinstance(value, dict):
+            updated_at = value.get("updated_at")
+            return cls(int(value.get("id", 0)), datetime.datetime.fromisoformat(updated_at) if updated_at else None)
+        # Files written before updated_at existed hold the bare id; the first run
+        # re-exports every row changed since the epoch (i.e. the changed tables in full)
+        return cls(int(value), datetime.datetime(1970, 1, 1))
+
+    def to_json(self) -> Dict[str, Any]:
+        return {"id": self.id, "updated_at": self.updated_at.isoformat() if self.updated_at else None}
+
+
+def load_watermarks(out_dir: Path) -> Dict[str, Watermark]:
+    path = out_dir / WATERMARK_FILE
+    if not path.exists():
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return {k: Watermark.from_json(v) for k, v in json.load(f).items()}
+
+
+def save_watermarks(out_dir: Path, watermarks: Dict[str, Watermark]) -> None:
+    path = out_dir / WATERMARK_FILE
+    tmp = path.with_suffix(".json.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump({k: v.to_json() for k, v in watermarks.items()}, f, indent=2)
+    os.replace(tmp, path)
+
+
+def export_table(
+    export: TableExport,
+    sink: PartitionedSink,
+    after_id: int,
+    batch_size: int,
+    since: Optional[datetime.datetime] = None,
+) -> int:
+    """
+    Stream rows with id > after_id (plus, when `since` is given, rows changed
+    after it) into the sink; returns the highest exported id.
+    """
+    last_id = after_id
+    db = SessionLocal()
+    try:
+        result = db.execute(export.statement(after_id, since).execution_options(yield_per=batch_size))
+        for rows in result.partitions():
+            for row in rows:
+                data = dict(row._mapping)
+                last_id = max(last_id, data[export.id_column])
+                if export.explode is not None:
+                    for item in export.explode(data):
+                        sink.write(item)
+                    continue
+                if export.shape is not None:
+                    data = export.shape(data)
+                sink.write(data)
+    finally:
+        db.close()
+    return last_id
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Export sessions / chat logs / exam results / archives for research")
+    parser.add_argument("--out", required=True, help="output directory")
+    parser.add_argument("--tables", nargs="+", choices=list(EXPORTS), default=list(EXPORTS))
+    parser.add_argument("--format", choices=("parquet", "jsonl"), default="parquet" if pa is not None else "jsonl")
+    parser.add_argument("--incremental", action="store_true", help="only rows new or changed since the saved watermark")
+    parser.add_argument("--batch-size", type=int, default=5000, help="rows per fetch / parquet row group")
+    args = parser.parse_args()
+
+    if args.format == "parquet" and pa is None:
+        print("❌ Parquet export needs pyarrow (pip install pyarrow) — or use --format jsonl")
+        return 1
+
+    init_db()
+    out_dir = Path(args.out)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    watermarks = load_watermarks(out_dir)
+    run_id = datetime.datetime.utcnow().strftime("%Y%m%dT%H%M%S")
+
+    print(f"📦 Export → {out_dir} ({args.format}{', incremental' if args.incremental else ''})")
+    for name in args.tables:
+        export = EXPORTS[name]
+        previous = watermarks.get(name) if args.incremental else None
+        started = datetime.datetime.utcnow()
+        sink = PartitionedSink(out_dir, export, args.format, run_id, args.batch_size)
+        try:
+            last_id = export_table(
+                export,
+                sink,
+                previous.id if previous else 0,
+                args.batch_size,
+                since=previous.updated_at if previous else None,
+            )
+        except Exception as e:
+            sink.abort()
+            print(f"❌ {name}: export failed ({e}); watermark unchanged")
+            return 1
+        files = sink.commit()
+        # Watermark only moves after the files are in place
+        kept = watermarks.get(name, Watermark())
+        watermarks[name] = Watermark(max(last_id, kept.id), started - WATERMARK_OVERLAP)
+        save_watermarks(out_dir, watermarks)
+        print(f"   ✅ {name:<18} {sink.rows} row(s), {files} file(s), watermark id={watermarks[name].id}")
+
+    print("✅ Export complete")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
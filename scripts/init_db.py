@@ -11,14 +11,15 @@ Usage:
 
 import os
 import sys
-import sqlite3
 from pathlib import Path
 
 # Add parent directory to path
 project_root = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(project_root))
 
-from db.database import init_db, SessionLocal, StudentSession, ExamResult
+from db.database import init_db, SessionLocal, StudentSession, ExamResult, DATABASE_URL, engine
+from db.migrations import LATEST_VERSION, current_version
+from db.storage import sqlite_db_file_path
 import datetime
 
 
@@ -31,11 +32,16 @@ def setup_database():
     try:
         recreate = "--recreate" in sys.argv or os.getenv("DENTAI_RECREATE_DB") == "1"
 
-        # SQLite file lives at project root: ./dentai_app.db
-        db_path = project_root / "dentai_app.db"
-        if recreate and db_path.exists():
-            print("\n🧹 Recreate requested: deleting existing dentai_app.db...")
+        # SQLite file from DENTAI_DATABASE_URL (default ./dentai_app.db); None in server mode
+        sqlite_path = sqlite_db_file_path(DATABASE_URL)
+        db_path = Path(sqlite_path) if sqlite_path else None
+        if recreate and db_path and db_path.exists():
+            print(f"\n🧹 Recreate requested: deleting existing {db_path}...")
             db_path.unlink()
+            for suffix in ("-wal", "-shm"):
+                sidecar = Path(str(db_path) + suffix)
+                if sidecar.exists():
+                    sidecar.unlink()
 
         # Create all tables
         print("\n📦 Creating database tables...")
@@ -58,25 +64,13 @@ def setup_database():
         finally:
             db.close()
 
-        # Verify schema includes state_json
-        if db_path.exists():
-            try:
-                con = sqlite3.connect(str(db_path))
-                cur = con.cursor()
-                cur.execute("PRAGMA table_info(student_sessions)")
-                cols = [r[1] for r in cur.fetchall()]  # (cid, name, type, notnull, dflt_value, pk)
-                con.close()
-
-                if "state_json" not in cols:
-                    print("\n⚠️  WARNING: student_sessions.state_json column is missing.")
-                    print("   SQLite cannot auto-migrate columns via create_all().")
-                    print("   Options:")
-                    print("   - Recreate DB: python scripts/init_db.py --recreate")
-                    print("   - Or delete dentai_app.db and rerun init_db")
-                else:
-                    print("✅ Schema OK: state_json column present")
-            except Exception as e:
-                print(f"\n⚠️  Could not verify schema via PRAGMA: {e}")
+        # Verify schema version (migrations are applied by init_db)
+        version = current_version(engine)
+        if version < LATEST_VERSION:
+            print(f"\n⚠️  WARNING: schema version {version}, expected {LATEST_VERSION}.")
+            print("   Run: python scripts/migrate.py")
+        else:
+            print(f"✅ Schema OK: version {version}")
         
         print("\n" + "=" * 60)
         print("✅ DATABASE SETUP COMPLETE!")
@@ -0,0 +1,63 @@
+"""
+Schema Migration Script
+=======================
+Applies pending migrations from db/migrations.py to the configured database
+(DENTAI_DATABASE_URL, default ./dentai_app.db).
+
+Usage:
+    python scripts/migrate.py              # apply all pending migrations
+    python scripts/migrate.py --status     # show applied / pending versions
+    python scripts/migrate.py --check      # exit 1 if the schema is behind (CI / deploy gate)
+    python scripts/migrate.py --target 3   # migrate up to version 3 only
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from db.database import engine
+from db.migrations import LATEST_VERSION, MIGRATIONS, current_version, migrate, pending_migrations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="DentAI schema migrations")
+    parser.add_argument("--status", action="store_true", help="show applied / pending migrations")
+    parser.add_argument("--check", action="store_true", help="exit with status 1 if migrations are pending")
+    parser.add_argument("--target", type=int, default=None, help="migrate up to this version")
+    args = parser.parse_args()
+
+    print(f"📁 Database: {engine.url.render_as_string(hide_password=True)}")
+    version = current_version(engine)
+    pending = pending_migrations(engine)
+
+    if args.status or args.check:
+        print(f"📌 Schema version: {version} (latest: {LATEST_VERSION})")
+        for m in MIGRATIONS:
+            mark = "⏳ pending" if m in pending else "✅ applied"
+            print(f"   {m.version:03d}_{m.name:<45} {mark}")
+        if args.check and pending:
+            print("❌ Schema is out of date. Run: python scripts/migrate.py")
+            return 1
+        return 0
+
+    if not pending:
+        print(f"✅ Schema is up to date (version {version}).")
+        return 0
+
+    applied = migrate(engine, target=args.target)
+    for m in applied:
+        print(f"   ➕ {m.version:03d}_{m.name}")
+    print(f"✅ Schema version: {current_version(engine)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
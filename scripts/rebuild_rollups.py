@@ -0,0 +1,46 @@
+"""
+Stat Rollup Rebuild Script
+==========================
+Recomputes student_stats / student_case_stats / case_stats from
+exam_results + action_events (backfill after imports, or repair).
+
+Usage:
+    python scripts/rebuild_rollups.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from db.database import SessionLocal, init_db
+from db.rollups import rebuild_rollups
+
+
+def main() -> int:
+    init_db()
+    db = SessionLocal()
+    try:
+        counts = rebuild_rollups(db)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        print(f"❌ Rollup rebuild failed: {e}")
+        return 1
+    finally:
+        db.close()
+
+    print("✅ Rollups rebuilt:")
+    for table, count in counts.items():
+        print(f"   {table:<20} {count} row(s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""
+Scenario Replay Script
+======================
+Rebuilds a session's scenario state at any point in time from
+scenario_snapshots + scenario_events (see db/event_store.py).
+
+Usage:
+    python scripts/replay_session.py 42                      # latest state
+    python scripts/replay_session.py 42 --seq 5              # state after the 5th delta
+    python scripts/replay_session.py 42 --at 2025-01-10T14:30
+    python scripts/replay_session.py 42 --timeline           # score after every delta
+"""
+
+import argparse
+import datetime
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.scenario_manager import ScenarioManager
+from db import event_store
+from db.database import SessionLocal, init_db
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay a session's scenario state")
+    parser.add_argument("session_id", type=int)
+    parser.add_argument("--seq", type=int, default=None, help="state after this event")
+    parser.add_argument("--at", type=datetime.datetime.fromisoformat, default=None, help="state as of this UTC time")
+    parser.add_argument("--timeline", action="store_true", help="list every delta with the running score")
+    args = parser.parse_args()
+
+    init_db()
+    manager = ScenarioManager()
+
+    if args.timeline:
+        db = SessionLocal()
+        try:
+            events = event_store.load_events(db, args.session_id, 0)
+        finally:
+            db.close()
+        if not events:
+            print(f"ℹ️ No events for session {args.session_id}")
+        for seq, delta in events:
+            state = manager.replay_state(args.session_id, seq=seq)
+            print(f"   #{seq:<4} score={state.get('current_score', 0):<6} {json.dumps(delta, ensure_ascii=False)}")
+        return 0
+
+    state = manager.replay_state(args.session_id, seq=args.seq, at=args.at)
+    if not state:
+        print(f"❌ Session {args.session_id} not found")
+        return 1
+    print(f"📌 Session {args.session_id} @ seq {state.pop('seq')}")
+    print(json.dumps(state, ensure_ascii=False, indent=2, default=str))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,99 @@
+"""
+Session Re-scoring Script
+=========================
+Re-applies the current data/scoring_rules.json to every stored chat turn
+(reusing the interpreted_action; no LLM calls) and corrects session scores,
+message assessments, action_events and rollups (see app/rescoring.py).
+
+Usage:
+    python scripts/rescore_sessions.py --dry-run                 # diff only, nothing written
+    python scripts/rescore_sessions.py --dry-run --report diff.jsonl
+    python scripts/rescore_sessions.py --workers 8               # process pool, sharded by session
+    python scripts/rescore_sessions.py --case behcet_01 --batch-size 500
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.rescoring import DEFAULT_BATCH_SESSIONS, run_rescore
+from db.database import SessionLocal, init_db
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Re-score stored sessions with the current rules")
+    parser.add_argument("--dry-run", action="store_true", help="report the differences without writing")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="worker processes (1 = in-process)")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SESSIONS, help="sessions per read/write batch")
+    parser.add_argument("--case", default=None, help="only sessions of this case_id")
+    parser.add_argument("--report", default=None, help="write one JSON line per changed session to this file")
+    parser.add_argument("--show", type=int, default=20, help="changed sessions to print (default 20)")
+    args = parser.parse_args()
+
+    init_db()
+    report_file = open(args.report, "w", encoding="utf-8") if args.report else None
+    shown = 0
+
+    def on_result(result) -> None:
+        nonlocal shown
+        if report_file is not None:
+            report_file.write(json.dumps(result.to_report(), ensure_ascii=False) + "\n")
+        if shown < args.show:
+            shown += 1
+            print(
+                f"   • session {result.session_id} ({result.case_id}, {result.student_id}): "
+                f"{result.score_delta:+g} puan, {len(result.changed_turns)} mesaj değişti"
+            )
+
+    mode = "dry run" if args.dry_run else "writing"
+    print(f"🔁 Re-scoring sessions ({mode}, {args.workers} worker(s), batch {args.batch_size})")
+    started = time.perf_counter()
+    try:
+        report = run_rescore(
+            SessionLocal,
+            workers=args.workers,
+            batch_sessions=args.batch_size,
+            dry_run=args.dry_run,
+            case_id=args.case,
+            on_result=on_result,
+        )
+    except Exception as e:
+        print(f"❌ Re-scoring failed: {e}")
+        return 1
+    finally:
+        if report_file is not None:
+            report_file.close()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n📊 Rules {report.rules_digest[:12]}: {report.sessions_scanned} session(s), "
+          f"{report.turns_scanned} turn(s) in {elapsed:.1f}s")
+    print(f"   changed: {report.sessions_changed} session(s), {report.turns_changed} turn(s), "
+          f"total score delta {report.score_delta_total:+g}")
+    for action, (turns, delta) in sorted(report.by_action.items(), key=lambda item: -item[1][0]):
+        print(f"   {action:<40} {int(turns):>6} turn(s) {delta:+g}")
+    if args.dry_run:
+        print("ℹ️ Dry run: nothing written.")
+    else:
+        written = dict(report.written)
+        print(f"✅ Written: {written.get('sessions', 0)} session(s), {written.get('messages', 0)} message(s), "
+              f"{written.get('action_events', 0)} action event(s)")
+        if written.get("conflicts"):
+            print(f"⚠️ {written['conflicts']} session(s) changed during the run; run again to pick them up.")
+    if args.report:
+        print(f"📝 Diff report: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
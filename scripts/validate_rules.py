@@ -0,0 +1,46 @@
+"""
+Scoring Rules Validation Script
+===============================
+Compiles data/scoring_rules.json the way the app does (app/services/rule_index.py)
+and reports duplicate target_actions, duplicate / unknown cases and malformed rules.
+
+Usage:
+    python scripts/validate_rules.py                    # exit 1 if any problem is found
+    python scripts/validate_rules.py path/to/rules.json
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.services.rule_index import DEFAULT_CASES_PATH, DEFAULT_RULES_PATH, known_case_ids, compile_rules
+
+
+def main() -> int:
+    rules_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_RULES_PATH
+    print(f"📁 Rules: {rules_path}")
+    try:
+        with open(rules_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        index = compile_rules(data, known_case_ids(DEFAULT_CASES_PATH))
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not load rules: {e}")
+        return 1
+
+    for case in index.cases.values():
+        print(f"   {case.case_id:<24} {len(case.rules)} rule(s)")
+    if index.problems:
+        print(f"❌ {len(index.problems)} problem(s):")
+        for problem in index.problems:
+            print(f"   • {problem}")
+        return 1
+    print("✅ Rules file is valid")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
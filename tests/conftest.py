@@ -0,0 +1,21 @@
+"""Shared fixtures: a migrated, throwaway SQLite database per test."""
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from db.migrations import migrate
+from db.storage import StorageConfig, create_storage_engine
+
+
+@pytest.fixture
+def db_engine(tmp_path):
+    engine = create_storage_engine(StorageConfig(url=f"sqlite:///{tmp_path / 'dentai_test.db'}"))
+    migrate(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(db_engine):
+    """Stands in for db.database.SessionLocal (monkeypatch it into the module under test)."""
+    return sessionmaker(autocommit=False, autoflush=False, bind=db_engine)
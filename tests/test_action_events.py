@@ -0,0 +1,60 @@
+"""action_events: scored turns are recorded once per turn and feed the stats page queries."""
+
+import pytest
+
+import app.scenario_manager as scenario_module
+import db.database as database
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import ActionEvent, get_student_action_summary, get_student_detailed_history
+
+TURNS = [
+    ("olp_001", "check_allergies_meds", 15, "Anamnez tamamlandı."),
+    ("olp_001", "general_chat", 0, None),  # conversation: stored, never counted
+    ("olp_001", "perform_oral_exam", 20, "Oral mukoza muayenesi yapıldı."),
+    ("perio_001", "check_allergies_meds", 2.5, "Kısmi anamnez."),
+]
+
+
+@pytest.fixture
+def played(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    manager = ScenarioManager(state_cache=SessionStateCache())
+    for case_id, action, score, outcome in TURNS:
+        turn = manager.begin_turn("s1", case_id)
+        with manager.unit_of_work(turn) as uow:
+            uow.add_message("user", action)
+            reply = uow.add_message("assistant", "ok", metadata={"interpreted_action": action})
+            uow.flush()
+            uow.add_action_event(action, score, outcome, chat_log=reply)
+    return session_factory
+
+
+def test_every_turn_is_one_event_linked_to_its_reply(played):
+    db = played()
+    try:
+        events = db.query(ActionEvent).order_by(ActionEvent.id).all()
+        assert [(e.case_id, e.action, e.score) for e in events] == [(c, a, s) for c, a, s, _ in TURNS]
+        assert all(e.chat_log_id is not None and e.session_id is not None for e in events)
+    finally:
+        db.close()
+
+
+def test_history_excludes_conversation_turns(played):
+    history = get_student_detailed_history("s1")
+    assert [(r["case_id"], r["action"], r["score"], r["outcome"]) for r in history["action_history"]] == [
+        ("olp_001", "check_allergies_meds", 15, "Anamnez tamamlandı."),
+        ("olp_001", "perform_oral_exam", 20, "Oral mukoza muayenesi yapıldı."),
+        ("perio_001", "check_allergies_meds", 2.5, "Kısmi anamnez."),
+    ]
+    assert (history["total_actions"], history["total_score"]) == (3, 37.5)
+    assert history["completed_cases"] == {"olp_001", "perio_001"}
+
+
+def test_unknown_student_has_an_empty_history(played):
+    history = get_student_detailed_history("nobody")
+    assert (history["action_history"], history["total_actions"], history["completed_cases"]) == ([], 0, set())
+    assert get_student_action_summary("nobody") == {
+        "total_sessions": 0, "completed_cases": 0, "total_actions": 0, "total_score": 0
+    }
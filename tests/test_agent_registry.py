@@ -0,0 +1,76 @@
+"""AgentRegistry pooling and the shared per-file catalogs."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import app.services.agent_registry as registry_module
+from app.services.agent_registry import DEFAULT_MODEL_NAME, AgentRegistry
+from app.services.case_catalog import DEFAULT_CASES_PATH, get_case_catalog
+from app.services.rule_index import DEFAULT_RULES_PATH, get_rule_catalog
+
+
+class FailingMedGemma:
+    built = 0
+
+    def __init__(self):
+        FailingMedGemma.built += 1
+        raise RuntimeError("no MedGemma credentials")
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setenv("DENTAI_LLM_BACKEND", "local")
+    FailingMedGemma.built = 0
+    monkeypatch.setattr(registry_module, "MedGemmaService", FailingMedGemma)
+    return AgentRegistry()
+
+
+def test_agents_are_pooled_by_model_and_temperature(registry):
+    agent = registry.get_agent()
+    assert registry.get_agent(DEFAULT_MODEL_NAME, 0.2000001) is agent
+    assert registry.get_agent(temperature=0.7) is not agent
+    other = registry.get_agent("models/other-model")
+    assert other is not agent
+    assert other.model_name == "models/other-model"
+
+
+def test_agents_share_the_catalogs(registry):
+    first = registry.get_agent()
+    second = registry.get_agent(temperature=0.7)
+    assert first.assessment_engine is second.assessment_engine is registry.get_assessment_engine()
+    assert first.scenario_manager is second.scenario_manager is registry.get_scenario_manager()
+    assert first.prompt_compiler is second.prompt_compiler is registry.get_prompt_compiler()
+
+
+def test_failed_med_gemma_is_not_retried(registry):
+    registry.get_agent()
+    registry.get_agent(temperature=0.7)
+    assert registry.get_med_gemma() is None
+    assert FailingMedGemma.built == 1
+
+
+def test_concurrent_first_use_builds_one_agent(registry):
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        agents = list(pool.map(lambda _: registry.get_agent(), range(16)))
+    assert len({id(a) for a in agents}) == 1
+
+
+def test_warm_up_and_reset(registry, monkeypatch):
+    assert registry.warm_up() is True
+    agent = registry.get_agent()
+    registry.reset()
+    assert registry.get_agent() is not agent
+
+    def no_key(*args, **kwargs):
+        raise ValueError("GEMINI_API_KEY not found")
+
+    monkeypatch.setattr(registry, "get_agent", no_key)
+    assert registry.warm_up() is False
+
+
+def test_one_catalog_per_file():
+    assert get_case_catalog() is get_case_catalog(DEFAULT_CASES_PATH)
+    assert get_case_catalog(os.path.join(os.path.dirname(DEFAULT_CASES_PATH), ".", "case_scenarios.json")) is get_case_catalog()
+    assert get_rule_catalog() is get_rule_catalog(DEFAULT_RULES_PATH)
@@ -0,0 +1,37 @@
+"""GZipExceptStreamsMiddleware: JSON bodies are compressed, the SSE route never is."""
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.api.middleware import GZipExceptStreamsMiddleware
+
+BODY = "x" * 4000
+
+
+def _client():
+    app = FastAPI()
+
+    @app.get("/history")
+    def history():
+        return {"messages": BODY}
+
+    @app.get("/stream")
+    def stream():
+        # Served as text/plain on purpose: only the path keeps it uncompressed
+        return StreamingResponse(iter([BODY, BODY]), media_type="text/plain")
+
+    app.add_middleware(GZipExceptStreamsMiddleware, stream_paths={"/stream"}, minimum_size=1000)
+    return TestClient(app)
+
+
+def test_json_is_compressed():
+    response = _client().get("/history", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.json() == {"messages": BODY}
+
+
+def test_stream_path_is_passed_through():
+    response = _client().get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == BODY * 2
@@ -0,0 +1,65 @@
+"""CaseCatalog: the generated case menu and the finding indexes of data/case_scenarios.json."""
+
+import json
+
+from app.services.case_catalog import DEFAULT_CASES_PATH, CaseCatalog, compile_cases
+
+# The hand-curated menu the sidebar shipped before it was generated from the cases file
+OLD_CASE_OPTIONS = {
+    "Oral Liken Planus (Orta)": "olp_001",
+    "Kronik Periodontitis (Zor)": "perio_001",
+    "Primer Herpes (Orta)": "herpes_primary_01",
+    "Behçet Hastalığı (Zor)": "behcet_01",
+    "Sekonder Sifiliz (Zor)": "syphilis_02",
+    "Kronik Deskuamatif Gingivitis (Zor)": "desquamative_01",
+}
+
+
+def _index():
+    return CaseCatalog(DEFAULT_CASES_PATH, reload_seconds=0).index()
+
+
+def test_generated_menu_matches_the_old_case_options():
+    menu = _index().menu()
+    assert menu == OLD_CASE_OPTIONS
+    assert list(menu) == list(OLD_CASE_OPTIONS)
+
+
+def test_unlisted_case_is_still_loadable():
+    index = _index()
+    assert "infectious_child_01" not in index.menu().values()
+    assert index.case("infectious_child_01")["name"] == "Primer Herpetik Gingivostomatitis (Pediatrik)"
+    assert index.default_case_id == "olp_001"
+
+
+def test_label_fallbacks_and_parenthesised_names():
+    index = compile_cases(
+        [
+            {"case_id": "a", "name": "Kronik Periodontitis (Riskli Hasta)", "difficulty": "Zor"},
+            {"case_id": "b", "dogru_tani": "Oral liken planus", "zorluk_seviyesi": "Orta"},
+            {"case_id": "c"},
+            {"case_id": "d", "menu_name": "Kısa", "name": "Uzun Ad", "difficulty": "Kolay"},
+        ]
+    )
+    assert list(index.menu()) == ["Kronik Periodontitis (Riskli Hasta)", "Oral liken planus (Orta)", "c", "Kısa (Kolay)"]
+
+
+def test_duplicate_labels_are_reported_and_disambiguated():
+    index = compile_cases([{"case_id": "a", "name": "X"}, {"case_id": "b", "name": "X"}])
+    assert list(index.menu()) == ["X", "X [b]"]
+    assert index.problems == ("b: menu label 'X' also used by a",)
+
+
+def test_both_finding_schemas_are_indexed(tmp_path):
+    data = [
+        {"case_id": "tr", "gizli_bulgular": [{"bulgu_id": "b1", "tanim": "Beyaz çizgiler"}, {"bulgu_id": "b2"}]},
+        {"case_id": "en", "hidden_findings": [{"finding_id": "f1", "description": "Ulcers", "media": "nope.png"}]},
+    ]
+    path = tmp_path / "cases.json"
+    path.write_text(json.dumps(data), encoding="utf-8")
+    index = CaseCatalog(str(path), reload_seconds=0).index()
+    assert index.findings("tr") == ("b1", "b2")
+    assert index.finding_descriptions("tr", ["b2", "b1"]) == ["Beyaz çizgiler"]
+    assert index.finding_descriptions("en", ["f1"]) == ["Ulcers"]
+    assert index.finding_media("en", ["f1"]) is None
+    assert index.problems == ("en/f1: media file not found: nope.png",)
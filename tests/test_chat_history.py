@@ -0,0 +1,148 @@
+"""GET /api/chat/history: keyset cursors in both directions, ETag / If-None-Match and archived sessions."""
+
+import datetime
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.scenario_manager as scenario_module
+from app.api.deps import get_db
+from app.api.routers import chat as chat_router
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import ChatLog, EvaluationJob
+from db.retention import archive_session
+
+CASE_ID = "olp_001"
+URL = f"/api/chat/history/s1/{CASE_ID}"
+
+
+@pytest.fixture
+def manager(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    return ScenarioManager(state_cache=SessionStateCache())
+
+
+@pytest.fixture
+def client(session_factory):
+    app = FastAPI()
+    app.include_router(chat_router.router, prefix="/api/chat")
+
+    def db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[get_db] = db
+    return TestClient(app)
+
+
+def _messages(manager, count, student_id="s1", timestamp=None):
+    """`count` user/assistant pairs; returns the ids of the rows written."""
+    ids = []
+    for i in range(count):
+        turn = manager.begin_turn(student_id, CASE_ID)
+        with manager.unit_of_work(turn) as uow:
+            rows = [
+                uow.add_message("user", f"mesaj {i}", timestamp=timestamp),
+                uow.add_message("assistant", f"yanıt {i}", metadata={"n": i}, timestamp=timestamp),
+            ]
+            uow.flush()
+            ids.extend(row.id for row in rows)
+    return ids
+
+
+def _ids(body):
+    return [m["id"] for m in body["messages"]]
+
+
+def test_forward_pages_and_polling(manager, client):
+    ids = _messages(manager, 4)
+    first = client.get(URL, params={"limit": 3}).json()
+    assert (_ids(first), first["has_more"], first["next_cursor"]) == (ids[:3], True, ids[2])
+    assert first["last_message_id"] == ids[-1]
+
+    second = client.get(URL, params={"limit": 3, "after_id": first["next_cursor"]}).json()
+    third = client.get(URL, params={"limit": 3, "after_id": second["next_cursor"]}).json()
+    assert _ids(second) + _ids(third) == ids[3:]
+    assert (third["has_more"], third["next_cursor"]) == (False, ids[-1])
+
+    # Polling past the end keeps the cursor where it was
+    idle = client.get(URL, params={"after_id": ids[-1]}).json()
+    assert (idle["messages"], idle["has_more"], idle["next_cursor"]) == ([], False, ids[-1])
+
+
+def test_backward_pages(manager, client):
+    ids = _messages(manager, 3)
+    newest = client.get(URL, params={"limit": 4, "before_id": ids[-1] + 1}).json()
+    assert (_ids(newest), newest["has_more"], newest["next_cursor"]) == (ids[2:], True, ids[2])
+    older = client.get(URL, params={"limit": 4, "before_id": newest["next_cursor"]}).json()
+    assert (_ids(older), older["has_more"], older["next_cursor"]) == (ids[:2], False, None)
+
+
+def test_metadata_can_be_left_out(manager, client):
+    _messages(manager, 1)
+    assert client.get(URL).json()["messages"][1]["metadata"] == {"n": 0}
+    assert "metadata" not in client.get(URL, params={"include_metadata": "false"}).json()["messages"][1]
+
+
+def test_bad_requests(manager, client):
+    _messages(manager, 1)
+    assert client.get(URL, params={"after_id": 1, "before_id": 5}).status_code == 400
+    assert client.get("/api/chat/history/nobody/olp_001").status_code == 404
+
+
+def test_etag_answers_304_until_something_changes(manager, client, session_factory):
+    ids = _messages(manager, 1)
+    response = client.get(URL)
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    for header in (etag, etag[2:], f'"other", {etag}', "*"):
+        cached = client.get(URL, headers={"If-None-Match": header})
+        assert cached.status_code == 304
+        assert cached.headers["etag"] == etag
+    # The validator covers the page parameters too
+    assert client.get(URL, params={"limit": 10}, headers={"If-None-Match": etag}).status_code == 200
+
+    # A finished silent evaluation changes the metadata view only
+    plain_etag = client.get(URL, params={"include_metadata": "false"}).headers["etag"]
+    db = session_factory()
+    try:
+        db.add(EvaluationJob(chat_log_id=ids[-1], status="done", payload_json="{}"))
+        db.commit()
+    finally:
+        db.close()
+    assert client.get(URL, headers={"If-None-Match": etag}).status_code == 200
+    assert client.get(URL, params={"include_metadata": "false"}, headers={"If-None-Match": plain_etag}).status_code == 304
+
+    # A new message changes every view
+    _messages(manager, 1)
+    assert client.get(URL, params={"include_metadata": "false"}, headers={"If-None-Match": plain_etag}).status_code == 200
+
+
+def test_archived_session_pages_across_archive_and_hot_rows(manager, client, session_factory):
+    long_ago = datetime.datetime(2024, 1, 1, 10, 0)
+    archived_ids = _messages(manager, 2, timestamp=long_ago)
+    _messages(manager, 1, student_id="s2")  # holds the newest message, so s1 can be archived
+    db = session_factory()
+    try:
+        session_id = db.query(ChatLog.session_id).filter(ChatLog.id == archived_ids[0]).scalar()
+        manager.checkpoint(db, session_id)
+        assert archive_session(db, session_id) is not None
+        db.commit()
+    finally:
+        db.close()
+    hot_ids = _messages(manager, 1)
+
+    first = client.get(URL, params={"limit": 3}).json()
+    rest = client.get(URL, params={"limit": 3, "after_id": first["next_cursor"]}).json()
+    assert _ids(first) + _ids(rest) == archived_ids + hot_ids
+    assert first["has_more"] and not rest["has_more"]
+    back = client.get(URL, params={"limit": 2, "before_id": hot_ids[0]}).json()
+    assert (_ids(back), back["has_more"]) == (archived_ids[2:], True)
+    etag = client.get(URL).headers["etag"]
+    assert client.get(URL, headers={"If-None-Match": etag}).status_code == 304
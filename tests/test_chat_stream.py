@@ -0,0 +1,114 @@
+"""Streaming turns: token events in order, exactly one final event last, and the SSE framing of /api/chat/stream."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.scenario_manager as scenario_module
+from app.api.deps import get_current_user
+from app.api.routers import chat as chat_router
+from app.services.interpretation_cache import InterpretationCache
+from app.services.llm_backends import LocalBackend, LocalBackendError
+
+CASE_ID = "olp_001"
+MESSAGE = "Lezyonlara bir göz atayım"
+FEEDBACK = "Ağız içi muayene yapılıyor; bukkal mukozayı dikkatle inceleyin."
+
+
+def _responder(prompt, hints):
+    return json.dumps(
+        {
+            "intent_type": "ACTION",
+            "interpreted_action": "perform_oral_exam",
+            "clinical_intent": "examination",
+            "priority": "medium",
+            "safety_concerns": [],
+            "explanatory_feedback": FEEDBACK,
+            "structured_args": {},
+        },
+        ensure_ascii=False,
+    )
+
+
+def _failing(prompt, hints):
+    raise LocalBackendError("503 synthetic backend failure")
+
+
+def _agent(session_factory, monkeypatch, responder=_responder):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    from app.agent import DentalEducationAgent
+
+    return DentalEducationAgent(
+        backend=LocalBackend(responder, stream_chunk_chars=8),
+        interpretation_cache=InterpretationCache(persistent=False),
+        enable_med_gemma=False,
+    )
+
+
+def _events(agent, student_id="s1", message=MESSAGE):
+    async def collect():
+        return [event async for event in agent.astream_student_input(student_id, message, CASE_ID)]
+
+    return asyncio.run(collect())
+
+
+def test_tokens_come_first_and_the_final_event_last(session_factory, monkeypatch):
+    agent = _agent(session_factory, monkeypatch)
+    events = _events(agent)
+    kinds = [event["event"] for event in events]
+    assert kinds[-1] == "final" and kinds.count("final") == 1
+    assert set(kinds[:-1]) == {"token"} and len(kinds) > 2
+    assert "".join(event["data"]["text"] for event in events[:-1]) == FEEDBACK
+
+    result = events[-1]["data"]
+    assert result["case_id"] == CASE_ID
+    assert result["assessment"]["score"] == 20
+    assert agent.scenario_manager.get_state("s1", CASE_ID)["current_score"] == 20.0
+
+
+def test_cached_interpretation_streams_as_one_token(session_factory, monkeypatch):
+    agent = _agent(session_factory, monkeypatch)
+    _events(agent, "s1")
+    events = _events(agent, "s2")
+    assert [event["event"] for event in events] == ["token", "final"]
+    assert events[0]["data"]["text"] == FEEDBACK
+
+
+def test_backend_failure_still_ends_with_a_final_event(session_factory, monkeypatch):
+    events = _events(_agent(session_factory, monkeypatch, _failing))
+    assert [event["event"] for event in events] == ["final"]
+    assert events[0]["data"]["final_feedback"]
+
+
+@pytest.fixture
+def client(session_factory, monkeypatch):
+    monkeypatch.setattr(chat_router, "agent", _agent(session_factory, monkeypatch))
+    app = FastAPI()
+    app.include_router(chat_router.router, prefix="/api/chat")
+    app.dependency_overrides[get_current_user] = lambda: "s1"
+    return TestClient(app)
+
+
+def _parse_sse(body):
+    events = []
+    for block in body.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        events.append((lines["event"], json.loads(lines["data"])))
+    return events
+
+
+def test_stream_endpoint_frames_server_sent_events(client):
+    response = client.post("/api/chat/stream", json={"message": MESSAGE, "case_id": CASE_ID})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+
+    events = _parse_sse(response.text)
+    assert [name for name, _ in events[:-1]] == ["token"] * (len(events) - 1)
+    name, final = events[-1]
+    assert name == "final"
+    assert (final["student_id"], final["case_id"], final["score"]) == ("s1", CASE_ID, 20)
+    assert FEEDBACK in final["final_feedback"]
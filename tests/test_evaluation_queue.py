@@ -0,0 +1,125 @@
+"""Evaluation queue: claim, retry with backoff, terminal failure and stale-job recovery."""
+
+import datetime
+
+import pytest
+
+from app.services import evaluation_queue as queue_module
+from app.services.evaluation_queue import EvaluationQueue
+from db.database import ChatLog, EvaluationJob, StudentSession
+
+
+@pytest.fixture
+def queue(session_factory, monkeypatch):
+    monkeypatch.setattr(queue_module, "SessionLocal", session_factory)
+    return EvaluationQueue(workers=1, max_pending=10, max_attempts=2, lease_seconds=60)
+
+
+@pytest.fixture
+def chat_log_id(session_factory):
+    db = session_factory()
+    try:
+        session = StudentSession(student_id="s1", case_id="olp_001")
+        db.add(session)
+        db.flush()
+        log = ChatLog(session_id=session.id, role="assistant", content="ok", metadata_json={"silent_evaluation": {"status": "queued"}})
+        db.add(log)
+        db.commit()
+        return log.id
+    finally:
+        db.close()
+
+
+def _job(session_factory, job_id):
+    db = session_factory()
+    try:
+        return db.get(EvaluationJob, job_id)
+    finally:
+        db.close()
+
+
+def _silent_evaluation(session_factory, chat_log_id):
+    db = session_factory()
+    try:
+        return db.get(ChatLog, chat_log_id).metadata_json["silent_evaluation"]
+    finally:
+        db.close()
+
+
+def test_claim_is_oldest_first_and_exclusive(queue, session_factory):
+    first = queue.enqueue({"n": 1})
+    second = queue.enqueue({"n": 2})
+
+    assert queue._claim_next() == (first, {"n": 1}, 1)
+    assert queue._claim_next() == (second, {"n": 2}, 1)
+    assert queue._claim_next() is None
+    assert _job(session_factory, first).status == "running"
+
+
+def test_failure_is_retried_with_backoff(queue, session_factory, chat_log_id):
+    job_id = queue.enqueue({"n": 1}, chat_log_id=chat_log_id)
+    _, _, attempts = queue._claim_next()
+    queue._fail(job_id, attempts, RuntimeError("timeout"))
+
+    job = _job(session_factory, job_id)
+    assert job.status == "pending"
+    assert job.last_error == "timeout"
+    assert job.available_at > datetime.datetime.utcnow()
+    assert queue._claim_next() is None  # not due yet
+    assert _silent_evaluation(session_factory, chat_log_id) == {"status": "queued"}
+
+
+def test_exhausted_retries_mark_the_chat_log_failed(queue, session_factory, chat_log_id):
+    job_id = queue.enqueue({"n": 1}, chat_log_id=chat_log_id)
+    queue._fail(job_id, queue.max_attempts, RuntimeError("model unavailable"))
+
+    assert _job(session_factory, job_id).status == "failed"
+    assert _silent_evaluation(session_factory, chat_log_id) == {
+        "status": "failed",
+        "job_id": job_id,
+        "attempts": queue.max_attempts,
+        "error": "model unavailable",
+    }
+    assert queue.get_result(job_id) is None
+
+
+def test_completed_result_is_patched_into_the_chat_log(queue, session_factory, chat_log_id):
+    job_id = queue.enqueue({"n": 1}, chat_log_id=chat_log_id)
+    queue._claim_next()
+    queue._complete(job_id, {"is_clinically_accurate": True})
+
+    assert queue.get_result(job_id) == {"is_clinically_accurate": True}
+    assert _silent_evaluation(session_factory, chat_log_id) == {"is_clinically_accurate": True}
+
+
+def test_back_pressure_refuses_jobs_when_full(queue):
+    queue.max_pending = 1
+    assert queue.enqueue({"n": 1}) is not None
+    assert queue.enqueue({"n": 2}) is None
+
+
+def test_stale_running_jobs_are_recovered_periodically(queue, session_factory):
+    stale = datetime.datetime.utcnow() - datetime.timedelta(seconds=queue.lease_seconds + 1)
+
+    def make_stale(job_id):
+        db = session_factory()
+        try:
+            db.query(EvaluationJob).filter(EvaluationJob.id == job_id).update({"status": "running", "updated_at": stale})
+            db.commit()
+        finally:
+            db.close()
+
+    first = queue.enqueue({"n": 1})
+    make_stale(first)
+    queue._maybe_recover_stale_jobs()
+    assert _job(session_factory, first).status == "pending"
+
+    # Throttled: the next pass only runs after lease_seconds / 2
+    second = queue.enqueue({"n": 2})
+    make_stale(second)
+    queue._maybe_recover_stale_jobs()
+    assert _job(session_factory, second).status == "running"
+
+    queue._next_recovery_at = 0.0
+    queue._maybe_recover_stale_jobs()
+    assert _job(session_factory, second).status == "pending"
@@ -0,0 +1,87 @@
+"""Event-sourced session state: replaying scenario_events reproduces every snapshot and the live state."""
+
+import pytest
+
+import app.scenario_manager as scenario_module
+from app.progress import PROGRESS_ACTION_KEY
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db import event_store
+from db.database import StudentSession
+
+CASE_ID = "olp_001"
+
+TURNS = [
+    {"score_change": 10, PROGRESS_ACTION_KEY: "check_allergies_meds"},
+    {"score_change": 10, PROGRESS_ACTION_KEY: "check_allergies_meds"},  # repeat: not re-awarded
+    {"score_change": 20, PROGRESS_ACTION_KEY: "perform_oral_exam", "revealed_findings": ["bulgu_001"]},
+    {"score_change": -5, PROGRESS_ACTION_KEY: "perform_oral_exam"},  # penalties always apply
+    {"revealed_findings": ["bulgu_001", "extra_note"]},
+    {"patient_mood": {"anxious": True}},
+    {"score_change": 15},
+]
+
+
+@pytest.fixture
+def manager(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    monkeypatch.setenv("DENTAI_STATE_SNAPSHOT_EVERY", "3")
+    return ScenarioManager(state_cache=SessionStateCache())
+
+
+def _played(manager, session_factory):
+    for updates in TURNS:
+        manager.update_state("s1", dict(updates), CASE_ID)
+    db = session_factory()
+    try:
+        return db.query(StudentSession).filter_by(student_id="s1").one().id
+    finally:
+        db.close()
+
+
+def test_folding_all_events_reproduces_every_snapshot(manager, session_factory):
+    session_id = _played(manager, session_factory)
+    db = session_factory()
+    try:
+        first = event_store.load_snapshot(db, session_id, 0)
+        assert first is not None
+        _, state, score = first
+        snapshots = {}
+        for seq in range(1, len(TURNS) + 1):
+            snapshot = event_store.load_snapshot(db, session_id, seq)
+            if snapshot[0] == seq:
+                snapshots[seq] = snapshot[1:]
+        events = event_store.load_events(db, session_id, 0)
+    finally:
+        db.close()
+
+    assert sorted(snapshots) == [3, 6]
+    assert [seq for seq, _ in events] == list(range(1, len(TURNS) + 1))
+    for seq, delta in events:
+        state, score = manager._apply_updates(state, score, delta)
+        if seq in snapshots:
+            assert (state, score) == snapshots[seq]
+
+
+def test_replay_matches_the_live_state(manager, session_factory):
+    session_id = _played(manager, session_factory)
+    live = manager.get_state("s1", CASE_ID)
+    assert live["current_score"] == 40.0
+
+    # A fresh process (empty cache) rebuilds the same state from snapshot + events
+    fresh = ScenarioManager(state_cache=SessionStateCache()).get_state("s1", CASE_ID)
+    assert fresh == live
+
+    replayed = manager.replay_state(session_id)
+    assert replayed.pop("seq") == len(TURNS)
+    assert replayed == live
+
+
+def test_point_in_time_replay(manager, session_factory):
+    session_id = _played(manager, session_factory)
+    assert manager.replay_state(session_id, seq=0)["current_score"] == 0.0
+    after_repeat = manager.replay_state(session_id, seq=2)
+    assert after_repeat["current_score"] == 10.0
+    assert after_repeat["progress"]["counts"] == {"actions": 1, "repeats": 1}
+    assert manager.replay_state(session_id, seq=4)["current_score"] == 25.0
+    assert manager.replay_state(999) == {}
@@ -0,0 +1,138 @@
+"""scripts/export_corpus.py: the incremental watermark picks up new, patched, re-scored and archived rows."""
+
+import datetime
+import gzip
+import importlib.util
+import json
+import os
+import shutil
+import sys
+
+import pytest
+
+import app.scenario_manager as scenario_module
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import ChatLog, StudentSession
+from db.retention import archive_session
+
+SCRIPT = os.path.join(os.path.dirname(__file__), "..", "scripts", "export_corpus.py")
+CASE_ID = "olp_001"
+TABLES = ("student_sessions", "chat_logs", "session_archives")
+
+
+@pytest.fixture
+def export(session_factory, monkeypatch):
+    spec = importlib.util.spec_from_file_location("export_corpus", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(module, "SessionLocal", session_factory)
+    monkeypatch.setattr(module, "init_db", lambda: None)
+    # Every row here is seconds old; without this each run would repeat the previous one
+    monkeypatch.setattr(module, "WATERMARK_OVERLAP", datetime.timedelta(0))
+    return module
+
+
+@pytest.fixture
+def manager(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    return ScenarioManager(state_cache=SessionStateCache())
+
+
+def _turn(manager, student_id, action, score, status="queued"):
+    turn = manager.begin_turn(student_id, CASE_ID)
+    with manager.unit_of_work(turn) as uow:
+        uow.apply_updates({"score_change": score, "progress_action": action})
+        uow.add_message("user", action)
+        uow.add_message(
+            "assistant", "ok", metadata={"interpreted_action": action, "silent_evaluation": {"status": status}}
+        )
+    return turn.session_id
+
+
+def _run(export, out, monkeypatch):
+    """One --incremental run; returns {table: rows} and clears the parts (run ids repeat within a second)."""
+    monkeypatch.setattr(sys, "argv", ["export_corpus.py", "--out", str(out), "--format", "jsonl", "--incremental",
+                                      "--tables", *TABLES])
+    assert export.main() == 0
+    rows = {}
+    for table in TABLES:
+        rows[table] = []
+        for path in sorted((out / table).glob("date=*/part-*.jsonl.gz")):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                rows[table].extend(json.loads(line) for line in f)
+        shutil.rmtree(out / table, ignore_errors=True)
+    return rows
+
+
+def _ids(rows):
+    return sorted(row["id"] for row in rows)
+
+
+def test_incremental_round_trip(export, manager, session_factory, monkeypatch, tmp_path):
+    out = tmp_path / "exports"
+    first = _turn(manager, "s1", "check_allergies_meds", 15)
+
+    rows = _run(export, out, monkeypatch)
+    assert _ids(rows["student_sessions"]) == [first]
+    assert [r["medgemma_status"] for r in rows["chat_logs"]] == [None, "queued"]
+    reply_id = rows["chat_logs"][1]["id"]
+    assert rows["session_archives"] == []
+
+    # Nothing changed: nothing is exported again
+    assert _run(export, out, monkeypatch) == {table: [] for table in TABLES}
+
+    # The MedGemma evaluation lands after the reply was exported
+    db = session_factory()
+    try:
+        log = db.get(ChatLog, reply_id)
+        log.metadata_json = dict(log.metadata_json, silent_evaluation={"status": "done", "is_clinically_accurate": True})
+        db.commit()
+    finally:
+        db.close()
+    rows = _run(export, out, monkeypatch)
+    assert [(r["id"], r["medgemma_status"], r["medgemma_clinically_accurate"]) for r in rows["chat_logs"]] == [
+        (reply_id, "done", True)
+    ]
+    assert rows["student_sessions"] == []
+
+    # A later turn: new messages, and the session row again with its new score / version
+    _turn(manager, "s1", "perform_oral_exam", 20)
+    rows = _run(export, out, monkeypatch)
+    assert [(r["id"], r["current_score"], r["version"]) for r in rows["student_sessions"]] == [(first, 35.0, 2)]
+    assert len(rows["chat_logs"]) == 2 and min(_ids(rows["chat_logs"])) > reply_id
+
+    # Archiving moves the messages out of chat_logs; session_archives carries them
+    _turn(manager, "s2", "check_allergies_meds", 15)
+    _run(export, out, monkeypatch)
+    db = session_factory()
+    try:
+        manager.checkpoint(db, first)
+        assert archive_session(db, first) is not None
+        db.commit()
+        archived_ids = [c.id for c in db.query(ChatLog).filter(ChatLog.session_id == first)]
+        archived_at = db.get(StudentSession, first).archived_at
+    finally:
+        db.close()
+    assert archived_ids == []
+    rows = _run(export, out, monkeypatch)
+    assert [(r["id"], r["archived_at"] is not None) for r in rows["student_sessions"]] == [(first, True)]
+    archived = rows["session_archives"]
+    assert len(archived) == 4 and {r["session_id"] for r in archived} == {first}
+    assert next(r for r in archived if r["id"] == reply_id)["medgemma_status"] == "done"
+    assert {r["archived_at"] for r in archived} == {archived_at.isoformat(sep=" ")}
+    assert rows["chat_logs"] == []
+
+    watermarks = json.loads((out / export.WATERMARK_FILE).read_text(encoding="utf-8"))
+    assert watermarks["session_archives"]["id"] == first
+    assert watermarks["chat_logs"]["updated_at"] is not None
+
+
+def test_legacy_id_watermark_is_read(export, tmp_path):
+    (tmp_path / export.WATERMARK_FILE).write_text(json.dumps({"chat_logs": 42}), encoding="utf-8")
+    watermark = export.load_watermarks(tmp_path)["chat_logs"]
+    assert watermark.id == 42
+    assert watermark.updated_at == datetime.datetime(1970, 1, 1)
+
+    export.save_watermarks(tmp_path, {"chat_logs": watermark})
+    assert export.load_watermarks(tmp_path)["chat_logs"].to_json() == {"id": 42, "updated_at": "1970-01-01T00:00:00"}
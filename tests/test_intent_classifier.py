@@ -0,0 +1,135 @@
+"""Local fast-path classifier: negation / question gating, the confidence threshold and the agent's fast-path replies."""
+
+import pytest
+
+from app.intent_classifier import classify_intent
+
+FAST_PATH_THRESHOLD = 0.95  # DentalEducationAgent default
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "antibiyotik yazmıyorum",
+        "Hastaya antibiyotik vermeyi düşünmüyorum, gerek yok",
+        "alerjisi yok",
+        "paterji testi yapmadan tanı koymak doğru değil",
+    ],
+)
+def test_negated_messages_never_skip_the_llm(text):
+    prediction = classify_intent(text)
+    assert prediction["blocked_by"] == "negation"
+    assert prediction["confidence"] == 0.0
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "paterji testi yapmadan tanı koymak doğru mu?",
+        "antibiyotik yazalım mı?",
+        "tansiyonunuzu ölçebilir miyim?",
+    ],
+)
+def test_questions_that_are_not_history_taking_go_to_the_llm(text):
+    prediction = classify_intent(text)
+    assert prediction["blocked_by"] == "question"
+    assert 0.0 < prediction["confidence"] < FAST_PATH_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "text, action",
+    [
+        ("Alerjiniz var mı?", "check_allergies_meds"),
+        ("alerjisi var mı?", "check_allergies_meds"),
+        ("ilaç kullanıyor mu?", "check_allergies_meds"),
+        ("Herhangi bir ilaç kullanıyor musunuz?", "check_allergies_meds"),
+        ("İlaç kullanmıyor musunuz?", "check_allergies_meds"),
+        ("Sigara içiyor musunuz?", "check_smoking_history"),
+        ("Şeker hastalığınız var mı?", "check_diabetes"),
+        ("Kalp piliniz var mı?", "check_pacemaker"),
+    ],
+)
+def test_anamnesis_questions_take_the_fast_path(text, action):
+    prediction = classify_intent(text)
+    assert prediction["blocked_by"] == ""
+    assert prediction["interpreted_action"] == action
+    assert prediction["confidence"] >= FAST_PATH_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "text, action",
+    [
+        ("paterji testi yapıyorum", "perform_pathergy_test"),
+        ("amoksisilin reçete ediyorum", "prescribe_antibiotics"),
+        ("ağız içi muayene yapıyorum", "perform_oral_exam"),
+        ("Behçet tanısı koyuyorum", "diagnose_behcet_disease"),
+    ],
+)
+def test_unambiguous_actions_take_the_fast_path(text, action):
+    prediction = classify_intent(text)
+    assert prediction["blocked_by"] == ""
+    assert prediction["interpreted_action"] == action
+    assert prediction["confidence"] >= FAST_PATH_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "tansiyonunu ölçüyorum",  # single 0.9 pattern
+        "muayene ediyorum",  # weak pattern
+        "behçet olabilir",  # disease named without a diagnosis cue
+    ],
+)
+def test_weak_single_patterns_stay_below_the_threshold(text):
+    assert classify_intent(text)["confidence"] < FAST_PATH_THRESHOLD
+
+
+@pytest.mark.parametrize(
+    "text, kind",
+    [("merhaba", "greeting"), ("Günaydın, nasılsınız?", "greeting"), ("teşekkürler", "thanks"), ("görüşürüz", "closing")],
+)
+def test_small_talk_is_chat(text, kind):
+    prediction = classify_intent(text)
+    assert prediction["decision"] == "CHAT"
+    assert prediction["interpreted_action"] == "general_chat"
+    assert prediction["chat_kind"] == kind
+
+
+def test_every_scored_action_has_a_turkish_label():
+    from app.assessment_engine import AssessmentEngine
+    from app.intent_classifier import ACTION_LABELS
+
+    index = AssessmentEngine().rule_index
+    actions = {a for case in index.cases.values() for a in case.actions}
+    assert actions <= set(ACTION_LABELS)
+
+
+@pytest.fixture
+def agent(monkeypatch):
+    monkeypatch.setenv("DENTAI_LLM_BACKEND", "local")
+    from app.agent import DentalEducationAgent
+
+    return DentalEducationAgent(enable_med_gemma=False)
+
+
+def test_fast_path_feedback_never_shows_the_verdict(agent):
+    # herpes_primary_01 rules: the antibiotic outcome is "HATA: ..." and the diagnosis "Doğru Tanı ..."
+    state = {"case_id": "herpes_primary_01"}
+    for text in ("amoksisilin reçete ediyorum", "herpetik gingivostomatit tanısı koyuyorum"):
+        interpretation = agent._fast_path_interpretation(text, state)
+        rule = agent.assessment_engine.get_rule("herpes_primary_01", interpretation["interpreted_action"])
+        assert rule["rule_outcome"] not in interpretation["explanatory_feedback"]
+        assert not interpretation["explanatory_feedback"].startswith(("HATA", "Doğru"))
+
+
+def test_fast_path_feedback_describes_the_revealed_finding(agent):
+    interpretation = agent._fast_path_interpretation("ağız içi muayene yapıyorum", {"case_id": "olp_001"})
+    assert interpretation["explanatory_feedback"] == (
+        "Ağız içi muayene: Bilateral bukkal mukozada retikular beyaz çizgiler (Wickham striae)"
+    )
+
+
+def test_only_greetings_are_answered_with_a_greeting(agent):
+    assert agent._fast_path_interpretation("merhaba", {})["explanatory_feedback"].startswith("Merhaba")
+    for text in ("teşekkürler", "görüşürüz"):
+        assert not agent._fast_path_interpretation(text, {})["explanatory_feedback"].startswith("Merhaba")
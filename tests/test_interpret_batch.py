@@ -0,0 +1,125 @@
+"""Batched interpretation: per-item error isolation, de-duplication and /api/chat/interpret-batch."""
+
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.deps import get_current_user
+from app.api.routers import chat as chat_router
+from app.services.interpretation_cache import InterpretationCache
+from app.services.llm_backends import LocalBackend, LocalBackendError
+
+CASE_ID = "olp_001"
+ACTIONS = {
+    "Lezyonlara bir göz atayım": "perform_oral_exam",
+    "Kullandığı şeyleri bir konuşalım": "check_allergies_meds",
+}
+POISON = "bozuk mesaj"
+
+
+def _interpretation(message):
+    return {
+        "intent_type": "ACTION",
+        "interpreted_action": ACTIONS[message],
+        "clinical_intent": "examination",
+        "priority": "medium",
+        "safety_concerns": [],
+        "explanatory_feedback": "Tamam.",
+        "structured_args": {},
+    }
+
+
+class Responder:
+    """Batch requests drop the poison item; a single request for it fails."""
+
+    def __init__(self, fail_batches=False):
+        self.fail_batches = fail_batches
+        self.batches = []
+        self.singles = []
+
+    def __call__(self, prompt, hints):
+        if "student_actions" in hints:
+            items = hints["student_actions"]
+            self.batches.append([item["action"] for item in items])
+            if self.fail_batches:
+                raise LocalBackendError("503 synthetic backend failure")
+            return json.dumps(
+                [{"id": item["id"], **_interpretation(item["action"])} for item in items if item["action"] != POISON]
+            )
+        self.singles.append(hints["student_action"])
+        if hints["student_action"] == POISON:
+            raise LocalBackendError("503 synthetic backend failure")
+        return json.dumps(_interpretation(hints["student_action"]))
+
+
+def _agent(responder):
+    from app.agent import DentalEducationAgent
+
+    return DentalEducationAgent(
+        backend=LocalBackend(responder),
+        interpretation_cache=InterpretationCache(persistent=False),
+        enable_med_gemma=False,
+    )
+
+
+@pytest.fixture(autouse=True)
+def local_backend(monkeypatch):
+    monkeypatch.setenv("DENTAI_LLM_BACKEND", "local")
+
+
+def _state(agent):
+    return agent.scenario_manager.build_initial_state(CASE_ID)
+
+
+def test_a_failing_item_does_not_fail_its_batch():
+    responder = Responder()
+    agent = _agent(responder)
+    messages = ["Lezyonlara bir göz atayım", POISON, "Kullandığı şeyleri bir konuşalım"]
+    results = agent.interpret_actions_batch(messages, _state(agent))
+
+    assert [r["interpreted_action"] for r in results] == ["perform_oral_exam", "error", "check_allergies_meds"]
+    assert responder.batches == [messages]
+    assert responder.singles == [POISON]  # only the dropped item is retried on its own
+
+
+def test_failed_batch_call_falls_back_to_single_calls():
+    responder = Responder(fail_batches=True)
+    agent = _agent(responder)
+    messages = ["Lezyonlara bir göz atayım", POISON]
+    results = agent.interpret_actions_batch(messages, _state(agent), batch_size=2)
+    assert [r["interpreted_action"] for r in results] == ["perform_oral_exam", "error"]
+    assert responder.singles == messages
+
+
+def test_duplicates_and_cached_items_are_not_resent():
+    responder = Responder()
+    agent = _agent(responder)
+    state = _state(agent)
+    first = "Lezyonlara bir göz atayım"
+    results = agent.interpret_actions_batch([first, "  LEZYONLARA bir göz atayım ", first], state)
+    assert len({r["interpreted_action"] for r in results}) == 1
+    assert responder.batches == [[first]]
+
+    agent.interpret_actions_batch([first, "Kullandığı şeyleri bir konuşalım"], state)
+    assert responder.batches[-1] == ["Kullandığı şeyleri bir konuşalım"]
+
+
+def test_endpoint_isolates_items_and_scores_in_order(monkeypatch):
+    monkeypatch.setattr(chat_router, "agent", _agent(Responder()))
+    app = FastAPI()
+    app.include_router(chat_router.router, prefix="/api/chat")
+    app.dependency_overrides[get_current_user] = lambda: "s1"
+
+    messages = ["Lezyonlara bir göz atayım", POISON, "Lezyonlara bir göz atayım"]
+    response = TestClient(app).post("/api/chat/interpret-batch", json={"case_id": CASE_ID, "messages": messages})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["count"] == 3
+    assert [item["index"] for item in body["items"]] == [0, 1, 2]
+    assert [item["interpretation"]["interpreted_action"] for item in body["items"]] == [
+        "perform_oral_exam", "error", "perform_oral_exam"
+    ]
+    # The repeat at index 2 sees the exam from index 0
+    assert [item["assessment"].get("score", 0) for item in body["items"]] == [20, 0, 0]
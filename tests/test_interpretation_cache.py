@@ -0,0 +1,136 @@
+"""InterpretationCache: key material, LRU + TTL in memory, and the shared DB tier."""
+
+import datetime
+
+import pytest
+
+import app.services.interpretation_cache as cache_module
+from app.services.interpretation_cache import InterpretationCache
+from db.database import InterpretationCacheEntry
+
+VALUE = {"interpreted_action": "perform_oral_exam", "clinical_intent": "examination"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def db_cache(session_factory, monkeypatch):
+    monkeypatch.setattr(cache_module, "SessionLocal", session_factory)
+    return lambda **kwargs: InterpretationCache(persistent=True, **kwargs)
+
+
+def _key(text="Ağız içi muayene", findings=("b2", "b1"), **kwargs):
+    return InterpretationCache.make_key(text, "olp_001", findings, "gemini", **kwargs)
+
+
+def test_key_ignores_spelling_noise_and_findings_order():
+    assert _key("  AĞIZ İÇİ   muayene!! ") == _key()
+    assert _key(findings=["b1", "b2", "b1"]) == _key()
+    assert _key(findings=[]) == _key(findings=None)
+
+
+def test_key_changes_with_case_model_rules_and_prompt():
+    base = _key(rules_digest="r1", prompt_version=1)
+    assert _key(findings=["b1"], rules_digest="r1", prompt_version=1) != base
+    assert _key(rules_digest="r2", prompt_version=1) != base
+    assert _key(rules_digest="r1", prompt_version=2) != base
+    assert InterpretationCache.make_key("Ağız içi muayene", "perio_001", ["b1", "b2"], "gemini", "r1", 1) != base
+    assert InterpretationCache.make_key("Ağız içi muayene", "olp_001", ["b1", "b2"], "medgemma", "r1", 1) != base
+
+
+def test_memory_tier_expires_and_evicts(clock):
+    cache = InterpretationCache(max_entries=2, ttl_seconds=60, persistent=False)
+    cache.set("a", VALUE)
+    clock.now += 59
+    assert cache.get("a") == VALUE
+    clock.now += 2
+    assert cache.get("a") is None
+
+    cache.set("a", VALUE)
+    cache.set("b", VALUE)
+    assert cache.get("a") == VALUE  # a is now the most recent
+    cache.set("c", VALUE)
+    assert cache.get("b") is None
+    assert cache.get("a") == VALUE
+    stats = cache.stats()
+    assert (stats["memory_hits"], stats["misses"], stats["evictions"], stats["memory_entries"]) == (3, 2, 1, 2)
+
+
+def test_values_are_copied_in_and_out():
+    cache = InterpretationCache(persistent=False)
+    value = {"interpreted_action": "perform_oral_exam", "findings": ["b1"]}
+    cache.set("a", value)
+    value["findings"].append("mutated")
+    cache.get("a")["findings"].append("mutated")
+    assert cache.get("a") == {"interpreted_action": "perform_oral_exam", "findings": ["b1"]}
+
+
+def test_db_tier_is_shared_between_processes(db_cache, session_factory):
+    writer = db_cache(ttl_seconds=3600)
+    writer.set("k", VALUE, case_id="olp_001", model_name="gemini")
+
+    reader = db_cache(ttl_seconds=3600)  # another process: empty memory tier
+    assert reader.get("k") == VALUE
+    assert reader.get("k") == VALUE
+    stats = reader.stats()
+    assert (stats["db_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 0)
+
+    db = session_factory()
+    try:
+        row = db.get(InterpretationCacheEntry, "k")
+        assert (row.case_id, row.model_name) == ("olp_001", "gemini")
+    finally:
+        db.close()
+
+
+def test_db_hit_never_outlives_its_row(db_cache, session_factory, clock):
+    db_cache(ttl_seconds=3600).set("k", VALUE)
+    db = session_factory()
+    try:
+        row = db.get(InterpretationCacheEntry, "k")
+        row.expires_at = datetime.datetime.utcnow() + datetime.timedelta(seconds=30)
+        db.commit()
+    finally:
+        db.close()
+
+    reader = db_cache(ttl_seconds=3600)
+    assert reader.get("k") == VALUE
+    clock.now += 60  # past the row's remaining 30 s, well inside the reader's own TTL
+    reader.get("k")  # the memory copy has expired: the row is consulted again
+    stats = reader.stats()
+    assert (stats["memory_hits"], stats["db_hits"]) == (0, 2)
+
+
+def test_expired_rows_are_not_served_and_are_purged(db_cache, session_factory):
+    cache = db_cache(ttl_seconds=3600)
+    cache.set("old", VALUE)
+    cache.set("fresh", VALUE)
+    db = session_factory()
+    try:
+        db.get(InterpretationCacheEntry, "old").expires_at = datetime.datetime.utcnow() - datetime.timedelta(seconds=1)
+        db.commit()
+    finally:
+        db.close()
+
+    reader = db_cache(ttl_seconds=3600)
+    assert reader.get("old") is None
+    assert reader.get("fresh") == VALUE
+    assert reader.purge_expired() == 1
+    db = session_factory()
+    try:
+        assert [row.key for row in db.query(InterpretationCacheEntry)] == ["fresh"]
+    finally:
+        db.close()
@@ -0,0 +1,103 @@
+"""JsonScanner / parse_json_object: prose and fences, streamed chunks and truncated output."""
+
+import pytest
+
+from app.json_extractor import (
+    JsonExtractionError,
+    JsonScanner,
+    JsonStringFieldStreamer,
+    extract_json,
+    parse_json_object,
+)
+
+FIELDS = {
+    "interpreted_action": (str, "unspecified_action"),
+    "explanatory_feedback": (str, ""),
+    "safety_concerns": (list, []),
+}
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"a": 1}',
+        'Sure! ```json\n{"a": 1}\n``` done',
+        'Use {curly} braces: {"a": 1}',
+        'prefix {"a": 1} {"b": 2}',
+    ],
+)
+def test_first_valid_object_is_found_in_free_text(text):
+    assert extract_json(text, expect="object") == {"a": 1}
+
+
+def test_braces_inside_strings_do_not_close_the_object():
+    assert extract_json('{"note": "a } b { c", "n": [1, {"x": "]"}]}') == {
+        "note": "a } b { c",
+        "n": [1, {"x": "]"}],
+    }
+
+
+def test_value_completes_across_stream_chunks():
+    scanner = JsonScanner(expect="object")
+    assert scanner.feed('Here: {"interpreted_action": "perf') is None
+    assert not scanner.complete and scanner.found
+    assert scanner.feed('orm_oral_exam", "safety_concerns": []}') == {
+        "interpreted_action": "perform_oral_exam",
+        "safety_concerns": [],
+    }
+    assert scanner.complete and not scanner.partial
+    # Text after the value is ignored
+    assert scanner.feed(' {"other": 1}') == {"interpreted_action": "perform_oral_exam", "safety_concerns": []}
+
+
+def test_truncated_string_value_is_closed_and_reported():
+    scanner = JsonScanner(expect="object")
+    scanner.feed('{"interpreted_action": "perform_oral_exam", "explanatory_feedback": "Ağız içi muay')
+    assert scanner.finish() == {"interpreted_action": "perform_oral_exam", "explanatory_feedback": "Ağız içi muay"}
+    assert scanner.partial
+    assert scanner.truncated_key == "explanatory_feedback"
+
+
+def test_truncated_key_is_cut_back_to_the_last_complete_member():
+    value = extract_json('{"interpreted_action": "take_history", "safety_conc')
+    assert value == {"interpreted_action": "take_history"}
+
+
+def test_truncated_array_keeps_complete_items():
+    value = extract_json('[{"id": 0, "a": "x"}, {"id": 1, "a": "y"}, {"id": 2, "a"', expect="array")
+    assert value[:2] == [{"id": 0, "a": "x"}, {"id": 1, "a": "y"}]
+
+
+def test_partial_recovery_can_be_disabled():
+    assert extract_json('{"a": "b', allow_partial=False) is None
+    assert extract_json("no json here") is None
+
+
+def test_truncated_action_key_is_dropped_and_defaulted():
+    result = parse_json_object(
+        '{"explanatory_feedback": "ok", "interpreted_action": "perform_or',
+        FIELDS,
+        complete_only=("interpreted_action",),
+    )
+    assert result["interpreted_action"] == "unspecified_action"
+    assert result["explanatory_feedback"] == "ok"
+
+
+def test_partial_required_fields_are_enforced_only_on_recovery():
+    with pytest.raises(JsonExtractionError):
+        parse_json_object('{"explanatory_feedback": "ok", "x": "tr', FIELDS, partial_required=("interpreted_action",))
+    result = parse_json_object('{"explanatory_feedback": "ok"}', FIELDS, partial_required=("interpreted_action",))
+    assert result["interpreted_action"] == "unspecified_action"
+
+
+def test_wrong_types_fall_back_to_defaults():
+    result = parse_json_object('{"interpreted_action": 5, "safety_concerns": "none"}', FIELDS)
+    assert result["interpreted_action"] == "unspecified_action"
+    assert result["safety_concerns"] == []
+
+
+def test_string_field_streamer_decodes_escapes_split_across_chunks():
+    streamer = JsonStringFieldStreamer("explanatory_feedback")
+    out = [streamer.feed(chunk) for chunk in ('{"explanatory_feedback": "Satır 1\\', 'n\\u00e', '7ok", "x": 1}')]
+    assert "".join(out) == "Satır 1\nçok"
+    assert streamer.done
@@ -0,0 +1,121 @@
+"""LLM backend interface: the local stand-in, fixture record/replay and backend selection."""
+
+import asyncio
+import json
+
+import pytest
+
+from app.services.llm_backends import (
+    LLMBackend,
+    LocalBackend,
+    LocalBackendError,
+    RecordingBackend,
+    create_interpretation_backend,
+    create_validation_backend,
+    estimate_tokens,
+    interpretation_responder,
+    load_fixtures,
+    prompt_fingerprint,
+)
+
+
+class EchoBackend(LLMBackend):
+    """Only generate(): the other methods must fall back to it."""
+
+    name = "echo"
+
+    def generate(self, prompt, generation_config=None, hints=None):
+        return prompt.upper()
+
+
+def _collect(async_iterable):
+    async def run():
+        return [part async for part in async_iterable]
+
+    return asyncio.run(run())
+
+
+def test_interface_defaults_fall_back_to_generate():
+    backend = EchoBackend()
+    assert list(backend.stream("abc")) == ["ABC"]
+    assert asyncio.run(backend.agenerate("abc")) == "ABC"
+    assert _collect(backend.astream("abc")) == ["ABC"]
+    assert backend.count_tokens("x" * 9) == estimate_tokens("x" * 9) == 3
+    assert backend.counts_tokens is False
+
+
+def test_local_backend_streams_the_same_text_in_chunks():
+    backend = LocalBackend(lambda prompt, hints: "0123456789", stream_chunk_chars=4)
+    assert backend.generate("p") == "0123456789"
+    assert list(backend.stream("p")) == ["0123", "4567", "89"]
+    assert _collect(backend.astream("p")) == ["0123", "4567", "89"]
+    assert backend.calls == 3
+
+
+def test_local_backend_failures_are_seeded():
+    def outcomes(seed):
+        backend = LocalBackend(lambda prompt, hints: "ok", failure_rate=0.5, seed=seed)
+        result = []
+        for _ in range(20):
+            try:
+                backend.generate("p")
+                result.append(True)
+            except LocalBackendError:
+                result.append(False)
+        return result
+
+    assert outcomes(7) == outcomes(7)
+    assert True in outcomes(7) and False in outcomes(7)
+    with pytest.raises(LocalBackendError):
+        LocalBackend(lambda prompt, hints: "ok", failure_rate=1.0).generate("p")
+
+
+def test_interpretation_responder_uses_the_hints():
+    single = json.loads(interpretation_responder("ignored", {"student_action": "Ağız içi muayene yapıyorum"}))
+    assert single["interpreted_action"] == "perform_oral_exam"
+    batch = json.loads(
+        interpretation_responder("ignored", {"student_actions": [{"id": 3, "action": "Merhaba"}]})
+    )
+    assert [(item["id"], item["intent_type"]) for item in batch] == [(3, "CHAT")]
+
+
+def test_fingerprint_covers_the_system_instruction():
+    assert prompt_fingerprint("p") == prompt_fingerprint("p", None)
+    assert prompt_fingerprint("p", "case A") != prompt_fingerprint("p", "case B")
+    assert prompt_fingerprint("p", "case A") != prompt_fingerprint("p")
+
+
+def test_recorded_responses_replay_under_the_same_system_instruction(tmp_path):
+    path = tmp_path / "fixtures.jsonl"
+    live = LocalBackend(lambda prompt, hints: f"live:{prompt}", model_name="gemini", system_instruction="case A")
+    recorder = RecordingBackend(live, str(path))
+    assert recorder.generate("one") == "live:one"
+    assert "".join(recorder.stream("two")) == "live:two"
+    with open(path, "a", encoding="utf-8") as f:
+        f.write("not json\n\n")
+
+    fixtures = load_fixtures(str(path))
+    assert len(fixtures) == 2
+
+    def offline(prompt, hints):
+        return "offline"
+
+    replay = LocalBackend(offline, system_instruction="case A", fixtures_path=str(path))
+    assert (replay.generate("one"), replay.generate("two"), replay.generate("three")) == ("live:one", "live:two", "offline")
+    assert replay.fixture_hits == 2
+    # Another case's prompt never replays case A's answers
+    assert LocalBackend(offline, system_instruction="case B", fixtures_path=str(path)).generate("one") == "offline"
+
+
+def test_backend_selection(monkeypatch):
+    monkeypatch.setenv("DENTAI_LLM_BACKEND", "local")
+    backend = create_interpretation_backend("models/x", None, "system", None)
+    assert isinstance(backend, LocalBackend)
+    assert (backend.model_name, backend.system_instruction) == ("models/x", "system")
+    assert isinstance(create_validation_backend("medgemma", lambda: None), LocalBackend)
+
+    monkeypatch.setenv("DENTAI_LLM_BACKEND", "gemini")
+    with pytest.raises(ValueError):
+        create_interpretation_backend("models/x", None, None, None)
+    with pytest.raises(ValueError):
+        create_validation_backend("medgemma", lambda: None)
@@ -0,0 +1,94 @@
+"""Schema migrations: idempotence, check_schema and the action_events backfill."""
+
+import json
+
+import pytest
+from sqlalchemy import text
+
+from db.migrations import LATEST_VERSION, MIGRATIONS, SchemaOutOfDateError, check_schema, current_version, migrate
+from db.storage import StorageConfig, create_storage_engine
+
+
+@pytest.fixture
+def blank_engine(tmp_path):
+    engine = create_storage_engine(StorageConfig(url=f"sqlite:///{tmp_path / 'legacy.db'}"))
+    yield engine
+    engine.dispose()
+
+
+def _seed_legacy_turns(engine):
+    """Data as written before action_events existed (schema at version 5)."""
+    assessment = {"score": 20, "rule_outcome": "Oral mukoza muayenesi yapıldı."}
+    with engine.begin() as conn:
+        conn.execute(
+            text(
+                "INSERT INTO student_sessions (id, student_id, case_id, current_score, state_json, version, start_time) "
+                "VALUES (1, 's1', 'olp_001', 20, '{}', 2, '2025-01-01 10:00:00')"
+            )
+        )
+        rows = [
+            (1, "user", "ağız içi muayene", None),
+            (2, "assistant", "ok", json.dumps({"interpreted_action": "perform_oral_exam", "assessment": assessment})),
+            (3, "assistant", "merhaba", json.dumps({"assessment": {"score": 0}})),  # no action: skipped
+            (4, "assistant", "bozuk", "not json"),
+        ]
+        for row_id, role, content, metadata in rows:
+            conn.execute(
+                text(
+                    "INSERT INTO chat_logs (id, session_id, role, content, metadata_json, timestamp) "
+                    "VALUES (:id, 1, :role, :content, :metadata, '2025-01-01 10:05:00')"
+                ),
+                {"id": row_id, "role": role, "content": content, "metadata": metadata},
+            )
+
+
+def _action_events(engine):
+    with engine.connect() as conn:
+        return conn.execute(
+            text("SELECT student_id, case_id, session_id, chat_log_id, action, score, outcome FROM action_events")
+        ).all()
+
+
+def test_fresh_database_migrates_once(blank_engine):
+    applied = migrate(blank_engine)
+    assert [m.version for m in applied] == [m.version for m in MIGRATIONS]
+    assert current_version(blank_engine) == LATEST_VERSION
+    assert migrate(blank_engine) == []
+    check_schema(blank_engine)
+
+
+def test_check_schema_rejects_a_database_that_is_behind(blank_engine):
+    migrate(blank_engine, target=5)
+    with pytest.raises(SchemaOutOfDateError):
+        check_schema(blank_engine)
+
+
+def test_action_events_are_backfilled_from_chat_logs(blank_engine):
+    migrate(blank_engine, target=5)
+    _seed_legacy_turns(blank_engine)
+    migrate(blank_engine)
+
+    assert _action_events(blank_engine) == [
+        ("s1", "olp_001", 1, 2, "perform_oral_exam", 20.0, "Oral mukoza muayenesi yapıldı.")
+    ]
+    with blank_engine.connect() as conn:
+        stats = conn.execute(text("SELECT actions_count, action_score_total FROM student_stats WHERE student_id = 's1'")).one()
+        snapshot = conn.execute(text("SELECT seq, score FROM scenario_snapshots WHERE session_id = 1")).one()
+    assert tuple(stats) == (1, 20.0)
+    assert tuple(snapshot) == (2, 20.0)
+
+
+def test_every_migration_can_be_reapplied(blank_engine):
+    migrate(blank_engine, target=5)
+    _seed_legacy_turns(blank_engine)
+    migrate(blank_engine)
+
+    # Adopting a DB whose schema is already there (e.g. created before schema_migrations) must be a no-op
+    for migration in MIGRATIONS:
+        with blank_engine.begin() as conn:
+            migration.apply(conn)
+
+    assert len(_action_events(blank_engine)) == 1
+    with blank_engine.connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM scenario_snapshots")).scalar() == 1
+        assert conn.execute(text("SELECT actions_count FROM student_stats WHERE student_id = 's1'")).scalar() == 1
@@ -0,0 +1,105 @@
+"""Per-session progress bitmap: layout order, repeats and re-interning after a layout change."""
+
+import json
+
+from app import progress
+from app.progress import ProgressTracker
+from app.services.rule_index import get_rule_catalog
+
+RULES = [
+    {
+        "case_id": "prog_case",
+        "rules": [
+            {
+                "target_action": "perform_oral_exam",
+                "score": 10,
+                "rule_outcome": "ok",
+                "state_updates": {"revealed_findings": ["lesion"]},
+            },
+            {
+                "target_action": "prescribe_antibiotics",
+                "score": 10,
+                "rule_outcome": "ok",
+                "requires": ["check_allergies_meds"],
+            },
+        ],
+    }
+]
+
+
+def _tracker(tmp_path, rules=RULES):
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps(rules), encoding="utf-8")
+    catalog = get_rule_catalog(str(rules_path))
+    return ProgressTracker(catalog, lambda case_id: ("fever",)), catalog, rules_path
+
+
+def test_actions_share_the_sequence_bits(tmp_path):
+    tracker, catalog, _ = _tracker(tmp_path)
+    layout = tracker.layout("prog_case")
+    sequence = catalog.index().cases["prog_case"].sequence
+    assert {a: layout.action_bits[a] for a in sequence.bits} == dict(sequence.bits)
+    assert layout.findings == ("fever", "lesion")
+
+
+def test_repeat_keeps_penalty_and_drops_positive_score(tmp_path):
+    tracker, _, _ = _tracker(tmp_path)
+    state = {"case_id": "prog_case"}
+    tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "perform_oral_exam", "score_change": 10})
+    assert progress.is_done(state, "perform_oral_exam")
+
+    repeat = tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "perform_oral_exam", "score_change": 10})
+    assert "score_change" not in repeat
+    penalty = tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "perform_oral_exam", "score_change": -5})
+    assert penalty["score_change"] == -5
+    assert state["progress"]["counts"] == {"actions": 1, "repeats": 2}
+
+
+def test_progress_is_reinterned_after_a_layout_change(tmp_path):
+    tracker, catalog, rules_path = _tracker(tmp_path)
+    state = {"case_id": "prog_case"}
+    tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "check_allergies_meds"})
+    tracker.apply(
+        state, {progress.PROGRESS_ACTION_KEY: "perform_oral_exam", "revealed_findings": ["lesion"]}
+    )
+    old_digest = state["progress"]["layout"]
+
+    edited = json.loads(json.dumps(RULES))
+    edited[0]["rules"].insert(0, {"target_action": "take_history", "score": 5, "rule_outcome": "ok"})
+    rules_path.write_text(json.dumps(edited), encoding="utf-8")
+    catalog.reload()
+
+    tracker.apply(state, {})
+    assert state["progress"]["layout"] != old_digest
+    assert progress.is_done(state, "check_allergies_meds")
+    assert progress.is_done(state, "perform_oral_exam")
+    assert not progress.is_done(state, "take_history")
+    assert progress.has_finding(state, "lesion")
+    assert state["revealed_findings"] == ["lesion"]
+    assert state["progress"]["counts"]["actions"] == 2
+
+
+def test_progress_survives_a_layout_change_across_a_restart(tmp_path, monkeypatch):
+    tracker, catalog, rules_path = _tracker(tmp_path)
+    state = {"case_id": "prog_case"}
+    tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "check_allergies_meds"})
+    tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "perform_oral_exam", "score_change": 10})
+    # As stored in a snapshot
+    state = json.loads(json.dumps(state))
+
+    edited = json.loads(json.dumps(RULES))
+    edited[0]["rules"].insert(0, {"target_action": "take_history", "score": 5, "rule_outcome": "ok"})
+    rules_path.write_text(json.dumps(edited), encoding="utf-8")
+    catalog.reload()
+    # A new process only knows the layouts it built itself
+    monkeypatch.setattr(progress, "_layouts", {})
+
+    assert progress.layout_of(state) is None
+    assert progress.is_done(state, "check_allergies_meds")
+    sequence = catalog.index().cases["prog_case"].sequence
+    assert progress.sequence_mask(state, sequence) == sequence.mask_of(["check_allergies_meds", "perform_oral_exam"])
+
+    repeat = tracker.apply(state, {progress.PROGRESS_ACTION_KEY: "perform_oral_exam", "score_change": 10})
+    assert "score_change" not in repeat
+    assert progress.is_done(state, "check_allergies_meds")
+    assert state["progress"]["done"] == ["perform_oral_exam", "check_allergies_meds"]
@@ -0,0 +1,93 @@
+"""Case-scoped prompts: recompiling on a rules change, the per-case backend pool and token counts."""
+
+import json
+
+import pytest
+
+from app.assessment_engine import AssessmentEngine
+from app.scenario_manager import ScenarioManager
+from app.services.prompt_compiler import PromptCompiler
+
+CASE_ID = "olp_001"
+
+RULES = [
+    {
+        "case_id": CASE_ID,
+        "rules": [
+            {"target_action": "check_allergies_meds", "score": 15, "rule_outcome": "ok"},
+            {"target_action": "perform_oral_exam", "score": 20, "rule_outcome": "ok"},
+        ],
+    }
+]
+
+
+@pytest.fixture
+def rules_path(tmp_path):
+    path = tmp_path / "scoring_rules.json"
+    path.write_text(json.dumps(RULES), encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def agent(rules_path, monkeypatch):
+    monkeypatch.setenv("DENTAI_LLM_BACKEND", "local")
+    monkeypatch.delenv("DENTAI_CASE_PROMPTS", raising=False)
+    from app.agent import DentalEducationAgent
+
+    return DentalEducationAgent(assessment_engine=AssessmentEngine(str(rules_path)), enable_med_gemma=False)
+
+
+def _edit_rules(agent, rules_path, rules):
+    rules_path.write_text(json.dumps(rules), encoding="utf-8")
+    agent.assessment_engine._catalog.reload()
+
+
+def test_prompt_offers_only_the_case_actions(agent):
+    compiled = agent.prompt_compiler.compile(CASE_ID, agent.model_name)
+    assert compiled.action_keys == ("check_allergies_meds", "perform_oral_exam")
+    assert "ACTION KEYS: check_allergies_meds,perform_oral_exam\n" in compiled.system_instruction
+    assert compiled.system_tokens < compiled.generic_system_tokens
+    assert agent.prompt_compiler.compile(CASE_ID, agent.model_name) is compiled
+    assert agent.prompt_compiler.compile("no_such_case", agent.model_name) is None
+
+
+def test_rules_change_recompiles_the_prompt_and_replaces_the_backend(agent, rules_path):
+    state = {"case_id": CASE_ID}
+    backend, compiled = agent._backend_for(state)
+    assert agent._backend_for(state)[0] is backend
+    assert backend.system_instruction == compiled.system_instruction
+
+    edited = json.loads(json.dumps(RULES))
+    edited[0]["rules"].append(
+        {"target_action": "prescribe_steroid", "score": 10, "rule_outcome": "ok", "requires": ["request_dif_biopsy"]}
+    )
+    _edit_rules(agent, rules_path, edited)
+
+    new_backend, recompiled = agent._backend_for(state)
+    assert recompiled is not compiled
+    # Added and newly required actions are offered to the model
+    assert recompiled.action_keys[-2:] == ("prescribe_steroid", "request_dif_biopsy")
+    assert new_backend is not backend
+    assert new_backend.system_instruction == recompiled.system_instruction
+    assert [r["case_id"] for r in agent.prompt_compiler.token_report()] == [CASE_ID]
+
+
+def test_token_counts_use_the_model_tokenizer_when_there_is_one(agent):
+    assert agent.prompt_compiler.compile(CASE_ID, agent.model_name).token_source == "estimate"
+
+    agent.prompt_compiler.clear()
+    agent.backend.counts_tokens = True
+    agent.backend.count_tokens = len
+    compiled = agent._compiled_prompt(CASE_ID)
+    assert compiled.token_source == "model"
+    assert compiled.system_tokens == len(compiled.system_instruction)
+
+
+def test_failing_token_counter_falls_back_to_the_estimate():
+    def broken(text):
+        raise RuntimeError("quota")
+
+    compiler = PromptCompiler(AssessmentEngine(), ScenarioManager(), "generic prompt " * 50)
+    compiled = compiler.compile(CASE_ID, "m", token_counter=broken)
+    assert compiled.token_source == "estimate"
+    assert compiled.system_tokens > 0
@@ -0,0 +1,119 @@
+"""Bulk re-scoring: corrections are written once, re-runs are no-ops, and a concurrent turn is skipped."""
+
+import pytest
+
+import app.scenario_manager as scenario_module
+from app.assessment_engine import AssessmentEngine
+from app.rescoring import run_rescore
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import ActionEvent, ChatLog, ScenarioEvent, StudentSession, StudentStats
+
+CASE_ID = "olp_001"
+
+# What check_allergies_meds scored under an older scoring_rules.json (the current rules give 15)
+STALE_ASSESSMENT = {
+    "score": 10,
+    "score_change": 10,
+    "rule_outcome": "Eski kural.",
+    "action_effect": None,
+    "state_updates": {"progress_action": "check_allergies_meds"},
+}
+
+
+@pytest.fixture
+def manager(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    return ScenarioManager(state_cache=SessionStateCache())
+
+
+def _turn(manager, student_id, action, assessment=None):
+    """One agent turn as _finalize_turn writes it; `assessment` defaults to the current rules."""
+    turn = manager.begin_turn(student_id, CASE_ID)
+    if assessment is None:
+        assessment = AssessmentEngine().evaluate_action(CASE_ID, {"interpreted_action": action}, turn.state)
+    updates = {}
+    if assessment.get("score_change"):
+        updates["score_change"] = assessment["score_change"]
+    updates.update(assessment.get("state_updates") or {})
+    metadata = {
+        "interpreted_action": action,
+        "assessment": assessment,
+        "silent_evaluation": {"status": "done", "score": 7},
+    }
+    with manager.unit_of_work(turn) as uow:
+        uow.apply_updates(updates)
+        uow.add_message("user", action)
+        reply = uow.add_message("assistant", "ok", metadata=metadata)
+        uow.flush()
+        uow.add_action_event(action, assessment.get("score", 0), assessment.get("rule_outcome"), chat_log=reply)
+    return turn.session_id
+
+
+def _stored(session_factory, session_id):
+    db = session_factory()
+    try:
+        session = db.get(StudentSession, session_id)
+        scores = [e.score for e in db.query(ActionEvent).filter_by(session_id=session_id).order_by(ActionEvent.id)]
+        metadata = [
+            c.metadata_json
+            for c in db.query(ChatLog).filter_by(session_id=session_id, role="assistant").order_by(ChatLog.id)
+        ]
+        total = db.get(StudentStats, session.student_id).action_score_total
+        events = db.query(ScenarioEvent).filter_by(session_id=session_id).count()
+        return session.current_score, session.version, scores, total, metadata, events
+    finally:
+        db.close()
+
+
+def test_rescore_corrects_stale_turns_once(manager, session_factory):
+    stale = _turn(manager, "s1", "check_allergies_meds", STALE_ASSESSMENT)
+    _turn(manager, "s1", "perform_oral_exam")
+    current = _turn(manager, "s2", "check_allergies_meds")
+    untouched = _stored(session_factory, current)
+
+    dry = run_rescore(session_factory, workers=1, dry_run=True)
+    assert (dry.sessions_scanned, dry.sessions_changed, dry.score_delta_total) == (2, 1, 5.0)
+    assert not dry.written
+    assert _stored(session_factory, stale)[:2] == (30.0, 2)
+
+    changed = []
+    report = run_rescore(session_factory, workers=1, on_result=changed.append)
+    assert [r.session_id for r in changed] == [stale]
+    assert dict(report.written) == {"sessions": 1, "conflicts": 0, "messages": 1, "action_events": 1}
+    assert report.by_action["check_allergies_meds"] == [1, 5.0]
+
+    score, version, scores, total, metadata, events = _stored(session_factory, stale)
+    assert (score, version, scores, total, events) == (35.0, 3, [15.0, 20.0], 35.0, 3)
+    assert metadata[0]["assessment"]["rule_outcome"] == "Anamnez tamamlandı."
+    assert metadata[0]["silent_evaluation"] == {"status": "done", "score": 7}
+    assert _stored(session_factory, current) == untouched
+
+    # The live state rebuilt from the events agrees with the corrected row
+    fresh = ScenarioManager(state_cache=SessionStateCache())
+    assert fresh.get_state("s1", CASE_ID)["current_score"] == 35.0
+
+    again = run_rescore(session_factory, workers=1)
+    assert (again.sessions_changed, again.turns_changed) == (0, 0)
+    assert sum(again.written.values()) == 0
+    assert _stored(session_factory, stale)[:2] == (35.0, 3)
+
+
+def test_session_that_took_a_turn_meanwhile_is_skipped(manager, session_factory):
+    stale = _turn(manager, "s1", "check_allergies_meds", STALE_ASSESSMENT)
+
+    def student_answers(result):
+        # A live turn commits between the replay and the batch write
+        _turn(manager, "s1", "perform_oral_exam")
+
+    report = run_rescore(session_factory, workers=1, on_result=student_answers)
+    assert report.written["conflicts"] == 1
+    assert report.written["sessions"] == 0
+    score, version, scores, total, metadata, _ = _stored(session_factory, stale)
+    assert (score, version, scores, total) == (30.0, 2, [10.0, 20.0], 30.0)
+    assert metadata[0]["assessment"] == STALE_ASSESSMENT
+
+    # The next run picks the session up with its new turn included
+    report = run_rescore(session_factory, workers=1)
+    assert dict(report.written) == {"sessions": 1, "conflicts": 0, "messages": 1, "action_events": 1}
+    assert _stored(session_factory, stale)[:4] == (35.0, 3, [15.0, 20.0], 35.0)
@@ -0,0 +1,146 @@
+"""Session retention: archive -> rehydrate round-trip keeps state, history and rollups."""
+
+import datetime
+
+import pytest
+from sqlalchemy import text
+
+import app.scenario_manager as scenario_module
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import ActionEvent, ChatLog, ScenarioEvent, ScenarioSnapshot, SessionArchive
+from db.retention import archive_session, archived_messages, compress, decompress, find_archivable_sessions
+
+CASE_ID = "olp_001"
+LONG_AGO = datetime.datetime(2024, 1, 1, 10, 0, 0)
+
+
+@pytest.fixture
+def manager(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    monkeypatch.setenv("DENTAI_STATE_SNAPSHOT_EVERY", "2")
+    return ScenarioManager(state_cache=SessionStateCache())
+
+
+def _turn(manager, student_id, text_in, action, score, timestamp=None):
+    turn = manager.begin_turn(student_id, CASE_ID)
+    with manager.unit_of_work(turn) as uow:
+        uow.apply_updates({"score_change": score, "progress_action": action})
+        uow.add_message("user", text_in, timestamp=timestamp)
+        reply = uow.add_message("assistant", "ok", metadata={"interpreted_action": action}, timestamp=timestamp)
+        uow.flush()
+        uow.add_action_event(action, score, "done", chat_log=reply)
+    return turn.session_id
+
+
+def _rollups(db):
+    return {
+        table: sorted(tuple(row) for row in db.execute(text(f"SELECT * FROM {table}")))
+        for table in ("student_stats", "student_case_stats", "case_stats")
+    }
+
+
+def _archive(manager, db, session_id):
+    """One session per transaction, as scripts/archive_sessions.py does it."""
+    manager.checkpoint(db, session_id)
+    result = archive_session(db, session_id)
+    if result is None:
+        db.rollback()
+    else:
+        db.commit()
+    return result
+
+
+def _history(db, session_id):
+    hot = [
+        {"id": c.id, "role": c.role, "content": c.content}
+        for c in db.query(ChatLog).filter(ChatLog.session_id == session_id).order_by(ChatLog.id)
+    ]
+    archived = [{k: m[k] for k in ("id", "role", "content")} for m in archived_messages(db, session_id)]
+    return archived + hot
+
+
+def test_compression_round_trip():
+    codec, blob = compress(b'{"a": "\xc3\xa7"}' * 50)
+    assert decompress(codec, blob) == b'{"a": "\xc3\xa7"}' * 50
+    with pytest.raises(ValueError):
+        decompress("lz4", blob)
+
+
+def test_archive_and_rehydrate_round_trip(manager, session_factory):
+    old = _turn(manager, "s1", "anamnez", "check_allergies_meds", 10, LONG_AGO)
+    _turn(manager, "s1", "ağız içi muayene", "perform_oral_exam", 20, LONG_AGO)
+    recent = _turn(manager, "s2", "anamnez", "check_allergies_meds", 10)
+    state_before = manager.get_state("s1", CASE_ID)
+
+    db = session_factory()
+    try:
+        history_before = _history(db, old)
+        rollups_before = _rollups(db)
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=180)
+        assert find_archivable_sessions(db, cutoff) == [old]
+
+        result = _archive(manager, db, old)
+        assert result["messages"] == 4 and result["events"] == 2
+
+        # Hot rows are gone; the current-version snapshot and the rollups stay
+        assert db.query(ChatLog).filter(ChatLog.session_id == old).count() == 0
+        assert db.query(ScenarioEvent).filter(ScenarioEvent.session_id == old).count() == 0
+        assert [s.seq for s in db.query(ScenarioSnapshot).filter(ScenarioSnapshot.session_id == old)] == [2]
+        assert db.query(ChatLog).filter(ChatLog.session_id == recent).count() == 2
+        assert _rollups(db) == rollups_before
+        events = db.query(ActionEvent).filter(ActionEvent.session_id == old).all()
+        assert [(e.action, e.chat_log_id) for e in events] == [("check_allergies_meds", None), ("perform_oral_exam", None)]
+
+        assert _history(db, old) == history_before
+        assert find_archivable_sessions(db, cutoff) == []
+    finally:
+        db.close()
+
+    # A fresh process rebuilds the same live state from the kept snapshot
+    rehydrated = ScenarioManager(state_cache=SessionStateCache())
+    assert rehydrated.get_state("s1", CASE_ID) == state_before
+
+
+def test_turn_after_archiving_is_folded_into_the_same_archive(manager, session_factory):
+    old = _turn(manager, "s1", "anamnez", "check_allergies_meds", 10, LONG_AGO)
+    _turn(manager, "s2", "anamnez", "check_allergies_meds", 10)
+    db = session_factory()
+    try:
+        _archive(manager, db, old)
+    finally:
+        db.close()
+
+    # The returning student continues where they left off
+    _turn(manager, "s1", "ağız içi muayene", "perform_oral_exam", 20, LONG_AGO + datetime.timedelta(days=1))
+    assert manager.get_state("s1", CASE_ID)["current_score"] == 30.0
+    _turn(manager, "s2", "muayene", "perform_oral_exam", 20)
+
+    db = session_factory()
+    try:
+        history_before = _history(db, old)
+        rollups_before = _rollups(db)
+        cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=180)
+        assert find_archivable_sessions(db, cutoff) == [old]
+        result = _archive(manager, db, old)
+        assert result["messages"] == 2 and result["events"] == 1
+
+        archive = db.get(SessionArchive, old)
+        assert (archive.message_count, archive.event_count) == (4, 2)
+        assert _history(db, old) == history_before
+        assert _rollups(db) == rollups_before
+    finally:
+        db.close()
+
+    assert ScenarioManager(state_cache=SessionStateCache()).get_state("s1", CASE_ID)["current_score"] == 30.0
+
+
+def test_session_holding_the_newest_message_waits(manager, session_factory):
+    only = _turn(manager, "s1", "anamnez", "check_allergies_meds", 10, LONG_AGO)
+    db = session_factory()
+    try:
+        assert _archive(manager, db, only) is None
+        assert db.query(ChatLog).filter(ChatLog.session_id == only).count() == 2
+        assert db.get(SessionArchive, only) is None
+    finally:
+        db.close()
@@ -0,0 +1,108 @@
+"""Stat rollups: incremental upserts agree with the rows they summarize and with rebuild_rollups()."""
+
+import datetime
+
+import pytest
+from sqlalchemy import func, text
+
+import app.scenario_manager as scenario_module
+import db.database as database
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import (
+    ActionEvent,
+    ExamResult,
+    get_student_action_summary,
+    get_user_stats,
+    save_exam_result,
+)
+from db.rollups import rebuild_rollups
+
+EXAMS = [
+    ("s1", "olp_001", 60, 100),
+    ("s1", "olp_001", 90, 100),
+    ("s1", "olp_001", 70, 100),  # latest is not the best
+    ("s1", "perio_001", 40, 80),
+    ("s2", "olp_001", 100, 100),
+]
+ACTIONS = [
+    ("s1", "olp_001", "check_allergies_meds", 15),
+    ("s1", "olp_001", "general_chat", 0),
+    ("s1", "perio_001", "perform_oral_exam", -5),
+    ("s2", "olp_001", "perform_oral_exam", 20),
+]
+
+
+@pytest.fixture
+def filled(session_factory, monkeypatch):
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    monkeypatch.setattr(database, "SessionLocal", session_factory)
+    manager = ScenarioManager(state_cache=SessionStateCache())
+    for student_id, case_id, action, score in ACTIONS:
+        turn = manager.begin_turn(student_id, case_id)
+        with manager.unit_of_work(turn) as uow:
+            reply = uow.add_message("assistant", "ok", metadata={"interpreted_action": action})
+            uow.flush()
+            uow.add_action_event(action, score, None, chat_log=reply)
+    start = datetime.datetime(2025, 3, 1, 9, 0)
+    for minutes, (user_id, case_id, score, max_score) in enumerate(EXAMS):
+        result = save_exam_result(user_id, case_id, score, max_score)
+        db = session_factory()
+        try:
+            # Distinct, increasing completion times (utcnow can repeat within a test)
+            db.get(ExamResult, result.id).completed_at = start + datetime.timedelta(minutes=minutes)
+            db.commit()
+        finally:
+            db.close()
+    return session_factory
+
+
+def _rollups(db):
+    """Rollup rows without the *_at columns (the fixture re-stamps completed_at after the upserts)."""
+    return {
+        table: sorted(
+            tuple(value for key, value in row._mapping.items() if not key.endswith("_at"))
+            for row in db.execute(text(f"SELECT * FROM {table}"))
+        )
+        for table in ("student_stats", "student_case_stats", "case_stats")
+    }
+
+
+def test_user_stats_read_from_the_rollups(filled):
+    stats = get_user_stats("s1")
+    assert (stats["total_solved"], stats["total_points"]) == (4, 260)
+    assert stats["avg_score"] == int(260 / 380 * 100)
+    assert stats["user_level"] == "Orta"
+    assert [(r["case_id"], r["score"]) for r in stats["case_breakdown"]] == [
+        ("olp_001", 60), ("olp_001", 90), ("olp_001", 70), ("perio_001", 40)
+    ]
+    summary = {r["case_id"]: (r["score"], r["best_score"], r["attempts"], r["percentage"]) for r in stats["case_summary"]}
+    assert summary == {"olp_001": (70, 90, 3, 70), "perio_001": (40, 40, 1, 50)}
+    assert get_user_stats("nobody")["total_solved"] == 0
+
+
+def test_action_totals_match_the_events(filled):
+    db = filled()
+    try:
+        count, total = (
+            db.query(func.count(ActionEvent.id), func.sum(ActionEvent.score))
+            .filter(ActionEvent.student_id == "s1", ActionEvent.action != "general_chat")
+            .one()
+        )
+    finally:
+        db.close()
+    summary = get_student_action_summary("s1")
+    assert (summary["total_actions"], summary["total_score"]) == (count, total) == (2, 10)
+    assert (summary["total_sessions"], summary["completed_cases"]) == (2, 2)
+
+
+def test_rebuild_reproduces_the_incremental_rollups(filled):
+    db = filled()
+    try:
+        incremental = _rollups(db)
+        counts = rebuild_rollups(db)
+        db.commit()
+        assert counts == {"student_stats": 2, "student_case_stats": 3, "case_stats": 2}
+        assert _rollups(db) == incremental
+    finally:
+        db.close()
@@ -0,0 +1,149 @@
+"""RuleCatalog hot reload (keep-last-good) and the validation problems list / scripts/validate_rules.py."""
+
+import importlib.util
+import json
+import os
+import sys
+
+import pytest
+
+from app.services.rule_index import DEFAULT_RULES_PATH, RuleCatalog, RulesFileError, compile_rules
+
+SCRIPT = os.path.join(os.path.dirname(DEFAULT_RULES_PATH), "..", "scripts", "validate_rules.py")
+
+RULES = [
+    {
+        "case_id": "olp_001",
+        "rules": [
+            {"target_action": "check_allergies_meds", "score": 15},
+            {"target_action": "perform_oral_exam", "score": 20},
+        ],
+    }
+]
+
+
+def _write(path, content):
+    """Write and move the mtime forward, so the change is seen even on coarse-mtime filesystems."""
+    previous = os.stat(path).st_mtime_ns if path.exists() else 0
+    path.write_text(content if isinstance(content, str) else json.dumps(content), encoding="utf-8")
+    stamp = max(os.stat(path).st_mtime_ns, previous + 1_000_000_000)
+    os.utime(path, ns=(stamp, stamp))
+
+
+@pytest.fixture
+def rules_file(tmp_path):
+    path = tmp_path / "scoring_rules.json"
+    _write(path, RULES)
+    return path
+
+
+def _catalog(path):
+    return RuleCatalog(str(path), cases_path=None, reload_seconds=0)
+
+
+def test_changed_file_is_recompiled(rules_file):
+    catalog = _catalog(rules_file)
+    first = catalog.index()
+    assert first.case_actions("olp_001") == ("check_allergies_meds", "perform_oral_exam")
+
+    changed = [dict(RULES[0], rules=RULES[0]["rules"] + [{"target_action": "prescribe_steroid", "score": 5}])]
+    _write(rules_file, changed)
+    second = catalog.index()
+    assert second is not first
+    assert second.digest != first.digest
+    assert second.rule("olp_001", "prescribe_steroid").score == 5
+    assert catalog.reloads == 2
+
+
+def test_touched_but_unchanged_file_keeps_the_index(rules_file):
+    catalog = _catalog(rules_file)
+    first = catalog.index()
+    _write(rules_file, RULES)
+    assert catalog.index() is first
+    assert catalog.reloads == 1
+
+
+@pytest.mark.parametrize("broken", ['[{"case_id": "olp_001", "rules": [', '{"case_id": "olp_001"}'])
+def test_broken_file_keeps_the_last_good_index(rules_file, broken):
+    catalog = _catalog(rules_file)
+    good = catalog.index()
+    _write(rules_file, broken)
+    assert catalog.index() is good
+
+    # Fixing the file is picked up again
+    _write(rules_file, RULES + [{"case_id": "perio_001", "rules": []}])
+    assert set(catalog.index().cases) == {"olp_001", "perio_001"}
+
+
+def test_missing_file_keeps_the_last_good_index(rules_file):
+    catalog = _catalog(rules_file)
+    good = catalog.index()
+    rules_file.unlink()
+    assert catalog.index() is good
+
+
+def test_wrong_top_level_is_a_file_error():
+    with pytest.raises(RulesFileError):
+        compile_rules({"olp_001": []})
+
+
+def test_problems_are_collected_and_first_entries_win():
+    data = [
+        {"case_id": "olp_001", "rules": [
+            {"target_action": "perform_oral_exam", "score": 20},
+            {"target_action": "perform_oral_exam", "score": 99},
+            {"score": 5},
+            {"target_action": "check_allergies_meds", "first_time_only": True},
+        ]},
+        {"case_id": "olp_001", "rules": []},
+        {"case_id": "ghost_case", "rules": "nope"},
+        "not an object",
+        {"rules": []},
+    ]
+    index = compile_rules(data, known_cases={"olp_001"})
+    assert index.rule("olp_001", "perform_oral_exam").score == 20
+    assert index.problems == (
+        "olp_001: duplicate target_action 'perform_oral_exam' (rule #1 ignored)",
+        "olp_001: rule #2 has no target_action",
+        "olp_001: 'check_allergies_meds'.first_time_only is unused (repeats of a positive-score action score 0)",
+        "olp_001: duplicate case entry #1 ignored",
+        "ghost_case: not found in case_scenarios.json",
+        "ghost_case: rules is not a list",
+        "entry #3: not an object",
+        "entry #4: missing case_id",
+    )
+
+
+def test_sequence_keys_are_validated():
+    data = [{"case_id": "olp_001", "rules": [
+        {"target_action": "prescribe_steroid", "requires": ["check_allergies_meds", 3], "penalty": -25},
+        {"target_action": "biopsy", "requires": ["biopsy"]},
+    ]}]
+    problems = compile_rules(data).problems
+    assert "olp_001: 'prescribe_steroid'.requires must be a list of action keys" in problems
+    assert "olp_001: 'prescribe_steroid'.penalty must be an object" in problems
+    assert "olp_001: 'biopsy'.requires refers to itself" in problems
+
+
+def _run_validate_rules(monkeypatch, *args):
+    spec = importlib.util.spec_from_file_location("validate_rules", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    monkeypatch.setattr(sys, "argv", ["validate_rules.py", *args])
+    return module.main()
+
+
+def test_shipped_rules_file_is_valid(monkeypatch, capsys):
+    assert _run_validate_rules(monkeypatch) == 0
+    assert "Rules file is valid" in capsys.readouterr().out
+
+
+def test_validate_rules_reports_problems(monkeypatch, capsys, tmp_path):
+    path = tmp_path / "rules.json"
+    path.write_text(json.dumps(RULES + [{"case_id": "ghost_case", "rules": []}]), encoding="utf-8")
+    assert _run_validate_rules(monkeypatch, str(path)) == 1
+    assert "ghost_case: not found in case_scenarios.json" in capsys.readouterr().out
+
+    path.write_text("{", encoding="utf-8")
+    assert _run_validate_rules(monkeypatch, str(path)) == 1
+    assert "Could not load rules" in capsys.readouterr().out
@@ -6,6 +6,8 @@ This script tests the integration between:
 2. app/services/med_gemma_service.py (AI Validator)
 
 Run from project root: python tests/test_rules_integration.py
+Under pytest only the offline checks run; the MedGemma checks need
+HUGGINGFACE_API_KEY and are skipped without it.
 """
 
 import sys
@@ -13,6 +15,12 @@ import os
 import json
 from pathlib import Path
 
+import pytest
+
+INFECTIOUS_CONTEXT = "Patient is a 28-year-old male with a known Penicillin allergy (documented anaphylaxis). Chief complaint: Dental abscess."
+UNSAFE_ACTION = "I will prescribe Amoxicillin 500mg TID for 7 days."
+SAFE_ACTION = "I will prescribe Clindamycin 300mg QID for 7 days, considering the patient's Penicillin allergy."
+
 # === ANSI Color Codes for Terminal Output ===
 class Colors:
     HEADER = '\033[95m'
@@ -42,150 +50,181 @@ def print_info(text):
 def print_warning(text):
     print(f"{Colors.WARNING}⚠ {text}{Colors.ENDC}")
 
-# === Step 0: Configure Python Path ===
-print_header("STEP 0: Environment Setup")
 
-project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
+def main() -> int:
+    # === Step 0: Configure Python Path ===
+    print_header("STEP 0: Environment Setup")
 
-print_info(f"Project root: {project_root}")
-print_info(f"Python path configured: {sys.path[0]}")
+    project_root = Path(__file__).resolve().parent.parent
+    sys.path.insert(0, str(project_root))
+
+    print_info(f"Project root: {project_root}")
+    print_info(f"Python path configured: {sys.path[0]}")
+
+    try:
+        from app.rules.clinical_rules import get_rules_for_category, CLINICAL_RULES_DB
+        from app.services.med_gemma_service import MedGemmaService
+        print_success("Successfully imported required modules")
+    except ImportError as e:
+        print_error(f"Import failed: {e}")
+        print_warning("Make sure you run this script from the project root directory.")
+        return 1
+
+    # === Step 1: Rule Retrieval Test ===
+    print_header("STEP 1: Rule Retrieval Test")
+
+    print_info("Testing: get_rules_for_category('INFECTIOUS')")
+
+    try:
+        infectious_rules = get_rules_for_category("INFECTIOUS")
+
+        assert isinstance(infectious_rules, dict), "Rules must be a dictionary"
+        assert len(infectious_rules) > 0, "Rules dictionary should not be empty"
+        assert "critical_safety_rules" in infectious_rules, "Missing critical_safety_rules key"
+
+        print_success("Rule retrieval successful!")
+        print(f"\n{Colors.OKBLUE}Retrieved Rules:{Colors.ENDC}")
+        print(json.dumps(infectious_rules, indent=2, ensure_ascii=False))
+
+    except AssertionError as e:
+        print_error(f"Assertion failed: {e}")
+        return 1
+    except Exception as e:
+        print_error(f"Unexpected error: {e}")
+        return 1
+
+    # === Step 2: Initialize MedGemma Service ===
+    print_header("STEP 2: MedGemma Service Initialization")
+
+    try:
+        med_gemma_service = MedGemmaService()
+        print_success("MedGemmaService initialized successfully")
+        print_info(f"Using model: {med_gemma_service.model_id}")
+    except ValueError as e:
+        print_error(f"Configuration error: {e}")
+        print_warning("Please ensure HUGGINGFACE_API_KEY is set in your .env file")
+        return 1
+    except Exception as e:
+        print_error(f"Initialization failed: {e}")
+        return 1
+
+    # === Step 3: Negative Test - Safety Violation ===
+    print_header("STEP 3: Negative Test - Safety Violation")
+
+    print_info("Scenario: Student prescribes Amoxicillin to patient with Penicillin allergy")
+
+    test_context_negative = INFECTIOUS_CONTEXT
+    test_input_negative = UNSAFE_ACTION
+
+    print(f"\n{Colors.OKCYAN}Context:{Colors.ENDC}")
+    print(f"  {test_context_negative}")
+    print(f"\n{Colors.OKCYAN}Student Action:{Colors.ENDC}")
+    print(f"  {test_input_negative}")
+    print(f"\n{Colors.OKCYAN}Validating with AI...{Colors.ENDC}")
+
+    try:
+        result_negative = med_gemma_service.validate_clinical_action(
+            student_text=test_input_negative,
+            rules=infectious_rules,
+            context_summary=test_context_negative
+        )
+
+        print(f"\n{Colors.OKBLUE}AI Validation Result:{Colors.ENDC}")
+        print(json.dumps(result_negative, indent=2, ensure_ascii=False))
+
+        # Assertions
+        assert result_negative.get("is_clinically_accurate") == False, \
+            "Expected is_clinically_accurate to be False"
+        assert result_negative.get("safety_violation") == True, \
+            "Expected safety_violation to be True"
+
+        print_success("\nNegative test passed: AI correctly identified the safety violation")
+
+    except AssertionError as e:
+        print_error(f"\nTest failed: {e}")
+        print_warning("The AI did not flag the Penicillin allergy violation as expected")
+        return 1
+    except Exception as e:
+        print_error(f"\nUnexpected error during validation: {e}")
+        return 1
+
+    # === Step 4: Positive Test - Correct Action ===
+    print_header("STEP 4: Positive Test - Correct Clinical Action")
+
+    print_info("Scenario: Student prescribes Clindamycin instead (allergy-safe alternative)")
+
+    test_input_positive = SAFE_ACTION
+
+    print(f"\n{Colors.OKCYAN}Context:{Colors.ENDC}")
+    print(f"  {test_context_negative}")  # Same patient context
+    print(f"\n{Colors.OKCYAN}Student Action:{Colors.ENDC}")
+    print(f"  {test_input_positive}")
+    print(f"\n{Colors.OKCYAN}Validating with AI...{Colors.ENDC}")
+
+    try:
+        result_positive = med_gemma_service.validate_clinical_action(
+            student_text=test_input_positive,
+            rules=infectious_rules,
+            context_summary=test_context_negative
+        )
+
+        print(f"\n{Colors.OKBLUE}AI Validation Result:{Colors.ENDC}")
+        print(json.dumps(result_positive, indent=2, ensure_ascii=False))
+
+        # Assertions
+        assert result_positive.get("is_clinically_accurate") == True, \
+            "Expected is_clinically_accurate to be True"
+        assert result_positive.get("safety_violation") == False, \
+            "Expected safety_violation to be False"
+
+        print_success("\nPositive test passed: AI correctly validated the safe alternative")
+
+    except AssertionError as e:
+        print_error(f"\nTest failed: {e}")
+        print_warning("The AI did not approve the Clindamycin prescription as expected")
+        print_warning("This might be due to model variability. Review the feedback above.")
+        # Don't exit here - this is acceptable variation
+    except Exception as e:
+        print_error(f"\nUnexpected error during validation: {e}")
+        return 1
+
+    # === Final Summary ===
+    print_header("TEST SUMMARY")
+
+    print_success("All integration tests completed successfully! ✓")
+    print_info("\nVerified Components:")
+    print(f"  {Colors.OKGREEN}✓{Colors.ENDC} clinical_rules.py - Rule retrieval working")
+    print(f"  {Colors.OKGREEN}✓{Colors.ENDC} med_gemma_service.py - AI validation working")
+    print(f"  {Colors.OKGREEN}✓{Colors.ENDC} Safety violation detection - Working")
+    print(f"  {Colors.OKGREEN}✓{Colors.ENDC} Correct action validation - Working")
+
+    print(f"\n{Colors.BOLD}Integration test suite passed!{Colors.ENDC}\n")
+    return 0
+
+
+# === pytest ===
+
+def test_infectious_rules_have_critical_safety_rules():
+    from app.rules.clinical_rules import get_rules_for_category
 
-try:
-    from app.rules.clinical_rules import get_rules_for_category, CLINICAL_RULES_DB
+    rules = get_rules_for_category("INFECTIOUS")
+    assert isinstance(rules, dict) and rules
+    assert "critical_safety_rules" in rules
+
+
+@pytest.mark.skipif(not os.getenv("HUGGINGFACE_API_KEY"), reason="needs HUGGINGFACE_API_KEY (live MedGemma call)")
+def test_med_gemma_flags_penicillin_allergy():
+    from app.rules.clinical_rules import get_rules_for_category
     from app.services.med_gemma_service import MedGemmaService
-    print_success("Successfully imported required modules")
-except ImportError as e:
-    print_error(f"Import failed: {e}")
-    print_warning("Make sure you run this script from the project root directory.")
-    sys.exit(1)
-
-# === Step 1: Rule Retrieval Test ===
-print_header("STEP 1: Rule Retrieval Test")
-
-print_info("Testing: get_rules_for_category('INFECTIOUS')")
-
-try:
-    infectious_rules = get_rules_for_category("INFECTIOUS")
-    
-    assert isinstance(infectious_rules, dict), "Rules must be a dictionary"
-    assert len(infectious_rules) > 0, "Rules dictionary should not be empty"
-    assert "critical_safety_rules" in infectious_rules, "Missing critical_safety_rules key"
-    
-    print_success("Rule retrieval successful!")
-    print(f"\n{Colors.OKBLUE}Retrieved Rules:{Colors.ENDC}")
-    print(json.dumps(infectious_rules, indent=2, ensure_ascii=False))
-    
-except AssertionError as e:
-    print_error(f"Assertion failed: {e}")
-    sys.exit(1)
-except Exception as e:
-    print_error(f"Unexpected error: {e}")
-    sys.exit(1)
-
-# === Step 2: Initialize MedGemma Service ===
-print_header("STEP 2: MedGemma Service Initialization")
-
-try:
-    med_gemma_service = MedGemmaService()
-    print_success("MedGemmaService initialized successfully")
-    print_info(f"Using model: {med_gemma_service.model_id}")
-except ValueError as e:
-    print_error(f"Configuration error: {e}")
-    print_warning("Please ensure HUGGINGFACE_API_KEY is set in your .env file")
-    sys.exit(1)
-except Exception as e:
-    print_error(f"Initialization failed: {e}")
-    sys.exit(1)
-
-# === Step 3: Negative Test - Safety Violation ===
-print_header("STEP 3: Negative Test - Safety Violation")
-
-print_info("Scenario: Student prescribes Amoxicillin to patient with Penicillin allergy")
-
-test_context_negative = "Patient is a 28-year-old male with a known Penicillin allergy (documented anaphylaxis). Chief complaint: Dental abscess."
-test_input_negative = "I will prescribe Amoxicillin 500mg TID for 7 days."
-
-print(f"\n{Colors.OKCYAN}Context:{Colors.ENDC}")
-print(f"  {test_context_negative}")
-print(f"\n{Colors.OKCYAN}Student Action:{Colors.ENDC}")
-print(f"  {test_input_negative}")
-print(f"\n{Colors.OKCYAN}Validating with AI...{Colors.ENDC}")
-
-try:
-    result_negative = med_gemma_service.validate_clinical_action(
-        student_text=test_input_negative,
-        rules=infectious_rules,
-        context_summary=test_context_negative
-    )
-    
-    print(f"\n{Colors.OKBLUE}AI Validation Result:{Colors.ENDC}")
-    print(json.dumps(result_negative, indent=2, ensure_ascii=False))
-    
-    # Assertions
-    assert result_negative.get("is_clinically_accurate") == False, \
-        "Expected is_clinically_accurate to be False"
-    assert result_negative.get("safety_violation") == True, \
-        "Expected safety_violation to be True"
-    
-    print_success("\nNegative test passed: AI correctly identified the safety violation")
-    
-except AssertionError as e:
-    print_error(f"\nTest failed: {e}")
-    print_warning("The AI did not flag the Penicillin allergy violation as expected")
-    sys.exit(1)
-except Exception as e:
-    print_error(f"\nUnexpected error during validation: {e}")
-    sys.exit(1)
-
-# === Step 4: Positive Test - Correct Action ===
-print_header("STEP 4: Positive Test - Correct Clinical Action")
-
-print_info("Scenario: Student prescribes Clindamycin instead (allergy-safe alternative)")
-
-test_input_positive = "I will prescribe Clindamycin 300mg QID for 7 days, considering the patient's Penicillin allergy."
-
-print(f"\n{Colors.OKCYAN}Context:{Colors.ENDC}")
-print(f"  {test_context_negative}")  # Same patient context
-print(f"\n{Colors.OKCYAN}Student Action:{Colors.ENDC}")
-print(f"  {test_input_positive}")
-print(f"\n{Colors.OKCYAN}Validating with AI...{Colors.ENDC}")
-
-try:
-    result_positive = med_gemma_service.validate_clinical_action(
-        student_text=test_input_positive,
-        rules=infectious_rules,
-        context_summary=test_context_negative
+
+    result = MedGemmaService().validate_clinical_action(
+        student_text=UNSAFE_ACTION,
+        rules=get_rules_for_category("INFECTIOUS"),
+        context_summary=INFECTIOUS_CONTEXT,
     )
-    
-    print(f"\n{Colors.OKBLUE}AI Validation Result:{Colors.ENDC}")
-    print(json.dumps(result_positive, indent=2, ensure_ascii=False))
-    
-    # Assertions
-    assert result_positive.get("is_clinically_accurate") == True, \
-        "Expected is_clinically_accurate to be True"
-    assert result_positive.get("safety_violation") == False, \
-        "Expected safety_violation to be False"
-    
-    print_success("\nPositive test passed: AI correctly validated the safe alternative")
-    
-except AssertionError as e:
-    print_error(f"\nTest failed: {e}")
-    print_warning("The AI did not approve the Clindamycin prescription as expected")
-    print_warning("This might be due to model variability. Review the feedback above.")
-    # Don't exit here - this is acceptable variation
-except Exception as e:
-    print_error(f"\nUnexpected error during validation: {e}")
-    sys.exit(1)
-
-# === Final Summary ===
-print_header("TEST SUMMARY")
-
-print_success("All integration tests completed successfully! ✓")
-print_info("\nVerified Components:")
-print(f"  {Colors.OKGREEN}✓{Colors.ENDC} clinical_rules.py - Rule retrieval working")
-print(f"  {Colors.OKGREEN}✓{Colors.ENDC} med_gemma_service.py - AI validation working")
-print(f"  {Colors.OKGREEN}✓{Colors.ENDC} Safety violation detection - Working")
-print(f"  {Colors.OKGREEN}✓{Colors.ENDC} Correct action validation - Working")
-
-print(f"\n{Colors.BOLD}Integration test suite passed!{Colors.ENDC}\n")
\ No newline at end of file
+    assert result.get("is_clinically_accurate") is False
+    assert result.get("safety_violation") is True
+
+
+if __name__ == "__main__":
+    sys.exit(main())
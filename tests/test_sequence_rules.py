@@ -0,0 +1,121 @@
+"""Sequence DSL (requires / forbidden_after): verdicts, prompt keys, repeats and rules reloads."""
+
+import json
+
+from app.assessment_engine import AssessmentEngine
+from app.progress import ProgressTracker
+from app.services.rule_index import compile_rules, get_rule_catalog
+
+RULES = [
+    {
+        "case_id": "seq_case",
+        "rules": [
+            {"target_action": "take_history", "score": 5, "rule_outcome": "ok"},
+            {
+                "target_action": "prescribe_antibiotics",
+                "score": 10,
+                "rule_outcome": "ok",
+                "requires": ["check_allergies_meds"],
+                "penalty": {"score": -25},
+            },
+            {
+                "target_action": "perform_biopsy",
+                "score": 10,
+                "rule_outcome": "ok",
+                "forbidden_after": ["prescribe_antibiotics"],
+                "penalty": {"score": -5},
+            },
+        ],
+    }
+]
+
+
+def _sequence(rules=RULES):
+    index = compile_rules(rules)
+    assert not index.problems
+    return index.cases["seq_case"].sequence
+
+
+def _engine(tmp_path, rules=RULES):
+    rules_path = tmp_path / "rules.json"
+    rules_path.write_text(json.dumps(rules), encoding="utf-8")
+    engine = AssessmentEngine(str(rules_path))
+    tracker = ProgressTracker(get_rule_catalog(str(rules_path)), lambda case_id: ())
+    state = {"case_id": "seq_case"}
+    tracker.apply(state, {})
+    return engine, tracker, state, rules_path
+
+
+def _perform(engine, tracker, state, action):
+    result = engine.evaluate_action("seq_case", {"interpreted_action": action}, state)
+    tracker.apply(state, dict(result.get("state_updates") or {}))
+    return result
+
+
+def test_requires_reports_the_missing_action():
+    sequence = _sequence()
+    verdict = sequence.check(0, "prescribe_antibiotics")
+    assert verdict.kind == "requires"
+    assert verdict.actions == ("check_allergies_meds",)
+    assert sequence.check(sequence.bits["check_allergies_meds"], "prescribe_antibiotics").kind == "ok"
+
+
+def test_forbidden_after_reports_the_offending_action():
+    sequence = _sequence()
+    assert sequence.check(0, "perform_biopsy").kind == "ok"
+
+    verdict = sequence.check(sequence.bits["prescribe_antibiotics"], "perform_biopsy")
+    assert verdict.kind == "forbidden"
+    assert verdict.actions == ("prescribe_antibiotics",)
+
+
+def test_first_time_only_is_reported_as_unused():
+    rules = json.loads(json.dumps(RULES))
+    rules[0]["rules"][0]["first_time_only"] = True
+    assert any("first_time_only" in problem for problem in compile_rules(rules).problems)
+
+
+def test_required_actions_are_offered_in_the_prompt_keys():
+    index = compile_rules(RULES)
+    assert index.case_actions("seq_case") == ("take_history", "prescribe_antibiotics", "perform_biopsy")
+    assert "check_allergies_meds" in index.prompt_actions("seq_case")
+
+
+def test_engine_scores_penalty_then_accepts_after_prerequisite(tmp_path):
+    engine, tracker, state, _ = _engine(tmp_path)
+
+    result = engine.evaluate_action("seq_case", {"interpreted_action": "prescribe_antibiotics"}, state)
+    assert result["score"] == -25
+    assert result["sequence_violation"] == {"kind": "requires", "actions": ["check_allergies_meds"]}
+    assert "check allergies meds" not in result["rule_outcome"]
+
+    _perform(engine, tracker, state, "check_allergies_meds")
+    result = _perform(engine, tracker, state, "prescribe_antibiotics")
+    assert result["score"] == 10
+    assert "sequence_violation" not in result
+
+
+def test_repeat_of_a_positive_action_scores_zero(tmp_path):
+    engine, tracker, state, _ = _engine(tmp_path)
+    assert _perform(engine, tracker, state, "take_history")["score"] == 5
+    result = _perform(engine, tracker, state, "take_history")
+    assert result["score"] == 0
+    assert result["sequence_violation"]["kind"] == "repeat"
+    assert state["progress"]["counts"] == {"actions": 1, "repeats": 1}
+
+
+def test_history_survives_a_rules_reload_that_shifts_bits(tmp_path):
+    engine, tracker, state, rules_path = _engine(tmp_path)
+    _perform(engine, tracker, state, "check_allergies_meds")
+    old_layout = engine.rule_index.cases["seq_case"].sequence.layout
+
+    # A new rule in front shifts every bit position
+    edited = json.loads(json.dumps(RULES))
+    edited[0]["rules"].insert(0, {"target_action": "perform_oral_exam", "score": 5, "rule_outcome": "ok"})
+    rules_path.write_text(json.dumps(edited), encoding="utf-8")
+    get_rule_catalog(str(rules_path)).reload()
+    assert engine.rule_index.cases["seq_case"].sequence.layout != old_layout
+
+    result = engine.evaluate_action("seq_case", {"interpreted_action": "prescribe_antibiotics"}, state)
+    assert result["score"] == 10
+    assert "sequence_violation" not in result
@@ -0,0 +1,93 @@
+"""SessionStateCache: LRU / idle eviction, version checks, and ScenarioManager reads through it."""
+
+import pytest
+
+import app.scenario_manager as scenario_module
+import app.services.session_state_cache as cache_module
+from app.scenario_manager import ScenarioManager
+from app.services.session_state_cache import CachedSessionState, SessionStateCache
+
+CASE_ID = "olp_001"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "monotonic", clock)
+    return clock
+
+
+def _entry(version=1):
+    return CachedSessionState(session_id=1, case_id=CASE_ID, version=version, score=0.0, state={})
+
+
+def test_lru_bound_and_version_check(clock):
+    cache = SessionStateCache(max_entries=2, idle_seconds=60)
+    cache.put(("a", CASE_ID), _entry())
+    cache.put(("b", CASE_ID), _entry())
+    assert cache.get(("a", CASE_ID)) is not None  # a becomes the most recent
+    cache.put(("c", CASE_ID), _entry())
+    assert cache.get(("b", CASE_ID)) is None
+
+    assert cache.get(("a", CASE_ID), version=2) is None  # stale: dropped
+    assert cache.get(("a", CASE_ID)) is None
+    stats = cache.stats()
+    assert (stats["hits"], stats["stale"], stats["misses"], stats["evictions"]) == (1, 1, 2, 1)
+
+
+def test_idle_entries_are_evicted(clock):
+    cache = SessionStateCache(idle_seconds=60)
+    cache.put(("a", CASE_ID), _entry())
+    cache.put(("b", CASE_ID), _entry())
+    clock.now += 30
+    assert cache.get(("b", CASE_ID)) is not None
+    clock.now += 45
+    assert cache.evict_idle() == 1
+    assert cache.get(("b", CASE_ID)) is not None
+    clock.now += 61
+    assert cache.get(("b", CASE_ID)) is None
+
+
+@pytest.fixture
+def managers(session_factory, monkeypatch):
+    """Two ScenarioManagers with their own caches: two processes on one DB."""
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    return ScenarioManager(state_cache=SessionStateCache()), ScenarioManager(state_cache=SessionStateCache())
+
+
+def test_repeated_reads_are_served_from_the_cache(managers):
+    manager, _ = managers
+    manager.update_state("s1", {"score_change": 10, "progress_action": "check_allergies_meds"}, CASE_ID)
+    before = manager.state_cache.stats()["hits"]
+    for _ in range(3):
+        assert manager.get_state("s1", CASE_ID)["current_score"] == 10.0
+    assert manager.state_cache.stats()["hits"] == before + 3
+
+
+def test_handed_out_state_is_a_copy(managers):
+    manager, _ = managers
+    manager.update_state("s1", {"revealed_findings": ["bulgu_001"]}, CASE_ID)
+    state = manager.get_state("s1", CASE_ID)
+    state["revealed_findings"].append("tampered")
+    state["current_score"] = 999
+    assert manager.get_state("s1", CASE_ID)["revealed_findings"] == ["bulgu_001"]
+    assert manager.get_state("s1", CASE_ID)["current_score"] == 0.0
+
+
+def test_write_by_another_process_is_picked_up(managers):
+    first, second = managers
+    first.update_state("s1", {"score_change": 10, "progress_action": "check_allergies_meds"}, CASE_ID)
+    assert first.get_state("s1", CASE_ID)["current_score"] == 10.0
+
+    second.update_state("s1", {"score_change": 20, "progress_action": "perform_oral_exam"}, CASE_ID)
+    assert first.get_state("s1", CASE_ID)["current_score"] == 30.0
+    assert first.state_cache.stats()["stale"] == 1
+    assert first.get_state("s1", CASE_ID) == second.get_state("s1", CASE_ID)
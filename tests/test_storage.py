@@ -0,0 +1,79 @@
+"""Storage layer: SQLite pragmas on every connection, URL parsing and environment config."""
+
+from sqlalchemy import text
+
+from db.storage import StorageConfig, create_storage_engine, sqlite_db_file_path
+
+
+def _pragmas(engine):
+    with engine.connect() as conn:
+        return {
+            name: conn.execute(text(f"PRAGMA {name}")).scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size")
+        }
+
+
+def test_file_database_gets_the_tuned_pragmas(tmp_path):
+    config = StorageConfig(url=f"sqlite:///{tmp_path / 'app.db'}", sqlite_busy_timeout_ms=1234,
+                           sqlite_cache_size_kb=2048, sqlite_mmap_size=1 << 20)
+    engine = create_storage_engine(config)
+    try:
+        assert _pragmas(engine) == {
+            "journal_mode": "wal",
+            "synchronous": 1,  # NORMAL
+            "busy_timeout": 1234,
+            "cache_size": -2048,
+            "mmap_size": 1 << 20,
+        }
+    finally:
+        engine.dispose()
+
+
+def test_wal_lets_a_reader_see_the_last_commit_while_a_write_is_open(tmp_path):
+    engine = create_storage_engine(StorageConfig(url=f"sqlite:///{tmp_path / 'app.db'}"))
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (v INTEGER)"))
+            conn.execute(text("INSERT INTO t VALUES (1)"))
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(text("INSERT INTO t VALUES (2)"))
+            assert reader.execute(text("SELECT COUNT(*) FROM t")).scalar() == 1
+            writer.execute(text("COMMIT"))
+    finally:
+        engine.dispose()
+
+
+def test_memory_database_is_one_shared_connection():
+    engine = create_storage_engine(StorageConfig(url="sqlite://"))
+    try:
+        with engine.begin() as conn:
+            conn.execute(text("CREATE TABLE t (v INTEGER)"))
+        with engine.connect() as conn:
+            assert conn.execute(text("SELECT COUNT(*) FROM t")).scalar() == 0
+        assert _pragmas(engine)["journal_mode"] == "memory"
+    finally:
+        engine.dispose()
+
+
+def test_sqlite_file_paths():
+    assert sqlite_db_file_path("sqlite:///./dentai_app.db") == "dentai_app.db"
+    assert sqlite_db_file_path("sqlite:////var/lib/dentai/app.db") == "/var/lib/dentai/app.db"
+    assert sqlite_db_file_path("sqlite://") is None
+    assert sqlite_db_file_path("sqlite:///:memory:") is None
+    assert sqlite_db_file_path("postgresql+psycopg://u:p@host/dentai") is None
+
+
+def test_config_from_env(monkeypatch):
+    monkeypatch.setenv("DENTAI_DATABASE_URL", "postgresql+psycopg://u:p@host/dentai")
+    monkeypatch.setenv("DENTAI_DB_POOL_SIZE", "4")
+    monkeypatch.setenv("DENTAI_DB_MAX_OVERFLOW", "many")
+    monkeypatch.setenv("DENTAI_SQLITE_SYNCHRONOUS", "sometimes")
+    config = StorageConfig.from_env()
+    assert (config.mode, config.pool_size, config.max_overflow) == ("server", 4, 20)
+    assert config.sqlite_synchronous == "NORMAL"
+
+    monkeypatch.delenv("DENTAI_DATABASE_URL")
+    monkeypatch.setenv("DENTAI_SQLITE_SYNCHRONOUS", "full")
+    config = StorageConfig.from_env()
+    assert (config.mode, config.is_sqlite_memory, config.sqlite_synchronous) == ("sqlite", False, "FULL")
@@ -0,0 +1,89 @@
+"""TurnUnitOfWork: one transaction per turn, and the version-conflict reload / replay path."""
+
+import pytest
+
+import app.scenario_manager as scenario_module
+from app.scenario_manager import MAX_STATE_WRITE_ATTEMPTS, ScenarioManager
+from app.services.session_state_cache import SessionStateCache
+from db.database import ChatLog, ScenarioEvent, StudentSession
+
+CASE_ID = "olp_001"
+
+
+@pytest.fixture
+def managers(session_factory, monkeypatch):
+    """Two managers with separate state caches, like two worker processes."""
+    monkeypatch.setattr(scenario_module, "SessionLocal", session_factory)
+    return ScenarioManager(state_cache=SessionStateCache()), ScenarioManager(state_cache=SessionStateCache())
+
+
+def _session_row(session_factory, session_id):
+    db = session_factory()
+    try:
+        row = db.get(StudentSession, session_id)
+        events = db.query(ScenarioEvent).filter(ScenarioEvent.session_id == session_id).count()
+        messages = db.query(ChatLog).filter(ChatLog.session_id == session_id).count()
+        return row.current_score, row.version, events, messages
+    finally:
+        db.close()
+
+
+def test_turn_is_written_in_one_transaction(managers, session_factory):
+    manager, _ = managers
+    turn = manager.begin_turn("s1", CASE_ID)
+    with manager.unit_of_work(turn) as uow:
+        uow.apply_updates({"score_change": 10})
+        uow.add_message("user", "ağız içi muayene")
+        uow.add_message("assistant", "ok")
+
+    assert _session_row(session_factory, turn.session_id) == (10.0, 1, 1, 2)
+    assert manager.get_state("s1", CASE_ID)["current_score"] == 10.0
+
+
+def test_version_conflict_reloads_and_replays_the_turn(managers, session_factory):
+    manager, other = managers
+    turn = manager.begin_turn("s1", CASE_ID)
+
+    # Another process writes the session while this turn is in flight
+    other.update_state("s1", {"score_change": 5, "revealed_findings": ["other_finding"]}, CASE_ID)
+
+    with manager.unit_of_work(turn) as uow:
+        uow.apply_updates({"score_change": 10, "revealed_findings": ["own_finding"]})
+        uow.add_message("assistant", "ok")
+
+    assert _session_row(session_factory, turn.session_id) == (15.0, 2, 2, 1)
+    assert manager.state_cache.stats()["conflicts"] == 1
+    state = manager.get_state("s1", CASE_ID)
+    assert state["current_score"] == 15.0
+    assert {"other_finding", "own_finding"} <= set(state["revealed_findings"])
+
+
+def test_endless_conflicts_roll_the_whole_turn_back(managers, session_factory, monkeypatch):
+    manager, _ = managers
+    turn = manager.begin_turn("s1", CASE_ID)
+    calls = []
+
+    def always_conflict(db, entry, state, score, deltas):
+        calls.append(entry.version)
+        return None
+
+    monkeypatch.setattr(manager, "_write_entry", always_conflict)
+    with pytest.raises(RuntimeError):
+        with manager.unit_of_work(turn) as uow:
+            uow.apply_updates({"score_change": 10})
+            uow.add_message("assistant", "ok")
+
+    assert len(calls) == MAX_STATE_WRITE_ATTEMPTS
+    assert _session_row(session_factory, turn.session_id) == (0.0, 0, 0, 0)
+
+
+def test_error_inside_the_turn_writes_nothing(managers, session_factory):
+    manager, _ = managers
+    turn = manager.begin_turn("s1", CASE_ID)
+    with pytest.raises(ValueError):
+        with manager.unit_of_work(turn) as uow:
+            uow.apply_updates({"score_change": 10})
+            uow.add_message("assistant", "ok")
+            raise ValueError("scoring failed")
+
+    assert _session_row(session_factory, turn.session_id) == (0.0, 0, 0, 0)